@@ -1,21 +1,37 @@
 #!/usr/bin/python
 # Classification (U)
+# pylint:disable=C0302
 
 """Program:  mysql_rep_cmp.py
 
-    Description:  Does a table checksum comparsion between a master database
+    Description:  Does a table checksum comparison between a master database
         and a replica database.  This should determine whether the tables
         in both databases are in sync with each other.  This is not a
-        100% guarntee check as the comparsion process only uses a
+        100% guarntee check as the comparison process only uses a
         time-delay recursion check.  If a table is listed as being out
         of sync, then further investigation will be required.
 
     Usage:
         mysql_rep_cmp.py -c master_cfg -r slave_cfg -d path
             [-C db_name [db_name2 ...] [-t table_name [table_name2 ...]]]
-            [-e to_email [to_email2 ...] [-s subject_line] [-u]]
-            [-z] [-b] [-p [-n N]] [-i]
-            [-y flavor_id]
+            [-I pattern [pattern2 ...]] [-X pattern [pattern2 ...]]
+            [-E engine [engine2 ...]] [-L min:max] [-V] [-D] [-Y N]
+            [-o path/file [-w a|w] [-f gzip|zstd] [-R N] [-A hourly|daily]
+                [-K N] [-F [-Z]]]
+            [-e to_email [to_email2 ...] [-s subject_line] [-u] [-k]]
+            [-z] [-b] [-p [-n N]] [-i] [-q]
+            [-P [-S path/file]] [-G [-T seconds] [-a]] [-j N]
+            [-W path/file [-J] [-U seconds]] [-g path/file [-O N]]
+            [-x db_name.table_name [-N slave_cfg [slave_cfg2 ...]]]
+            [-H path/file] [-B path/file]
+            [-y flavor_id [seconds]]
+            [-v | -h]
+
+        mysql_rep_cmp.py -M path/file -d path [-m N] [-l N]
+            [any of the above options except -c and -r]
+
+        mysql_rep_cmp.py -Q -H path/file
+            [-o path/file [-w a|w]] [-e to_email [to_email2 ...]] [-z] [-p]
             [-v | -h]
 
     Arguments:
@@ -26,28 +42,245 @@
         -C database_names => Compare one or more databases
             -t table name(s) => Table names to check.  If this option is used
                 only one database will be checked based on the -C option.
+        -I pattern(s) => Only compare the tables matching one of the patterns.
+        -X pattern(s) => Do not compare the tables matching one of the
+                patterns.
+        -E engine(s) => Do not compare the tables of these storage engines,
+                i.e. MEMORY BLACKHOLE.
+        -L min:max => Only compare the tables whose data and index size is
+                within the range in MB.  Either side may be left empty, i.e.
+                10: or :500.
+        -V => Only compare base tables, views are skipped.
+        -D => Compare the table definitions before the data.  Tables whose
+                columns or indexes differ between the master and slave are
+                reported as "Schema differs" and are not checksummed.
+        -Y N => Locate the rows of the tables whose checksums do not match.
+                The rows are hashed in chunks of N primary key values on
+                both servers and the key ranges of the chunks that differ
+                are added to the table's status as "Ranges".  The chunks
+                are compared with numpy if the numpy module is installed.
 
         -o path/file => Directory path and file name for output.
             -w a|w => Append or write to output to output file. Default is
                 write.
+            -f gzip|zstd => Compress the output file.  The zstd compression
+                requires the zstandard module.
+            -R N => Rotate the output file when it is larger than N MB.
+            -A hourly|daily => Rotate the output file when it was last written
+                in a previous hour or day.
+            -K N => Number of rotated output files to keep.  Default is 5.
+            -F => Profile the run.  The cProfile statistics are written to
+                the output file name with a .prof suffix, for use with
+                pstats or snakeviz, and the wall-clock time spent
+                connecting, checking replication, enumerating, on the
+                tables and their checksums, waiting to recheck, waiting on
+                the work queue and writing the output to a .phases.json
+                file.
+                -Z => Also trace the memory allocations.  The peak memory
+                    is added to the .phases.json file and a tracemalloc
+                    snapshot is written to a .mem file.
         -e to_email_address(es) => Enables emailing and sends output to one
                 or more email addresses.  Email addresses are delimited by
                 a space.
             -s subject_line => Subject line of email.
             -u => Override the default mail command and use mailx.
+            -k => Compress the email body (gzip and base64 encoded) when it
+                is larger than 1 MB.
         -z => Suppress standard out.
         -b => Only return those tables that are not in sync.
         -p => Expand the JSON format.
             -n N => Indentation for expanded JSON format.
         -i => Override the master/slave check and compare the databases.
+        -q => Plan only, no checksums are run.  The tables are selected as
+                for the comparison and their sizes and row estimates read in
+                bulk.  Outputs the comparison mode, the strategy, rows and
+                bytes of each table, the bytes scanned on each server and
+                the projected time of the run.  The projection uses the
+                throughput measured in the -H history database, or 100 MB
+                per second without history, and the -j concurrency.
+        -P => Partition-level comparison.  Partitioned tables are checksummed
+                one partition at a time and the status will list the
+                partitions that are not in sync.
+            -S path/file => Partition state file.  Partitions that were in
+                sync during the last run and whose metadata has not changed
+                since are skipped.  The file is created if not present.
+        -G => Consistent snapshot comparison.  A consistent snapshot is opened
+                on the master and its GTID set captured, the replica is then
+                brought to the same GTID set and a snapshot opened on it.
+                Each table is checked once within the snapshots, no
+                rechecks are done.
+            -T seconds => Seconds to wait for the replica to reach the
+                master's GTID set.  Default is 60 seconds.
+            -a => Replica comparison.  The -c and -r options are two
+                replicas of the same source and no load is put on the
+                source.  Both replicas are stopped at or brought to the
+                same GTID set and snapshots opened on them.  The source's
+                server UUID and the GTID set are added to the results.  The
+                -W and -j options are ignored.
+        -j N => Compare the tables concurrently with N extra connections to
+                each of the master and replica.  Tables waiting to be
+                rechecked do not hold a connection, so many tables can be in
+                progress at once.  Ignored with the -G and -P options.
+        -W path/file => SQLite work queue database.  The tables are added to
+                the queue as work units and compared by this process along
+                with any number of worker processes, on this or other hosts,
+                using the same queue.  The results are merged into one
+                results document once all units are done.  The -G and -j
+                options are ignored.
+            -J => Run as a worker only.  Claims and compares work units
+                until all units of the queue are done, there is no output.
+            -U seconds => Lease of a claimed work unit.  A unit not done
+                within its lease is handed out again, the first result of a
+                unit is kept.  Default is 600 seconds.
+
+        -g path/file => Incremental state file.  Only the tables changed on
+            the master since the last run, read from the master's binary
+            logs from the position saved in this file, are compared along
+            with a rotating slice of all tables.  Tables not in sync are
+            kept in the file and compared on every run until they are.  All
+            tables are compared on the first run and when the changes are
+            not known.  The file is created if not present.
+            -O N => Number of full-scan slices, every table is compared at
+                least once every N runs.  Default is 7.
+
+        -M path/file => Topology file.  Compares all of the master/slave pairs
+            listed in the file in one process, instead of the -c and -r
+            options, and outputs one combined results document.  Each line
+            holds the master and slave configuration file names, in the -d
+            directory, separated by white space.  Lines starting with # are
+            skipped.
+            -m N => Number of pairs compared at the same time.  Default
+                is 4.
+            -l N => Number of pairs that can use a server at the same time.
+                Default is 1.  A server is known by the host and port of its
+                configuration files.  Pairs sharing a configuration file
+                share its connections.
+
+        -x db_name.table_name => Replicated checksums table.  Each table is
+            checksummed once on the master into this table with statement
+            based replication, so each replica checksums its own rows at the
+            same point of the replication stream.  Tables with an integer
+            primary key are checksummed in chunks of 1000 rows, each in its
+            own transaction.  The replicas' checksums are then collected and
+            compared with the master's.  The table is dropped and created
+            by each run.  The -P, -G, -a, -j and -W options are
+            ignored.  Not used with the -M option.
+            -N slave_cfg(s) => Configuration files of more replicas to
+                collect the checksums from, in the -d directory.  With more
+                than one replica one combined results document is output.
+
+        -H path/file => SQLite history database.  The run and the status,
+            checksum time, duration and retries of each table are saved to
+            the database.  The database is created if not present.
+        -Q => Report from the history database instead of comparing.  Lists
+            the tables whose status changed since the previous run and the
+            tables whose checksum time went up more than 10% over their
+            30 day average, for each master/slave pair.  Requires -H.
+
+        -B path/file => Trace file.  Each step of the run is written as a
+            span in the Chrome trace event format, to be loaded into
+            chrome://tracing or Perfetto: the connects, the replica check,
+            the table enumeration, each table, its checksum on each server
+            and retry waits, and the output sinks.  Each span holds its
+            database, table and server and the id of the span it ran
+            within.
 
-        -y value => A flavor id for the program lock.  To create unique lock.
+        -y value [seconds] => A flavor id for the program lock.  To create
+            unique lock.  The lock is taken per master/slave pair, so runs
+            on different pairs run at the same time and a run on a pair
+            already being compared is skipped.  A -J worker takes no lock.
+            The seconds are how long to wait for the lock of a pair before
+            the run is skipped.  Default is not to wait.
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1: -v or -h overrides the other options.
         NOTE 2: If the -C option is not selected, then all of the databases
             will be compared.
+        NOTE 3: The -S option relies on the partition metadata in
+            information_schema.  Set information_schema_stats_expiry to 0 on
+            the master, otherwise the metadata may be cached and changes to
+            a partition can go undetected.  Partitions without an update
+            time, as with some storage engines, are always compared.
+        NOTE 4: The -I and -X patterns are matched against database.table
+            and are glob patterns (* and ?) unless prefixed with re: for a
+            regular expression, i.e. "sales.*" or "re:^stage_.*[.]tmp_".
+            The selection rules are evaluated in the master's
+            information_schema query, tables filtered out are never read.
+            The slave's query uses the name rules only, a table the -E, -L
+            or -V rules dropped on the master is not reported as extra.
+        NOTE 5: The table lists of the master and slave are merged as read.
+            Tables only on the master or only on the slave are reported as
+            "Missing on slave" or "Extra on slave" and are not checksummed.
+        NOTE 6: The output file is written to a temporary file and renamed
+            into place, readers will never see a partially written file.
+            Rotated files have a numeric suffix, with .1 being the newest.
+        NOTE 7: The email is sent in the background and the program lock is
+            released before the email has been sent.
+        NOTE 8: The -G option requires GTID replication, the RELOAD
+            privilege on the master to briefly take a global read lock and
+            the REPLICATION_SLAVE_ADMIN privilege on the replica.  The
+            replica's SQL thread is stopped until its snapshot is opened.
+        NOTE 9: The -a option requires the REPLICATION_SLAVE_ADMIN privilege
+            on both replicas, whose SQL threads are stopped until the
+            snapshots are opened.  Replicas whose GTID sets have diverged
+            can not be compared.
+        NOTE 10: With the -M option the -S state file, -W work queue and -g
+            incremental state file names have the master and slave
+            configuration file names appended, one per pair.
+        NOTE 11: Start the -J workers after the -W coordinator has started, a
+            worker exits once all units of the queue are done.  The -U
+            lease should be longer than the longest table comparison, or the
+            table is also compared by another worker.  The -S partition
+            state is passed to the workers with the work units.  The work
+            queue must be on a file system with working file locks to be
+            shared between hosts.
+        NOTE 12: The -x option requires the SUPER or SYSTEM_VARIABLES_ADMIN
+            privilege on the master to set the session's binlog_format and
+            GTID replication for the replicas to be waited for.  As with
+            pt-table-checksum, a checksum statement that fails on a replica
+            stops its replication, use the -D option beforehand to check the
+            table definitions.  Tables missing on a replica are not
+            checksummed.
+        NOTE 13: The -F option profiles the main thread only, the time of
+            the -j and -M worker threads is in the phases breakdown but not
+            in the .prof file.  The phase times are summed over the threads
+            and can be larger than the wall-clock time of the run.
+        NOTE 14: The -B trace file is written once the run and the email
+            are done.  The spans of the -M worker threads are not linked to
+            a parent span.
+        NOTE 15: The -q projection does not include rechecks of tables out of
+            sync or the replicas of the -N option.  With the -P option the
+            partitions skipped by the -S state file are counted.
+        NOTE 16: The -g option requires the REPLICATION CLIENT and
+            REPLICATION SLAVE privileges on the master and its binary logs
+            to be kept between runs.  Row events name the tables they
+            change.  A statement changes any table of its default database
+            and any database qualified table it names, and a statement
+            without a default database causes all tables to be compared.
+            Tables changed only on the slave are found by the full-scan
+            slices.  The -g option is ignored with the -x and -q options.
+        NOTE 17: The -Y option only locates the rows of tables with an
+            integer primary key and is ignored with the -j, -x and -q
+            options.  The chunks are hashed by MD5 over the same row
+            expression as the checksums.
+        NOTE 18: A pair's lock is named after the host and port of its
+            master and slave configuration files, not the file names, so
+            configuration files of the same servers share a lock.  With the
+            -M option a lock is taken for each pair of the topology file
+            before any pair is compared.
+        NOTE 19: Each table is compared with the strategy of its storage
+            engine, which is added to the table's entry.  Tables of the
+            MEMORY, BLACKHOLE and FEDERATED engines are "Skipped", MyISAM
+            and Aria tables created with CHECKSUM=1 and the same row format
+            on both servers have their live checksum read without a scan,
+            and tables whose engine or row format differs between the
+            servers are compared on their row values.  With the -Y option
+            a table with an integer primary key is compared on its chunk
+            hashes, which are also used to locate its rows out of sync.
+            The -j, -G and -a options and the partitioned tables of the -P
+            option only skip tables, the -x option does not use the
+            strategies.
 
     Notes:
         Database configuration file format (config/mysql_cfg.py.TEMPLATE):
@@ -107,38 +340,392 @@
     Example compare all databases:
         mysql_rep_cmp.py -c master -r slave -d config
 
+    Example compare all base tables except staging and MEMORY tables:
+        mysql_rep_cmp.py -c master -r slave -d config -V -X "staging.*" \\
+            "*.tmp_*" -E MEMORY BLACKHOLE
+
+    Example compare the pairs of a topology file, 8 pairs at a time:
+        mysql_rep_cmp.py -M config/topology.txt -d config -m 8
+
+    Example compare two replicas of the same source:
+        mysql_rep_cmp.py -c replica1 -r replica2 -d config -G -a
+
+    Example compare three replicas with one scan of the master:
+        mysql_rep_cmp.py -c master -r slave1 -d config -x admin.checksums \\
+            -N slave2 slave3
+
+    Example compare with two more worker processes:
+        mysql_rep_cmp.py -c master -r slave -d config -W /tmp/queue.db
+        mysql_rep_cmp.py -c master -r slave -d config -W /tmp/queue.db -J
+        mysql_rep_cmp.py -c master -r slave -d config -W /tmp/queue.db -J
+
+    Example profile a run:
+        mysql_rep_cmp.py -c master -r slave -d config -o /tmp/cmp.json -F
+
+    Example estimate a run before scheduling it:
+        mysql_rep_cmp.py -c master -r slave -d config -j 4 -q \\
+            -H /var/lib/mysql_rep_cmp/history.db
+
+    Example compare the tables changed since the last nightly run:
+        mysql_rep_cmp.py -c master -r slave -d config \\
+            -g /var/lib/mysql_rep_cmp/incr.json -O 7
+
+    Example trace a run:
+        mysql_rep_cmp.py -c master -r slave -d config -j 4 -B /tmp/trace.json
+
+    Example locate the rows out of sync in 10000 row chunks:
+        mysql_rep_cmp.py -c master -r slave -d config -C sales -Y 10000
+
+    Example wait up to 10 minutes for a run on the same pair to finish:
+        mysql_rep_cmp.py -c master -r slave -d config -y nightly 600
+
+    Example report from the history database:
+        mysql_rep_cmp.py -Q -H /var/lib/mysql_rep_cmp/history.db
+
 """
 
 # Libraries and Global Variables
 
 # Standard
 import sys
+import os
 import time
-import pprint
-
-try:
-    import simplejson as json
-except ImportError:
-    import json
+import types
+import datetime
+import re
+import functools
+import collections
+import contextlib
+import contextvars
+import itertools
+import importlib.util
 
 # Local
 try:
     from .lib import gen_libs
     from .lib import gen_class
-    from .mysql_lib import mysql_libs
-    from .mysql_lib import mysql_class
     from . import version
 
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
-    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
-    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
     import version
 
 __version__ = version.__version__
 
+
+def lazy_import(name):
+
+    """Function:  lazy_import
+
+    Description:  Return a module whose loading is deferred until one of its
+        attributes is first used.  A module already loaded is returned as is.
+
+    Arguments:
+        (input) name -> Full module name
+        (output) module -> Module instance or None if not found
+
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        return None
+
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def load_modules(args):
+
+    """Function:  load_modules
+
+    Description:  Load the lazy loaded modules in the main thread, before
+        any worker threads are started.  The loading of a lazy module is not
+        thread safe, threads using it for the first time at the same moment
+        can see it without its attributes.  numpy is only loaded with the -Y
+        option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    modules = [mysql_libs, mysql_class, json, zstandard, gzip, base64,
+               hashlib, shutil, pprint, sqlite3, asyncio, tempfile, threading,
+               futures, zlib]
+
+    if args.get_val("-Y"):
+        modules.append(numpy)
+
+    for module in modules:
+        if module is not None:
+            getattr(module, "__dict__")
+
+
+# Lazy loaded
+PKG = f"{__package__}." if __package__ else ""
+mysql_libs = lazy_import(PKG + "mysql_lib.mysql_libs")
+mysql_class = lazy_import(PKG + "mysql_lib.mysql_class")
+json = lazy_import("simplejson") or lazy_import("json")
+zstandard = lazy_import("zstandard")
+numpy = lazy_import("numpy")
+gzip = lazy_import("gzip")
+base64 = lazy_import("base64")
+hashlib = lazy_import("hashlib")
+shutil = lazy_import("shutil")
+pprint = lazy_import("pprint")
+sqlite3 = lazy_import("sqlite3")
+asyncio = lazy_import("asyncio")
+tempfile = lazy_import("tempfile")
+threading = lazy_import("threading")
+futures = lazy_import("concurrent.futures")
+cProfile = lazy_import("cProfile")
+tracemalloc = lazy_import("tracemalloc")
+zlib = lazy_import("zlib")
+
 # Global
+MAIL_COMPRESS_SIZE = 1048576
+SINK_POOL = []
+PENDING_SINKS = []
+MAX_INFLIGHT = 10000
+PAGE_SIZE = 1000
+TBL_META = ["Engine", "TableType", "TableRows", "DataLength", "IndexLength",
+            "CreateOptions"]
+TBL_ORDER = "cast(table_name as binary)"
+ATTR_RULES = ["skip_engines", "size", "skip_views"]
+CHUNK_DTYPE = [("Chunk", "<i8"), ("Crc", "<u8")]
+HISTORY_SCHEMA = """
+create table if not exists runs (
+    run_id integer primary key autoincrement, as_of text, master text,
+    slave text, start_time real, end_time real);
+create table if not exists results (
+    run_id integer not null references runs (run_id), db_name text not null,
+    tbl_name text not null, status text, checksum_time real, duration real,
+    retries integer);
+create index if not exists runs_pair_idx on runs (master, slave, run_id);
+create index if not exists results_run_idx on results (run_id);
+create index if not exists results_tbl_idx
+    on results (db_name, tbl_name, run_id);
+"""
+QUEUE_SCHEMA = """
+create table if not exists units (
+    unit_id integer primary key, db_name text not null,
+    tbl_name text not null, state text not null default 'pending',
+    worker text, lease_until real, entry text, checksum_time real,
+    duration real, retries integer);
+create table if not exists queue_state (name text primary key, value text);
+create index if not exists units_state_idx on units (state, unit_id);
+"""
+QUEUE_POLL = 1
+PLAN_RATE = 104857600
+LOCK_POLL = 5
+REP_CHUNK = 1000
+NO_CHECKSUM_ENGINES = frozenset(["BLACKHOLE", "FEDERATED", "MEMORY"])
+LIVE_CHECKSUM_ENGINES = frozenset(["ARIA", "MYISAM"])
+PHASES = collections.defaultdict(lambda: [0.0, 0])
+TRACE = {}
+SPAN = contextvars.ContextVar("SPAN", default=None)
+STATUSES = ["Synced", "Checksums do not match", "Partitions do not match",
+            "Missing on slave", "Extra on slave", "Schema differs",
+            "Missing on another slave",
+            "Replica did not reach the master's GTID set", "Skipped"]
+STATUS_CODE = {status: code for code, status in enumerate(STATUSES)}
+CFG_REQ = ["user", "japd", "host", "name", "sid", "serv_os", "port"]
+ServerCfg = collections.namedtuple(
+    "ServerCfg",
+    ["cfg_name", "cfg_dir", "ign_dbs", "ign_db_tbl", "host", "port"])
+
+
+class Check():                                    # pylint:disable=R0903
+
+    """Class:  Check
+
+    Description:  Compact status entry of a table, held with a status code
+        until the document is output.  Not a tuple, so the JSON encoder hands
+        it to check_default instead of writing it as a list.
+
+    Methods:
+        __init__
+        __eq__
+        __repr__
+
+    """
+
+    __slots__ = ("table", "status", "partitions", "ranges", "strategy")
+
+    def __init__(                                 # pylint:disable=R0913,R0917
+            self, table, status, partitions=None, ranges=None,
+            strategy=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Check class.
+
+        Arguments:
+            (input) table -> Table name
+            (input) status -> Status code
+            (input) partitions -> List of partitions not in sync
+            (input) ranges -> List of key ranges not in sync
+            (input) strategy -> Checksum strategy of the table
+
+        """
+
+        self.table = table
+        self.status = status
+        self.partitions = partitions
+        self.ranges = ranges
+        self.strategy = strategy
+
+    def __eq__(self, other):
+
+        """Method:  __eq__
+
+        Description:  Check entries are equal when all of their fields are.
+
+        Arguments:
+            (input) other -> Object to compare to
+            (output) True|False - Entries are equal
+
+        """
+
+        if not isinstance(other, Check):
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+
+        """Method:  __repr__
+
+        Description:  The entry in its expanded shape, so the str format of
+            the document shows the same text as before.
+
+        Arguments:
+            (output) Representation of the expanded entry
+
+        """
+
+        return repr(expand_doc(self))
+
+
+@contextlib.contextmanager
+def phase(name, **fields):
+
+    """Function:  phase
+
+    Description:  Context manager adding the wall-clock time of a step to its
+        phase of the run.  The times are summed over all threads and tasks.
+        When tracing, the step is also recorded as a span linked to the
+        span it was started within.
+
+    Arguments:
+        (input) name -> Name of the phase
+        (input) fields -> Details of the step for its span, i.e. db, table
+            and server
+
+    """
+
+    start = time.perf_counter()
+    events = TRACE.get("events")
+    token = None
+
+    if events is not None:
+        fields["id"] = TRACE["ids"]()
+        fields["parent"] = SPAN.get()
+        token = SPAN.set(fields["id"])
+
+    try:
+        yield
+
+    finally:
+        end = time.perf_counter()
+        item = PHASES[name]
+        item[0] += end - start
+        item[1] += 1
+
+        if token is not None:
+            SPAN.reset(token)
+            events.append(trace_event(name, start, end, fields))
+
+
+def trace_event(name, start, end, fields):
+
+    """Function:  trace_event
+
+    Description:  Return a step as a complete event of the Chrome trace
+        event format.
+
+    Arguments:
+        (input) name -> Name of the phase
+        (input) start -> perf_counter at the start of the step
+        (input) end -> perf_counter at the end of the step
+        (input) fields -> Details of the step
+        (output) Trace event
+
+    """
+
+    thread = threading.current_thread()
+    TRACE["threads"][thread.ident] = thread.name
+    label = name
+
+    if fields.get("table"):
+        label = f"{name} {fields.get('db')}.{fields['table']}"
+
+    if fields.get("server"):
+        label = f"{label} @ {fields['server']}"
+
+    return {"name": label, "cat": name, "ph": "X", "pid": os.getpid(),
+            "tid": thread.ident,
+            "ts": round((start - TRACE["start"]) * 1000000, 3),
+            "dur": round((end - start) * 1000000, 3), "args": fields}
+
+
+@contextlib.contextmanager
+def trace_file(trace_path):
+
+    """Function:  trace_file
+
+    Description:  Context manager recording the steps run within it as
+        spans and writing them to a trace file in the Chrome trace event
+        format, for chrome://tracing or Perfetto.  Does nothing without a
+        trace file.
+
+    Arguments:
+        (input) trace_path -> Path and file name of the trace file or None
+
+    """
+
+    if not trace_path:
+        yield
+        return
+
+    TRACE.update(events=[], ids=itertools.count(1).__next__, threads={},
+                 start=time.perf_counter())
+
+    try:
+        yield
+
+    finally:
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                   "args": {"name": name}}
+                  for tid, name in TRACE["threads"].items()] \
+            + TRACE["events"]
+        TRACE.clear()
+
+        with open(trace_path, mode="w", encoding="UTF-8") as fhdr:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fhdr)
 
 
 def help_message():
@@ -175,6 +762,46 @@ def get_json_template(server):
     return json_doc
 
 
+@functools.lru_cache(maxsize=None)
+def load_cfg(cfg_name, cfg_dir):
+
+    """Function:  load_cfg
+
+    Description:  Load and validate a server configuration file.  Each file is
+        only loaded once per run, later calls return the same immutable
+        instance.  The ignore lists are converted to sets.
+
+    Arguments:
+        (input) cfg_name -> Configuration file name
+        (input) cfg_dir -> Directory path to the configuration file
+        (output) cfg -> ServerCfg instance or None if not valid
+        (output) err_msg -> Error message
+
+    """
+
+    cfg = gen_libs.load_module(cfg_name, cfg_dir)
+    missing = [item for item in CFG_REQ if not hasattr(cfg, item)]
+
+    if missing:
+        return None, f"Error: {cfg_name}: Missing settings: {missing}"
+
+    ign_dbs = getattr(cfg, "ign_dbs", [])
+    ign_db_tbl = getattr(cfg, "ign_db_tbl", {})
+
+    if not isinstance(ign_dbs, (list, tuple, set)) \
+       or not isinstance(ign_db_tbl, dict) \
+       or not all(isinstance(tbls, (list, tuple, set))
+                  for tbls in ign_db_tbl.values()):
+        return None, f"Error: {cfg_name}: ign_dbs must be a list and" \
+            f" ign_db_tbl a dictionary of lists"
+
+    return ServerCfg(
+        cfg_name, cfg_dir, frozenset(ign_dbs),
+        types.MappingProxyType(
+            {dbs: frozenset(tbls) for dbs, tbls in ign_db_tbl.items()}),
+        cfg.host, cfg.port), None
+
+
 def create_data_config(args):
 
     """Function:  create_data_config
@@ -193,261 +820,3840 @@ def create_data_config(args):
     data_config["mailx"] = args.get_val("-u", def_val=False)
     data_config["outfile"] = args.get_val("-o")
     data_config["mode"] = args.get_val("-w", def_val="w")
+    data_config["file_compress"] = args.get_val("-f")
+    data_config["rotate_size"] = args.get_val("-R")
+    data_config["rotate_period"] = args.get_val("-A")
+    data_config["keep"] = args.get_val("-K", def_val=5)
     data_config["expand"] = args.get_val("-p", def_val=False)
     data_config["indent"] = args.get_val("-n")
     data_config["suppress"] = args.get_val("-z", def_val=False)
+    data_config["compress"] = args.get_val("-k", def_val=False)
 
     return data_config
 
 
-def data_out(data, **kwargs):
+def encode_data(data, encoded, fmt, indent=None):
 
-    """Function:  data_out
+    """Function:  encode_data
 
-    Description:  Outputs the data in a variety of formats and media.
+    Description:  Return the data document in the requested format.  Each
+        format is only encoded once and then reused by all of the sinks.
+        The Check entries are expanded one at a time as they are encoded,
+        only the pprint format needs an expanded copy of the document.
 
     Arguments:
         (input) data -> JSON data document
-        (input) kwargs:
-            to_addr -> To email address
-            subj -> Email subject line
-            mailx -> True|False - Use mailx command
-            outfile -> Name of output file name
-            mode -> w|a => Write or append mode for file
-            expand -> True|False - Expand the JSON format
-            indent -> Indentation of JSON document if expanded
-            suppress -> True|False - Suppress standard out
-        (output) state -> True|False - Successful operation
-        (output) msg -> None or error message
+        (input) encoded -> Dictionary of the formats already encoded
+        (input) fmt -> json|pprint|str - Format to encode to
+        (input) indent -> Indentation of the document
+        (output) Encoded data document
 
     """
 
-    state = True
-    msg = None
+    key = (fmt, indent)
 
-    if not isinstance(data, dict):
-        return False, f"Error: Is not a dictionary: {data}"
+    if key not in encoded:
+        if fmt == "json":
+            encoded[key] = json.dumps(data, indent=indent,
+                                      default=check_default)
 
-    mail = None
-    data = dict(data)
-    cfg = {"indent": kwargs.get("indent", 4)} if kwargs.get("indent", False) \
-        else {}
+        elif fmt == "pprint":
+            cfg = {"indent": indent} if indent else {}
+            encoded[key] = pprint.pformat(expand_doc(data), **cfg)
 
-    if kwargs.get("to_addr", False):
-        subj = kwargs.get("subj", "MySQLRepCompare")
-        mail = gen_class.setup_mail(kwargs.get("to_addr"), subj=subj)
-        mail.add_2_msg(json.dumps(data, **cfg))
-        mail.send_mail(use_mailx=kwargs.get("mailx", False))
+        else:
+            encoded[key] = str(data)
 
-    if kwargs.get("outfile", False):
-        if kwargs.get("expand", False):
-            with open(kwargs.get("outfile"), kwargs.get("mode", "w"),
-                      encoding="UTF-8") as outfile:
-                pprint.pprint(data, stream=outfile, **cfg)
+    return encoded[key]
 
-        else:
-            gen_libs.write_file(
-                kwargs.get("outfile"), kwargs.get("mode", "w"),
-                json.dumps(data, indent=kwargs.get("indent")))
 
-    if not kwargs.get("suppress", False):
-        if kwargs.get("expand", False):
-            pprint.pprint(data, **cfg)
+def compress_body(body):
 
-        else:
-            print(data)
+    """Function:  compress_body
 
-    return state, msg
+    Description:  Compress an email body with gzip and base64 encode it.
 
+    Arguments:
+        (input) body -> Email body
+        (output) Compressed and encoded email body
 
-def recur_tbl_cmp(master, slave, dbs, tbl, recur=0):
+    """
 
-    """Function:  recur_tbl_cmp
+    return "Content is gzip compressed and base64 encoded:\n" \
+        + base64.encodebytes(gzip.compress(body.encode("UTF-8"))).decode()
 
-    Description:  Recursive call to check a table between the master and
-        replica databases.  Will compare the table's checksums and if not same,
-        then recursively call itself to N levels with a specific time period
-        between calls.
+
+def mail_sink(mail, body, use_mailx=False):
+
+    """Function:  mail_sink
+
+    Description:  Send the email.  Runs in the background sink pool.
 
     Arguments:
-        (input) master -> Master instance
-        (input) slave -> Slave instance
-        (input) dbs -> Database name
-        (input) tbl -> Table name
-        (input) recur -> Current level of recursion
-        (output) data -> Status of the table comparsion
+        (input) mail -> Mail instance
+        (input) body -> Email body
+        (input) use_mailx -> True|False - Use mailx command
 
     """
 
-    if recur < 4:
+    with phase("sink", sink="mail"):
+        mail.add_2_msg(body)
+        mail.send_mail(use_mailx=use_mailx)
 
-        if mysql_libs.checksum(master, dbs, tbl) == \
-           mysql_libs.checksum(slave, dbs, tbl):
-            data = "Synced"
 
-        else:
-            time.sleep(5)
-            data = recur_tbl_cmp(master, slave, dbs, tbl, recur + 1)
+def sink_pool():
 
-    else:
-        data = "Checksums do not match"
+    """Function:  sink_pool
 
-    return data
+    Description:  Return the thread pool of the background sinks.  The pool is
+        created on first use.
 
+    Arguments:
+        (output) SINK_POOL[0] -> ThreadPoolExecutor instance
 
-def setup_cmp(args, master, slave):
+    """
 
-    """Function:  setup_cmp
+    if not SINK_POOL:
+        SINK_POOL.append(futures.ThreadPoolExecutor(max_workers=2))
 
-    Description:  Setup the comparsion check getting list of databases and
-        tables then calling the compare function.
+    return SINK_POOL[0]
 
-    Arguments:
-        (input) args -> ArgParser class instance
-        (input) master -> Master instance
-        (input) slave -> Slave instance
 
-    """
+def wait_sinks():
 
-    db_list = args.get_val("-C", def_val=[])
-    tbls = args.get_val("-t", def_val=[])
-    cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
-    mst_db_tbl = mysql_libs.get_db_tbl(
-        master, db_list=db_list, tbls=tbls, ign_dbs=cfg.ign_dbs,
-        ign_db_tbl=cfg.ign_db_tbl)
-    results = get_json_template(master)
-    results["Master"] = master.name
-    results["Slave"] = slave.name
-    results["Checks"] = {}
-    data_config = dict(create_data_config(args))
+    """Function:  wait_sinks
 
-    for dbs in mst_db_tbl:                              # pylint:disable=C0206
-        results["Checks"][dbs] = []
-        for tbl in mst_db_tbl[dbs]:
-            # Recursion to ensure tables are out of sync if detected
-            recur = 1
-            data = recur_tbl_cmp(master, slave, dbs, tbl, recur)
+    Description:  Wait for the background sinks to finish.
 
-            if args.arg_exist("-b"):
-                if data != "Synced":
-                    results["Checks"][dbs].append(
-                        {"Table": tbl, "Status": data})
+    Arguments:
+        (output) state -> True|False - All sinks finished successfully
 
-            else:
-                results["Checks"][dbs].append({"Table": tbl, "Status": data})
+    """
 
-    state = data_out(results, **data_config)
+    state = True
 
-    if not state[0]:
-        print(f"setup_cmp: Error encountered: {state[1]}")
+    while PENDING_SINKS:
+        try:
+            PENDING_SINKS.pop(0).result()
 
+        except Exception as err:                        # pylint:disable=W0718
+            print(f"wait_sinks: Error encountered: {err}")
+            state = False
 
-def run_program(args):
+    return state
 
-    """Function:  run_program
 
-    Description:  Creates class instance(s) and controls flow of the program.
+def rotate_due(outfile, rotate_size=None, rotate_period=None):
+
+    """Function:  rotate_due
+
+    Description:  Determine whether the output file is due to be rotated.
 
     Arguments:
-        (input) args -> ArgParser class instance
+        (input) outfile -> Name of output file name
+        (input) rotate_size -> Rotate when larger than N MB
+        (input) rotate_period -> hourly|daily - Rotate when last written in a
+            previous period
+        (output) True|False - Output file is due to be rotated
 
     """
 
-    master = mysql_libs.create_instance(
-        args.get_val("-c"), args.get_val("-d"), mysql_class.MasterRep)
-    master.connect(silent=True)
+    if not os.path.isfile(outfile) or not os.path.getsize(outfile):
+        return False
 
-    server_type = mysql_class.SlaveRep
+    if rotate_size and \
+       os.path.getsize(outfile) > float(rotate_size) * 1048576:
+        return True
 
-    if args.arg_exist("-i"):
-        server_type = mysql_class.Server
+    if rotate_period:
+        fmt = "%Y%m%d%H" if rotate_period == "hourly" else "%Y%m%d"
+        mtime = datetime.datetime.fromtimestamp(os.path.getmtime(outfile))
 
-    slave = mysql_libs.create_instance(
-        args.get_val("-r"), args.get_val("-d"), server_type)
-    slave.connect(silent=True)
+        return mtime.strftime(fmt) != datetime.datetime.now().strftime(fmt)
 
-    if master.conn_msg or slave.conn_msg:
-        print("run_program: Error encountered with connection of master/slave")
-        print(f"\tMaster:  {master.conn_msg}")
-        print(f"\tSlave:  {slave.conn_msg}")
-        return
+    return False
 
-    if args.arg_exist("-i"):
-        setup_cmp(args, master, slave)
-        mysql_libs.disconnect(master, slave)
 
-    else:
-        # Determine datatype of server_id and convert appropriately.
-        #   Required for mysql.connector v1.1.6 as this version assigns the
-        #   id to a different datatype then later mysql.connector versions.
-        sid = "Server_Id" if master.version >= (8, 0, 26) else "Server_id"
-        slv_list = gen_libs.dict_2_list(master.show_slv_hosts(), sid)
-        slv_id = str(slave.server_id) \
-            if isinstance(slv_list[0], str) else slave.server_id
+def rotate_file(outfile, keep=5):
 
-        # Is slave in replication with master
-        if slv_id in slv_list:
-            setup_cmp(args, master, slave)
-            mysql_libs.disconnect(master, slave)
+    """Function:  rotate_file
 
-        else:
-            mysql_libs.disconnect(master, slave)
-            print("Error:  Slave is not in replication with Master.")
+    Description:  Rotate the output file, the newest rotated file has the .1
+        suffix.  Rotated files past the retention count are removed.
+
+    Arguments:
+        (input) outfile -> Name of output file name
+        (input) keep -> Number of rotated files to keep
 
+    """
 
-def main():
+    keep = int(keep)
 
-    """Function:  main
+    for cnt in range(keep, 0, -1):
+        name = f"{outfile}.{cnt}"
 
-    Description:  Initializes program-wide used variables and processes command
-        line arguments and values.
+        if os.path.isfile(name):
+            if cnt == keep:
+                os.remove(name)
 
-    Variables:
-        dir_perms_chk -> contains directories and their octal permissions
-        file_perms -> file check options with their perms in octal
-        file_crt_list -> contains options which require files to be created
-        multi_val -> contains the options that will have multiple values
-        opt_con_req_list -> contains the options that require other options
-        opt_def_dict -> contains options with their default values
-        opt_req_list -> contains the options that are required for the program
-        opt_req_xor_list -> contains a list of options that are required XOR
-        opt_val_list -> contains options which require values
+            else:
+                os.replace(name, f"{outfile}.{cnt + 1}")
 
-    Arguments:
-        (input) argv -> Arguments from the command line
+    if keep:
+        os.replace(outfile, f"{outfile}.1")
 
-    """
+    else:
+        os.remove(outfile)
 
-    dir_perms_chk = {"-d": 5}
-    file_perms = {"-o": 6}
-    file_crt_list = ["-o"]
-    multi_val = ["-C", "-e", "-s", "-t"]
-    opt_con_req_list = {"-t": ["-C"], "-s": ["-e"], "-u": ["-e"], "-w": ["-o"]}
-    opt_def_dict = {"-C": [], "-t": None, "-n": 4}
-    opt_req_list = ["-r", "-c", "-d"]
-    opt_val_list = ["-r", "-c", "-d", "-e", "-s", "-y", "-C", "-n", "-t"]
 
-    # Process argument list from command line.
-    args = gen_class.ArgParser(
-        sys.argv, opt_val=opt_val_list, multi_val=multi_val,
-        opt_def=opt_def_dict)
+def write_outfile(outfile, text, **kwargs):
 
-    if args.arg_parse2()                                                    \
-       and not gen_libs.help_func(args, __version__, help_message)          \
-       and args.arg_require(opt_req=opt_req_list)                           \
-       and args.arg_cond_req(opt_con_req=opt_con_req_list)                  \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                    \
-       and args.arg_file_chk(file_perm_chk=file_perms, file_crt=file_crt_list):
+    """Function:  write_outfile
 
-        try:
-            prog_lock = gen_class.ProgramLock(
-                sys.argv, args.get_val("-y", def_val=""))
-            run_program(args)
-            del prog_lock
+    Description:  Write the text to the output file.  The text is written to
+        a temporary file in the same directory which is then renamed into
+        place.  In append mode the current contents are copied to the
+        temporary file first, compressed files are appended to as a new
+        gzip member or zstd frame.  A new file has the default permissions
+        of the umask, an existing file keeps its permissions.
+
+    Arguments:
+        (input) outfile -> Name of output file name
+        (input) text -> Text to write
+        (input) kwargs:
+            mode -> w|a => Write or append mode for file
+            file_compress -> None|gzip|zstd - Compress the output file
+            rotate_size -> Rotate when larger than N MB
+            rotate_period -> hourly|daily - Rotate at the start of a period
+            keep -> Number of rotated files to keep
+
+    """
+
+    data = (text + "\n").encode("UTF-8")
+
+    if kwargs.get("file_compress") == "gzip":
+        data = gzip.compress(data)
+
+    elif kwargs.get("file_compress") == "zstd":
+        data = zstandard.ZstdCompressor().compress(data)
+
+    if rotate_due(outfile, kwargs.get("rotate_size"),
+                  kwargs.get("rotate_period")):
+        rotate_file(outfile, kwargs.get("keep", 5))
+
+    fdesc, tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(outfile)),
+        prefix="." + os.path.basename(outfile) + ".")
+
+    try:
+        with os.fdopen(fdesc, "wb") as fhdr:
+            if kwargs.get("mode", "w") == "a" and os.path.isfile(outfile):
+                with open(outfile, "rb") as old_fhdr:
+                    shutil.copyfileobj(old_fhdr, fhdr)
+
+            fhdr.write(data)
+
+        if os.path.isfile(outfile):
+            shutil.copymode(outfile, tmp_file)
+
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_file, 0o666 & ~umask)
+
+        os.replace(tmp_file, outfile)
+
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+
+
+def data_out(data, **kwargs):
+
+    """Function:  data_out
+
+    Description:  Outputs the data in a variety of formats and media.  The
+        document is encoded once per format and fanned out to the sinks.
+        The email is sent in the background, see wait_sinks.
+
+    Arguments:
+        (input) data -> JSON data document
+        (input) kwargs:
+            to_addr -> To email address
+            subj -> Email subject line
+            mailx -> True|False - Use mailx command
+            compress -> True|False - Compress large email bodies
+            outfile -> Name of output file name
+            mode -> w|a => Write or append mode for file
+            file_compress -> None|gzip|zstd - Compress the output file
+            rotate_size -> Rotate output file when larger than N MB
+            rotate_period -> hourly|daily - Rotate output file each period
+            keep -> Number of rotated output files to keep
+            expand -> True|False - Expand the JSON format
+            indent -> Indentation of JSON document if expanded
+            suppress -> True|False - Suppress standard out
+        (output) state -> True|False - Successful operation
+        (output) msg -> None or error message
+
+    """
+
+    state = True
+    msg = None
+
+    if not isinstance(data, dict):
+        return False, f"Error: Is not a dictionary: {data}"
+
+    if kwargs.get("file_compress") not in [None, "gzip", "zstd"]:
+        return False, \
+            f"Error: Invalid compression: {kwargs.get('file_compress')}"
+
+    if kwargs.get("file_compress") == "zstd" and not zstandard:
+        return False, "Error: zstandard module is not installed"
+
+    with phase("output"):
+        encoded = {}
+        indent = kwargs.get("indent", None)
+        cfg_indent = indent if indent else None
+        fmt = "pprint" if kwargs.get("expand", False) else "json"
+
+        if kwargs.get("to_addr", False):
+            subj = kwargs.get("subj", "MySQLRepCompare")
+            mail = gen_class.setup_mail(kwargs.get("to_addr"), subj=subj)
+            body = encode_data(data, encoded, "json", cfg_indent)
+
+            if kwargs.get("compress", False) \
+                    and len(body) > MAIL_COMPRESS_SIZE:
+                body = compress_body(body)
+
+            PENDING_SINKS.append(sink_pool().submit(
+                contextvars.copy_context().run, mail_sink, mail, body,
+                kwargs.get("mailx", False)))
+
+        if kwargs.get("outfile", False):
+            text = encode_data(
+                data, encoded, fmt,
+                cfg_indent if kwargs.get("expand", False) else indent)
+
+            with phase("sink", sink="file"):
+                write_outfile(
+                    kwargs.get("outfile"), text, mode=kwargs.get("mode", "w"),
+                    file_compress=kwargs.get("file_compress"),
+                    rotate_size=kwargs.get("rotate_size"),
+                    rotate_period=kwargs.get("rotate_period"),
+                    keep=kwargs.get("keep", 5))
+
+        if not kwargs.get("suppress", False):
+            text = encode_data(data, encoded,
+                               fmt if kwargs.get("expand", False) else "str",
+                               cfg_indent)
+
+            with phase("sink", sink="stdout"):
+                print(text)
+
+    return state, msg
+
+
+def keep_checksum(checksum, last, server, dbs, tbl):
+
+    """Function:  keep_checksum
+
+    Description:  Return a table's checksum and keep it as the last checksum
+        of the server.
+
+    Arguments:
+        (input) checksum -> Function returning a table's checksum
+        (input) last -> Dictionary of the last checksum of each server
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) Checksum of the table
+
+    """
+
+    last[server] = checksum(server, dbs, tbl)
+
+    return last[server]
+
+
+def recur_tbl_cmp(                                # pylint:disable=R0913,R0917
+        master, slave, dbs, tbl, recur=0, stats=None, checksum=None):
+
+    """Function:  recur_tbl_cmp
+
+    Description:  Recursive call to check a table between the master and
+        replica databases.  Will compare the table's checksums and if not same,
+        then recursively call itself to N levels with a specific time period
+        between calls.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) recur -> Current level of recursion
+        (input) stats -> Dictionary to record ChecksumTime and Retries in
+        (input) checksum -> Function returning a table's checksum
+            Default is mysql_libs.checksum
+        (output) data -> Status of the table comparison
+
+    """
+
+    checksum = checksum or mysql_libs.checksum
+
+    if recur < 4:
+        start = time.perf_counter()
+        with phase("compare", db=dbs, table=tbl, server=master.name):
+            mst_chk = checksum(master, dbs, tbl)
+
+        with phase("compare", db=dbs, table=tbl, server=slave.name):
+            slv_chk = checksum(slave, dbs, tbl)
+
+        if stats is not None:
+            stats["ChecksumTime"] = stats.get("ChecksumTime", 0) \
+                + time.perf_counter() - start
+
+        if mst_chk == slv_chk:
+            data = "Synced"
+
+        else:
+            if stats is not None:
+                stats["Retries"] = stats.get("Retries", 0) + 1
+
+            with phase("retry-wait", db=dbs, table=tbl):
+                time.sleep(5)
+
+            data = recur_tbl_cmp(master, slave, dbs, tbl, recur + 1, stats,
+                                 checksum)
+
+    else:
+        data = "Checksums do not match"
+
+    return data
+
+
+def quote_name(name):
+
+    """Function:  quote_name
+
+    Description:  Quote a database, table, column or partition name for use
+        in a SQL statement.
+
+    Arguments:
+        (input) name -> Name of the object
+        (output) Name enclosed in backticks
+
+    """
+
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def quote_str(value):
+
+    """Function:  quote_str
+
+    Description:  Quote a string for use as a literal in a SQL statement.
+
+    Arguments:
+        (input) value -> String value
+        (output) Value enclosed in single quotes
+
+    """
+
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def get_columns(server, dbs, tbl):
+
+    """Function:  get_columns
+
+    Description:  Return the column names of a table in ordinal order.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) List of column names
+
+    """
+
+    cmd = "select column_name as Name from information_schema.columns" \
+        " where table_schema = %s and table_name = %s" \
+        " order by ordinal_position"
+
+    return [item["Name"] for item in server.col_sql(cmd, params=(dbs, tbl))]
+
+
+def glob_like(pattern):
+
+    """Function:  glob_like
+
+    Description:  Convert a glob pattern (* and ?) to a SQL LIKE pattern.
+
+    Arguments:
+        (input) pattern -> Glob pattern
+        (output) SQL LIKE pattern
+
+    """
+
+    for char in ["\\", "%", "_"]:
+        pattern = pattern.replace(char, "\\" + char)
+
+    return pattern.replace("*", "%").replace("?", "_")
+
+
+def size_range(value):
+
+    """Function:  size_range
+
+    Description:  Parse a size range in MB of the form min:max into bytes.
+        Either side of the range may be left empty.
+
+    Arguments:
+        (input) value -> Size range, i.e. 10:500, 10: or :500
+        (output) (min, max) -> Sizes in bytes or None if no limit
+            None if the size range is not valid
+
+    """
+
+    low, sep, high = str(value).partition(":")
+
+    if not sep or not all(item.strip().isdigit() for item in [low, high]
+                          if item.strip()):
+        return None
+
+    return tuple(int(item) * 1048576 if item.strip() else None
+                 for item in [low, high])
+
+
+def tbl_patterns(patterns):
+
+    """Function:  tbl_patterns
+
+    Description:  Build a SQL expression matching database.table against any
+        of the patterns.  Patterns are glob patterns unless prefixed with re:
+        for a regular expression.
+
+    Arguments:
+        (input) patterns -> List of patterns
+        (output) expr -> SQL expression
+        (output) params -> List of the expression parameters
+
+    """
+
+    full_name = "concat(table_schema, '.', table_name)"
+    exprs = []
+    params = []
+
+    for item in patterns:
+        if item.startswith("re:"):
+            exprs.append(f"{full_name} regexp %s")
+            params.append(item[3:])
+
+        else:
+            exprs.append(f"{full_name} like %s")
+            params.append(glob_like(item))
+
+    return "(" + " or ".join(exprs) + ")", params
+
+
+def db_query(**kwargs):
+
+    """Function:  db_query
+
+    Description:  Build the information_schema query of the databases to be
+        compared.
+
+    Arguments:
+        (input) **kwargs:
+            db_list -> List of databases to compare
+            ign_dbs -> Databases to ignore
+        (output) cmd -> SQL select statement
+        (output) params -> List of the statement parameters
+
+    """
+
+    where = []
+    params = []
+
+    for column, items in [
+            ("schema_name not in", sorted(kwargs.get("ign_dbs") or [])),
+            ("schema_name in", list(kwargs.get("db_list") or []))]:
+        if items:
+            where.append(f"{column} ({', '.join(['%s'] * len(items))})")
+            params.extend(items)
+
+    cmd = "select schema_name as SchemaName from information_schema.schemata"
+
+    if where:
+        cmd = cmd + " where " + " and ".join(where)
+
+    return cmd, params
+
+
+def tbl_query(dbs, after=None, limit=None, **kwargs):    # pylint:disable=R0914
+
+    """Function:  tbl_query
+
+    Description:  Build the information_schema query of the tables of a
+        database to be compared.  The selection rules are evaluated in the
+        query, so tables that are filtered out are never returned.  The
+        database is matched on its name alone so the server only reads the
+        one database.  The tables are returned in binary table order, a page
+        at a time when a limit is passed.  The binary order is the same on
+        all servers and in Python, so table lists from two servers can be
+        merged.
+
+    Arguments:
+        (input) dbs -> Database name
+        (input) after -> Table to return the tables after
+        (input) limit -> Maximum number of tables to return
+        (input) **kwargs:
+            tbls -> List of tables to compare
+            ign_db_tbl -> Dictionary of databases and tables to ignore
+            include -> Patterns of the tables to compare
+            exclude -> Patterns of the tables not to compare
+            skip_engines -> Storage engines not to compare
+            size -> (min, max) size range in bytes
+            skip_views -> True|False - Only compare base tables
+        (output) cmd -> SQL select statement
+        (output) params -> List of the statement parameters
+
+    """
+
+    where = ["table_schema = %s"]
+    params = [dbs]
+    in_lists = [
+        ("table_name in", list(kwargs.get("tbls") or [])),
+        ("table_name not in",
+         sorted((kwargs.get("ign_db_tbl") or {}).get(dbs) or [])),
+        ("upper(coalesce(engine, '')) not in",
+         [item.upper() for item in kwargs.get("skip_engines") or []])]
+
+    for column, items in in_lists:
+        if items:
+            where.append(f"{column} ({', '.join(['%s'] * len(items))})")
+            params.extend(items)
+
+    for key, prefix in [("include", ""), ("exclude", "not ")]:
+        if kwargs.get(key):
+            expr, expr_params = tbl_patterns(kwargs.get(key))
+            where.append(prefix + expr)
+            params.extend(expr_params)
+
+    for oper, bound in zip([">=", "<="], kwargs.get("size") or []):
+        if bound is not None:
+            where.append(f"coalesce(data_length, 0)"
+                         f" + coalesce(index_length, 0) {oper} %s")
+            params.append(bound)
+
+    if kwargs.get("skip_views"):
+        where.append("table_type = 'BASE TABLE'")
+
+    if after is not None:
+        where.append(f"{TBL_ORDER} > cast(%s as binary)")
+        params.append(after)
+
+    cmd = "select table_name as TableName, engine as Engine, table_type as" \
+        " TableType, table_rows as TableRows, data_length as DataLength," \
+        " index_length as IndexLength, create_options as CreateOptions" \
+        " from information_schema.tables where " + " and ".join(where) \
+        + " order by " + TBL_ORDER
+
+    if limit:
+        cmd = cmd + " limit %s"
+        params.append(limit)
+
+    return cmd, params
+
+
+def iter_tables(server, page_size=PAGE_SIZE, **kwargs):
+
+    """Function:  iter_tables
+
+    Description:  Generator of the tables to be compared in database and table
+        order.  The databases are read first and sorted in binary order, then
+        the tables of each database are read a page at a time, so the first
+        table is returned straight away and memory use does not grow with
+        the number of tables.  If tables are passed then only the first
+        database is checked.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) page_size -> Number of tables read per query
+        (input) **kwargs:
+            See db_query and tbl_query for the selection rules
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    kwargs = dict(kwargs)
+
+    if kwargs.get("tbls"):
+        kwargs["db_list"] = list(kwargs.get("db_list") or [])[:1]
+
+    cmd, params = db_query(**kwargs)
+
+    with phase("enumerate", server=server.name):
+        names = sorted(sys.intern(item["SchemaName"]) for item in
+                       server.col_sql(cmd, params=tuple(params)))
+
+    for dbs in names:
+        after = None
+
+        while True:
+            cmd, params = tbl_query(
+                dbs, after=after, limit=page_size, **kwargs)
+            with phase("enumerate", server=server.name):
+                page = server.col_sql(cmd, params=tuple(params))
+
+            for item in page:
+                yield (dbs, item["TableName"],
+                       {key: item.get(key) for key in TBL_META})
+
+            if len(page) < page_size:
+                break
+
+            after = page[-1]["TableName"]
+
+
+def diff_tables(mst_tables, slv_tables):
+
+    """Function:  diff_tables
+
+    Description:  Generator merging the master's and slave's table lists,
+        both in database and table order.  Tables only on one of the servers
+        have a Status added to their metadata and are not to be compared.
+        Tables on both servers have the slave's engine and create options
+        added to the master's metadata.
+
+    Arguments:
+        (input) mst_tables -> Iterable of the master's tables
+        (input) slv_tables -> Iterable of the slave's tables
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    mst_tables = iter(mst_tables)
+    slv_tables = iter(slv_tables)
+    mst_item = next(mst_tables, None)
+    slv_item = next(slv_tables, None)
+
+    while mst_item or slv_item:
+        if not slv_item or (mst_item and mst_item[:2] < slv_item[:2]):
+            yield (mst_item[0], mst_item[1],
+                   dict(mst_item[2], Status="Missing on slave"))
+            mst_item = next(mst_tables, None)
+
+        elif not mst_item or slv_item[:2] < mst_item[:2]:
+            yield (slv_item[0], slv_item[1],
+                   dict(slv_item[2], Status="Extra on slave"))
+            slv_item = next(slv_tables, None)
+
+        else:
+            yield (mst_item[0], mst_item[1],
+                   dict(mst_item[2], SlaveEngine=slv_item[2].get("Engine"),
+                        SlaveCreateOptions=slv_item[2].get("CreateOptions")))
+            mst_item = next(mst_tables, None)
+            slv_item = next(slv_tables, None)
+
+
+def name_rules(rules):
+
+    """Function:  name_rules
+
+    Description:  Return the selection rules on the database and table names
+        only.  The attribute rules (-E, -L and -V) are left out of the
+        slave's query, as a table filtered out by its attributes on the
+        slave would otherwise be reported as missing on the slave.
+
+    Arguments:
+        (input) rules -> Dictionary of the iter_tables selection rules
+        (output) Dictionary of the name selection rules
+
+    """
+
+    return {key: value for key, value in rules.items()
+            if key not in ATTR_RULES}
+
+
+def attr_filter(tables, master, rules):
+
+    """Function:  attr_filter
+
+    Description:  Generator dropping the tables only on the slave which are
+        not to be compared.  The master's tables are read with all of the
+        selection rules and the slave's with the name rules only, so a table
+        the attribute rules (-E, -L and -V) filtered out on the master shows
+        as extra on the slave.  A table failing the rules on the slave's
+        metadata is dropped, any other is dropped if the master has it.
+
+    Arguments:
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) master -> Master instance
+        (input) rules -> Dictionary of the iter_tables selection rules
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    engines = {item.upper() for item in rules.get("skip_engines") or []}
+    low, high = rules.get("size") or (None, None)
+
+    for item in tables:
+        meta = item[2]
+
+        if meta.get("Status") != "Extra on slave":
+            yield item
+            continue
+
+        size = int(meta.get("DataLength") or 0) \
+            + int(meta.get("IndexLength") or 0)
+        failed = [(meta.get("Engine") or "").upper() in engines,
+                  rules.get("skip_views")
+                  and meta.get("TableType") != "BASE TABLE",
+                  low is not None and size < low,
+                  high is not None and size > high]
+
+        if any(failed) or next(iter_tables(
+                master, db_list=[item[0]], tbls=[item[1]]), None):
+            continue
+
+        yield item
+
+
+def schema_hashes(server, dbs):
+
+    """Function:  schema_hashes
+
+    Description:  Return a hash of each table's definition in a database.
+        The columns and indexes of all of the tables are read in one query
+        each.  The integer display widths are dropped from the column types
+        as these are not shown by all MySQL versions.  Servers before MySQL
+        8.0.13 have no functional indexes and a null expression is hashed
+        for each index column, as newer servers return for a plain index.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (output) hashes -> Dictionary of table names and definition hashes
+
+    """
+
+    expression = "expression" if server.version >= (8, 0, 13) \
+        else "null as expression"
+    cmds = [
+        "select table_name as TableName, column_name, ordinal_position,"
+        " column_type, is_nullable, column_default, extra, collation_name"
+        " from information_schema.columns where table_schema = %s"
+        " order by table_name, ordinal_position",
+        "select table_name as TableName, index_name, seq_in_index,"
+        f" column_name, non_unique, sub_part, index_type, {expression}"
+        " from information_schema.statistics where table_schema = %s"
+        " order by table_name, index_name, seq_in_index"]
+    hashes = {}
+
+    for cmd in cmds:
+        for item in server.col_sql(cmd, params=(dbs,)):
+            row = [re.sub(r"^(tinyint|smallint|mediumint|int|bigint)\(\d+\)",
+                          r"\1", str(item[key]))
+                   for key in sorted(item, key=str.lower)
+                   if key != "TableName"]
+            hashes.setdefault(item["TableName"], hashlib.sha256()).update(
+                repr(row).encode("UTF-8"))
+
+    return {tbl: digest.hexdigest() for tbl, digest in hashes.items()}
+
+
+def schema_filter(master, slave, tables):
+
+    """Function:  schema_filter
+
+    Description:  Generator which compares the table definitions on the
+        master and slave before any data is read.  The definitions are hashed
+        a database at a time as the tables are read.  Tables whose
+        definitions differ have a Status added to their metadata and are not
+        to be compared.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    cur_db = None
+    hashes = ({}, {})
+
+    for dbs, tbl, meta in tables:
+        if meta.get("Status"):
+            yield dbs, tbl, meta
+            continue
+
+        if dbs != cur_db:
+            cur_db = dbs
+            hashes = (schema_hashes(master, dbs), schema_hashes(slave, dbs))
+
+        if hashes[0].get(tbl) != hashes[1].get(tbl):
+            meta = dict(meta, Status="Schema differs")
+
+        yield dbs, tbl, meta
+
+
+def tbl_strategy(args, meta):
+
+    """Function:  tbl_strategy
+
+    Description:  Choose how a table is to be compared from its storage
+        engine and create options.  Tables of engines without lasting data
+        are skipped, tables whose engine or row format differs between the
+        servers are compared on their row values, and tables with a live
+        checksum on both servers have it read without a scan.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) meta -> Metadata of the table
+        (output) Strategy: Skip, Row checksum, Quick checksum, Chunk hash or
+            Checksum
+
+    """
+
+    engine = (meta.get("Engine") or "").upper()
+    options = [(item or "").lower().split() for item in [
+        meta.get("CreateOptions"),
+        meta.get("SlaveCreateOptions", meta.get("CreateOptions"))]]
+    formats = [[item for item in opts if item.startswith("row_format=")]
+               for opts in options]
+
+    if engine in NO_CHECKSUM_ENGINES:
+        return "Skip"
+
+    if engine != (meta.get("SlaveEngine", meta.get("Engine")) or "").upper() \
+       or formats[0] != formats[1]:
+        return "Row checksum"
+
+    if engine in LIVE_CHECKSUM_ENGINES \
+       and all("checksum=1" in item for item in options):
+        return "Quick checksum"
+
+    if args.get_val("-Y"):
+        return "Chunk hash"
+
+    return "Checksum"
+
+
+def tbl_strategies(args, tables):
+
+    """Function:  tbl_strategies
+
+    Description:  Generator adding the comparison strategy to the metadata
+        of the tables to be compared.  Skipped tables have a Status added to
+        their metadata and are not to be compared.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    for dbs, tbl, meta in tables:
+        if not meta.get("Status"):
+            meta = dict(meta, Strategy=tbl_strategy(args, meta))
+
+            if meta["Strategy"] == "Skip":
+                meta["Status"] = "Skipped"
+
+        yield dbs, tbl, meta
+
+
+def get_partitions(server, dbs, tbl):
+
+    """Function:  get_partitions
+
+    Description:  Return the partitions of a table along with their metadata.
+        Subpartitions are rolled up into their parent partition.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) parts -> Dictionary of partition names and their metadata
+            Empty if the table is not partitioned
+
+    """
+
+    cmd = "select partition_name as Name, sum(table_rows) as TableRows," \
+        " sum(data_length) as DataLength, max(update_time) as UpdateTime" \
+        " from information_schema.partitions" \
+        " where table_schema = %s and table_name = %s" \
+        " and partition_name is not null" \
+        " group by partition_name, partition_ordinal_position" \
+        " order by partition_ordinal_position"
+    parts = {}
+
+    for item in server.col_sql(cmd, params=(dbs, tbl)):
+        updated = item["UpdateTime"]
+        parts[item["Name"]] = {
+            "TableRows": int(item["TableRows"] or 0),
+            "DataLength": int(item["DataLength"] or 0),
+            "UpdateTime": None if updated is None else str(updated)}
+
+    return parts
+
+
+def checksum_sql(cols):
+
+    """Function:  checksum_sql
+
+    Description:  Return the select list of the row count and order
+        independent checksum of a table's rows.
+
+    Arguments:
+        (input) cols -> List of column names
+        (output) Select list of the Cnt and Crc columns
+
+    """
+
+    return f"count(*) as Cnt, coalesce(bit_xor(crc32({row_sql(cols)})), 0)" \
+        " as Crc"
+
+
+def row_sql(cols):
+
+    """Function:  row_sql
+
+    Description:  Return the expression of a row's columns as one string.
+        The NULL flags of the columns are appended, so a NULL and an empty
+        string differ.
+
+    Arguments:
+        (input) cols -> List of column names
+        (output) SQL expression of the row
+
+    """
+
+    col_list = ", ".join(quote_name(col) for col in cols)
+    null_list = ", ".join("isnull(" + quote_name(col) + ")" for col in cols)
+
+    return f"concat_ws('#', {col_list}, concat({null_list}))"
+
+
+def key_column(server, dbs, tbl):
+
+    """Function:  key_column
+
+    Description:  Return the first column of a table's primary key if it is
+        an integer column.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) Column name or None
+
+    """
+
+    cmd = "select col.column_name as Name from information_schema.statistics" \
+        " stat join information_schema.columns col" \
+        " on col.table_schema = stat.table_schema" \
+        " and col.table_name = stat.table_name" \
+        " and col.column_name = stat.column_name" \
+        " where stat.table_schema = %s and stat.table_name = %s" \
+        " and stat.index_name = 'PRIMARY' and stat.seq_in_index = 1" \
+        " and col.data_type in" \
+        " ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')"
+    data = server.col_sql(cmd, params=(dbs, tbl))
+
+    return data[0]["Name"] if data else None
+
+
+def chunk_hashes(                                 # pylint:disable=R0913,R0917
+        server, dbs, tbl, key, cols, size):
+
+    """Function:  chunk_hashes
+
+    Description:  Return the 64-bit hash of each chunk of a table.  A chunk
+        holds the rows whose key divided by the chunk size rounds down to
+        the chunk number.  With numpy the rows are read from the cursor
+        straight into an array of CHUNK_DTYPE and its bytes are returned, so
+        two tables' hashes compare as one value.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) key -> Integer key column name
+        (input) cols -> List of column names
+        (input) size -> Chunk size in key values
+        (output) Bytes of the chunk array or a tuple of (chunk, hash) in
+            chunk order
+
+    """
+
+    cmd = f"select floor({quote_name(key)} / {int(size)}) as Chunk," \
+        f" bit_xor(cast(conv(left(md5({row_sql(cols)}), 16), 16, 10) as" \
+        f" unsigned)) as Crc from {quote_name(dbs)}.{quote_name(tbl)}" \
+        " group by Chunk order by Chunk"
+
+    with phase("compare", db=dbs, table=tbl, server=server.name):
+        rows = ((int(chunk), int(crc))
+                for chunk, crc in server.sql(cmd, res_set="row"))
+
+        if numpy:
+            return numpy.fromiter(rows, dtype=CHUNK_DTYPE).tobytes()
+
+        return tuple(rows)
+
+
+def chunk_ranges(mst, slv, size):
+
+    """Function:  chunk_ranges
+
+    Description:  Return the key ranges of the chunks that differ between
+        the master and slave.  With numpy the chunk arrays are read from the
+        bytes without a copy and compared with vectorised set operations.
+
+    Arguments:
+        (input) mst -> Master's chunk hashes from chunk_hashes
+        (input) slv -> Slave's chunk hashes from chunk_hashes
+        (input) size -> Chunk size in key values
+        (output) ranges -> List of [first key, last key] ranges
+
+    """
+
+    if numpy:
+        mst = numpy.frombuffer(mst, dtype=CHUNK_DTYPE)
+        slv = numpy.frombuffer(slv, dtype=CHUNK_DTYPE)
+        common, mst_idx, slv_idx = numpy.intersect1d(
+            mst["Chunk"], slv["Chunk"], assume_unique=True,
+            return_indices=True)
+        diffs = numpy.union1d(
+            numpy.setxor1d(mst["Chunk"], slv["Chunk"], assume_unique=True),
+            common[mst["Crc"][mst_idx] != slv["Crc"][slv_idx]]).tolist()
+
+    else:
+        mst, slv = dict(mst), dict(slv)
+        diffs = sorted(chunk for chunk in mst.keys() | slv.keys()
+                       if mst.get(chunk) != slv.get(chunk))
+
+    ranges = []
+
+    for chunk in diffs:
+        if ranges and ranges[-1][1] == chunk - 1:
+            ranges[-1][1] = chunk
+
+        else:
+            ranges.append([chunk, chunk])
+
+    return [[first * size, (last + 1) * size - 1] for first, last in ranges]
+
+
+def diff_ranges(master, slave, dbs, tbl, size):
+
+    """Function:  diff_ranges
+
+    Description:  Locate the key ranges of a table that differ between the
+        master and slave by comparing the hashes of its chunks.  The master
+        and slave hashes are read in parallel.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) size -> Chunk size in key values
+        (output) List of [first key, last key] ranges or None if the table
+            has no integer primary key
+
+    """
+
+    key = key_column(master, dbs, tbl)
+
+    if not key:
+        return None
+
+    cols = get_columns(master, dbs, tbl)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        mst, slv = [executor.submit(
+            contextvars.copy_context().run, chunk_hashes, server, dbs, tbl,
+            key, cols, size) for server in (master, slave)]
+
+        return chunk_ranges(mst.result(), slv.result(), size)
+
+
+def row_checksum(server, dbs, tbl, cols, part=None):
+
+    """Function:  row_checksum
+
+    Description:  Return the row count and an order independent checksum of
+        a table or of a single partition of a table.  Unlike a CHECKSUM
+        TABLE the rows are read with a select statement, so the checksum
+        will honor an open consistent snapshot transaction.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) cols -> List of column names
+        (input) part -> Partition name or None for the whole table
+        (output) Tuple of row count and checksum
+
+    """
+
+    cmd = f"select {checksum_sql(cols)}" \
+        f" from {quote_name(dbs)}.{quote_name(tbl)}"
+
+    if part:
+        cmd = cmd + f" partition ({quote_name(part)})"
+
+    with phase("compare", db=dbs, table=tbl, server=server.name,
+               partition=part):
+        data = server.col_sql(cmd)
+
+    return int(data[0]["Cnt"]), int(data[0]["Crc"])
+
+
+def quick_checksum(server, dbs, tbl):
+
+    """Function:  quick_checksum
+
+    Description:  Return the live checksum of a table kept by its storage
+        engine, without a scan of the table.  If the server does not have a
+        live checksum for the table, then the table is checksummed as usual.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) data -> Checksum of the table
+
+    """
+
+    data = server.col_sql(
+        f"checksum table {quote_name(dbs)}.{quote_name(tbl)} quick")
+
+    if not data or data[0].get("Checksum") is None:
+        data = mysql_libs.checksum(server, dbs, tbl)
+
+    return data
+
+
+def tbl_checksum(args, master, dbs, tbl, strategy):
+
+    """Function:  tbl_checksum
+
+    Description:  Return the checksum function of a table's strategy.  A
+        chunk hash needs an integer primary key, a table without one is
+        checksummed instead.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) strategy -> Strategy of the table or None
+        (output) strategy -> Strategy used
+        (output) Function returning a table's checksum
+
+    """
+
+    if strategy == "Quick checksum":
+        return strategy, quick_checksum
+
+    if strategy == "Row checksum":
+        return strategy, functools.partial(
+            row_checksum, cols=get_columns(master, dbs, tbl))
+
+    key = key_column(master, dbs, tbl) if strategy == "Chunk hash" else None
+
+    if key:
+        return strategy, functools.partial(
+            chunk_hashes, key=key, cols=get_columns(master, dbs, tbl),
+            size=int(args.get_val("-Y")))
+
+    return "Checksum", mysql_libs.checksum
+
+
+def part_tbl_cmp(                                 # pylint:disable=R0913,R0917
+        master, slave, dbs, tbl, parts, recur=1):
+
+    """Function:  part_tbl_cmp
+
+    Description:  Compare a partitioned table between the master and replica
+        databases one partition at a time.  The master and replica
+        checksums of a partition are run in parallel.  Partitions that are
+        not the same are re-checked to N levels with a specific time period
+        between checks, the same as recur_tbl_cmp.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) parts -> List of partition names to compare
+        (input) recur -> Current level of recursion
+        (output) diffs -> List of partition names not in sync
+
+    """
+
+    diffs = list(parts)
+    cols = get_columns(master, dbs, tbl)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        while diffs and recur < 4:
+            mismatch = []
+
+            for part in diffs:
+                mst = executor.submit(
+                    contextvars.copy_context().run, row_checksum, master, dbs,
+                    tbl, cols, part)
+                slv = executor.submit(
+                    contextvars.copy_context().run, row_checksum, slave, dbs,
+                    tbl, cols, part)
+
+                if mst.result() != slv.result():
+                    mismatch.append(part)
+
+            diffs = mismatch
+            recur += 1
+
+            if diffs and recur < 4:
+                with phase("retry-wait", db=dbs, table=tbl):
+                    time.sleep(5)
+
+    return diffs
+
+
+def load_part_state(state_file):
+
+    """Function:  load_part_state
+
+    Description:  Load the partition state from the last run.
+
+    Arguments:
+        (input) state_file -> Path and file name of the state file
+        (output) Dictionary of tables and their synced partition metadata
+
+    """
+
+    if state_file and os.path.isfile(state_file):
+        with open(state_file, "r", encoding="UTF-8") as fhdr:
+            return json.load(fhdr)
+
+    return {}
+
+
+def save_part_state(state_file, state):
+
+    """Function:  save_part_state
+
+    Description:  Save the partition state for the next run.
+
+    Arguments:
+        (input) state_file -> Path and file name of the state file
+        (input) state -> Dictionary of tables and their synced partition
+            metadata
+
+    """
+
+    if state_file:
+        with open(state_file, "w", encoding="UTF-8") as fhdr:
+            json.dump(state, fhdr)
+
+
+def part_status(                                  # pylint:disable=R0913,R0917
+        master, slave, dbs, tbl, parts, state, recur=1):
+
+    """Function:  part_status
+
+    Description:  Compare a partitioned table and return its status entry.
+        Partitions which were in sync during the last run and whose
+        metadata has not changed are skipped, a partition without an update
+        time is always compared.  The state is updated with the partitions
+        that are now in sync.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) parts -> Dictionary of partition names and their metadata
+        (input) state -> Dictionary of tables and synced partition metadata
+        (input) recur -> Starting level of recursion
+        (output) entry -> Status entry of the table
+
+    """
+
+    key = f"{dbs}.{tbl}"
+    last = state.get(key, {})
+    todo = [part for part in parts if last.get(part) != parts[part]
+            or parts[part]["UpdateTime"] is None]
+    diffs = part_tbl_cmp(master, slave, dbs, tbl, todo, recur=recur)
+    state[key] = {
+        part: parts[part] for part in parts if part not in diffs}
+
+    if diffs:
+        entry = {"Table": tbl, "Status": "Partitions do not match",
+                 "Partitions": diffs}
+
+    else:
+        entry = {"Table": tbl, "Status": "Synced"}
+
+    return entry
+
+
+def open_snapshot(master, slave, timeout=60):
+
+    """Function:  open_snapshot
+
+    Description:  Open a consistent snapshot on the master and replica at
+        the same GTID set.  The replica's SQL thread is stopped first so the
+        replica cannot be ahead of the master's snapshot, then restarted
+        once the replica's snapshot is open.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) timeout -> Seconds to wait for the replica to catch up
+        (output) gtid -> GTID set of the snapshots or None if the replica
+            did not reach the master's GTID set
+
+    """
+
+    term = "replica" if slave.version >= (8, 0, 22) else "slave"
+    slave.sql(f"stop {term} sql_thread")
+
+    try:
+        master.sql("flush tables with read lock")
+
+        try:
+            master.sql("start transaction with consistent snapshot")
+            gtid = master.col_sql(
+                "select @@global.gtid_executed as Gtid")[0]["Gtid"]
+            gtid = gtid.replace("\n", "")
+
+        finally:
+            master.sql("unlock tables")
+
+        slave.sql(f"start {term} sql_thread until sql_after_gtids = '{gtid}'")
+        status = slave.col_sql(
+            "select wait_for_executed_gtid_set(%s, %s) as Status",
+            params=(gtid, int(timeout)))
+
+        if int(status[0]["Status"]) == 0:
+            slave.sql("start transaction with consistent snapshot")
+
+        else:
+            master.sql("rollback")
+            gtid = None
+
+    finally:
+        slave.sql(f"stop {term} sql_thread")
+        slave.sql(f"start {term} sql_thread")
+
+    return gtid
+
+
+def close_snapshot(master, slave):
+
+    """Function:  close_snapshot
+
+    Description:  Close the consistent snapshots on the master and replica.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+
+    """
+
+    master.sql("commit")
+    slave.sql("commit")
+
+
+def get_sources(server):
+
+    """Function:  get_sources
+
+    Description:  Return the server UUIDs of the sources a replica replicates
+        from.
+
+    Arguments:
+        (input) server -> Server instance
+        (output) sources -> Set of the sources' server UUIDs
+
+    """
+
+    if server.version >= (8, 0, 22):
+        rows, key = server.col_sql("show replica status"), "Source_UUID"
+
+    else:
+        rows, key = server.col_sql("show slave status"), "Master_UUID"
+
+    return {row[key] for row in rows if row.get(key)}
+
+
+def open_rep_snapshot(rep1, rep2, timeout=60):
+
+    """Function:  open_rep_snapshot
+
+    Description:  Open a consistent snapshot on two replicas at the same GTID
+        set.  Both replicas' SQL threads are stopped, the replica that is
+        behind is brought to the other replica's GTID set and the snapshots
+        are opened before the SQL threads are restarted.
+
+    Arguments:
+        (input) rep1 -> First replica instance
+        (input) rep2 -> Second replica instance
+        (input) timeout -> Seconds to wait for the replica behind to catch up
+        (output) gtid -> GTID set of the snapshots or None if the GTID sets
+            have diverged or the replica behind did not catch up
+
+    """
+
+    terms = ["replica" if rep.version >= (8, 0, 22) else "slave"
+             for rep in (rep1, rep2)]
+
+    for rep, term in zip((rep1, rep2), terms):
+        rep.sql(f"stop {term} sql_thread")
+
+    try:
+        gtids = [rep.col_sql("select @@global.gtid_executed as Gtid")[0]
+                 ["Gtid"].replace("\n", "") for rep in (rep1, rep2)]
+        subset = rep1.col_sql(
+            "select gtid_subset(%s, %s) as Behind1,"
+            " gtid_subset(%s, %s) as Behind2",
+            params=(gtids[0], gtids[1], gtids[1], gtids[0]))[0]
+
+        if int(subset["Behind1"]) and int(subset["Behind2"]):
+            gtid = gtids[0]
+
+        elif int(subset["Behind1"]) or int(subset["Behind2"]):
+            idx = 0 if int(subset["Behind1"]) else 1
+            gtid = gtids[1 - idx]
+            rep = (rep1, rep2)[idx]
+            rep.sql(f"start {terms[idx]} sql_thread until sql_after_gtids ="
+                    f" '{gtid}'")
+            status = rep.col_sql(
+                "select wait_for_executed_gtid_set(%s, %s) as Status",
+                params=(gtid, int(timeout)))
+            gtid = gtid if int(status[0]["Status"]) == 0 else None
+
+        else:
+            gtid = None
+
+        if gtid:
+            rep1.sql("start transaction with consistent snapshot")
+            rep2.sql("start transaction with consistent snapshot")
+
+    finally:
+        for rep, term in zip((rep1, rep2), terms):
+            rep.sql(f"stop {term} sql_thread")
+            rep.sql(f"start {term} sql_thread")
+
+    return gtid
+
+
+def snap_tbl_cmp(master, slave, dbs, tbl):
+
+    """Function:  snap_tbl_cmp
+
+    Description:  Check a table between the master and replica databases
+        within their consistent snapshots.  The master and replica checksums
+        are run in parallel and the table is only checked once.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) data -> Status of the table comparison
+
+    """
+
+    cols = get_columns(master, dbs, tbl)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        mst = executor.submit(
+            contextvars.copy_context().run, row_checksum, master, dbs, tbl,
+            cols)
+        slv = executor.submit(
+            contextvars.copy_context().run, row_checksum, slave, dbs, tbl,
+            cols)
+        data = "Synced" if mst.result() == slv.result() \
+            else "Checksums do not match"
+
+    return data
+
+
+def cmp_table(args, master, slave, dbs, tbl, **kwargs):  # pylint:disable=R0914
+
+    """Function:  cmp_table
+
+    Description:  Compare a table between the master and replica databases
+        using the comparison selected by the options.  With the -Y option
+        the key ranges out of sync are located from the last chunk hashes
+        of a chunk hash comparison, otherwise the chunk hashes are read.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) kwargs:
+            part_state -> Dictionary of tables and synced partition metadata
+            gtid -> GTID set of the consistent snapshots or None
+            stats -> Dictionary to record ChecksumTime and Retries in
+            meta -> Metadata of the table with its strategy
+        (output) entry -> Status entry of the table
+
+    """
+
+    gtid = kwargs.get("gtid", None)
+    stats = kwargs.get("stats", {})
+    last = {}
+
+    with phase("table", db=dbs, table=tbl):
+        start = time.perf_counter()
+        parts = get_partitions(master, dbs, tbl) \
+            if args.arg_exist("-P") else {}
+
+        if parts:
+            entry = part_status(
+                master, slave, dbs, tbl, parts, kwargs.get("part_state", {}),
+                recur=3 if gtid else 1)
+            stats["ChecksumTime"] = time.perf_counter() - start
+
+        elif gtid:
+            entry = {"Table": tbl,
+                     "Status": snap_tbl_cmp(master, slave, dbs, tbl)}
+            stats["ChecksumTime"] = time.perf_counter() - start
+
+        else:
+            # Recursion to ensure tables are out of sync if detected
+            recur = 1
+            strategy, checksum = tbl_checksum(
+                args, master, dbs, tbl, kwargs.get("meta", {}).get("Strategy"))
+
+            if strategy == "Chunk hash":
+                checksum = functools.partial(keep_checksum, checksum, last)
+
+            entry = {"Table": tbl,
+                     "Status": recur_tbl_cmp(master, slave, dbs, tbl, recur,
+                                             stats, checksum=checksum)}
+
+            if kwargs.get("meta", {}).get("Strategy"):
+                entry["Strategy"] = strategy
+
+        if args.get_val("-Y") and entry["Status"] == "Checksums do not match":
+            ranges = chunk_ranges(last[master], last[slave],
+                                  int(args.get_val("-Y"))) if last \
+                else diff_ranges(master, slave, dbs, tbl,
+                                 int(args.get_val("-Y")))
+
+            if ranges is not None:
+                entry["Ranges"] = ranges
+
+    return entry
+
+
+def status_code(status):
+
+    """Function:  status_code
+
+    Description:  Return the code of a table status, a status not yet known
+        is added to the list of statuses.
+
+    Arguments:
+        (input) status -> Status of a table
+        (output) Code of the status
+
+    """
+
+    if status not in STATUS_CODE:
+        STATUS_CODE[status] = len(STATUSES)
+        STATUSES.append(status)
+
+    return STATUS_CODE[status]
+
+
+def expand_doc(data):
+
+    """Function:  expand_doc
+
+    Description:  Return a copy of the document with the Check entries
+        expanded to their JSON shape.
+
+    Arguments:
+        (input) data -> Document
+        (output) Copy of the document
+
+    """
+
+    if isinstance(data, Check):
+        entry = {"Table": data.table, "Status": STATUSES[data.status]}
+
+        if data.strategy is not None:
+            entry["Strategy"] = data.strategy
+
+        if data.partitions is not None:
+            entry["Partitions"] = data.partitions
+
+        if data.ranges is not None:
+            entry["Ranges"] = data.ranges
+
+        return entry
+
+    if isinstance(data, dict):
+        return {key: expand_doc(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [expand_doc(item) for item in data]
+
+    return data
+
+
+def check_default(obj):
+
+    """Function:  check_default
+
+    Description:  JSON encoder hook writing a Check entry in its expanded
+        shape.
+
+    Arguments:
+        (input) obj -> Object the JSON encoder cannot encode
+        (output) Expanded Check entry
+
+    """
+
+    if not isinstance(obj, Check):
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return expand_doc(obj)
+
+
+def add_entry(args, results, dbs, entry):
+
+    """Function:  add_entry
+
+    Description:  Add a table's status entry to the results document.  With
+        the -b option only tables not in sync are added.  The entry is held
+        as a Check with a status code until the document is output.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) results -> Results document
+        (input) dbs -> Database name
+        (input) entry -> Status entry of the table
+
+    """
+
+    if not args.arg_exist("-b") or entry["Status"] != "Synced":
+        results["Checks"][dbs].append(Check(
+            entry["Table"], status_code(entry["Status"]),
+            entry.get("Partitions"), entry.get("Ranges"),
+            entry.get("Strategy")))
+
+
+def status_entry(tbl, meta):
+
+    """Function:  status_entry
+
+    Description:  Return the status entry of a table not to be compared.
+
+    Arguments:
+        (input) tbl -> Table name
+        (input) meta -> Metadata of the table with its Status
+        (output) entry -> Status entry of the table
+
+    """
+
+    entry = {"Table": tbl, "Status": meta["Status"]}
+
+    if meta.get("Strategy"):
+        entry["Strategy"] = meta["Strategy"]
+
+    return entry
+
+
+def cmp_tables(args, master, slave, tables, results, **kwargs):
+
+    """Function:  cmp_tables
+
+    Description:  Compare the tables one at a time and add their status to
+        the results document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) results -> Results document
+        (input) kwargs:
+            part_state -> Dictionary of tables and synced partition metadata
+            gtid -> GTID set of the consistent snapshots or None
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    tbl_stats = []
+
+    for dbs, tbl, meta in tables:
+        results["Checks"].setdefault(dbs, [])
+        start = time.perf_counter()
+        stats = {"ChecksumTime": 0, "Retries": 0}
+        entry = status_entry(tbl, meta) if meta.get("Status") else cmp_table(
+            args, master, slave, dbs, tbl,
+            part_state=kwargs.get("part_state", {}),
+            gtid=kwargs.get("gtid", None), stats=stats, meta=meta)
+        add_entry(args, results, dbs, entry)
+
+        if args.get_val("-H"):
+            tbl_stats.append(
+                (dbs, tbl, entry["Status"], stats["ChecksumTime"],
+                 time.perf_counter() - start, stats["Retries"]))
+
+    return tbl_stats
+
+
+async def async_checksum(pool, executor, dbs, tbl):
+
+    """Function:  async_checksum
+
+    Description:  Checksum a table on a connection taken from the server's
+        pool.  The blocking checksum call is run on the executor.
+
+    Arguments:
+        (input) pool -> asyncio.Queue of connected server instances
+        (input) executor -> Executor for the blocking driver calls
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (output) Checksum of the table
+
+    """
+
+    server = await pool.get()
+
+    try:
+        with phase("compare", db=dbs, table=tbl, server=server.name):
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, mysql_libs.checksum, server, dbs, tbl)
+
+    finally:
+        pool.put_nowait(server)
+
+
+async def async_tbl_cmp(pools, executor, dbs, tbl, stats):
+
+    """Function:  async_tbl_cmp
+
+    Description:  Check a table between the master and replica databases.
+        The master and replica checksums run at the same time and the
+        rechecks wait on a non-blocking timer, so the connections are free
+        for other tables between rechecks.
+
+    Arguments:
+        (input) pools -> Master and replica connection pools
+        (input) executor -> Executor for the blocking driver calls
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) stats -> Dictionary to record ChecksumTime and Retries in
+        (output) Status of the table comparison
+
+    """
+
+    for recur in range(1, 4):
+        start = time.perf_counter()
+        mst_chk, slv_chk = await asyncio.gather(
+            async_checksum(pools[0], executor, dbs, tbl),
+            async_checksum(pools[1], executor, dbs, tbl))
+        stats["ChecksumTime"] += time.perf_counter() - start
+
+        if mst_chk == slv_chk:
+            return "Synced"
+
+        if recur < 3:
+            stats["Retries"] += 1
+
+            with phase("retry-wait", db=dbs, table=tbl):
+                await asyncio.sleep(5)
+
+    return "Checksums do not match"
+
+
+async def async_run_tbl(pools, executor, dbs, tbl, inflight):
+
+    """Function:  async_run_tbl
+
+    Description:  Compare a table and release its in-flight slot.
+
+    Arguments:
+        (input) pools -> Master and replica connection pools
+        (input) executor -> Executor for the blocking driver calls
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) inflight -> asyncio.Semaphore of the tables in progress
+        (output) Tuple of the table result:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    start = time.perf_counter()
+    stats = {"ChecksumTime": 0, "Retries": 0}
+
+    try:
+        with phase("table", db=dbs, table=tbl):
+            status = await async_tbl_cmp(pools, executor, dbs, tbl, stats)
+
+    finally:
+        inflight.release()
+
+    return (dbs, tbl, status, stats["ChecksumTime"],
+            time.perf_counter() - start, stats["Retries"])
+
+
+async def async_cmp(servers, tables, size):
+
+    """Function:  async_cmp
+
+    Description:  Compare the tables with up to N checksums at a time on
+        each server.  The extra connections are opened at the same time and
+        any that fail to connect are left out of the pools.  The tables are
+        read on the first connections while the extra connections run the
+        checksums.  If all of a server's extra connections failed, then the
+        tables are read up front and its first connection is pooled.
+
+    Arguments:
+        (input) servers -> Lists of master and replica instances, the first
+            instance of each list is already connected
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) size -> Number of connections per server
+        (output) List of table results in database and table order:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    loop = asyncio.get_running_loop()
+    inflight = asyncio.Semaphore(MAX_INFLIGHT)
+    pools = [asyncio.Queue(), asyncio.Queue()]
+    tasks = []
+
+    with futures.ThreadPoolExecutor(
+            max_workers=2 * size) as executor:
+        with phase("connect"):
+            await asyncio.gather(*[
+                loop.run_in_executor(
+                    executor, functools.partial(server.connect, silent=True))
+                for server_list in servers for server in server_list[1:]])
+
+        for pool, server_list in zip(pools, servers):
+            for server in server_list[1:]:
+                if server.conn_msg:
+                    print(f"async_cmp: Warning: Connection not used:"
+                          f" {server.conn_msg}")
+
+                else:
+                    pool.put_nowait(server)
+
+        if any(pool.empty() for pool in pools):
+            tables = list(tables)
+
+            for pool, server_list in zip(pools, servers):
+                if pool.empty():
+                    pool.put_nowait(server_list[0])
+
+        tables = iter(tables)
+
+        while True:
+            item = await loop.run_in_executor(executor, next, tables, None)
+
+            if item is None:
+                break
+
+            if item[2].get("Status"):
+                tasks.append(loop.create_future())
+                tasks[-1].set_result(
+                    (item[0], item[1], item[2]["Status"], 0, 0, 0))
+                continue
+
+            await inflight.acquire()
+            tasks.append(asyncio.create_task(
+                async_run_tbl(pools, executor, item[0], item[1], inflight)))
+
+        return await asyncio.gather(*tasks)
+
+
+def async_setup(                                # pylint:disable=R0913,R0917
+        args, master, slave, tables, results, cfg_names=None):
+
+    """Function:  async_setup
+
+    Description:  Compare the tables with the asyncio orchestrator and add
+        their status to the results document.  Opens N extra connections to
+        each server for the checksums.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) results -> Results document
+        (input) cfg_names -> (master, slave) configuration file names
+            Default is the -c and -r options
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    size = max(int(args.get_val("-j")), 1)
+    servers = [[master], [slave]]
+
+    for server_list, cfg_name in zip(
+            servers, cfg_names or [args.get_val("-c"), args.get_val("-r")]):
+        server_list.extend(
+            mysql_libs.create_instance(
+                cfg_name, args.get_val("-d"), mysql_class.Server)
+            for _ in range(size))
+
+    try:
+        tbl_stats = asyncio.run(async_cmp(servers, tables, size))
+
+    finally:
+        mysql_libs.disconnect(*(servers[0][1:] + servers[1][1:]))
+
+    for item in tbl_stats:
+        results["Checks"].setdefault(item[0], [])
+        add_entry(args, results, item[0], {"Table": item[1],
+                                           "Status": item[2]})
+
+    return tbl_stats if args.get_val("-H") else []
+
+
+def save_history(hist_file, results, tbl_stats, run_start):
+
+    """Function:  save_history
+
+    Description:  Save the run and the result of each table to the SQLite
+        history database.  The database and its tables are created if not
+        present.
+
+    Arguments:
+        (input) hist_file -> Path and file name of the history database
+        (input) results -> Results document of the run
+        (input) tbl_stats -> List of table results:
+            (database, table, status, checksum time, duration, retries)
+        (input) run_start -> Start time of the run in epoch seconds
+
+    """
+
+    conn = sqlite3.connect(hist_file)
+
+    try:
+        with conn:
+            conn.executescript(HISTORY_SCHEMA)
+            cur = conn.execute(
+                "insert into runs (as_of, master, slave, start_time,"
+                " end_time) values (?, ?, ?, ?, ?)",
+                (results.get("AsOf"), results.get("Master"),
+                 results.get("Slave"), run_start, time.time()))
+            conn.executemany(
+                "insert into results (run_id, db_name, tbl_name, status,"
+                " checksum_time, duration, retries)"
+                " values (?, ?, ?, ?, ?, ?, ?)",
+                [(cur.lastrowid,) + item for item in tbl_stats])
+
+    finally:
+        conn.close()
+
+
+def get_history(hist_file, days=30, ratio=1.1):
+
+    """Function:  get_history
+
+    Description:  Report on the latest run of each master/slave pair in the
+        history database.  Reports the tables whose status changed since the
+        previous run of the pair and the tables whose checksum time went up
+        against their average over the last N days.
+
+    Arguments:
+        (input) hist_file -> Path and file name of the history database
+        (input) days -> Number of days to average the checksum times over
+        (input) ratio -> Checksum time increase to report a table as slower
+        (output) data -> List of reports, one per master/slave pair
+
+    """
+
+    data = []
+    conn = sqlite3.connect(hist_file)
+    conn.row_factory = sqlite3.Row
+
+    try:
+        conn.executescript(HISTORY_SCHEMA)
+
+        for run in conn.execute(
+                "select max(run_id) as run_id, master, slave from runs"
+                " group by master, slave order by master, slave").fetchall():
+            prev = conn.execute(
+                "select max(run_id) from runs where master = ? and slave = ?"
+                " and run_id < ?",
+                (run["master"], run["slave"], run["run_id"])).fetchone()[0]
+            report = {"Master": run["master"], "Slave": run["slave"],
+                      "RunId": run["run_id"], "PreviousRunId": prev}
+            report["StatusChanges"] = [
+                {"Database": row[0], "Table": row[1], "Previous": row[2],
+                 "Current": row[3]} for row in conn.execute(
+                     "select cur.db_name, cur.tbl_name, old.status,"
+                     " cur.status from results cur left join results old"
+                     " on old.run_id = ? and old.db_name = cur.db_name"
+                     " and old.tbl_name = cur.tbl_name"
+                     " where cur.run_id = ?"
+                     " and old.status is not cur.status"
+                     " order by cur.db_name, cur.tbl_name",
+                     (prev, run["run_id"]))]
+            report["SlowerTables"] = [
+                {"Database": row[0], "Table": row[1],
+                 "ChecksumTime": row[2], "AvgChecksumTime": row[3]}
+                for row in conn.execute(
+                    "select cur.db_name, cur.tbl_name, cur.checksum_time,"
+                    " avg(old.checksum_time) from results cur"
+                    " join results old on old.db_name = cur.db_name"
+                    " and old.tbl_name = cur.tbl_name"
+                    " join runs r on r.run_id = old.run_id"
+                    " where cur.run_id = ? and old.run_id < cur.run_id"
+                    " and r.master = ? and r.slave = ?"
+                    " and r.start_time >= ?"
+                    " group by cur.db_name, cur.tbl_name"
+                    " having cur.checksum_time > avg(old.checksum_time) * ?"
+                    " order by cur.checksum_time - avg(old.checksum_time)"
+                    " desc",
+                    (run["run_id"], run["master"], run["slave"],
+                     time.time() - float(days) * 86400, float(ratio)))]
+            data.append(report)
+
+    finally:
+        conn.close()
+
+    return data
+
+
+def history_report(args):
+
+    """Function:  history_report
+
+    Description:  Output the report of the history database.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    results = {"Platform": "MySQL",
+               "AsOf": gen_libs.get_date() + "T" + gen_libs.get_time(),
+               "History": get_history(args.get_val("-H"))}
+    state = data_out(results, **dict(create_data_config(args)))
+
+    if not state[0]:
+        print(f"history_report: Error encountered: {state[1]}")
+
+
+def open_queue(queue_file):
+
+    """Function:  open_queue
+
+    Description:  Open the SQLite work queue database.  The database and its
+        tables are created if not present.
+
+    Arguments:
+        (input) queue_file -> Path and file name of the work queue database
+        (output) conn -> SQLite connection
+
+    """
+
+    conn = sqlite3.connect(queue_file, timeout=60)
+    conn.executescript(QUEUE_SCHEMA)
+
+    return conn
+
+
+def fill_queue(queue_file, tables, part_state=None):
+
+    """Function:  fill_queue
+
+    Description:  Empty the work queue and add a work unit for each table.
+        The units are committed a page at a time so workers can start on
+        them while the tables are still being read.  Tables with a status
+        are added as done, the entry of a pending unit holds the strategy and
+        synced partition metadata of its table.  The queue is closed once
+        all tables are added.
+
+    Arguments:
+        (input) queue_file -> Path and file name of the work queue database
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) part_state -> Dictionary of tables and synced partition
+            metadata
+
+    """
+
+    conn = open_queue(queue_file)
+    cmd = "insert into units (db_name, tbl_name, state, entry)" \
+        " values (?, ?, ?, ?)"
+
+    try:
+        with conn:
+            conn.execute("delete from units")
+            conn.execute("delete from queue_state")
+
+        units = []
+
+        for dbs, tbl, meta in tables:
+            if meta.get("Status"):
+                units.append(
+                    (dbs, tbl, "done", json.dumps(status_entry(tbl, meta))))
+
+            else:
+                work = {key: value for key, value in [
+                    ("Strategy", meta.get("Strategy")),
+                    ("PartState", (part_state or {}).get(f"{dbs}.{tbl}"))]
+                        if value}
+                units.append(
+                    (dbs, tbl, "pending", json.dumps(work) if work else None))
+
+            if len(units) >= PAGE_SIZE:
+                with conn:
+                    conn.executemany(cmd, units)
+
+                units = []
+
+        with conn:
+            conn.executemany(cmd, units)
+            conn.execute(
+                "insert into queue_state (name, value) values ('closed', 1)")
+
+    finally:
+        conn.close()
+
+
+def claim_unit(conn, worker, lease):
+
+    """Function:  claim_unit
+
+    Description:  Claim the next pending work unit, or a unit whose lease
+        has expired, for a lease of N seconds.
+
+    Arguments:
+        (input) conn -> SQLite connection to the work queue
+        (input) worker -> Name of the worker
+        (input) lease -> Lease in seconds
+        (output) unit -> (unit id, database, table, entry) or None if none
+            to claim
+
+    """
+
+    now = time.time()
+
+    with conn:
+        conn.execute(
+            "update units set state = 'leased', worker = ?, lease_until = ?"
+            " where unit_id = (select unit_id from units"
+            " where state = 'pending'"
+            " or (state = 'leased' and lease_until < ?)"
+            " order by unit_id limit 1)", (worker, now + lease, now))
+
+    return conn.execute(
+        "select unit_id, db_name, tbl_name, entry from units"
+        " where state = 'leased' and worker = ? order by unit_id limit 1",
+        (worker,)).fetchone()
+
+
+def queue_done(conn):
+
+    """Function:  queue_done
+
+    Description:  Check the work queue is closed and all of its units done.
+
+    Arguments:
+        (input) conn -> SQLite connection to the work queue
+        (output) True|False -> All units are done
+
+    """
+
+    closed = conn.execute(
+        "select count(*) from queue_state where name = 'closed'").fetchone()
+    left = conn.execute(
+        "select count(*) from units where state != 'done'").fetchone()
+
+    return bool(closed[0]) and not left[0]
+
+
+def queue_work(args, master, slave, queue_file):
+
+    """Function:  queue_work
+
+    Description:  Claim and compare the work units of the work queue until
+        all units are done.  The first result of a unit is saved, so a table
+        taking longer than the lease is still done once a worker finishes
+        it.  The table's synced partition metadata is saved with its result.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) queue_file -> Path and file name of the work queue database
+        (output) cnt -> Number of units compared by this worker
+
+    """
+
+    worker = f"{os.uname().nodename}:{os.getpid()}"
+    lease = int(args.get_val("-U", def_val=600))
+    conn = open_queue(queue_file)
+    cnt = 0
+
+    try:
+        while True:
+            unit = claim_unit(conn, worker, lease)
+
+            if not unit:
+                if queue_done(conn):
+                    break
+
+                with phase("queue-wait"):
+                    time.sleep(QUEUE_POLL)
+
+                continue
+
+            start = time.perf_counter()
+            stats = {"ChecksumTime": 0, "Retries": 0}
+            meta = json.loads(unit[3]) if unit[3] else {}
+            part_state = {f"{unit[1]}.{unit[2]}": meta["PartState"]} \
+                if meta.get("PartState") else {}
+            entry = cmp_table(args, master, slave, unit[1], unit[2],
+                              part_state=part_state, stats=stats, meta=meta)
+
+            if part_state:
+                entry["PartState"] = part_state[f"{unit[1]}.{unit[2]}"]
+
+            with conn:
+                conn.execute(
+                    "update units set state = 'done', entry = ?,"
+                    " checksum_time = ?, duration = ?, retries = ?"
+                    " where unit_id = ? and state != 'done'",
+                    (json.dumps(entry), stats["ChecksumTime"],
+                     time.perf_counter() - start, stats["Retries"], unit[0]))
+
+            cnt += 1
+
+    finally:
+        conn.close()
+
+    return cnt
+
+
+def queue_results(args, queue_file, results, part_state=None):
+
+    """Function:  queue_results
+
+    Description:  Add the results of the work units, in table order, to the
+        results document.  The state is updated with the synced partition
+        metadata saved by the workers.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) queue_file -> Path and file name of the work queue database
+        (input) results -> Results document
+        (input) part_state -> Dictionary of tables and synced partition
+            metadata
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    tbl_stats = []
+    conn = open_queue(queue_file)
+
+    try:
+        for dbs, tbl, entry, chk_time, duration, retries in conn.execute(
+                "select db_name, tbl_name, entry, checksum_time, duration,"
+                " retries from units order by unit_id"):
+            entry = json.loads(entry)
+
+            if "PartState" in entry and part_state is not None:
+                part_state[f"{dbs}.{tbl}"] = entry.pop("PartState")
+
+            results["Checks"].setdefault(dbs, [])
+            add_entry(args, results, dbs, entry)
+
+            if args.get_val("-H"):
+                tbl_stats.append(
+                    (dbs, tbl, entry["Status"], chk_time or 0, duration or 0,
+                     retries or 0))
+
+    finally:
+        conn.close()
+
+    return tbl_stats
+
+
+def queue_cmp(                                  # pylint:disable=R0913,R0917
+        args, master, slave, tables, results, queue_file, part_state=None):
+
+    """Function:  queue_cmp
+
+    Description:  Coordinate a comparison through the work queue.  The tables
+        are added to the queue as work units, this process then works on
+        the queue along with any other workers and merges the results once
+        all units are done.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) results -> Results document
+        (input) queue_file -> Path and file name of the work queue database
+        (input) part_state -> Dictionary of tables and synced partition
+            metadata
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    fill_queue(queue_file, tables, part_state)
+    queue_work(args, master, slave, queue_file)
+
+    return queue_results(args, queue_file, results, part_state)
+
+
+def table_rules(args, cfg):
+
+    """Function:  table_rules
+
+    Description:  Return the table selection rules of the options and the
+        master's configuration file.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> ServerCfg of the master
+        (output) rules -> Dictionary of the iter_tables selection rules or
+            None if the -L size range is not valid
+
+    """
+
+    size = size_range(args.get_val("-L")) if args.get_val("-L") \
+        else (None, None)
+
+    return {
+        "db_list": args.get_val("-C", def_val=[]),
+        "tbls": args.get_val("-t", def_val=[]), "ign_dbs": cfg.ign_dbs,
+        "ign_db_tbl": cfg.ign_db_tbl,
+        "include": args.get_val("-I", def_val=[]),
+        "exclude": args.get_val("-X", def_val=[]),
+        "skip_engines": args.get_val("-E", def_val=[]), "size": size,
+        "skip_views": args.arg_exist("-V")} if size else None
+
+
+def pair_snapshot(args, master, slave, results):
+
+    """Function:  pair_snapshot
+
+    Description:  Open the consistent snapshots selected by the options and
+        add the GTID set, and with the -a option the replicas' source, to
+        the results document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance, or first replica with -a option
+        (input) slave -> Slave instance
+        (input) results -> Results document
+        (output) gtid -> GTID set of the snapshots or None if failed
+        (output) err_msg -> Error message
+
+    """
+
+    timeout = args.get_val("-T", def_val=60)
+
+    if args.arg_exist("-a"):
+        sources = get_sources(master) & get_sources(slave)
+
+        if not sources:
+            return None, "Replicas do not replicate from the same source"
+
+        results["Source"] = sorted(sources)
+        gtid = open_rep_snapshot(master, slave, timeout)
+        err_msg = "Replicas did not reach the same GTID set"
+
+    else:
+        gtid = open_snapshot(master, slave, timeout)
+        err_msg = "Replica did not reach the master's GTID set"
+
+    if not gtid:
+        return None, err_msg
+
+    results["Snapshot"] = gtid
+
+    return gtid, None
+
+
+def part_tables(server, db_list=None):
+
+    """Function:  part_tables
+
+    Description:  Return the partitioned tables of a server in one query.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) db_list -> List of databases or None for all databases
+        (output) Set of (database, table) of the partitioned tables
+
+    """
+
+    db_list = list(db_list or [])
+    cmd = "select distinct table_schema as TableSchema, table_name as" \
+        " TableName from information_schema.partitions" \
+        " where partition_name is not null"
+
+    if db_list:
+        cmd = cmd + \
+            f" and table_schema in ({', '.join(['%s'] * len(db_list))})"
+
+    return {(item["TableSchema"], item["TableName"])
+            for item in server.col_sql(cmd, params=tuple(db_list))}
+
+
+def plan_mode(args):
+
+    """Function:  plan_mode
+
+    Description:  Return the comparison mode selected by the options, in the
+        order cmp_pair and setup_cmp select them.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) Comparsion mode
+
+    """
+
+    if args.get_val("-x"):
+        return "Replicated"
+
+    if args.arg_exist("-a") or (args.arg_exist("-G")
+                                and not args.get_val("-W")):
+        return "Snapshot"
+
+    if args.get_val("-W"):
+        return "Work queue"
+
+    if args.get_val("-j") and not args.arg_exist("-P"):
+        return "Concurrent"
+
+    return "Sequential"
+
+
+def plan_rate(hist_file, master, slave, sizes):
+
+    """Function:  plan_rate
+
+    Description:  Return the comparison throughput measured in the history
+        database, as the sizes of the tables over their average checksum
+        times in the previous runs of the pair.
+
+    Arguments:
+        (input) hist_file -> Path and file name of the history database
+        (input) master -> Master name
+        (input) slave -> Slave name
+        (input) sizes -> Dictionary of (database, table) and size in bytes
+        (output) rate -> Bytes compared per second
+        (output) source -> History|Default - Source of the rate
+
+    """
+
+    conn = sqlite3.connect(hist_file)
+
+    try:
+        conn.executescript(HISTORY_SCHEMA)
+        rows = conn.execute(
+            "select res.db_name, res.tbl_name, avg(res.checksum_time)"
+            " from results res join runs run on run.run_id = res.run_id"
+            " where run.master = ? and run.slave = ?"
+            " and res.checksum_time > 0 group by res.db_name, res.tbl_name",
+            (master, slave)).fetchall()
+
+    finally:
+        conn.close()
+
+    rows = [(sizes[row[:2]], row[2]) for row in rows if sizes.get(row[:2])]
+    seconds = sum(row[1] for row in rows)
+
+    if seconds > 0:
+        return sum(row[0] for row in rows) / seconds, "History"
+
+    return PLAN_RATE, "Default"
+
+
+def plan_pair(args, master, slave, rules):
+
+    """Function:  plan_pair
+
+    Description:  Estimate the cost of comparing a master and slave pair
+        without running any checksums.  The tables are selected as for the
+        comparison and their sizes and row estimates read in bulk from
+        information_schema.  The projected time is the bytes to compare over
+        the measured throughput, spread over the concurrent connections but
+        no shorter than the largest table.  Tables compared one at a time
+        have the strategy of their engine, a quick checksum reads no bytes.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) rules -> Dictionary of the iter_tables selection rules
+        (output) results -> Results document of the plan
+
+    """
+
+    slv_tables = list(iter_tables(slave, **name_rules(rules)))
+    slv_sizes = {item[:2]: int(item[2]["DataLength"] or 0)
+                 for item in slv_tables}
+    tables = attr_filter(diff_tables(
+        iter_tables(master, **rules), slv_tables), master, rules)
+
+    if args.arg_exist("-D"):
+        tables = schema_filter(master, slave, tables)
+
+    if not args.get_val("-x"):
+        tables = tbl_strategies(args, tables)
+
+    parts = part_tables(master, rules["db_list"]) \
+        if args.arg_exist("-P") and not args.get_val("-x") else set()
+    plan = {"Mode": plan_mode(args), "Concurrency": 1, "Tables": {}}
+    strategy = {"Replicated": "Replicated checksum",
+                "Snapshot": "Snapshot checksum"}.get(plan["Mode"], "Checksum")
+    sizes = {}
+
+    if plan["Mode"] == "Concurrent":
+        plan["Concurrency"] = max(int(args.get_val("-j")), 1)
+
+    for dbs, tbl, meta in tables:
+        entry = {"Table": tbl, "Rows": int(meta["TableRows"] or 0),
+                 "Bytes": int(meta["DataLength"] or 0)}
+
+        if meta.get("Status"):
+            entry["Strategy"] = meta.get("Strategy", "None")
+            entry["Status"] = meta["Status"]
+
+        elif (dbs, tbl) in parts:
+            entry["Strategy"] = "Partition checksum"
+            sizes[(dbs, tbl)] = entry["Bytes"]
+
+        else:
+            entry["Strategy"] = meta["Strategy"] \
+                if plan["Mode"] in ["Sequential", "Work queue"] else strategy
+            sizes[(dbs, tbl)] = 0 if entry["Strategy"] == "Quick checksum" \
+                else entry["Bytes"]
+
+        plan["Tables"].setdefault(dbs, []).append(entry)
+
+    plan["Rate"], plan["RateSource"] = plan_rate(
+        args.get_val("-H"), master.name, slave.name, sizes) \
+        if args.get_val("-H") else (PLAN_RATE, "Default")
+    plan["BytesScanned"] = {
+        master.name: sum(sizes.values()),
+        slave.name: sum(slv_sizes.get(key, 0)
+                        for key, size in sizes.items() if size)}
+    plan["ProjectedSeconds"] = round(max(
+        sum(sizes.values()) / plan["Concurrency"],
+        max(sizes.values(), default=0)) / plan["Rate"], 1)
+    plan["Rate"] = int(plan["Rate"])
+
+    return dict(get_json_template(master), Master=master.name,
+                Slave=slave.name, Plan=plan)
+
+
+def pair_files(args, cfg_names):
+
+    """Function:  pair_files
+
+    Description:  Return the partition state, work queue and incremental
+        state file names of the options.  With the -M option the names have
+        the master and slave configuration file names appended.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg_names -> (master, slave) configuration file names
+        (output) Dictionary of the options and their file names or None
+
+    """
+
+    suffix = f".{cfg_names[0]}.{cfg_names[1]}" if args.get_val("-M") else ""
+
+    return {name: args.get_val(name) and args.get_val(name) + suffix
+            for name in ["-S", "-W", "-g"]}
+
+
+def binlog_pos(master):
+
+    """Function:  binlog_pos
+
+    Description:  Return the current binary log position of the master.
+
+    Arguments:
+        (input) master -> Master instance
+        (output) Tuple of (binary log file name, position)
+
+    """
+
+    cmd = "show binary log status" if master.version >= (8, 2, 0) \
+        else "show master status"
+    data = master.col_sql(cmd)[0]
+
+    return data["File"], int(data["Position"])
+
+
+def binlog_event(event, changed):
+
+    """Function:  binlog_event
+
+    Description:  Add the tables changed by a binary log event.  Row events
+        are preceded by a Table_map event naming their table.  A statement
+        changes any of the tables of its default database along with any
+        database qualified table it names, a statement without a default
+        database can change any table.
+
+    Arguments:
+        (input) event -> Row of show binlog events
+        (input) changed -> Set of (database, table) changed, the table is
+            None when any table of the database may have changed
+        (output) True|False - The changes of the event are known
+
+    """
+
+    info = event["Info"] or ""
+
+    if event["Event_type"] == "Table_map":
+        dbs, tbl = info[info.index("(") + 1:-1].split(".", 1)
+        changed.add((dbs, tbl))
+
+    elif event["Event_type"] == "Query" and info not in ["BEGIN", "COMMIT"]:
+        match = re.match(r"use `((?:[^`]|``)+)`;", info)
+
+        if not match:
+            return False
+
+        changed.add((match.group(1).replace("``", "`"), None))
+        ident = r"(?:`((?:[^`]|``)+)`|\b([\w$]+))"
+
+        for item in re.finditer(ident + r"\s*\.\s*" + ident,
+                                info[match.end():]):
+            dbs = item.group(1) or item.group(2)
+            tbl = item.group(3) or item.group(4)
+            changed.add((dbs.replace("``", "`"), tbl.replace("``", "`")))
+
+    return True
+
+
+def binlog_changes(master, since, page_size=PAGE_SIZE):
+
+    """Function:  binlog_changes
+
+    Description:  Return the tables changed on the master since a binary log
+        position.  The events are read from the master's binary logs a page
+        at a time.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) since -> Tuple of (binary log file name, position)
+        (input) page_size -> Number of events read per query
+        (output) changed -> Set of (database, table) changed, the table is
+            None when any table of the database may have changed.  None if
+            the changes are not known, i.e. the binary log was purged
+
+    """
+
+    logs = [item["Log_name"] for item in master.col_sql("show binary logs")]
+
+    if since[0] not in logs:
+        return None
+
+    changed = set()
+
+    for log in logs[logs.index(since[0]):]:
+        pos = since[1] if log == since[0] else 4
+
+        while True:
+            with phase("binlog", server=master.name):
+                events = master.col_sql(
+                    "show binlog events in %s from %s limit %s",
+                    params=(log, pos, page_size))
+
+            if not all(binlog_event(event, changed) for event in events):
+                return None
+
+            if len(events) < page_size:
+                break
+
+            pos = int(events[-1]["End_log_pos"])
+
+    return changed
+
+
+def incr_filter(tables, changed, slice_no, slices):
+
+    """Function:  incr_filter
+
+    Description:  Generator of the tables changed since the last run and of
+        the tables in this run's full-scan slice.  Tables with a Status are
+        passed on to be reported.
+
+    Arguments:
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) changed -> Set of (database, table) changed, the table is
+            None when any table of the database may have changed
+        (input) slice_no -> Full-scan slice of this run
+        (input) slices -> Number of full-scan slices
+        (output) Tuple of (database, table, metadata)
+
+    """
+
+    for dbs, tbl, meta in tables:
+        if meta.get("Status") or (dbs, tbl) in changed \
+           or (dbs, None) in changed \
+           or zlib.crc32(f"{dbs}.{tbl}".encode("UTF-8")) % slices == slice_no:
+            yield dbs, tbl, meta
+
+
+def incr_tables(master, tables, state, slices=7):
+
+    """Function:  incr_tables
+
+    Description:  Return the tables to compare in an incremental run, the
+        tables changed since the binary log position of the last run, the
+        tables the last run found not in sync and a rotating slice of all
+        tables.  All tables are compared on the first run or when the
+        changes are not known.  The state is updated with the master's
+        current position and the slice of this run.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) state -> Dictionary of the last run's position and slice
+        (input) slices -> Number of full-scan slices
+        (output) tables -> Iterable of (database, table, metadata)
+        (output) summary -> Dictionary of the incremental run
+
+    """
+
+    since = (state.get("File"), state.get("Position"))
+    pos = binlog_pos(master)
+    slice_no = (state.get("Slice", -1) + 1) % slices
+    changed = binlog_changes(master, since) if since[0] else None
+    state.update(File=pos[0], Position=pos[1], Slice=slice_no)
+
+    if changed is not None:
+        changed.update(tuple(item) for item in state.get("Pending") or [])
+    summary = {"Since": f"{since[0]}:{since[1]}" if since[0] else None,
+               "Position": f"{pos[0]}:{pos[1]}",
+               "Slice": f"{slice_no + 1}/{slices}",
+               "FullScan": changed is None}
+
+    if changed is None:
+        return tables, summary
+
+    return incr_filter(tables, changed, slice_no, slices), summary
+
+
+def pair_tables(args, master, slave, tables, results, **kwargs):
+
+    """Function:  pair_tables
+
+    Description:  Compare the tables of a pair with the comparison selected
+        by the options and add their status to the results document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> Iterable of (database, table, metadata)
+        (input) results -> Results document
+        (input) kwargs:
+            queue_file -> Path and file name of the work queue or None
+            part_state -> Dictionary of tables and synced partition metadata
+            gtid -> GTID set of the consistent snapshots or None
+            cfg_names -> (master, slave) configuration file names
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    gtid = kwargs.get("gtid", None)
+
+    if kwargs.get("queue_file") and not gtid:
+        return queue_cmp(
+            args, master, slave, tables, results, kwargs.get("queue_file"),
+            part_state=kwargs.get("part_state", {}))
+
+    if args.get_val("-j") and not gtid and not args.arg_exist("-P"):
+        return async_setup(args, master, slave, tables, results,
+                           cfg_names=kwargs.get("cfg_names"))
+
+    return cmp_tables(
+        args, master, slave, tables, results,
+        part_state=kwargs.get("part_state", {}), gtid=gtid)
+
+
+def incr_pending(results):
+
+    """Function:  incr_pending
+
+    Description:  Return the tables of a results document not in sync, to
+        be compared again by the next incremental runs until they are.
+
+    Arguments:
+        (input) results -> Results document
+        (output) List of [database, table] in order
+
+    """
+
+    done = [STATUS_CODE["Synced"], STATUS_CODE["Skipped"]]
+
+    return sorted([dbs, item.table] for dbs, checks in
+                  results["Checks"].items() for item in checks
+                  if item.status not in done)
+
+
+def cmp_pair(args, master, slave, cfg_names=None):
+
+    """Function:  cmp_pair
+
+    Description:  Compare the tables of a master and slave pair and return
+        the results document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) cfg_names -> (master, slave) configuration file names
+            Default is the -c and -r options
+        (output) results -> Results document or None if failed
+        (output) err_msg -> Error message
+
+    """
+
+    cfg_names = cfg_names or (args.get_val("-c"), args.get_val("-r"))
+    rules = table_rules(args, load_cfg(cfg_names[0], args.get_val("-d"))[0])
+
+    if not rules:
+        return None, f"Invalid size range: {args.get_val('-L')}"
+
+    if args.arg_exist("-q"):
+        return plan_pair(args, master, slave, rules), None
+
+    tables = attr_filter(diff_tables(
+        iter_tables(master, **rules),
+        iter_tables(slave, **name_rules(rules))), master, rules)
+
+    if args.arg_exist("-D"):
+        tables = schema_filter(master, slave, tables)
+
+    tables = tbl_strategies(args, tables)
+    files = pair_files(args, cfg_names)
+    results = get_json_template(master)
+    results["Master"] = master.name
+    results["Slave"] = slave.name
+    results["Checks"] = {}
+    part_state = load_part_state(files["-S"])
+    incr_state = {}
+
+    if files["-g"]:
+        incr_state = load_part_state(files["-g"])
+        tables, results["Incremental"] = incr_tables(
+            master, tables, incr_state, int(args.get_val("-O", def_val=7)))
+
+    gtid = None
+    run_start = time.time()
+
+    if args.arg_exist("-a") or (args.arg_exist("-G") and not files["-W"]):
+        gtid, err_msg = pair_snapshot(args, master, slave, results)
+
+        if not gtid:
+            return None, err_msg
+
+    try:
+        tbl_stats = pair_tables(
+            args, master, slave, tables, results, queue_file=files["-W"],
+            part_state=part_state, gtid=gtid, cfg_names=cfg_names)
+
+    finally:
+        if gtid:
+            close_snapshot(master, slave)
+
+    if args.arg_exist("-P"):
+        save_part_state(files["-S"], part_state)
+
+    if files["-g"]:
+        incr_state["Pending"] = incr_pending(results)
+        save_part_state(files["-g"], incr_state)
+
+    if args.get_val("-H"):
+        save_history(args.get_val("-H"), results, tbl_stats, run_start)
+
+    return results, None
+
+
+def rep_setup(master, chk_tbl):
+
+    """Function:  rep_setup
+
+    Description:  Prepare the master's session for replicated checksums and
+        create the checksums table, with a row for each chunk of a table.
+        The session uses statement based binary logging so the replicas run
+        the same checksum statements against their own rows.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) chk_tbl -> Checksums table as database.table
+        (output) chk_tbl -> Quoted name of the checksums table
+
+    """
+
+    chk_tbl = ".".join(quote_name(name) for name in chk_tbl.split(".", 1))
+    master.sql("set session transaction_isolation = 'REPEATABLE-READ'")
+    master.sql("set session binlog_format = 'STATEMENT'")
+    master.sql(f"drop table if exists {chk_tbl}")
+    master.sql(
+        f"create table {chk_tbl} (db char(64) not null,"
+        " tbl char(64) not null, chunk int not null, this_cnt bigint,"
+        " this_crc bigint, master_cnt bigint, master_crc bigint,"
+        " ts timestamp not null default current_timestamp"
+        " on update current_timestamp, primary key (db, tbl, chunk))"
+        " engine = InnoDB")
+    master.sql("commit")
+
+    return chk_tbl
+
+
+def rep_chunk(                                    # pylint:disable=R0913,R0917
+        master, chk_tbl, dbs, tbl, chunk, select):
+
+    """Function:  rep_chunk
+
+    Description:  Checksum a chunk of a table on the master into the
+        checksums table, in its own transaction.  The checksum is replicated
+        as a statement so each replica checksums its own rows at the same
+        point of the replication stream, then the master's values are
+        replicated as literals next to them.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) chk_tbl -> Quoted name of the checksums table
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) chunk -> Chunk number
+        (input) select -> Select list, from and where clauses of the chunk
+
+    """
+
+    keys = f"db = {quote_str(dbs)} and tbl = {quote_str(tbl)}" \
+        f" and chunk = {int(chunk)}"
+    master.sql("start transaction")
+    master.sql(
+        f"replace into {chk_tbl} (db, tbl, chunk, this_cnt, this_crc)"
+        f" select {quote_str(dbs)}, {quote_str(tbl)}, {int(chunk)}, {select}")
+    data = master.col_sql(
+        f"select this_cnt as Cnt, this_crc as Crc from {chk_tbl}"
+        f" where {keys}")
+    master.sql(
+        f"update {chk_tbl} set master_cnt = {int(data[0]['Cnt'])},"
+        f" master_crc = {int(data[0]['Crc'])} where {keys}")
+    master.sql("commit")
+
+
+def rep_checksum(master, chk_tbl, dbs, tbl, size=REP_CHUNK):
+
+    """Function:  rep_checksum
+
+    Description:  Checksum a table on the master into the checksums table a
+        chunk of up to N rows at a time, walking the table's integer primary
+        key.  Only the rows of the current chunk are locked on the master
+        and the replicas.  The first and last chunks are open ended, so rows
+        only on a replica are counted.  A table without an integer primary
+        key is checksummed as one chunk.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) chk_tbl -> Quoted name of the checksums table
+        (input) dbs -> Database name
+        (input) tbl -> Table name
+        (input) size -> Number of rows per chunk
+
+    """
+
+    key = key_column(master, dbs, tbl)
+    name = f"{quote_name(dbs)}.{quote_name(tbl)}"
+    select = f"{checksum_sql(get_columns(master, dbs, tbl))} from {name}"
+    chunk, low = 0, None
+
+    while True:
+        after = f" where {quote_name(key)} > {low}" if low is not None else ""
+        data = master.col_sql(
+            f"select {quote_name(key)} as Hi from {name}{after}"
+            f" order by {quote_name(key)} limit 1 offset {int(size) - 1}") \
+            if key else []
+        high = int(data[0]["Hi"]) if data else None
+        where = [f"{quote_name(key)} {oper} {bound}" for oper, bound
+                 in [(">", low), ("<=", high)] if bound is not None]
+        rep_chunk(master, chk_tbl, dbs, tbl, chunk,
+                  select + (" where " + " and ".join(where) if where else ""))
+
+        if high is None:
+            break
+
+        chunk, low = chunk + 1, high
+
+
+def rep_collect(slave, chk_tbl, gtid, timeout=60):
+
+    """Function:  rep_collect
+
+    Description:  Wait for a replica to apply the master's checksums and
+        compare its own checksums against the master's.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) chk_tbl -> Quoted name of the checksums table
+        (input) gtid -> Master's GTID set after the last checksum
+        (input) timeout -> Seconds to wait for the replica to catch up
+        (output) checks -> Dictionary of (database, table) and status or
+            None if the replica did not reach the GTID set
+
+    """
+
+    status = slave.col_sql(
+        "select wait_for_executed_gtid_set(%s, %s) as Status",
+        params=(gtid, int(timeout)))
+
+    if int(status[0]["Status"]) != 0:
+        return None
+
+    slave.sql("commit")
+    checks = {}
+
+    for row in slave.col_sql(
+            "select db as Db, tbl as Tbl, this_cnt as Cnt, this_crc as Crc,"
+            f" master_cnt as MstCnt, master_crc as MstCrc from {chk_tbl}"):
+        synced = (row["Cnt"], row["Crc"]) == (row["MstCnt"], row["MstCrc"])
+
+        if checks.get((row["Db"], row["Tbl"]), "Synced") == "Synced":
+            checks[(row["Db"], row["Tbl"])] = "Synced" if synced \
+                else "Checksums do not match"
+
+    return checks
+
+
+def rep_cmp(args, master, slaves, rules):
+
+    """Function:  rep_cmp
+
+    Description:  Replicated checksum comparison.  The master's tables are
+        checksummed once into the checksums table and each replica's own
+        checksums are then collected and compared.  Tables missing on any
+        of the replicas are not checksummed, as the statement would fail on
+        the replica.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slaves -> List of Slave instances
+        (input) rules -> Dictionary of the iter_tables selection rules
+        (output) docs -> List of (results document, table results) for each
+            replica
+
+    """
+
+    chk_tbl = rep_setup(master, args.get_val("-x"))
+    present = [{(dbs, tbl) for dbs, tbl, _ in
+                iter_tables(slave, **name_rules(rules))} for slave in slaves]
+    tables = []
+
+    for dbs, tbl, _ in iter_tables(master, **rules):
+        start = time.perf_counter()
+
+        if all((dbs, tbl) in names for names in present):
+            with phase("compare", db=dbs, table=tbl, server=master.name):
+                rep_checksum(master, chk_tbl, dbs, tbl)
+            tables.append((dbs, tbl, time.perf_counter() - start))
+
+        else:
+            tables.append((dbs, tbl, None))
+
+    gtid = master.col_sql(
+        "select @@global.gtid_executed as Gtid")[0]["Gtid"].replace("\n", "")
+    docs = []
+
+    for slave, names in zip(slaves, present):
+        docs.append(rep_results(
+            args, master, slave, tables, names, rep_collect(
+                slave, chk_tbl, gtid, args.get_val("-T", def_val=60))))
+
+    return docs
+
+
+def rep_results(                                # pylint:disable=R0913,R0917
+        args, master, slave, tables, names, checks):
+
+    """Function:  rep_results
+
+    Description:  Create the results document of a replica from its
+        collected checksums.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (input) tables -> List of (database, table, checksum time), the
+            checksum time is None if the table was not checksummed
+        (input) names -> Set of the replica's (database, table)
+        (input) checks -> Dictionary of (database, table) and status or
+            None if the replica did not reach the GTID set
+        (output) results -> Results document
+        (output) tbl_stats -> List of table results for the -H option:
+            (database, table, status, checksum time, duration, retries)
+
+    """
+
+    results = get_json_template(master)
+    results.update({"Master": master.name, "Slave": slave.name,
+                    "Checksums": args.get_val("-x"), "Checks": {}})
+    tbl_stats = []
+
+    for dbs, tbl, chk_time in tables:
+        if (dbs, tbl) not in names:
+            status = "Missing on slave"
+
+        elif chk_time is None:
+            status = "Missing on another slave"
+
+        else:
+            status = (checks or {}).get(
+                (dbs, tbl), "Replica did not reach the master's GTID set")
+
+        results["Checks"].setdefault(dbs, [])
+        add_entry(args, results, dbs, {"Table": tbl, "Status": status})
+
+        if args.get_val("-H"):
+            tbl_stats.append(
+                (dbs, tbl, status, chk_time or 0, chk_time or 0, 0))
+
+    return results, tbl_stats
+
+
+def setup_rep_cmp(args, master, slave):
+
+    """Function:  setup_rep_cmp
+
+    Description:  Connect to the -N replicas and run the replicated checksum
+        comparison.  With more than one replica the results documents are
+        output as one combined document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+
+    """
+
+    run_start = time.time()
+    errors = [msg for msg in [
+        load_cfg(cfg_name, args.get_val("-d"))[1]
+        for cfg_name in args.get_val("-N", def_val=[])] if msg]
+
+    if errors:
+        print(f"setup_rep_cmp: Error: {errors}")
+        return
+
+    slaves = [slave] + [
+        mysql_libs.create_instance(
+            cfg_name, args.get_val("-d"), mysql_class.SlaveRep)
+        for cfg_name in args.get_val("-N", def_val=[])]
+
+    for server in slaves[1:]:
+        with phase("connect", server=server.name):
+            server.connect(silent=True)
+
+    try:
+        errors = [f"{server.name}: {server.conn_msg}" for server in slaves
+                  if server.conn_msg] or [
+                      f"{server.name}: Slave is not in replication with"
+                      " Master" for server in slaves[1:]
+                      if not args.arg_exist("-i")
+                      and not is_replica(master, server)]
+        rules = table_rules(
+            args, load_cfg(args.get_val("-c"), args.get_val("-d"))[0])
+
+        if errors or not rules:
+            print(f"setup_rep_cmp: Error: "
+                  f"{errors or 'Invalid size range: ' + args.get_val('-L')}")
+            return
+
+        docs = rep_cmp(args, master, slaves, rules)
+
+    finally:
+        if slaves[1:]:
+            mysql_libs.disconnect(*slaves[1:])
+
+    if args.get_val("-H"):
+        for results, tbl_stats in docs:
+            save_history(args.get_val("-H"), results, tbl_stats, run_start)
+
+    data = docs[0][0] if len(docs) == 1 else {
+        "Platform": "MySQL",
+        "AsOf": gen_libs.get_date() + "T" + gen_libs.get_time(),
+        "Pairs": [results for results, _ in docs]}
+    state = data_out(data, **dict(create_data_config(args)))
+
+    if not state[0]:
+        print(f"setup_rep_cmp: Error encountered: {state[1]}")
+
+
+def setup_cmp(args, master, slave):
+
+    """Function:  setup_cmp
+
+    Description:  Setup the comparison check getting list of databases and
+        tables then calling the compare function.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+
+    """
+
+    if args.arg_exist("-J") and not args.arg_exist("-q"):
+        queue_work(args, master, slave, args.get_val("-W"))
+        return
+
+    if args.get_val("-x") and not args.arg_exist("-q"):
+        setup_rep_cmp(args, master, slave)
+        return
+
+    results, err_msg = cmp_pair(args, master, slave)
+
+    if not results:
+        print(f"setup_cmp: Error: {err_msg}")
+        return
+
+    state = data_out(results, **dict(create_data_config(args)))
+
+    if not state[0]:
+        print(f"setup_cmp: Error encountered: {state[1]}")
+
+
+def is_replica(master, slave):
+
+    """Function:  is_replica
+
+    Description:  Determine whether the slave is in replication with the
+        master.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slave -> Slave instance
+        (output) True|False - Slave is in replication with the master
+
+    """
+
+    # Determine datatype of server_id and convert appropriately.
+    #   Required for mysql.connector v1.1.6 as this version assigns the
+    #   id to a different datatype then later mysql.connector versions.
+    sid = "Server_Id" if master.version >= (8, 0, 26) else "Server_id"
+
+    with phase("replica-check", server=master.name):
+        slv_list = gen_libs.dict_2_list(master.show_slv_hosts(), sid)
+
+    slv_id = str(slave.server_id) \
+        if slv_list and isinstance(slv_list[0], str) else slave.server_id
+
+    return slv_id in slv_list
+
+
+def load_topology(topo_file):
+
+    """Function:  load_topology
+
+    Description:  Load the master/slave pairs from a topology file.  Each
+        line holds the master and slave configuration file names separated by
+        white space.  Blank lines and lines starting with # are skipped.
+
+    Arguments:
+        (input) topo_file -> Path and file name of the topology file
+        (output) pairs -> List of (master, slave) configuration file names
+            or None if the file is not valid
+        (output) err_msg -> Error message
+
+    """
+
+    pairs = []
+
+    with open(topo_file, mode="r", encoding="UTF-8") as fhdr:
+        for cnt, line in enumerate(fhdr, start=1):
+            items = line.split()
+
+            if not items or items[0].startswith("#"):
+                continue
+
+            if len(items) != 2 or items[0] == items[1]:
+                return None, f"Error: {topo_file}: Line {cnt} is not valid"
+
+            pairs.append(tuple(items))
+
+    return pairs, None
+
+
+def get_conn(args, hosts, cfg_name, cls):
+
+    """Function:  get_conn
+
+    Description:  Return a connection to a server, reusing an idle connection
+        to the same server if there is one.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) hosts -> Dictionary of the configuration files' server,
+            limit and idle connections
+        (input) cfg_name -> Configuration file name of the server
+        (input) cls -> Server class
+        (output) server -> Server instance
+
+    """
+
+    try:
+        return hosts[cfg_name]["idle"].setdefault(cls, []).pop()
+
+    except IndexError:
+        server = mysql_libs.create_instance(cfg_name, args.get_val("-d"), cls)
+
+        with phase("connect", server=server.name):
+            server.connect(silent=True)
+
+        return server
+
+
+def run_pair(args, hosts, pair):                 # pylint:disable=R0914
+
+    """Function:  run_pair
+
+    Description:  Compare a master/slave pair of the topology.  Waits for the
+        servers' limits, which are taken in host and port order so pairs
+        sharing servers can not deadlock.  Connections are returned to the
+        servers' idle connections for the next pair, unless the comparison
+        raised an exception, as their sessions may be left within a
+        snapshot, and are then disconnected.  A failure of the pair is
+        recorded as its Error and does not stop the other pairs.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) hosts -> Dictionary of the configuration files' server,
+            limit and idle connections
+        (input) pair -> (master, slave) configuration file names
+        (output) results -> Results document of the pair
+
+    """
+
+    classes = [mysql_class.SlaveRep if args.arg_exist("-a")
+               else mysql_class.MasterRep,
+               mysql_class.Server if args.arg_exist("-i")
+               else mysql_class.SlaveRep]
+    error = {"Master": pair[0], "Slave": pair[1]}
+    servers = []
+    limits = [limit for _, limit in sorted(
+        {hosts[cfg_name]["server"]: hosts[cfg_name]["limit"]
+         for cfg_name in pair}.items())]
+
+    for limit in limits:
+        limit.acquire()
+
+    try:
+        errors = [msg for msg in [load_cfg(cfg_name, args.get_val("-d"))[1]
+                                  for cfg_name in pair] if msg]
+
+        if errors:
+            return dict(error, Error=errors)
+
+        for cfg_name, cls in zip(pair, classes):
+            servers.append(get_conn(args, hosts, cfg_name, cls))
+
+        errors = [server.conn_msg for server in servers if server.conn_msg]
+
+        if errors:
+            return dict(error, Error=errors)
+
+        if not args.arg_exist("-i") and not args.arg_exist("-a") \
+           and not is_replica(servers[0], servers[1]):
+            return dict(error, Error="Slave is not in replication with Master")
+
+        results, err_msg = cmp_pair(
+            args, servers[0], servers[1], cfg_names=pair)
+
+        return results or dict(error, Error=err_msg)
+
+    except Exception as err:                            # pylint:disable=W0718
+        connected = [server for server in servers if not server.conn_msg]
+        servers.clear()
+
+        if connected:
+            mysql_libs.disconnect(*connected)
+
+        return dict(error, Error=f"Error encountered: {err}")
+
+    finally:
+        for cfg_name, cls, server in zip(pair, classes, servers):
+            if not server.conn_msg:
+                hosts[cfg_name]["idle"].setdefault(cls, []).append(server)
+
+        for limit in limits:
+            limit.release()
+
+
+def run_topology(args):
+
+    """Function:  run_topology
+
+    Description:  Compare all of the master/slave pairs of a topology file in
+        one process and output one combined results document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    pairs, err_msg = load_topology(args.get_val("-M"))
+
+    if err_msg:
+        print(f"run_topology: {err_msg}")
+        return
+
+    hosts = {}
+    limits = {}
+
+    for cfg_name in {cfg_name for pair in pairs for cfg_name in pair}:
+        server = pair_id([cfg_name], args.get_val("-d"))
+
+        if server not in limits:
+            limits[server] = threading.BoundedSemaphore(
+                max(int(args.get_val("-l", def_val=1)), 1))
+
+        hosts[cfg_name] = {"server": server, "limit": limits[server],
+                           "idle": {}}
+    results = {"Platform": "MySQL",
+               "AsOf": gen_libs.get_date() + "T" + gen_libs.get_time()}
+
+    try:
+        with futures.ThreadPoolExecutor(
+                max_workers=max(int(args.get_val("-m", def_val=4)), 1)) \
+                as executor:
+            results["Pairs"] = list(executor.map(
+                functools.partial(run_pair, args, hosts), pairs))
+
+    finally:
+        idle = [server for host in hosts.values()
+                for servers in host["idle"].values() for server in servers]
+
+        if idle:
+            mysql_libs.disconnect(*idle)
+
+    state = data_out(results, **dict(create_data_config(args)))
+
+    if not state[0]:
+        print(f"run_topology: Error encountered: {state[1]}")
+
+
+def run_program(args):
+
+    """Function:  run_program
+
+    Description:  Creates class instance(s) and controls flow of the program.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    mst_cfg, mst_msg = load_cfg(args.get_val("-c"), args.get_val("-d"))
+    slv_cfg, slv_msg = load_cfg(args.get_val("-r"), args.get_val("-d"))
+
+    if not mst_cfg or not slv_cfg:
+        print("run_program: Error encountered with configuration files")
+        print(f"\tMaster:  {mst_msg}")
+        print(f"\tSlave:  {slv_msg}")
+        return
+
+    master = mysql_libs.create_instance(
+        mst_cfg.cfg_name, mst_cfg.cfg_dir,
+        mysql_class.SlaveRep if args.arg_exist("-a")
+        else mysql_class.MasterRep)
+    with phase("connect", server=master.name):
+        master.connect(silent=True)
+
+    server_type = mysql_class.SlaveRep
+
+    if args.arg_exist("-i"):
+        server_type = mysql_class.Server
+
+    slave = mysql_libs.create_instance(
+        slv_cfg.cfg_name, slv_cfg.cfg_dir, server_type)
+
+    with phase("connect", server=slave.name):
+        slave.connect(silent=True)
+
+    if master.conn_msg or slave.conn_msg:
+        print("run_program: Error encountered with connection of master/slave")
+        print(f"\tMaster:  {master.conn_msg}")
+        print(f"\tSlave:  {slave.conn_msg}")
+        return
+
+    if args.arg_exist("-i") or args.arg_exist("-a"):
+        setup_cmp(args, master, slave)
+        mysql_libs.disconnect(master, slave)
+
+    else:
+        # Is slave in replication with master
+        if is_replica(master, slave):
+            setup_cmp(args, master, slave)
+            mysql_libs.disconnect(master, slave)
+
+        else:
+            mysql_libs.disconnect(master, slave)
+            print("Error:  Slave is not in replication with Master.")
+
+
+def profile_run(args, func):
+
+    """Function:  profile_run
+
+    Description:  Runs the program under cProfile and writes the profile and
+        a wall-clock breakdown of the phases of the run next to the output
+        file.  Optionally traces the memory allocations of the run.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func -> Function to run with args
+
+    """
+
+    outfile = args.get_val("-o")
+    PHASES.clear()
+
+    if args.arg_exist("-Z"):
+        tracemalloc.start()
+
+    prof = cProfile.Profile()
+    start = time.perf_counter()
+    prof.enable()
+
+    try:
+        func(args)
+
+    finally:
+        prof.disable()
+        prof.dump_stats(outfile + ".prof")
+        data = {
+            "WallTime": round(time.perf_counter() - start, 6),
+            "Phases": {name: {"Seconds": round(item[0], 6),
+                              "Calls": item[1]}
+                       for name, item in sorted(PHASES.items())}}
+
+        if args.arg_exist("-Z"):
+            data["PeakMemory"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.take_snapshot().dump(outfile + ".mem")
+            tracemalloc.stop()
+
+        with open(outfile + ".phases.json", mode="w",
+                  encoding="UTF-8") as fhdr:
+            json.dump(data, fhdr, indent=4)
+
+
+def pair_id(cfg_names, cfg_dir):
+
+    """Function:  pair_id
+
+    Description:  Return the identity of a master/slave pair from the host
+        and port of its servers' configuration files.  The configuration
+        file name is used for a file that can not be loaded or is not
+        valid.  The identity
+        only holds characters that are safe in a file name.
+
+    Arguments:
+        (input) cfg_names -> Master and slave configuration file names
+        (input) cfg_dir -> Directory path to the configuration files
+        (output) Identity of the pair
+
+    """
+
+    names = []
+
+    for cfg_name in cfg_names:
+        try:
+            cfg = load_cfg(cfg_name, cfg_dir)[0]
+
+        except (ImportError, AttributeError):
+            cfg = None
+
+        names.append(f"{cfg.host}_{cfg.port}" if cfg else str(cfg_name))
+
+    return re.sub(r"[^\w.-]", "_", "-".join(names))
+
+
+def lock_ids(args):
+
+    """Function:  lock_ids
+
+    Description:  Return the program lock ids of the master/slave pairs of
+        the run in order, each made of the -y flavor id and the pair's
+        identity.  A -J worker takes no lock, the work queue already keeps
+        the workers of a pair from comparing the same table.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) List of lock ids
+
+    """
+
+    flavor = (args.get_val("-y", def_val=None) or [""])[0]
+
+    if args.get_val("-J", def_val=False):
+        return []
+
+    if args.get_val("-M"):
+        pairs = load_topology(args.get_val("-M"))[0] or []
+
+    else:
+        pairs = [(args.get_val("-c"), args.get_val("-r"))]
+
+    return sorted({"_".join(filter(None, [flavor, pair_id(
+        pair, args.get_val("-d"))])) for pair in pairs})
+
+
+def pair_locks(args, ids):
+
+    """Function:  pair_locks
+
+    Description:  Take the program locks of the pairs in order.  A lock held
+        by another run is waited for up to the seconds of the -y option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) ids -> List of lock ids
+        (output) locks -> List of ProgramLock instances
+
+    """
+
+    locks = []
+    wait = (args.get_val("-y", def_val=None) or [])[1:]
+    deadline = time.monotonic() + (float(wait[0]) if wait else 0)
+
+    for lock_id in ids:
+        while True:
+            try:
+                locks.append(gen_class.ProgramLock(sys.argv, lock_id))
+                break
+
+            except gen_class.SingleInstanceException:
+                if time.monotonic() >= deadline:
+                    raise
+
+                time.sleep(
+                    max(0, min(LOCK_POLL, deadline - time.monotonic())))
+
+    return locks
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Initializes program-wide used variables and processes command
+        line arguments and values.
+
+    Variables:
+        dir_perms_chk -> contains directories and their octal permissions
+        file_perms -> file check options with their perms in octal
+        file_crt_list -> contains options which require files to be created
+        multi_val -> contains the options that will have multiple values
+        opt_con_req_list -> contains the options that require other options
+        opt_def_dict -> contains options with their default values
+        opt_req_list -> contains the options that are required for the program
+        opt_req_xor_list -> contains a list of options that are required XOR
+        opt_val_list -> contains options which require values
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+
+    """
+
+    dir_perms_chk = {"-d": 5}
+    file_perms = {"-o": 6, "-M": 4}
+    file_crt_list = ["-o"]
+    multi_val = ["-C", "-e", "-s", "-t", "-I", "-X", "-E", "-N", "-y"]
+    opt_con_req_list = {
+        "-t": ["-C"], "-s": ["-e"], "-u": ["-e"], "-k": ["-e"], "-w": ["-o"],
+        "-f": ["-o"], "-R": ["-o"], "-A": ["-o"], "-K": ["-o"], "-S": ["-P"],
+        "-T": ["-G"], "-Q": ["-H"], "-m": ["-M"], "-l": ["-M"],
+        "-J": ["-W"], "-U": ["-W"], "-a": ["-G"], "-N": ["-x"],
+        "-F": ["-o"], "-Z": ["-F"], "-O": ["-g"]}
+    opt_def_dict = {"-C": [], "-t": None, "-n": 4}
+    opt_req_list = ["-r", "-c", "-d"]
+    opt_val_list = [
+        "-r", "-c", "-d", "-e", "-s", "-y", "-C", "-n", "-t", "-S", "-T",
+        "-f", "-R", "-A", "-K", "-H", "-j", "-I", "-X", "-E", "-L", "-M",
+        "-m", "-l", "-W", "-U", "-x", "-N", "-B", "-g", "-O", "-Y"]
+
+    # Process argument list from command line.
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=multi_val,
+        opt_def=opt_def_dict)
+
+    if not args.arg_parse2()                                                \
+       or gen_libs.help_func(args, __version__, help_message):
+        return
+
+    if args.get_val("-M"):
+        opt_req_list = ["-d"]
+
+    if args.get_val("-Q", def_val=False):
+        if args.arg_cond_req(opt_con_req=opt_con_req_list)                  \
+           and args.arg_file_chk(file_perm_chk=file_perms,
+                                 file_crt=file_crt_list):
+            history_report(args)
+            wait_sinks()
+
+    elif (args.arg_require(opt_req=opt_req_list)
+          and args.arg_cond_req(opt_con_req=opt_con_req_list)
+          and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)
+          and args.arg_file_chk(
+              file_perm_chk=file_perms, file_crt=file_crt_list)):
+
+        load_modules(args)
+        ids = lock_ids(args)
+
+        try:
+            with trace_file(args.get_val("-B")):
+                prog_lock = pair_locks(args, ids)
+                func = run_topology if args.get_val("-M") else run_program
+
+                if args.arg_exist("-F"):
+                    profile_run(args, func)
+
+                else:
+                    func(args)
+
+                del prog_lock
+                wait_sinks()
 
         except gen_class.SingleInstanceException:
             print(f'WARNING:  lock in place for mysql_rep_cmp with id of:'
-                  f' {args.get_val("-y", def_val="")}')
+                  f' {", ".join(ids)}')
 
 
 if __name__ == "__main__":
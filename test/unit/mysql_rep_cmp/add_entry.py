@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  add_entry.py
+
+    Description:  Unit testing of add_entry in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/add_entry.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_ranges
+        test_strategy
+        test_compact_entry
+        test_b_option_not_synced
+        test_b_option_synced
+        test_add_entry
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.results = {"Checks": {"db1": []}}
+        self.entry = {"Table": "tbl1", "Status": "Synced"}
+        self.entry2 = {"Table": "tbl1", "Status": "Checksums do not match"}
+
+    def test_ranges(self):
+
+        """Function:  test_ranges
+
+        Description:  Test the ranges of the rows out of sync are kept.
+
+        Arguments:
+
+        """
+
+        self.entry2["Ranges"] = [[0, 99]]
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry2)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"]),
+            [self.entry2])
+
+    def test_strategy(self):
+
+        """Function:  test_strategy
+
+        Description:  Test the strategy of the table is kept.
+
+        Arguments:
+
+        """
+
+        self.entry2["Strategy"] = "Row checksum"
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry2)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"]),
+            [self.entry2])
+
+    def test_compact_entry(self):
+
+        """Function:  test_compact_entry
+
+        Description:  Test the entry is held as a Check with a status code.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry2)
+
+        self.assertEqual(self.results["Checks"]["db1"],
+                         [mysql_rep_cmp.Check("tbl1", 1)])
+
+    def test_b_option_not_synced(self):
+
+        """Function:  test_b_option_not_synced
+
+        Description:  Test with -b option and table not in sync.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-b": True}
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry2)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"]),
+            [self.entry2])
+
+    def test_b_option_synced(self):
+
+        """Function:  test_b_option_synced
+
+        Description:  Test with -b option and table in sync.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-b": True}
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry)
+
+        self.assertEqual(self.results["Checks"]["db1"], [])
+
+    def test_add_entry(self):
+
+        """Function:  test_add_entry
+
+        Description:  Test with adding an entry.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.add_entry(self.args, self.results, "db1", self.entry)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"]),
+            [self.entry])
+
+
+if __name__ == "__main__":
+    unittest.main()
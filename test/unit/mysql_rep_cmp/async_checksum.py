@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  async_checksum.py
+
+    Description:  Unit testing of async_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/async_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import asyncio
+import concurrent.futures
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.conn_msg = conn_msg
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub holder for mysql_class.Server.connect method.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        run_checksum
+        test_checksum_failed
+        test_async_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    async def run_checksum(self):
+
+        """Function:  run_checksum
+
+        Description:  Run async_checksum with a pool of one server.
+
+        Arguments:
+
+        """
+
+        pool = asyncio.Queue()
+        pool.put_nowait(self.server)
+        data = await mysql_rep_cmp.async_checksum(
+            pool, self.executor, "db1", "tbl1")
+
+        return data, pool.qsize()
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_checksum_failed(self, mock_checksum):
+
+        """Function:  test_checksum_failed
+
+        Description:  Test the server is returned to the pool on failure.
+
+        Arguments:
+
+        """
+
+        mock_checksum.side_effect = OSError("Lost connection")
+        pool = asyncio.Queue()
+        pool.put_nowait(self.server)
+
+        with self.assertRaises(OSError):
+            asyncio.run(mysql_rep_cmp.async_checksum(
+                pool, self.executor, "db1", "tbl1"))
+
+        self.assertEqual(pool.qsize(), 1)
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_async_checksum(self, mock_checksum):
+
+        """Function:  test_async_checksum
+
+        Description:  Test with a checksum from the pool.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = 10
+
+        self.assertEqual(asyncio.run(self.run_checksum()), (10, 1))
+        mock_checksum.assert_called_with(self.server, "db1", "tbl1")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  async_cmp.py
+
+    Description:  Unit testing of async_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/async_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import asyncio
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.conn_msg = conn_msg
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub holder for mysql_class.Server.connect method.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_catalog_status
+        test_conn_failed
+        test_async_cmp
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.master2 = Server()
+        self.slave = Server()
+        self.slave2 = Server("Connection failed")
+        self.slave3 = Server()
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {}),
+                       ("db2", "tbl3", {})]
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_catalog_status(self, mock_checksum):
+
+        """Function:  test_catalog_status
+
+        Description:  Test a table on only one server is not compared.
+
+        Arguments:
+
+        """
+
+        mock_checksum.return_value = 10
+
+        data = asyncio.run(mysql_rep_cmp.async_cmp(
+            [[self.master, self.master2], [self.slave, self.slave3]],
+            [("db1", "tbl1", {"Status": "Extra on slave"})], 2))
+
+        self.assertEqual(data, [("db1", "tbl1", "Extra on slave", 0, 0, 0)])
+        mock_checksum.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum",
+                mock.Mock(return_value=10))
+    def test_conn_failed(self):
+
+        """Function:  test_conn_failed
+
+        Description:  Test with all of the replica's extra connections
+            failed, the first connection is used.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            data = asyncio.run(mysql_rep_cmp.async_cmp(
+                [[self.master, self.master2], [self.slave, self.slave2]],
+                iter(self.tables), 2))
+
+        self.assertEqual(len(data), 3)
+        self.assertTrue(self.slave2.connected)
+        self.assertFalse(self.slave.connected)
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum",
+                mock.Mock(return_value=10))
+    def test_async_cmp(self):
+
+        """Function:  test_async_cmp
+
+        Description:  Test the results are in database and table order.
+
+        Arguments:
+
+        """
+
+        data = asyncio.run(mysql_rep_cmp.async_cmp(
+            [[self.master, self.master2], [self.slave, self.slave3]],
+            (item for item in self.tables), 2))
+
+        self.assertEqual(
+            [item[:3] for item in data],
+            [("db1", "tbl1", "Synced"), ("db1", "tbl2", "Synced"),
+             ("db2", "tbl3", "Synced")])
+        self.assertTrue(self.master2.connected)
+        self.assertTrue(self.slave3.connected)
+        self.assertFalse(self.master.connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  async_run_tbl.py
+
+    Description:  Unit testing of async_run_tbl in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/async_run_tbl.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import asyncio
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cmp_failed
+        test_async_run_tbl
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.inflight = mock.Mock()
+
+    @mock.patch("mysql_rep_cmp.async_tbl_cmp", mock.AsyncMock())
+    def test_cmp_failed(self):
+
+        """Function:  test_cmp_failed
+
+        Description:  Test the in-flight slot is released on failure.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.async_tbl_cmp.side_effect = OSError("Lost connection")
+
+        with self.assertRaises(OSError):
+            asyncio.run(mysql_rep_cmp.async_run_tbl(
+                [], None, "db1", "tbl1", self.inflight))
+
+        self.inflight.release.assert_called_once_with()
+
+    @mock.patch("mysql_rep_cmp.async_tbl_cmp", mock.AsyncMock())
+    def test_async_run_tbl(self):
+
+        """Function:  test_async_run_tbl
+
+        Description:  Test with the table result returned.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.async_tbl_cmp.return_value = "Synced"
+
+        data = asyncio.run(mysql_rep_cmp.async_run_tbl(
+            [], None, "db1", "tbl1", self.inflight))
+
+        self.assertEqual(data[:3], ("db1", "tbl1", "Synced"))
+        self.assertEqual(data[5], 0)
+        self.inflight.release.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
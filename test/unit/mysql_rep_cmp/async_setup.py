@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  async_setup.py
+
+    Description:  Unit testing of async_setup in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/async_setup.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-r": "slave_cfg",
+                           "-d": "config", "-j": "2"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_b_option
+        test_one_conn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = "Master"
+        self.slave = "Slave"
+        self.tables = iter([])
+        self.results = {"Checks": {}}
+        self.tbl_stats = [("db1", "tbl1", "Synced", 0.1, 0.1, 0),
+                          ("db1", "tbl2", "Checksums do not match", 0.1,
+                           10.1, 2)]
+        self.checks = {"db1": [{"Table": "tbl2",
+                                "Status": "Checksums do not match"}]}
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance",
+                mock.Mock(return_value="Extra"))
+    @mock.patch("mysql_rep_cmp.async_cmp", mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.asyncio.run")
+    def test_b_option(self, mock_run, mock_disc):
+
+        """Function:  test_b_option
+
+        Description:  Test with -b option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-b": True, "-H": "history.db"})
+        mock_run.return_value = self.tbl_stats
+
+        self.assertEqual(
+            mysql_rep_cmp.async_setup(
+                self.args, self.master, self.slave, self.tables,
+                self.results), self.tbl_stats)
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]), self.checks)
+        mock_disc.assert_called_with("Extra", "Extra", "Extra", "Extra")
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance",
+                mock.Mock(return_value="Extra"))
+    @mock.patch("mysql_rep_cmp.async_cmp", mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.asyncio.run")
+    def test_one_conn(self, mock_run, mock_disc):
+
+        """Function:  test_one_conn
+
+        Description:  Test with one connection per server and without the
+            -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "1"
+        mock_run.return_value = self.tbl_stats
+
+        self.assertEqual(
+            mysql_rep_cmp.async_setup(
+                self.args, self.master, self.slave, self.tables,
+                self.results), [])
+        self.assertEqual(len(self.results["Checks"]["db1"]), 2)
+        mock_disc.assert_called_once_with("Extra", "Extra")
+
+
+if __name__ == "__main__":
+    unittest.main()
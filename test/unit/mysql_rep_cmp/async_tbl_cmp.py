@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  async_tbl_cmp.py
+
+    Description:  Unit testing of async_tbl_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/async_tbl_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import asyncio
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_synced
+        test_recheck
+        test_synced
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pools = ["MasterPool", "SlavePool"]
+        self.stats = {"ChecksumTime": 0, "Retries": 0}
+        self.status = "Synced"
+        self.status2 = "Checksums do not match"
+
+    @mock.patch("mysql_rep_cmp.asyncio.sleep", new_callable=mock.AsyncMock)
+    @mock.patch("mysql_rep_cmp.async_checksum", mock.AsyncMock())
+    def test_not_synced(self, mock_sleep):
+
+        """Function:  test_not_synced
+
+        Description:  Test with the table not in sync.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.async_checksum.side_effect = [10, 11, 10, 11, 10, 11]
+
+        self.assertEqual(
+            asyncio.run(mysql_rep_cmp.async_tbl_cmp(
+                self.pools, None, "db1", "tbl1", self.stats)), self.status2)
+        self.assertEqual(self.stats["Retries"], 2)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @mock.patch("mysql_rep_cmp.asyncio.sleep", mock.AsyncMock())
+    @mock.patch("mysql_rep_cmp.async_checksum", mock.AsyncMock())
+    def test_recheck(self):
+
+        """Function:  test_recheck
+
+        Description:  Test with the table in sync on the recheck.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.async_checksum.side_effect = [10, 11, 11, 11]
+
+        self.assertEqual(
+            asyncio.run(mysql_rep_cmp.async_tbl_cmp(
+                self.pools, None, "db1", "tbl1", self.stats)), self.status)
+        self.assertEqual(self.stats["Retries"], 1)
+
+    @mock.patch("mysql_rep_cmp.async_checksum", mock.AsyncMock())
+    def test_synced(self):
+
+        """Function:  test_synced
+
+        Description:  Test with the table in sync.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.async_checksum.side_effect = [10, 10]
+
+        self.assertEqual(
+            asyncio.run(mysql_rep_cmp.async_tbl_cmp(
+                self.pools, None, "db1", "tbl1", self.stats)), self.status)
+        self.assertEqual(self.stats["Retries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
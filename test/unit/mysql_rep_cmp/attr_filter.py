@@ -0,0 +1,199 @@
+# Classification (U)
+
+"""Program:  attr_filter.py
+
+    Description:  Unit testing of attr_filter in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/attr_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def meta(engine="InnoDB", size=0, tbl_type="BASE TABLE", status=None):
+
+    """Function:  meta
+
+    Description:  Return the metadata of a table.
+
+    Arguments:
+
+    """
+
+    data = {"Engine": engine, "TableType": tbl_type, "DataLength": size,
+            "IndexLength": None}
+
+    if status:
+        data["Status"] = status
+
+    return data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        names
+        test_on_master
+        test_size_range
+        test_skip_views
+        test_skip_engines
+        test_master_tables
+        test_extra_on_slave
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "master"
+        self.rules = {"db_list": [], "skip_engines": [], "size": (None, None),
+                      "skip_views": False}
+        self.tables = [("db1", "t1", meta()),
+                       ("db1", "t2", meta("MEMORY", 500)),
+                       ("db1", "t3", meta(None, 0, "VIEW")),
+                       ("db1", "t4",
+                        meta("memory", 3000, status="Extra on slave"))]
+
+    def names(self):
+
+        """Function:  names
+
+        Description:  Return the names of the tables passing the filter.
+
+        Arguments:
+
+        """
+
+        return [item[1] for item in mysql_rep_cmp.attr_filter(
+            iter(self.tables), self.master, self.rules)]
+
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_on_master(self, mock_iter):
+
+        """Function:  test_on_master
+
+        Description:  Test a table extra on the slave the master has.
+
+        Arguments:
+
+        """
+
+        mock_iter.return_value = iter([("db1", "t4", meta())])
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3"])
+        mock_iter.assert_called_once_with(
+            self.master, db_list=["db1"], tbls=["t4"])
+
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_size_range(self, mock_iter):
+
+        """Function:  test_size_range
+
+        Description:  Test with a size range on a table extra on the slave.
+
+        Arguments:
+
+        """
+
+        self.rules["size"] = (400, 2000)
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3"])
+        mock_iter.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.iter_tables",
+                mock.Mock(return_value=iter([])))
+    def test_skip_views(self):
+
+        """Function:  test_skip_views
+
+        Description:  Test with the views skipped.
+
+        Arguments:
+
+        """
+
+        self.rules["skip_views"] = True
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3", "t4"])
+
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_skip_engines(self, mock_iter):
+
+        """Function:  test_skip_engines
+
+        Description:  Test with the engines skipped on a table extra on the
+            slave.
+
+        Arguments:
+
+        """
+
+        self.rules["skip_engines"] = ["Memory"]
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3"])
+        mock_iter.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_master_tables(self, mock_iter):
+
+        """Function:  test_master_tables
+
+        Description:  Test the master's tables are not checked again.
+
+        Arguments:
+
+        """
+
+        self.rules["skip_engines"] = ["Memory"]
+        self.rules["skip_views"] = True
+        self.tables.pop()
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3"])
+        mock_iter.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.iter_tables",
+                mock.Mock(return_value=iter([])))
+    def test_extra_on_slave(self):
+
+        """Function:  test_extra_on_slave
+
+        Description:  Test a table only on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.names(), ["t1", "t2", "t3", "t4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  binlog_changes.py
+
+    Description:  Unit testing of binlog_changes in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/binlog_changes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+def event(event_type, info, end_pos=0):
+
+    """Function:  event
+
+    Description:  Return a row of show binlog events.
+
+    Arguments:
+
+    """
+
+    return {"Event_type": event_type, "Info": info, "End_log_pos": end_pos}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_purged
+        test_unknown
+        test_binlog_changes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.logs = [{"Log_name": "binlog.000011"},
+                     {"Log_name": "binlog.000012"},
+                     {"Log_name": "binlog.000013"}]
+        self.since = ("binlog.000012", 500)
+
+    def test_purged(self):
+
+        """Function:  test_purged
+
+        Description:  Test with the binary log of the last run purged.
+
+        Arguments:
+
+        """
+
+        self.master.data = [self.logs[1:]]
+
+        self.assertIsNone(mysql_rep_cmp.binlog_changes(
+            self.master, ("binlog.000011", 500)))
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with an event whose changes are not known.
+
+        Arguments:
+
+        """
+
+        self.master.data = [
+            self.logs, [event("Query", "flush tables")]]
+
+        self.assertIsNone(
+            mysql_rep_cmp.binlog_changes(self.master, self.since))
+
+    def test_binlog_changes(self):
+
+        """Function:  test_binlog_changes
+
+        Description:  Test with two pages of events over two binary logs.
+
+        Arguments:
+
+        """
+
+        self.master.data = [
+            self.logs,
+            [event("Query", "BEGIN", 600),
+             event("Table_map", "table_id: 1 (db1.tbl1)", 700)],
+            [event("Query", "use `db2`; alter table tbl2 add c2 int", 800)],
+            [event("Table_map", "table_id: 2 (db1.tbl3)", 200)]]
+
+        self.assertEqual(
+            mysql_rep_cmp.binlog_changes(self.master, self.since, 2),
+            {("db1", "tbl1"), ("db2", None), ("db1", "tbl3")})
+        self.assertEqual(self.master.cmds[2], ("binlog.000012", 500, 2))
+        self.assertEqual(self.master.cmds[4], ("binlog.000012", 700, 2))
+        self.assertEqual(self.master.cmds[6], ("binlog.000013", 4, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  binlog_event.py
+
+    Description:  Unit testing of binlog_event in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/binlog_event.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_table_map
+        test_statement
+        test_quoted_names
+        test_other_database
+        test_no_database
+        test_begin
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.changed = set()
+
+    def test_table_map(self):
+
+        """Function:  test_table_map
+
+        Description:  Test with a Table_map event.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.binlog_event(
+            {"Event_type": "Table_map", "Info": "table_id: 92 (db1.t.1)"},
+            self.changed))
+        self.assertEqual(self.changed, {("db1", "t.1")})
+
+    def test_statement(self):
+
+        """Function:  test_statement
+
+        Description:  Test with a statement with a default database.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.binlog_event(
+            {"Event_type": "Query",
+             "Info": "use `db``1`; update t1 set c1 = 1"}, self.changed))
+        self.assertEqual(self.changed, {("db`1", None)})
+
+    def test_quoted_names(self):
+
+        """Function:  test_quoted_names
+
+        Description:  Test with a statement naming a quoted database
+            qualified table.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.binlog_event(
+            {"Event_type": "Query",
+             "Info": "use `db1`; insert into `db``2` . `t 1` select * from"
+                     " t2"}, self.changed))
+        self.assertEqual(self.changed, {("db1", None), ("db`2", "t 1")})
+
+    def test_other_database(self):
+
+        """Function:  test_other_database
+
+        Description:  Test with a statement changing a table outside of its
+            default database.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.binlog_event(
+            {"Event_type": "Query",
+             "Info": "use `app`; update reporting.totals set c1 = 1"},
+            self.changed))
+        self.assertEqual(self.changed,
+                         {("app", None), ("reporting", "totals")})
+
+    def test_no_database(self):
+
+        """Function:  test_no_database
+
+        Description:  Test with a statement without a default database.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_cmp.binlog_event(
+            {"Event_type": "Query", "Info": "update db1.t1 set c1 = 1"},
+            self.changed))
+
+    def test_begin(self):
+
+        """Function:  test_begin
+
+        Description:  Test with BEGIN and other events.
+
+        Arguments:
+
+        """
+
+        for event in [{"Event_type": "Query", "Info": "BEGIN"},
+                      {"Event_type": "Xid", "Info": "COMMIT /* xid=5 */"},
+                      {"Event_type": "Rotate", "Info": None}]:
+            self.assertTrue(mysql_rep_cmp.binlog_event(event, self.changed))
+
+        self.assertEqual(self.changed, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
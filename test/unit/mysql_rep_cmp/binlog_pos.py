@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  binlog_pos.py
+
+    Description:  Unit testing of binlog_pos in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/binlog_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pre_8_2
+        test_binlog_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.master.data = [[{"File": "binlog.000012", "Position": "1234"}]]
+
+    def test_pre_8_2(self):
+
+        """Function:  test_pre_8_2
+
+        Description:  Test with a MySQL version before 8.2.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.binlog_pos(self.master),
+                         ("binlog.000012", 1234))
+        self.assertEqual(self.master.cmds, ["show master status"])
+
+    def test_binlog_pos(self):
+
+        """Function:  test_binlog_pos
+
+        Description:  Test with MySQL 8.2 or later.
+
+        Arguments:
+
+        """
+
+        self.master.version = (8, 4, 0)
+
+        self.assertEqual(mysql_rep_cmp.binlog_pos(self.master),
+                         ("binlog.000012", 1234))
+        self.assertEqual(self.master.cmds, ["show binary log status"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  check_default.py
+
+    Description:  Unit testing of check_default in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/check_default.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_check
+        test_check_default
+
+    """
+
+    def test_not_check(self):
+
+        """Function:  test_not_check
+
+        Description:  Test with an object that is not a Check entry.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(TypeError):
+            mysql_rep_cmp.check_default(set())
+
+    def test_check_default(self):
+
+        """Function:  test_check_default
+
+        Description:  Test a Check entry is expanded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.check_default(
+                mysql_rep_cmp.Check("tbl1", 2, ["p1"])),
+            {"Table": "tbl1", "Status": "Partitions do not match",
+             "Partitions": ["p1"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
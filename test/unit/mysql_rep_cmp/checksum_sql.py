@@ -0,0 +1,71 @@
+# Classification (U)
+
+"""Program:  checksum_sql.py
+
+    Description:  Unit testing of checksum_sql in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/checksum_sql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_checksum_sql
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cols = ["id", "name"]
+
+    def test_checksum_sql(self):
+
+        """Function:  test_checksum_sql
+
+        Description:  Test the select list of the checksum.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.checksum_sql(self.cols),
+            "count(*) as Cnt, coalesce(bit_xor(crc32(concat_ws('#',"
+            " `id`, `name`, concat(isnull(`id`), isnull(`name`))))), 0)"
+            " as Crc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  chunk_hashes.py
+
+    Description:  Unit testing of chunk_hashes in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/chunk_hashes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd, res_set="row"):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return iter(self.data.pop(0)) if res_set == "row" else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_numpy
+        test_chunk_hashes
+        test_chunk_query
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server.data = [[(0, 18446744073709551615), (3, "5")]]
+
+    @unittest.skipIf(not mysql_rep_cmp.numpy, "numpy not installed")
+    def test_numpy(self):
+
+        """Function:  test_numpy
+
+        Description:  Test the chunks and hashes are read into an array.
+
+        Arguments:
+
+        """
+
+        data = mysql_rep_cmp.chunk_hashes(
+            self.server, "db1", "tbl1", "id", ["id"], 100)
+
+        self.assertEqual(
+            mysql_rep_cmp.numpy.frombuffer(
+                data, dtype=mysql_rep_cmp.CHUNK_DTYPE).tolist(),
+            [(0, 18446744073709551615), (3, 5)])
+
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    def test_chunk_hashes(self):
+
+        """Function:  test_chunk_hashes
+
+        Description:  Test the chunks and hashes are returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_hashes(
+                self.server, "db1", "tbl1", "id", ["id"], 100),
+            ((0, 18446744073709551615), (3, 5)))
+
+    def test_chunk_query(self):
+
+        """Function:  test_chunk_query
+
+        Description:  Test the query of the chunk hashes.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.chunk_hashes(
+            self.server, "db1", "tbl1", "id", ["id"], 100)
+
+        self.assertEqual(
+            self.server.cmds[0],
+            "select floor(`id` / 100) as Chunk, bit_xor(cast(conv(left(md5("
+            "concat_ws('#', `id`, concat(isnull(`id`)))), 16), 16, 10) as"
+            " unsigned)) as Crc from `db1`.`tbl1` group by Chunk order by"
+            " Chunk")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  chunk_ranges.py
+
+    Description:  Unit testing of chunk_ranges in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/chunk_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chunks(pairs):
+
+    """Function:  chunks
+
+    Description:  Return the chunk hashes as chunk_hashes does with numpy.
+
+    Arguments:
+
+    """
+
+    return mysql_rep_cmp.numpy.fromiter(
+        pairs, dtype=mysql_rep_cmp.CHUNK_DTYPE).tobytes()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_numpy_synced
+        test_no_numpy
+        test_numpy_synced
+        test_numpy
+        test_separate_ranges
+        test_numpy_large_hash
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mst = ((0, 10), (1, 11), (2, 12), (4, 14), (5, 15))
+        self.slv = ((0, 10), (1, 99), (2, 98), (3, 13), (5, 15))
+
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    def test_no_numpy_synced(self):
+
+        """Function:  test_no_numpy_synced
+
+        Description:  Test with no chunks differing without numpy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(self.mst, self.mst, 100), [])
+
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    def test_no_numpy(self):
+
+        """Function:  test_no_numpy
+
+        Description:  Test without the numpy module.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(self.mst, self.slv, 100),
+            [[100, 499]])
+
+    @unittest.skipIf(not mysql_rep_cmp.numpy, "numpy not installed")
+    def test_numpy_synced(self):
+
+        """Function:  test_numpy_synced
+
+        Description:  Test with no chunks differing with numpy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(
+                chunks(self.mst), chunks(self.mst), 100), [])
+
+    @unittest.skipIf(not mysql_rep_cmp.numpy, "numpy not installed")
+    def test_numpy(self):
+
+        """Function:  test_numpy
+
+        Description:  Test with the numpy module.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(
+                chunks(self.mst), chunks(self.slv), 100),
+            [[100, 499]])
+
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    def test_separate_ranges(self):
+
+        """Function:  test_separate_ranges
+
+        Description:  Test with chunks differing apart.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(
+                ((1, 1), (3, 3)), ((1, 2), (3, 3), (4, 4)), 100),
+            [[100, 199], [400, 499]])
+
+    @unittest.skipIf(not mysql_rep_cmp.numpy, "numpy not installed")
+    def test_numpy_large_hash(self):
+
+        """Function:  test_numpy_large_hash
+
+        Description:  Test with hashes above the signed 64-bit range.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.chunk_ranges(
+                chunks([(0, 2 ** 64 - 1), (1, 1)]),
+                chunks([(0, 2 ** 64 - 2), (1, 1)]), 10),
+            [[0, 9]])
+
+
+if __name__ == "__main__":
+    unittest.main()
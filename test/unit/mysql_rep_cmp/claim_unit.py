@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  claim_unit.py
+
+    Description:  Unit testing of claim_unit in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/claim_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_expired_lease
+        test_held_lease
+        test_strategy
+        test_claim_unit
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        mysql_rep_cmp.fill_queue(
+            self.queue_file, [("db1", "tbl1", {}), ("db1", "tbl2", {})])
+        self.conn = mysql_rep_cmp.open_queue(self.queue_file)
+
+    def test_expired_lease(self):
+
+        """Function:  test_expired_lease
+
+        Description:  Test a unit whose lease expired is handed out again.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.claim_unit(self.conn, "worker1", -10)
+
+        self.assertEqual(
+            mysql_rep_cmp.claim_unit(self.conn, "worker2", 600),
+            (1, "db1", "tbl1", None))
+
+    def test_held_lease(self):
+
+        """Function:  test_held_lease
+
+        Description:  Test a unit whose lease is held is not handed out.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.claim_unit(self.conn, "worker1", 600)
+
+        self.assertEqual(
+            mysql_rep_cmp.claim_unit(self.conn, "worker2", 600),
+            (2, "db1", "tbl2", None))
+        self.assertIsNone(mysql_rep_cmp.claim_unit(self.conn, "worker3", 600))
+
+    def test_strategy(self):
+
+        """Function:  test_strategy
+
+        Description:  Test the unit's entry holds the table's strategy.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(
+            self.queue_file, [("db1", "tbl1", {"Strategy": "Quick checksum"})])
+
+        self.assertEqual(
+            mysql_rep_cmp.claim_unit(self.conn, "worker1", 600),
+            (1, "db1", "tbl1", '{"Strategy": "Quick checksum"}'))
+
+    def test_claim_unit(self):
+
+        """Function:  test_claim_unit
+
+        Description:  Test claiming a unit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.claim_unit(self.conn, "worker1", 600),
+            (1, "db1", "tbl1", None))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
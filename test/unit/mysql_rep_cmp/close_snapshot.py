@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  close_snapshot.py
+
+    Description:  Unit testing of close_snapshot in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/close_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_close_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+
+    def test_close_snapshot(self):
+
+        """Function:  test_close_snapshot
+
+        Description:  Test with closing the snapshots.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.close_snapshot(self.master, self.slave)
+
+        self.assertEqual(self.master.cmds, ["commit"])
+        self.assertEqual(self.slave.cmds, ["commit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,508 @@
+# Classification (U)
+
+"""Program:  cmp_pair.py
+
+    Description:  Unit testing of cmp_pair in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/cmp_pair.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-C": [], "-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        fetch_do_tbl
+        fetch_ign_tbl
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.extra_def_file = None
+        self.sql_user = "mysql"
+        self.host = "hostname"
+        self.port = 3306
+        self.do_tbl = {}
+        self.ign_tbl = {}
+        self.name = "MasterName"
+
+    def fetch_do_tbl(self):
+
+        """Method:  fetch_do_tbl
+
+        Description:  Stub holder for mysql_class.Server.fetch_do_tbl method.
+
+        Arguments:
+
+        """
+
+        return self.do_tbl
+
+    def fetch_ign_tbl(self):
+
+        """Method:  fetch_ign_tbl
+
+        Description:  Stub holder for mysql_class.Server.fetch_ign_tbl method.
+
+        Arguments:
+
+        """
+
+        return self.ign_tbl
+
+
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Emulate a configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization.
+
+        Arguments:
+
+        """
+
+        self.ign_dbs = [
+            "performance_schema", "information_schema", "mysql", "sys"]
+        self.ign_db_tbl = {"mysql": ["systems"]}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replica_option
+        test_snapshot_exception
+        test_queue_option
+        test_incr_option
+        test_plan_option
+        test_invalid_size
+        test_state_suffix
+        test_async_names
+        test_strategies
+        test_attr_rules
+        test_cmp_pair
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = Server()
+        self.slave = Server()
+        self.slave.name = "SlaveName"
+        self.cfg = Cfg()
+        self.cfg_names = ("master", "slave")
+        self.tables = [("dbs", "tbl1", {})]
+
+    @mock.patch("mysql_rep_cmp.close_snapshot")
+    @mock.patch("mysql_rep_cmp.pair_snapshot")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_replica_option(                    # pylint:disable=R0913,R0917
+            self, mock_dbstbls, mock_cmp, mock_load, mock_snap, mock_close):
+
+        """Function:  test_replica_option
+
+        Description:  Test with -a option, the tables are compared within
+            the snapshots and the -W option is ignored.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-a": True, "-G": True, "-W": "queue"})
+        mock_dbstbls.return_value = self.tables
+        mock_cmp.return_value = []
+        mock_load.return_value = (self.cfg, None)
+        mock_snap.return_value = ("uuid:1-10", None)
+
+        mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave)
+
+        self.assertEqual(mock_cmp.call_args[1]["gtid"], "uuid:1-10")
+        mock_close.assert_called_once_with(self.master, self.slave)
+
+    @mock.patch("mysql_rep_cmp.close_snapshot")
+    @mock.patch("mysql_rep_cmp.pair_snapshot")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_snapshot_exception(                # pylint:disable=R0913,R0917
+            self, mock_dbstbls, mock_cmp, mock_load, mock_snap, mock_close):
+
+        """Function:  test_snapshot_exception
+
+        Description:  Test the snapshots are closed when the comparison
+            raises an exception.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-a": True})
+        mock_dbstbls.return_value = self.tables
+        mock_cmp.side_effect = RuntimeError("Lost connection")
+        mock_load.return_value = (self.cfg, None)
+        mock_snap.return_value = ("uuid:1-10", None)
+
+        with self.assertRaises(RuntimeError):
+            mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave)
+
+        mock_close.assert_called_once_with(self.master, self.slave)
+
+    @mock.patch("mysql_rep_cmp.open_snapshot")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.queue_cmp")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_queue_option(                      # pylint:disable=R0913,R0917
+            self, mock_dbstbls, mock_queue, mock_load, mock_snap):
+
+        """Function:  test_queue_option
+
+        Description:  Test with -W option, the queue name is suffixed with
+            the pair with the -M option and -G is ignored.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-M": "topology", "-W": "queue.db", "-G": True})
+        mock_dbstbls.return_value = self.tables
+        mock_queue.return_value = []
+        mock_load.return_value = (self.cfg, None)
+
+        mysql_rep_cmp.cmp_pair(
+            self.args, self.master, self.slave, cfg_names=self.cfg_names)
+
+        self.assertEqual(mock_queue.call_args[0][5],
+                         "queue.db.master.slave")
+        mock_snap.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.save_part_state")
+    @mock.patch("mysql_rep_cmp.load_part_state")
+    @mock.patch("mysql_rep_cmp.incr_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_incr_option(                       # pylint:disable=R0913,R0917
+            self, mock_dbstbls, mock_incr, mock_load_part, mock_save_part,
+            mock_cmp, mock_load):
+
+        """Function:  test_incr_option
+
+        Description:  Test with -g option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-g": "incr.json", "-O": "5"})
+        mock_dbstbls.return_value = self.tables
+        mock_load.return_value = (self.cfg, None)
+        mock_load_part.return_value = {"Slice": 1}
+        mock_incr.return_value = ([], {"FullScan": False})
+        mock_cmp.return_value = []
+        results, _ = mysql_rep_cmp.cmp_pair(
+            self.args, self.master, self.slave)
+
+        self.assertEqual(results["Incremental"], {"FullScan": False})
+        self.assertIs(mock_incr.call_args[0][2], mock_load_part.return_value)
+        self.assertEqual(mock_incr.call_args[0][3], 5)
+        self.assertEqual(mock_cmp.call_args[0][3], [])
+        mock_save_part.assert_called_once_with(
+            "incr.json", {"Slice": 1, "Pending": []})
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.plan_pair")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_plan_option(self, mock_dbstbls, mock_plan, mock_load):
+
+        """Function:  test_plan_option
+
+        Description:  Test with -q option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+        mock_load.return_value = (self.cfg, None)
+        mock_plan.return_value = {"Plan": {}}
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave),
+            ({"Plan": {}}, None))
+        self.assertEqual(mock_plan.call_args[0][3]["ign_dbs"],
+                         self.cfg.ign_dbs)
+        mock_dbstbls.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_invalid_size(self, mock_dbstbls, mock_load):
+
+        """Function:  test_invalid_size
+
+        Description:  Test with an invalid -L size range.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-L"] = "10"
+        mock_load.return_value = (self.cfg, None)
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave),
+            (None, "Invalid size range: 10"))
+        mock_dbstbls.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_cmp.save_part_state")
+    @mock.patch("mysql_rep_cmp.load_part_state")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_state_suffix(                      # pylint:disable=R0913,R0917
+            self, mock_dbstbls, mock_load_part, mock_save_part, mock_load):
+
+        """Function:  test_state_suffix
+
+        Description:  Test the -S state file is suffixed with the pair with
+            the -M option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-M": "topology", "-S": "state", "-P": True})
+        mock_dbstbls.return_value = self.tables
+        mock_load_part.return_value = {}
+        mock_load.return_value = (self.cfg, None)
+
+        mysql_rep_cmp.cmp_pair(
+            self.args, self.master, self.slave, cfg_names=self.cfg_names)
+
+        mock_load_part.assert_called_once_with("state.master.slave")
+        mock_save_part.assert_called_once_with("state.master.slave", {})
+        mock_load.assert_called_once_with("master", "config")
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.async_setup")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_async_names(self, mock_dbstbls, mock_async, mock_load):
+
+        """Function:  test_async_names
+
+        Description:  Test the configuration names are passed to the async
+            comparison.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+        mock_dbstbls.return_value = self.tables
+        mock_async.return_value = []
+        mock_load.return_value = (self.cfg, None)
+
+        mysql_rep_cmp.cmp_pair(
+            self.args, self.master, self.slave, cfg_names=self.cfg_names)
+
+        self.assertEqual(
+            mock_async.call_args[1],
+            {"cfg_names": self.cfg_names})
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_strategies(self, mock_dbstbls, mock_cmp, mock_load):
+
+        """Function:  test_strategies
+
+        Description:  Test the tables are compared with the strategies of
+            their engines.
+
+        Arguments:
+
+        """
+
+        mock_dbstbls.return_value = [("dbs", "tbl1", {"Engine": "MEMORY"})]
+        mock_cmp.return_value = []
+        mock_load.return_value = (self.cfg, None)
+        mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave)
+
+        self.assertEqual(
+            list(mock_cmp.call_args[0][3]),
+            [("dbs", "tbl1", {"Engine": "MEMORY", "SlaveEngine": "MEMORY",
+                              "SlaveCreateOptions": None, "Strategy": "Skip",
+                              "Status": "Skipped"})])
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_attr_rules(self, mock_dbstbls, mock_cmp, mock_load):
+
+        """Function:  test_attr_rules
+
+        Description:  Test the -E option is in the master's query only and a
+            table it filtered out there is not reported as extra on the
+            slave.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = ["MEMORY"]
+        mock_dbstbls.side_effect = [
+            iter([("dbs", "tbl2", {"Engine": "InnoDB"})]),
+            iter([("dbs", "tbl1", {"Engine": "InnoDB"}),
+                  ("dbs", "tbl2", {"Engine": "InnoDB"})]),
+            iter([("dbs", "tbl1", {"Engine": "MEMORY"})])]
+        mock_cmp.return_value = []
+        mock_load.return_value = (self.cfg, None)
+        mysql_rep_cmp.cmp_pair(self.args, self.master, self.slave)
+
+        self.assertEqual([item[1] for item in mock_cmp.call_args[0][3]],
+                         ["tbl2"])
+        self.assertEqual(mock_dbstbls.call_args_list[0][1]["skip_engines"],
+                         ["MEMORY"])
+        self.assertNotIn("skip_engines", mock_dbstbls.call_args_list[1][1])
+        mock_dbstbls.assert_called_with(
+            self.master, db_list=["dbs"], tbls=["tbl1"])
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_cmp_pair(self, mock_dbstbls, mock_cmp, mock_load):
+
+        """Function:  test_cmp_pair
+
+        Description:  Test the results document is returned.
+
+        Arguments:
+
+        """
+
+        mock_dbstbls.return_value = self.tables
+        mock_cmp.return_value = []
+        mock_load.return_value = (self.cfg, None)
+
+        results, err_msg = mysql_rep_cmp.cmp_pair(
+            self.args, self.master, self.slave)
+
+        self.assertIsNone(err_msg)
+        self.assertEqual(
+            (results["Master"], results["Slave"], results["Checks"]),
+            ("MasterName", "SlaveName", {}))
+        mock_load.assert_called_once_with("mysql_cfg", "config")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,347 @@
+# Classification (U)
+
+"""Program:  cmp_table.py
+
+    Description:  Unit testing of cmp_table in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/cmp_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_ranges_no_key
+        test_ranges_synced
+        test_ranges
+        test_ranges_chunk_hash
+        test_partitioned_snapshot
+        test_partitioned
+        test_snapshot
+        test_strategy
+        test_cmp_table
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = Server()
+        self.slave = Server()
+        self.parts = {"p1": {"TableRows": 1}}
+        self.entry = {"Table": "tbl1", "Status": "Synced"}
+        self.stats = {"ChecksumTime": 0, "Retries": 0}
+
+    @mock.patch("mysql_rep_cmp.diff_ranges", mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
+                mock.Mock(return_value="Checksums do not match"))
+    def test_ranges_no_key(self):
+
+        """Function:  test_ranges_no_key
+
+        Description:  Test with -Y option and no integer primary key.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-Y": "100"}
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats),
+            {"Table": "tbl1", "Status": "Checksums do not match"})
+
+    @mock.patch("mysql_rep_cmp.diff_ranges")
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
+                mock.Mock(return_value="Synced"))
+    def test_ranges_synced(self, mock_ranges):
+
+        """Function:  test_ranges_synced
+
+        Description:  Test with -Y option and table in sync.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-Y": "100"}
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats), self.entry)
+        mock_ranges.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.diff_ranges")
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
+                mock.Mock(return_value="Checksums do not match"))
+    def test_ranges(self, mock_ranges):
+
+        """Function:  test_ranges
+
+        Description:  Test with -Y option and table not in sync.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-Y": "100"}
+        mock_ranges.return_value = [[0, 99]]
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats),
+            {"Table": "tbl1", "Status": "Checksums do not match",
+             "Ranges": [[0, 99]]})
+        mock_ranges.assert_called_with(
+            self.master, self.slave, "db1", "tbl1", 100)
+
+    @mock.patch("mysql_rep_cmp.diff_ranges")
+    @mock.patch("mysql_rep_cmp.tbl_checksum")
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    @mock.patch("mysql_rep_cmp.time.sleep", mock.Mock())
+    def test_ranges_chunk_hash(self, mock_checksum, mock_ranges):
+
+        """Function:  test_ranges_chunk_hash
+
+        Description:  Test with -Y option, a chunk hash comparison and table
+            not in sync, the last chunk hashes are used.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-Y": "100"}
+        hashes = {self.master: ((0, 11), (1, 12)),
+                  self.slave: ((0, 11), (1, 13))}
+        mock_checksum.return_value = (
+            "Chunk hash", lambda server, dbs, tbl: hashes[server])
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats, meta={"Strategy": "Chunk hash"}),
+            {"Table": "tbl1", "Status": "Checksums do not match",
+             "Strategy": "Chunk hash", "Ranges": [[100, 199]]})
+        mock_ranges.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.part_status")
+    @mock.patch("mysql_rep_cmp.get_partitions")
+    def test_partitioned_snapshot(self, mock_parts, mock_status):
+
+        """Function:  test_partitioned_snapshot
+
+        Description:  Test with a partitioned table within a snapshot.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-P": True}
+        mock_parts.return_value = self.parts
+        mock_status.return_value = self.entry
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                gtid="uuid:1-10", stats=self.stats), self.entry)
+        self.assertEqual(mock_status.call_args[1]["recur"], 3)
+
+    @mock.patch("mysql_rep_cmp.part_status")
+    @mock.patch("mysql_rep_cmp.get_partitions")
+    def test_partitioned(self, mock_parts, mock_status):
+
+        """Function:  test_partitioned
+
+        Description:  Test with a partitioned table.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-P": True}
+        mock_parts.return_value = self.parts
+        mock_status.return_value = self.entry
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats), self.entry)
+        self.assertEqual(mock_status.call_args[1]["recur"], 1)
+
+    @mock.patch("mysql_rep_cmp.snap_tbl_cmp", mock.Mock(return_value="Synced"))
+    def test_snapshot(self):
+
+        """Function:  test_snapshot
+
+        Description:  Test with a consistent snapshot.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                gtid="uuid:1-10"), self.entry)
+
+    @mock.patch("mysql_rep_cmp.tbl_checksum")
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp")
+    def test_strategy(self, mock_cmp, mock_checksum):
+
+        """Function:  test_strategy
+
+        Description:  Test the table's strategy is used and recorded.
+
+        Arguments:
+
+        """
+
+        checksum = mock.Mock()
+        mock_cmp.return_value = "Synced"
+        mock_checksum.return_value = ("Checksum", checksum)
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats, meta={"Strategy": "Chunk hash"}),
+            dict(self.entry, Strategy="Checksum"))
+        mock_checksum.assert_called_once_with(
+            self.args, self.master, "db1", "tbl1", "Chunk hash")
+        mock_cmp.assert_called_with(
+            self.master, self.slave, "db1", "tbl1", 1, self.stats,
+            checksum=checksum)
+
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp")
+    def test_cmp_table(self, mock_cmp):
+
+        """Function:  test_cmp_table
+
+        Description:  Test with a table checksum comparison.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = "Synced"
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_table(
+                self.args, self.master, self.slave, "db1", "tbl1",
+                stats=self.stats), self.entry)
+        mock_cmp.assert_called_with(
+            self.master, self.slave, "db1", "tbl1", 1, self.stats,
+            checksum=mysql_rep_cmp.mysql_libs.checksum)
+
+
+if __name__ == "__main__":
+    unittest.main()
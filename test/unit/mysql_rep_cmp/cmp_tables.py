@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  cmp_tables.py
+
+    Description:  Unit testing of cmp_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/cmp_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_strategy
+        test_catalog_status
+        test_no_tables
+        test_no_history
+        test_cmp_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {})]
+        self.results = {"Checks": {}}
+        self.entry = {"Table": "tbl1", "Status": "Synced"}
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_strategy(self, mock_cmp):
+
+        """Function:  test_strategy
+
+        Description:  Test the table's strategy is passed to the comparison
+            and kept for a skipped table.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = self.entry
+        meta = {"Strategy": "Quick checksum"}
+        mysql_rep_cmp.cmp_tables(
+            self.args, "Master", "Slave",
+            [("db1", "tbl1", meta),
+             ("db1", "tbl2", {"Strategy": "Skip", "Status": "Skipped"})],
+            self.results)
+
+        self.assertEqual(mock_cmp.call_args[1]["meta"], meta)
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"][1]),
+            {"Table": "tbl2", "Status": "Skipped", "Strategy": "Skip"})
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_catalog_status(self, mock_cmp):
+
+        """Function:  test_catalog_status
+
+        Description:  Test a table on only one server is not compared.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+        mock_cmp.return_value = self.entry
+
+        data = mysql_rep_cmp.cmp_tables(
+            self.args, "Master", "Slave",
+            [("db1", "tbl1", {"Status": "Missing on slave"}),
+             self.tables[1]], self.results)
+
+        self.assertEqual(data[0][:4], ("db1", "tbl1", "Missing on slave", 0))
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db1"][0]),
+            {"Table": "tbl1", "Status": "Missing on slave"})
+        mock_cmp.assert_called_once()
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_no_tables(self, mock_cmp):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no tables to compare.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_tables(
+                self.args, "Master", "Slave", iter([]), self.results), [])
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_no_history(self, mock_cmp):
+
+        """Function:  test_no_history
+
+        Description:  Test the table results are not kept without the -H
+            option.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = self.entry
+
+        self.assertEqual(
+            mysql_rep_cmp.cmp_tables(
+                self.args, "Master", "Slave", iter(self.tables),
+                self.results), [])
+        self.assertEqual(len(self.results["Checks"]["db1"]), 2)
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_cmp_tables(self, mock_cmp):
+
+        """Function:  test_cmp_tables
+
+        Description:  Test with tables to compare.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+        mock_cmp.return_value = self.entry
+
+        data = mysql_rep_cmp.cmp_tables(
+            self.args, "Master", "Slave", iter(self.tables), self.results)
+
+        self.assertEqual([item[:2] for item in data],
+                         [("db1", "tbl1"), ("db1", "tbl2")])
+        self.assertEqual(list(self.results["Checks"]), ["db1"])
+        self.assertEqual(len(self.results["Checks"]["db1"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
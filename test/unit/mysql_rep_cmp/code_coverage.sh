@@ -16,6 +16,110 @@ coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/setup_cmp.py
 coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/create_data_config.py
 coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_json_template.py
 coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/data_out.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/quote_name.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_columns.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_partitions.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/row_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/part_tbl_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/load_part_state.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/save_part_state.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/part_status.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/open_snapshot.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/close_snapshot.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/snap_tbl_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/encode_data.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/compress_body.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/mail_sink.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/wait_sinks.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rotate_due.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rotate_file.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/write_outfile.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/save_history.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_history.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/history_report.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/cmp_table.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/async_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/async_tbl_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/async_run_tbl.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/async_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/async_setup.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/add_entry.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/cmp_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/lazy_import.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/sink_pool.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/load_cfg.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/glob_like.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/size_range.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/tbl_patterns.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/tbl_query.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/iter_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/diff_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/schema_hashes.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/schema_filter.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/is_replica.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/load_topology.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_conn.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/run_pair.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/run_topology.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/cmp_pair.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/open_queue.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/fill_queue.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/claim_unit.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/queue_done.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/queue_work.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/queue_results.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/queue_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/get_sources.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/open_rep_snapshot.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/pair_snapshot.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/quote_str.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/checksum_sql.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/table_rules.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_setup.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_collect.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_results.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/setup_rep_cmp.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/status_code.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/expand_doc.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/phase.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/profile_run.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/trace_event.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/trace_file.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/part_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/plan_mode.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/plan_rate.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/plan_pair.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/binlog_pos.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/binlog_event.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/binlog_changes.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/incr_filter.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/incr_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/pair_files.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/pair_tables.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/row_sql.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/key_column.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/chunk_hashes.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/chunk_ranges.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/diff_ranges.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/end_to_end.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/pair_id.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/lock_ids.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/pair_locks.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/tbl_strategy.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/tbl_strategies.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/quick_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/tbl_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/status_entry.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/load_modules.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/rep_chunk.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/name_rules.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/attr_filter.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/keep_checksum.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/db_query.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/check_default.py
+coverage run -a --source=mysql_rep_cmp test/unit/mysql_rep_cmp/incr_pending.py
 
 echo ""
 echo "Producing code coverage report"
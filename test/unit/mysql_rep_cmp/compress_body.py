@@ -0,0 +1,73 @@
+# Classification (U)
+
+"""Program:  compress_body.py
+
+    Description:  Unit testing of compress_body in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/compress_body.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import base64
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_compress_body
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.body = '{"key": "value"}' * 100
+
+    def test_compress_body(self):
+
+        """Function:  test_compress_body
+
+        Description:  Test the body can be decoded and decompressed.
+
+        Arguments:
+
+        """
+
+        data = mysql_rep_cmp.compress_body(self.body).split("\n", 1)[1]
+
+        self.assertEqual(
+            gzip.decompress(base64.decodebytes(data.encode())).decode(),
+            self.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import json
+import pprint
 import unittest
 import mock
 
@@ -110,6 +111,13 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        tearDown
+        test_check_entries
+        test_zstd_not_installed
+        test_invalid_compress
+        test_email_compress_small
+        test_email_compress
+        test_email_pending
         test_outfile_mode_expand2
         test_outfile_mode_expand
         test_outfile_expand
@@ -161,10 +169,126 @@ class UnitTest(unittest.TestCase):
         self.results2 = (
             False, "Error: Is not a dictionary: %s" % (self.data2))
         self.results3 = (False, "Error Message")
+        self.data3 = {"key": "value" * 10}
+        self.results4 = (self.outfile, pprint.pformat(self.data))
+        self.results5 = (False, "Error: Invalid compression: bzip2")
+        self.results6 = (False, "Error: zstandard module is not installed")
 
-    @mock.patch("mysql_rep_cmp.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_mode_expand2(self, mock_file):
+    @mock.patch("mysql_rep_cmp.write_outfile")
+    def test_check_entries(self, mock_write):
+
+        """Function:  test_check_entries
+
+        Description:  Test the Check entries are expanded when output.
+
+        Arguments:
+
+        """
+
+        self.data["Checks"] = {"db1": [mysql_rep_cmp.Check("tbl1", 0)]}
+
+        mysql_rep_cmp.data_out(
+            self.data, suppress=self.suppress, outfile=self.outfile)
+
+        self.assertEqual(
+            json.loads(mock_write.call_args[0][1])["Checks"],
+            {"db1": [{"Table": "tbl1", "Status": "Synced"}]})
+
+    @mock.patch("mysql_rep_cmp.zstandard", None)
+    def test_zstd_not_installed(self):
+
+        """Function:  test_zstd_not_installed
+
+        Description:  Test with zstd compression and no zstandard module.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.data_out(
+                self.data, suppress=self.suppress, outfile=self.outfile,
+                file_compress="zstd"), self.results6)
+
+    def test_invalid_compress(self):
+
+        """Function:  test_invalid_compress
+
+        Description:  Test with an invalid file compression.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.data_out(
+                self.data, suppress=self.suppress, outfile=self.outfile,
+                file_compress="bzip2"), self.results5)
+
+    @mock.patch("mysql_rep_cmp.MAIL_COMPRESS_SIZE", 10000)
+    @mock.patch("mysql_rep_cmp.gen_class.setup_mail")
+    def test_email_compress_small(self, mock_mail):
+
+        """Function:  test_email_compress_small
+
+        Description:  Test with compress option and a small email body.
+
+        Arguments:
+
+        """
+
+        mock_mail.return_value = self.mail
+
+        mysql_rep_cmp.data_out(
+            self.data3, suppress=self.suppress, to_addr=self.to_addr,
+            compress=True)
+        mysql_rep_cmp.wait_sinks()
+
+        self.assertNotIn("gzip", self.mail.msg)
+
+    @mock.patch("mysql_rep_cmp.MAIL_COMPRESS_SIZE", 10)
+    @mock.patch("mysql_rep_cmp.gen_class.setup_mail")
+    def test_email_compress(self, mock_mail):
+
+        """Function:  test_email_compress
+
+        Description:  Test with compress option and a large email body.
+
+        Arguments:
+
+        """
+
+        mock_mail.return_value = self.mail
+
+        mysql_rep_cmp.data_out(
+            self.data3, suppress=self.suppress, to_addr=self.to_addr,
+            compress=True)
+        mysql_rep_cmp.wait_sinks()
+
+        self.assertTrue(self.mail.msg.startswith("Content is gzip"))
+
+    @mock.patch("mysql_rep_cmp.gen_class.setup_mail")
+    def test_email_pending(self, mock_mail):
+
+        """Function:  test_email_pending
+
+        Description:  Test the email is sent in the background.
+
+        Arguments:
+
+        """
+
+        mock_mail.return_value = self.mail
+
+        mysql_rep_cmp.data_out(
+            self.data, suppress=self.suppress, to_addr=self.to_addr)
+
+        self.assertEqual(len(mysql_rep_cmp.PENDING_SINKS), 1)
+        self.assertTrue(mysql_rep_cmp.wait_sinks())
+        self.assertEqual(self.mail.msg, json.dumps(self.data))
+
+    @mock.patch("mysql_rep_cmp.write_outfile")
+    def test_outfile_mode_expand2(self, mock_write):
 
         """Function:  test_outfile_mode_expand2
 
@@ -174,18 +298,15 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_rep_cmp.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode2, expand=True), self.results)
+        self.assertEqual(
+            mock_write.call_args[0], self.results4)
 
-    @mock.patch("mysql_rep_cmp.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_mode_expand(self, mock_file):
+    @mock.patch("mysql_rep_cmp.write_outfile")
+    def test_outfile_mode_expand(self, mock_write):
 
         """Function:  test_outfile_mode_expand
 
@@ -195,18 +316,15 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_rep_cmp.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode, expand=True), self.results)
+        self.assertEqual(
+            mock_write.call_args[0], self.results4)
 
-    @mock.patch("mysql_rep_cmp.pprint.pprint", mock.Mock(return_value=True))
-    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data="data")
-    def test_outfile_expand(self, mock_file):
+    @mock.patch("mysql_rep_cmp.write_outfile")
+    def test_outfile_expand(self, mock_write):
 
         """Function:  test_outfile_expand
 
@@ -216,17 +334,14 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "data"
-        mock_file.assert_called_with(self.outfile)
-
         self.assertEqual(
             mysql_rep_cmp.data_out(
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 expand=True), self.results)
+        self.assertEqual(
+            mock_write.call_args[0], self.results4)
 
-    @mock.patch("mysql_rep_cmp.gen_libs.write_file",
-                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.write_outfile", mock.Mock(return_value=True))
     def test_outfile_mode2(self):
 
         """Function:  test_outfile_mode2
@@ -242,8 +357,7 @@ class UnitTest(unittest.TestCase):
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode2), self.results)
 
-    @mock.patch("mysql_rep_cmp.gen_libs.write_file",
-                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.write_outfile", mock.Mock(return_value=True))
     def test_outfile_mode(self):
 
         """Function:  test_outfile_mode
@@ -259,8 +373,7 @@ class UnitTest(unittest.TestCase):
                 self.data, suppress=self.suppress, outfile=self.outfile,
                 mode=self.mode), self.results)
 
-    @mock.patch("mysql_rep_cmp.gen_libs.write_file",
-                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.write_outfile", mock.Mock(return_value=True))
     def test_outfile(self):
 
         """Function:  test_outfile
@@ -486,6 +599,18 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(mysql_rep_cmp.data_out(self.data2), self.results2)
 
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.wait_sinks()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  db_query.py
+
+    Description:  Unit testing of db_query in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/db_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_rules
+        test_db_list
+        test_no_rules
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.select = "select schema_name as SchemaName from" \
+            " information_schema.schemata"
+
+    def test_all_rules(self):
+
+        """Function:  test_all_rules
+
+        Description:  Test with the databases to compare and to ignore.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.db_query(
+                db_list=["db1", "db2"], ign_dbs=frozenset(["sys", "mysql"]),
+                tbls=["t1"]),
+            (self.select + " where schema_name not in (%s, %s) and"
+             " schema_name in (%s, %s)", ["mysql", "sys", "db1", "db2"]))
+
+    def test_db_list(self):
+
+        """Function:  test_db_list
+
+        Description:  Test with the databases to compare.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.db_query(db_list=["db1"]),
+            (self.select + " where schema_name in (%s)", ["db1"]))
+
+    def test_no_rules(self):
+
+        """Function:  test_no_rules
+
+        Description:  Test with no selection rules.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.db_query(), (self.select, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  diff_ranges.py
+
+    Description:  Unit testing of diff_ranges in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/diff_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_key
+        test_diff_ranges
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.slave = "Slave"
+
+    @mock.patch("mysql_rep_cmp.key_column", mock.Mock(return_value=None))
+    def test_no_key(self):
+
+        """Function:  test_no_key
+
+        Description:  Test with a table without an integer primary key.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_cmp.diff_ranges(
+                self.master, self.slave, "db1", "tbl1", 100))
+
+    @mock.patch("mysql_rep_cmp.chunk_hashes")
+    @mock.patch("mysql_rep_cmp.get_columns", mock.Mock(return_value=["id"]))
+    @mock.patch("mysql_rep_cmp.key_column", mock.Mock(return_value="id"))
+    @mock.patch("mysql_rep_cmp.numpy", None)
+    def test_diff_ranges(self, mock_hashes):
+
+        """Function:  test_diff_ranges
+
+        Description:  Test with chunks differing.
+
+        Arguments:
+
+        """
+
+        mock_hashes.side_effect = \
+            lambda server, *args: ([0, 1], [1, 2]) \
+            if server == self.master else ([0, 1], [1, 3])
+
+        self.assertEqual(
+            mysql_rep_cmp.diff_ranges(
+                self.master, self.slave, "db1", "tbl1", 100), [[100, 199]])
+        mock_hashes.assert_any_call(
+            self.slave, "db1", "tbl1", "id", ["id"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
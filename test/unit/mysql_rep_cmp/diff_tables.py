@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  diff_tables.py
+
+    Description:  Unit testing of diff_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/diff_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lazy
+        test_no_slave_tables
+        test_extra
+        test_missing
+        test_slave_engine
+        test_same_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.meta = {"Engine": "InnoDB"}
+        self.tables = [("db1", "t1", self.meta), ("db1", "t2", self.meta),
+                       ("db2", "t1", self.meta)]
+        self.missing = {"Engine": "InnoDB", "Status": "Missing on slave"}
+        self.extra = {"Engine": "InnoDB", "Status": "Extra on slave"}
+        self.both = {"Engine": "InnoDB", "SlaveEngine": "InnoDB",
+                     "SlaveCreateOptions": None}
+        self.matched = [(dbs, tbl, self.both) for dbs, tbl, _ in self.tables]
+
+    def test_lazy(self):
+
+        """Function:  test_lazy
+
+        Description:  Test the tables are merged as they are read.
+
+        Arguments:
+
+        """
+
+        tables = mysql_rep_cmp.diff_tables(
+            iter(self.tables), (item for item in self.tables))
+
+        self.assertEqual(next(tables), self.matched[0])
+
+    def test_no_slave_tables(self):
+
+        """Function:  test_no_slave_tables
+
+        Description:  Test with no tables on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [item[2]["Status"] for item in mysql_rep_cmp.diff_tables(
+                self.tables, [])], ["Missing on slave"] * 3)
+
+    def test_extra(self):
+
+        """Function:  test_extra
+
+        Description:  Test with tables only on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_cmp.diff_tables(
+                self.tables[1:2], self.tables)),
+            [("db1", "t1", self.extra), self.matched[1],
+             ("db2", "t1", self.extra)])
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with tables missing on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_cmp.diff_tables(
+                self.tables, [self.tables[0], self.tables[2]])),
+            [self.matched[0], ("db1", "t2", self.missing), self.matched[2]])
+
+    def test_slave_engine(self):
+
+        """Function:  test_slave_engine
+
+        Description:  Test the slave's engine and create options are added.
+
+        Arguments:
+
+        """
+
+        slv_meta = {"Engine": "MyISAM", "CreateOptions": "checksum=1"}
+
+        self.assertEqual(
+            list(mysql_rep_cmp.diff_tables(
+                self.tables[:1], [("db1", "t1", slv_meta)])),
+            [("db1", "t1", {"Engine": "InnoDB", "SlaveEngine": "MyISAM",
+                            "SlaveCreateOptions": "checksum=1"})])
+
+    def test_same_tables(self):
+
+        """Function:  test_same_tables
+
+        Description:  Test with the same tables on both servers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_cmp.diff_tables(self.tables, self.tables)),
+            self.matched)
+
+
+if __name__ == "__main__":
+    unittest.main()
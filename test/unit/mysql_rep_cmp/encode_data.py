@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  encode_data.py
+
+    Description:  Unit testing of encode_data in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/encode_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import pprint
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_check_pprint
+        test_check_str
+        test_check_json
+        test_encoded_once
+        test_indent
+        test_pprint
+        test_str
+        test_json
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"key": "value", "key2": ["list1", "list2"]}
+        self.results = '{"key": "value", "key2": ["list1", "list2"]}'
+        self.results2 = "{'key': 'value', 'key2': ['list1', 'list2']}"
+        self.checks = {"db1": [mysql_rep_cmp.Check("tbl1", 0)]}
+        self.results3 = {"db1": [{"Table": "tbl1", "Status": "Synced"}]}
+
+    def test_check_pprint(self):
+
+        """Function:  test_check_pprint
+
+        Description:  Test with Check entries and pprint format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.checks, {}, "pprint"),
+            pprint.pformat(self.results3))
+
+    def test_check_str(self):
+
+        """Function:  test_check_str
+
+        Description:  Test with Check entries and str format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.checks, {}, "str"),
+            str(self.results3))
+
+    def test_check_json(self):
+
+        """Function:  test_check_json
+
+        Description:  Test with Check entries and json format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.checks, {}, "json"),
+            json.dumps(self.results3))
+
+    def test_encoded_once(self):
+
+        """Function:  test_encoded_once
+
+        Description:  Test the document is only encoded once per format.
+
+        Arguments:
+
+        """
+
+        encoded = {}
+        mysql_rep_cmp.encode_data(self.data, encoded, "json")
+        encoded[("json", None)] = "cached"
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.data, encoded, "json"), "cached")
+
+    def test_indent(self):
+
+        """Function:  test_indent
+
+        Description:  Test with json format and indentation.
+
+        Arguments:
+
+        """
+
+        self.assertIn(
+            '\n    "key"', mysql_rep_cmp.encode_data(self.data, {}, "json", 4))
+
+    def test_pprint(self):
+
+        """Function:  test_pprint
+
+        Description:  Test with pprint format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.data, {}, "pprint"), self.results2)
+
+    def test_str(self):
+
+        """Function:  test_str
+
+        Description:  Test with str format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.data, {}, "str"), self.results2)
+
+    def test_json(self):
+
+        """Function:  test_json
+
+        Description:  Test with json format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.encode_data(self.data, {}, "json"), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,454 @@
+# Classification (U)
+
+"""Program:  end_to_end.py
+
+    Description:  End to end testing of run_program in mysql_rep_cmp.py
+        against the fake_mysql stand-in servers.
+
+    Usage:
+        test/unit/mysql_rep_cmp/end_to_end.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import fake_mysql                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def short_sleep(secs, sleep=time.sleep):
+
+    """Function:  short_sleep
+
+    Description:  Sleep for a 25th of the time.
+
+    Arguments:
+
+    """
+
+    sleep(secs / 25)
+
+
+async def short_async_sleep(secs, sleep=asyncio.sleep):
+
+    """Function:  short_async_sleep
+
+    Description:  Sleep for a 25th of the time.
+
+    Arguments:
+
+    """
+
+    await sleep(secs / 25)
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self, args_array):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        run_cmp
+        test_fake_quick_checksum
+        test_fake_lag
+        test_connect_error
+        test_not_replica
+        test_latency
+        test_missing_on_slave
+        test_concurrent
+        test_ranges
+        test_strategies
+        test_replication_lag
+        test_divergence
+        test_synced
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg_dir = tempfile.mkdtemp()
+        self.outfile = os.path.join(self.cfg_dir, "out.json")
+        self.master = fake_mysql.MasterRep("Master", 10)
+        self.slave = fake_mysql.SlaveRep("Slave", 11)
+        self.master.add_replica(self.slave)
+        self.master.execute("create database db1")
+
+        for tbl in ["tbl1", "tbl2"]:
+            self.master.execute(
+                f"create table `db1`.`{tbl}` (id int primary key,"
+                f" name varchar(20))")
+
+            for key in range(100):
+                self.master.execute(
+                    f"insert into `db1`.`{tbl}` values (%s, %s)",
+                    (key, f"name{key}"))
+
+        fake_mysql.write_cfg(self.cfg_dir, "master_e2e", self.master)
+        fake_mysql.write_cfg(self.cfg_dir, "slave_e2e", self.slave)
+        self.args_array = {"-c": "master_e2e", "-r": "slave_e2e", "-z": True,
+                           "-d": self.cfg_dir, "-o": self.outfile}
+
+    def run_cmp(self, **kwargs):
+
+        """Function:  run_cmp
+
+        Description:  Run the comparison against the fake servers with the
+            retry waits shortened and return the results document.
+
+        Arguments:
+
+        """
+
+        args = ArgParser(dict(self.args_array, **kwargs))
+
+        with fake_mysql.patch({"master_e2e": self.master,
+                               "slave_e2e": self.slave}), \
+                mock.patch("mysql_rep_cmp.time.sleep", short_sleep), \
+                mock.patch("mysql_rep_cmp.asyncio.sleep", short_async_sleep):
+            mysql_rep_cmp.run_program(args)
+
+        if not os.path.exists(self.outfile):
+            return None
+
+        with open(self.outfile, encoding="UTF-8") as fhdr:
+            return json.load(fhdr)
+
+    def test_fake_quick_checksum(self):
+
+        """Function:  test_fake_quick_checksum
+
+        Description:  Test the quick checksum is only kept for tables
+            created with the checksum option.
+
+        Arguments:
+
+        """
+
+        self.master.execute(
+            "create table `db1`.`tbl3` (id int primary key) engine=MyISAM"
+            " checksum=1")
+        self.master.execute("insert into `db1`.`tbl3` values (1)")
+
+        self.assertIsNotNone(self.master.col_sql(
+            "checksum table `db1`.`tbl3` quick")[0]["Checksum"])
+        self.assertIsNone(self.master.col_sql(
+            "checksum table `db1`.`tbl1` quick")[0]["Checksum"])
+        self.assertEqual(
+            self.master.col_sql(
+                "select engine as Engine from information_schema.tables"
+                " where table_name = 'tbl3'"), [{"Engine": "MyISAM"}])
+
+    def test_fake_lag(self):
+
+        """Function:  test_fake_lag
+
+        Description:  Test a replicated statement is applied once the
+            replica's lag has passed.
+
+        Arguments:
+
+        """
+
+        self.slave.lag = 0.2
+        self.master.execute("delete from `db1`.`tbl1`")
+        cmd = "select count(*) as Cnt from `db1`.`tbl1`"
+
+        self.assertEqual(self.slave.col_sql(cmd), [{"Cnt": 100}])
+
+        time.sleep(0.3)
+
+        self.assertEqual(self.slave.col_sql(cmd), [{"Cnt": 0}])
+
+    @mock.patch("mysql_rep_cmp.print", mock.Mock())
+    def test_connect_error(self):
+
+        """Function:  test_connect_error
+
+        Description:  Test with the slave failing to connect.
+
+        Arguments:
+
+        """
+
+        self.slave.conn_error = "Access denied"
+
+        self.assertIsNone(self.run_cmp())
+
+    @mock.patch("mysql_rep_cmp.print", mock.Mock())
+    def test_not_replica(self):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a slave not replicating from the master.
+
+        Arguments:
+
+        """
+
+        self.master.replicas = []
+
+        self.assertIsNone(self.run_cmp())
+
+    def test_latency(self):
+
+        """Function:  test_latency
+
+        Description:  Test each statement is delayed by the latency.
+
+        Arguments:
+
+        """
+
+        self.master.latency = 0.01
+        start = time.perf_counter()
+
+        self.assertEqual(
+            self.run_cmp()["Checks"],
+            {"db1": [{"Table": "tbl1", "Status": "Synced",
+                      "Strategy": "Checksum"},
+                     {"Table": "tbl2", "Status": "Synced",
+                      "Strategy": "Checksum"}]})
+        self.assertGreaterEqual(time.perf_counter() - start,
+                                len(self.master.statements) * 0.01)
+
+    def test_missing_on_slave(self):
+
+        """Function:  test_missing_on_slave
+
+        Description:  Test with a table only on the master.
+
+        Arguments:
+
+        """
+
+        self.master.apply(
+            "create table `db1`.`tbl3` (id int primary key)")
+
+        self.assertEqual(
+            self.run_cmp()["Checks"]["db1"][2],
+            {"Table": "tbl3", "Status": "Missing on slave"})
+
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test with the tables compared concurrently.
+
+        Arguments:
+
+        """
+
+        self.slave.execute("delete from `db1`.`tbl1` where id = 5")
+
+        self.assertEqual(
+            self.run_cmp(**{"-j": "2"})["Checks"],
+            {"db1": [{"Table": "tbl1", "Status": "Checksums do not match"},
+                     {"Table": "tbl2", "Status": "Synced"}]})
+
+    def test_ranges(self):
+
+        """Function:  test_ranges
+
+        Description:  Test the rows out of sync are located.
+
+        Arguments:
+
+        """
+
+        self.slave.execute(
+            "update `db1`.`tbl2` set name = 'changed' where id = 42")
+
+        self.assertEqual(
+            self.run_cmp(**{"-Y": "10"})["Checks"]["db1"][1],
+            {"Table": "tbl2", "Status": "Checksums do not match",
+             "Strategy": "Chunk hash", "Ranges": [[40, 49]]})
+
+    def test_strategies(self):
+
+        """Function:  test_strategies
+
+        Description:  Test each table is compared with the strategy of its
+            engine.
+
+        Arguments:
+
+        """
+
+        self.master.execute(
+            "create table `db1`.`tbl3` (id int primary key) engine=MyISAM"
+            " checksum=1")
+        self.master.execute(
+            "create table `db1`.`tbl4` (id int primary key) engine=MEMORY")
+        self.master.apply("create table `db1`.`tbl5` (id int primary key)")
+        self.slave.catch_up()
+        self.slave.apply(
+            "create table `db1`.`tbl5` (id int primary key) engine=MyISAM")
+
+        for tbl in ["tbl3", "tbl4", "tbl5"]:
+            self.master.execute(f"insert into `db1`.`{tbl}` values (1)")
+
+        self.assertEqual(
+            self.run_cmp()["Checks"]["db1"][2:],
+            [{"Table": "tbl3", "Status": "Synced",
+              "Strategy": "Quick checksum"},
+             {"Table": "tbl4", "Status": "Skipped", "Strategy": "Skip"},
+             {"Table": "tbl5", "Status": "Synced",
+              "Strategy": "Row checksum"}])
+        self.assertIn("checksum table `db1`.`tbl3` quick",
+                      self.slave.statements)
+        self.assertFalse(
+            [cmd for cmd in self.slave.statements if "`tbl4`" in cmd])
+
+    def test_replication_lag(self):
+
+        """Function:  test_replication_lag
+
+        Description:  Test a table behind on a lagging replica is in sync
+            once it is rechecked.
+
+        Arguments:
+
+        """
+
+        self.slave.lag = 0.3
+        self.master.execute("delete from `db1`.`tbl1` where id < 10")
+
+        self.assertEqual(
+            self.run_cmp()["Checks"]["db1"][0],
+            {"Table": "tbl1", "Status": "Synced", "Strategy": "Checksum"})
+
+    def test_divergence(self):
+
+        """Function:  test_divergence
+
+        Description:  Test with a table changed on the slave only.
+
+        Arguments:
+
+        """
+
+        self.slave.execute(
+            "update `db1`.`tbl1` set name = 'changed' where id = 7")
+
+        self.assertEqual(
+            self.run_cmp()["Checks"],
+            {"db1": [{"Table": "tbl1", "Status": "Checksums do not match",
+                      "Strategy": "Checksum"},
+                     {"Table": "tbl2", "Status": "Synced",
+                      "Strategy": "Checksum"}]})
+
+    def test_synced(self):
+
+        """Function:  test_synced
+
+        Description:  Test with the master and slave in sync.
+
+        Arguments:
+
+        """
+
+        results = self.run_cmp()
+
+        self.assertEqual(
+            results["Checks"],
+            {"db1": [{"Table": "tbl1", "Status": "Synced",
+                      "Strategy": "Checksum"},
+                     {"Table": "tbl2", "Status": "Synced",
+                      "Strategy": "Checksum"}]})
+        self.assertEqual((results["Master"], results["Slave"]),
+                         ("Master", "Slave"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
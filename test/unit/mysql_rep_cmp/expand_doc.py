@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  expand_doc.py
+
+    Description:  Unit testing of expand_doc in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/expand_doc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_copy
+        test_expand_doc
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {
+            "Platform": "MySQL",
+            "Pairs": [{"Checks": {"db1": [
+                mysql_rep_cmp.Check("tbl1", 0),
+                mysql_rep_cmp.Check("tbl2", 2, ["p1"]),
+                mysql_rep_cmp.Check(
+                    "tbl3", 1, None, [[0, 99]], "Chunk hash")]}}]}
+
+    def test_copy(self):
+
+        """Function:  test_copy
+
+        Description:  Test the document is not changed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.expand_doc(self.data)
+
+        self.assertIsInstance(
+            self.data["Pairs"][0]["Checks"]["db1"][0], mysql_rep_cmp.Check)
+
+    def test_expand_doc(self):
+
+        """Function:  test_expand_doc
+
+        Description:  Test the Check entries are expanded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.data),
+            {"Platform": "MySQL",
+             "Pairs": [{"Checks": {"db1": [
+                 {"Table": "tbl1", "Status": "Synced"},
+                 {"Table": "tbl2", "Status": "Partitions do not match",
+                  "Partitions": ["p1"]},
+                 {"Table": "tbl3", "Status": "Checksums do not match",
+                  "Strategy": "Chunk hash", "Ranges": [[0, 99]]}]}}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,745 @@
+# Classification (U)
+
+"""Program:  fake_mysql.py
+
+    Description:  In-process stand-in for the mysql_class.Server, MasterRep
+        and SlaveRep classes and the mysql_libs functions used by
+        mysql_rep_cmp.py, backed by an in-memory SQLite database per server.
+        The comparisons can be run from end to end in the unit tests and
+        benchmarks without a live server.
+
+        Each MySQL database is an attached SQLite database, so the
+        `db`.`table` names of the program's statements are used as is, and
+        information_schema is rebuilt from the SQLite catalog before each
+        statement reading it.  The MySQL functions used in the checksum
+        statements are registered as SQLite functions.
+
+        Statements run on a server with execute are replicated to its
+        replicas, which apply them once the replica's lag has passed.
+        Statements run on a replica are not replicated back, so a replica can
+        be made to diverge from its master.  Each statement can be delayed
+        by the server's latency.
+
+    Usage:
+        import fake_mysql
+
+        master = fake_mysql.MasterRep("Master", 10)
+        slave = fake_mysql.SlaveRep("Slave", 11, lag=0.5)
+        master.add_replica(slave)
+        master.execute("create database db1")
+        master.execute("create table `db1`.`tbl1` (id int primary key,"
+                       " name varchar(20)) engine=InnoDB")
+        master.execute("insert into `db1`.`tbl1` values (1, 'a')")
+        slave.execute("update `db1`.`tbl1` set name = 'b'")
+
+        with fake_mysql.patch({"master": master, "slave": slave}):
+            mysql_rep_cmp.run_program(args)
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import time
+import zlib
+import types
+import sqlite3
+import hashlib
+import threading
+import collections
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+INFO_SCHEMA = """
+create table information_schema.schemata (schema_name text);
+create table information_schema.tables (
+    table_schema text, table_name text, engine text, table_type text,
+    table_rows integer, data_length integer, index_length integer,
+    create_options text);
+create table information_schema.columns (
+    table_schema text, table_name text, column_name text,
+    ordinal_position integer, data_type text, column_type text,
+    is_nullable text, column_default text, extra text, collation_name text,
+    column_key text);
+create table information_schema.statistics (
+    table_schema text, table_name text, index_name text,
+    seq_in_index integer, column_name text, non_unique integer,
+    sub_part integer, index_type text, expression text);
+create table information_schema.partitions (
+    table_schema text, table_name text, partition_name text,
+    partition_ordinal_position integer, table_rows integer,
+    data_length integer, update_time text);
+"""
+ROW_LENGTH = 100
+NO_OPS = ("set ", "flush ", "unlock ", "lock ", "start transaction", "begin",
+          "commit", "rollback")
+TBL_OPTIONS = re.compile(r"\)\s*((?:\w+\s*=\s*\w+\s*)+)$", re.IGNORECASE)
+CHECKSUM = re.compile(
+    r"^checksum\s+table\s+(`?)(\w+)\1\.(`?)(\w+)\3(?:\s+(quick|extended))?$",
+    re.IGNORECASE)
+SQL_THREAD = re.compile(
+    r"^(stop|start)\s+(?:slave|replica)\s+sql_thread", re.IGNORECASE)
+SQL_MAP = [(r"%s", "?"), (r"\bas unsigned\b", "as text"),
+           (r"\bas binary\b", "as blob"), (r"\bleft\(", "left_str("),
+           (r"\bisnull\(", "is_null(")]
+
+
+class BitXor():
+
+    """Class:  BitXor
+
+    Description:  SQLite aggregate of the MySQL bit_xor function.  The result
+        is a string when it does not fit in a signed 64-bit integer.
+
+    Methods:
+        __init__
+        step
+        finalize
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.value = 0
+
+    def step(self, value):
+
+        """Method:  step
+
+        Description:  Add a value to the aggregate.
+
+        Arguments:
+            (input) value -> Integer or string of an integer
+
+        """
+
+        if value is not None:
+            self.value ^= int(value)
+
+    def finalize(self):
+
+        """Method:  finalize
+
+        Description:  Return the aggregate.
+
+        Arguments:
+            (output) Integer or string of the integer
+
+        """
+
+        return self.value if self.value < 2 ** 63 else str(self.value)
+
+
+def delay(secs, sleep=time.sleep):
+
+    """Function:  delay
+
+    Description:  Sleep for the latency.  The sleep function is bound when
+        the module is loaded, so the latency is not shortened when a test
+        patches time.sleep.
+
+    Arguments:
+        (input) secs -> Seconds to sleep
+        (input) sleep -> Sleep function
+
+    """
+
+    sleep(secs)
+
+
+def concat(*args):
+
+    """Function:  concat
+
+    Description:  MySQL concat function, NULL if any argument is NULL.
+
+    Arguments:
+        (input) args -> Values
+        (output) String or None
+
+    """
+
+    if any(arg is None for arg in args):
+        return None
+
+    return "".join(str(arg) for arg in args)
+
+
+def concat_ws(sep, *args):
+
+    """Function:  concat_ws
+
+    Description:  MySQL concat_ws function, NULL arguments are skipped.
+
+    Arguments:
+        (input) sep -> Separator
+        (input) args -> Values
+        (output) String
+
+    """
+
+    return sep.join(str(arg) for arg in args if arg is not None)
+
+
+def conv(value, from_base, to_base):
+
+    """Function:  conv
+
+    Description:  MySQL conv function, returns a string as MySQL does.
+
+    Arguments:
+        (input) value -> Number as a string
+        (input) from_base -> Base of the value
+        (input) to_base -> Base of the result, only 10 is supported
+        (output) String of the number
+
+    """
+
+    if value is None or int(to_base) != 10:
+        return None
+
+    return str(int(str(value), int(from_base)))
+
+
+def crc32(value):
+
+    """Function:  crc32
+
+    Description:  MySQL crc32 function.
+
+    Arguments:
+        (input) value -> Value
+        (output) Cyclic redundancy check value or None
+
+    """
+
+    return None if value is None else zlib.crc32(str(value).encode("UTF-8"))
+
+
+def md5(value):
+
+    """Function:  md5
+
+    Description:  MySQL md5 function.
+
+    Arguments:
+        (input) value -> Value
+        (output) Hexadecimal digest or None
+
+    """
+
+    return None if value is None \
+        else hashlib.md5(str(value).encode("UTF-8")).hexdigest()
+
+
+def regexp(pattern, value):
+
+    """Function:  regexp
+
+    Description:  MySQL REGEXP operator, SQLite passes the pattern first.
+
+    Arguments:
+        (input) pattern -> Regular expression
+        (input) value -> Value
+        (output) 1 if the value matches the pattern, otherwise 0
+
+    """
+
+    return int(bool(re.search(pattern, str(value))))
+
+
+FUNCTIONS = [
+    ("concat", -1, concat), ("concat_ws", -1, concat_ws), ("conv", 3, conv),
+    ("crc32", 1, crc32), ("md5", 1, md5), ("regexp", 2, regexp),
+    ("is_null", 1, lambda value: int(value is None)),
+    ("left_str", 2, lambda value, cnt: None if value is None
+     else str(value)[:int(cnt)]),
+    ("floor", 1, lambda value: None if value is None
+     else int(value // 1))]
+
+
+class Server():                                 # pylint:disable=R0902
+
+    """Class:  Server
+
+    Description:  Stand-in for mysql_class.Server backed by an in-memory
+        SQLite database.
+
+    Methods:
+        __init__
+        connect
+        disconnect
+        execute
+        replicate
+        add_replica
+        relay
+        catch_up
+        apply
+        refresh_info
+        table_info
+        checksum
+        col_sql
+        sql
+
+    """
+
+    def __init__(self, name, server_id=1, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Server name
+            (input) server_id -> Server id
+            (input) kwargs:
+                version -> Version tuple, default is (8, 0, 30)
+                latency -> Seconds each statement is delayed by
+                lag -> Seconds the replicated statements are delayed by
+                conn_error -> Connection error message to fail connect with
+
+        """
+
+        self.name = name
+        self.server_id = server_id
+        self.version = kwargs.get("version", (8, 0, 30))
+        self.latency = kwargs.get("latency", 0)
+        self.lag = kwargs.get("lag", 0)
+        self.conn_error = kwargs.get("conn_error", None)
+        self.conn = None
+        self.conn_msg = None
+        self.replicas = []
+        self.relay_log = collections.deque()
+        self.sql_thread = True
+        self.tbl_options = {}
+        self.statements = []
+        self.lock = threading.RLock()
+        self.db_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.db_conn.row_factory = sqlite3.Row
+        self.db_conn.isolation_level = None
+        self.db_conn.execute("attach ':memory:' as information_schema")
+        self.db_conn.executescript(INFO_SCHEMA)
+        self.db_conn.create_aggregate("bit_xor", 1, BitXor)
+
+        for func_name, nargs, func in FUNCTIONS:
+            self.db_conn.create_function(func_name, nargs, func)
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Connect to the server, fails with conn_error if set.
+
+        Arguments:
+            (input) silent -> True|False - Do not print the error
+
+        """
+
+        delay(self.latency)
+        self.conn_msg = self.conn_error
+        self.conn = None if self.conn_error else self
+
+        if self.conn_msg and not silent:
+            print(f"Couldn't connect to database.  MySQL error: "
+                  f"{self.conn_msg}")
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Disconnect from the server.
+
+        Arguments:
+
+        """
+
+        self.conn = None
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Run a data or definition statement on this server and
+            replicate it to its replicas.  The statements replicated to this
+            server are applied first.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) params -> Statement parameters
+
+        """
+
+        self.catch_up()
+        self.replicate(cmd, params)
+
+    def replicate(self, cmd, params=None):
+
+        """Method:  replicate
+
+        Description:  Run a statement on this server and relay it to its
+            replicas.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) params -> Statement parameters
+
+        """
+
+        self.apply(cmd, params)
+
+        for replica in self.replicas:
+            replica.relay(cmd, params)
+
+    def add_replica(self, replica):
+
+        """Method:  add_replica
+
+        Description:  Replicate the statements run on this server to a
+            replica.
+
+        Arguments:
+            (input) replica -> Server instance
+
+        """
+
+        self.replicas.append(replica)
+
+    def relay(self, cmd, params=None):
+
+        """Method:  relay
+
+        Description:  Queue a replicated statement, applied once the lag has
+            passed.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) params -> Statement parameters
+
+        """
+
+        with self.lock:
+            self.relay_log.append((time.monotonic() + self.lag, cmd, params))
+
+    def catch_up(self):
+
+        """Method:  catch_up
+
+        Description:  Apply the replicated statements whose lag has passed,
+            unless the SQL thread is stopped.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            while self.sql_thread and self.relay_log \
+                    and self.relay_log[0][0] <= time.monotonic():
+                _, cmd, params = self.relay_log.popleft()
+                self.replicate(cmd, params)
+
+    def apply(self, cmd, params=None):
+
+        """Method:  apply
+
+        Description:  Run a data or definition statement on this server.  A
+            create database statement attaches a database, the table options
+            of a create table statement are recorded.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) params -> Statement parameters
+
+        """
+
+        cmd = cmd.strip()
+
+        with self.lock:
+            if cmd.lower().startswith("create database"):
+                self.db_conn.execute(
+                    "attach ':memory:' as " + cmd.split()[-1])
+                return
+
+            options = TBL_OPTIONS.search(cmd)
+
+            if cmd.lower().startswith("create table") and options:
+                name = re.findall(r"\w+", cmd[12:])[:2]
+                self.tbl_options[tuple(name)] = dict(
+                    (key.lower(), value) for key, value in re.findall(
+                        r"(\w+)\s*=\s*(\w+)", options.group(1)))
+                cmd = cmd[:options.start(1)]
+
+            self.db_conn.execute(cmd.replace("%s", "?"), params or ())
+
+    def refresh_info(self):
+
+        """Method:  refresh_info
+
+        Description:  Rebuild information_schema from the SQLite catalog.
+
+        Arguments:
+
+        """
+
+        conn = self.db_conn
+
+        for tbl in ["schemata", "tables", "columns", "statistics",
+                    "partitions"]:
+            conn.execute(f"delete from information_schema.{tbl}")
+
+        for dbs in [row["name"] for row in conn.execute("pragma database_list")
+                    if row["name"] not in ("main", "temp",
+                                           "information_schema")]:
+            conn.execute(
+                "insert into information_schema.schemata values (?)", (dbs,))
+
+            for tbl in [row["name"] for row in conn.execute(
+                    f"select name from `{dbs}`.sqlite_master"
+                    " where type = 'table'")]:
+                self.table_info(dbs, tbl)
+
+    def table_info(self, dbs, tbl):
+
+        """Method:  table_info
+
+        Description:  Add a table to information_schema.
+
+        Arguments:
+            (input) dbs -> Database name
+            (input) tbl -> Table name
+
+        """
+
+        conn = self.db_conn
+        options = self.tbl_options.get((dbs, tbl), {})
+        rows = conn.execute(f"select count(*) from `{dbs}`.`{tbl}`").fetchone()
+        conn.execute(
+            "insert into information_schema.tables values"
+            " (?, ?, ?, 'BASE TABLE', ?, ?, 0, ?)",
+            (dbs, tbl, options.get("engine", "InnoDB"), rows[0],
+             rows[0] * ROW_LENGTH,
+             " ".join(f"{key}={value}" for key, value in options.items()
+                      if key != "engine")))
+
+        for col in conn.execute(f"pragma `{dbs}`.table_info(`{tbl}`)"):
+            conn.execute(
+                "insert into information_schema.columns values"
+                " (?, ?, ?, ?, ?, ?, ?, ?, '', NULL, ?)",
+                (dbs, tbl, col["name"], col["cid"] + 1,
+                 col["type"].lower().split("(")[0], col["type"].lower(),
+                 "NO" if col["notnull"] or col["pk"] else "YES",
+                 col["dflt_value"], "PRI" if col["pk"] else ""))
+
+            if col["pk"]:
+                conn.execute(
+                    "insert into information_schema.statistics values"
+                    " (?, ?, 'PRIMARY', ?, ?, 0, NULL, 'BTREE', NULL)",
+                    (dbs, tbl, col["pk"], col["name"]))
+
+        for idx in conn.execute(f"pragma `{dbs}`.index_list(`{tbl}`)"):
+            if idx["origin"] != "pk":
+                for col in conn.execute(
+                        f"pragma `{dbs}`.index_info(`{idx['name']}`)"):
+                    conn.execute(
+                        "insert into information_schema.statistics values"
+                        " (?, ?, ?, ?, ?, ?, NULL, 'BTREE', NULL)",
+                        (dbs, tbl, idx["name"], col["seqno"] + 1,
+                         col["name"], int(not idx["unique"])))
+
+    def checksum(self, match):
+
+        """Method:  checksum
+
+        Description:  Return the checksum of a table as checksum table does.
+            The quick checksum is only returned for tables created with the
+            checksum=1 option, as MySQL only keeps it for MyISAM tables.
+
+        Arguments:
+            (input) match -> Match of the checksum table statement
+            (output) List of the table's checksum
+
+        """
+
+        dbs, tbl, quick = match.group(2), match.group(4), match.group(5)
+        value = None
+
+        if not quick or quick.lower() != "quick" or self.tbl_options.get(
+                (dbs, tbl), {}).get("checksum") == "1":
+            rows = self.db_conn.execute(f"select * from `{dbs}`.`{tbl}`")
+            value = sum(crc32(repr(tuple(row))) for row in rows) % 2 ** 32
+
+        return [{"Table": f"{dbs}.{tbl}", "Checksum": value}]
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Run a select statement and return its rows.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) params -> Statement parameters
+            (output) List of dictionaries of the rows
+
+        """
+
+        delay(self.latency)
+        self.catch_up()
+        self.statements.append(cmd)
+        match = CHECKSUM.match(cmd.strip())
+
+        with self.lock:
+            if match:
+                return self.checksum(match)
+
+            if "information_schema" in cmd:
+                self.refresh_info()
+
+            for pattern, repl in SQL_MAP:
+                cmd = re.sub(pattern, repl, cmd, flags=re.IGNORECASE)
+
+            cur = self.db_conn.execute(cmd, params or ())
+
+            return [dict(row) for row in cur.fetchall()]
+
+    def sql(self, cmd, res_set="row", params=None):
+
+        """Method:  sql
+
+        Description:  Run a statement.  The transaction, locking and session
+            statements are accepted and ignored, stopping and starting the
+            SQL thread of a replica pauses and resumes its replication.  A
+            select statement returns an iterator over its row tuples, as
+            the cursor of mysql_class.Server.sql.
+
+        Arguments:
+            (input) cmd -> SQL statement
+            (input) res_set -> row|all - Type of result set
+            (input) params -> Statement parameters
+            (output) Iterator of the rows of a select, list of rows when
+                res_set is all
+
+        """
+
+        if cmd.strip().lower().startswith("select "):
+            return iter([tuple(row.values())
+                         for row in self.col_sql(cmd, params)])
+
+        delay(self.latency)
+        self.statements.append(cmd)
+        match = SQL_THREAD.match(cmd.strip())
+
+        if match:
+            with self.lock:
+                self.sql_thread = match.group(1).lower() == "start"
+
+            self.catch_up()
+
+        elif not cmd.strip().lower().startswith(NO_OPS):
+            self.execute(cmd, params)
+
+        return [] if res_set == "all" else None
+
+
+class MasterRep(Server):
+
+    """Class:  MasterRep
+
+    Description:  Stand-in for mysql_class.MasterRep.
+
+    Methods:
+        show_slv_hosts
+
+    """
+
+    def show_slv_hosts(self):
+
+        """Method:  show_slv_hosts
+
+        Description:  Return the replicas of the server.
+
+        Arguments:
+            (output) List of dictionaries of the replicas
+
+        """
+
+        delay(self.latency)
+        sid = "Server_Id" if self.version >= (8, 0, 26) else "Server_id"
+
+        return [{sid: replica.server_id, "Host": replica.name}
+                for replica in self.replicas]
+
+
+class SlaveRep(Server):
+
+    """Class:  SlaveRep
+
+    Description:  Stand-in for mysql_class.SlaveRep.
+
+    Methods:
+
+    """
+
+
+def patch(servers):
+
+    """Function:  patch
+
+    Description:  Patch the mysql_libs and mysql_class modules of
+        mysql_rep_cmp with the stand-ins.  The instances created from a
+        configuration file name are the servers passed.
+
+    Arguments:
+        (input) servers -> Dictionary of configuration file names and servers
+        (output) Patch of mysql_rep_cmp
+
+    """
+
+    libs = types.SimpleNamespace(
+        create_instance=lambda cfg_name, cfg_dir, cls: servers[cfg_name],
+        checksum=lambda server, dbs, tbl: server.col_sql(
+            f"checksum table `{dbs}`.`{tbl}`"),
+        disconnect=lambda *servers: [server.disconnect()
+                                     for server in servers])
+    classes = types.SimpleNamespace(
+        Server=Server, MasterRep=MasterRep, SlaveRep=SlaveRep)
+
+    return mock.patch.multiple(
+        "mysql_rep_cmp", mysql_libs=libs, mysql_class=classes)
+
+
+def write_cfg(cfg_dir, cfg_name, server):
+
+    """Function:  write_cfg
+
+    Description:  Write a configuration file for a server.
+
+    Arguments:
+        (input) cfg_dir -> Directory of the configuration files
+        (input) cfg_name -> Configuration file name
+        (input) server -> Server instance
+
+    """
+
+    with open(os.path.join(cfg_dir, cfg_name + ".py"), "w",
+              encoding="UTF-8") as fhdr:
+        fhdr.write(f'user = "user"\njapd = "japd"\nhost = "localhost"\n'
+                   f'name = "{server.name}"\nsid = {server.server_id}\n'
+                   f'serv_os = "Linux"\nport = 3306\n')
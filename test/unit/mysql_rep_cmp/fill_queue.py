@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  fill_queue.py
+
+    Description:  Unit testing of fill_queue in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/fill_queue.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import tempfile
+import shutil
+import sqlite3
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_refill
+        test_pages
+        test_strategy
+        test_part_state
+        test_fill_queue
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        self.tables = [("db1", "tbl1", {}),
+                       ("db1", "tbl2", {"Status": "Missing on slave"})]
+
+    def test_refill(self):
+
+        """Function:  test_refill
+
+        Description:  Test the units of a previous run are removed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables)
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables[:1])
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select db_name, tbl_name from units").fetchall(),
+            [("db1", "tbl1")])
+        conn.close()
+
+    @mock.patch("mysql_rep_cmp.PAGE_SIZE", 1)
+    def test_pages(self):
+
+        """Function:  test_pages
+
+        Description:  Test with more tables than a page.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables * 3)
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select count(*) from units").fetchone()[0], 6)
+        conn.close()
+
+    def test_strategy(self):
+
+        """Function:  test_strategy
+
+        Description:  Test the strategies are added to the units' entries.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(
+            self.queue_file,
+            [("db1", "tbl1", {"Strategy": "Row checksum"}),
+             ("db1", "tbl2", {"Strategy": "Skip", "Status": "Skipped"})])
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select state, entry from units order by unit_id")
+            .fetchall(),
+            [("pending", json.dumps({"Strategy": "Row checksum"})),
+             ("done", json.dumps({"Table": "tbl2", "Status": "Skipped",
+                                  "Strategy": "Skip"}))])
+        conn.close()
+
+    def test_part_state(self):
+
+        """Function:  test_part_state
+
+        Description:  Test the synced partitions are added to the units'
+            entries.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(
+            self.queue_file, self.tables, {"db1.tbl1": {"p1": [1]}})
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select entry from units order by unit_id")
+            .fetchone(), (json.dumps({"PartState": {"p1": [1]}}),))
+        conn.close()
+
+    def test_fill_queue(self):
+
+        """Function:  test_fill_queue
+
+        Description:  Test the units are added and the queue closed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables)
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute(
+                "select tbl_name, state, entry from units order by unit_id")
+            .fetchall(),
+            [("tbl1", "pending", None),
+             ("tbl2", "done",
+              json.dumps({"Table": "tbl2", "Status": "Missing on slave"}))])
+        self.assertEqual(
+            conn.execute("select name from queue_state").fetchall(),
+            [("closed",)])
+        conn.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  get_columns.py
+
+    Description:  Unit testing of get_columns in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/get_columns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.data = []
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_columns
+        test_columns
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.data = [{"Name": "col1"}, {"Name": "col2"}]
+        self.results = ["col1", "col2"]
+
+    def test_no_columns(self):
+
+        """Function:  test_no_columns
+
+        Description:  Test with no columns returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.get_columns(self.server, "db1", "tbl1"), [])
+
+    def test_columns(self):
+
+        """Function:  test_columns
+
+        Description:  Test with columns returned.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            mysql_rep_cmp.get_columns(self.server, "db1", "tbl1"),
+            self.results)
+        self.assertEqual(self.server.params, ("db1", "tbl1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+# Classification (U)
+
+"""Program:  get_conn.py
+
+    Description:  Unit testing of get_conn in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/get_conn.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub holder for mysql_class.Server.connect method.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_idle
+        test_new_conn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.server = Server()
+        self.hosts = {"master": {"limit": None, "idle": {}}}
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    def test_idle(self, mock_create):
+
+        """Function:  test_idle
+
+        Description:  Test an idle connection is reused.
+
+        Arguments:
+
+        """
+
+        self.hosts["master"]["idle"][Server] = [self.server]
+
+        self.assertIs(
+            mysql_rep_cmp.get_conn(self.args, self.hosts, "master", Server),
+            self.server)
+        self.assertEqual(self.hosts["master"]["idle"][Server], [])
+        mock_create.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    def test_new_conn(self, mock_create):
+
+        """Function:  test_new_conn
+
+        Description:  Test a connection is opened with no idle connection.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = self.server
+
+        self.assertIs(
+            mysql_rep_cmp.get_conn(self.args, self.hosts, "master", Server),
+            self.server)
+        self.assertTrue(self.server.connected)
+        mock_create.assert_called_once_with("master", "config", Server)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  get_history.py
+
+    Description:  Unit testing of get_history in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/get_history.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_other_pair
+        test_changes
+        test_empty_history
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.hist_file = os.path.join(self.tmp_dir, "history.db")
+        self.results = {"AsOf": "2025-01-01T00:00:00", "Master": "Master",
+                        "Slave": "Slave"}
+        self.tbl_stats = [("db1", "tbl1", "Synced", 1.0, 1.0, 0),
+                          ("db1", "tbl2", "Synced", 1.0, 1.0, 0)]
+        self.tbl_stats2 = [("db1", "tbl1", "Synced", 1.05, 1.05, 0),
+                           ("db1", "tbl2", "Checksums do not match", 3.0,
+                            18.0, 3)]
+        self.changes = [{"Database": "db1", "Table": "tbl2",
+                         "Previous": "Synced",
+                         "Current": "Checksums do not match"}]
+        self.slower = [{"Database": "db1", "Table": "tbl2",
+                        "ChecksumTime": 3.0, "AvgChecksumTime": 1.0}]
+
+    def test_other_pair(self):
+
+        """Function:  test_other_pair
+
+        Description:  Test with runs from two master/slave pairs.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats, time.time())
+        self.results["Slave"] = "Slave2"
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats2, time.time())
+
+        data = mysql_rep_cmp.get_history(self.hist_file)
+
+        self.assertEqual(len(data), 2)
+        self.assertIsNone(data[0]["PreviousRunId"])
+        self.assertEqual(data[0]["SlowerTables"], [])
+
+    def test_changes(self):
+
+        """Function:  test_changes
+
+        Description:  Test with status changes and slower tables.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats, time.time())
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats2, time.time())
+
+        data = mysql_rep_cmp.get_history(self.hist_file)
+
+        self.assertEqual(data[0]["PreviousRunId"], 1)
+        self.assertEqual(data[0]["StatusChanges"], self.changes)
+        self.assertEqual(data[0]["SlowerTables"], self.slower)
+
+    def test_empty_history(self):
+
+        """Function:  test_empty_history
+
+        Description:  Test with an empty history database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.get_history(self.hist_file), [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  get_partitions.py
+
+    Description:  Unit testing of get_partitions in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/get_partitions.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.data = []
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_partitioned
+        test_partitioned
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.data = [
+            {"Name": "p1", "TableRows": 10, "DataLength": 16384,
+             "UpdateTime": "2025-01-01 00:00:00"},
+            {"Name": "p2", "TableRows": None, "DataLength": None,
+             "UpdateTime": None}]
+        self.results = {
+            "p1": {"TableRows": 10, "DataLength": 16384,
+                   "UpdateTime": "2025-01-01 00:00:00"},
+            "p2": {"TableRows": 0, "DataLength": 0, "UpdateTime": None}}
+
+    def test_not_partitioned(self):
+
+        """Function:  test_not_partitioned
+
+        Description:  Test with a table that is not partitioned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.get_partitions(self.server, "db1", "tbl1"), {})
+
+    def test_partitioned(self):
+
+        """Function:  test_partitioned
+
+        Description:  Test with a partitioned table.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            mysql_rep_cmp.get_partitions(self.server, "db1", "tbl1"),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  get_sources.py
+
+    Description:  Unit testing of get_sources in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/get_sources.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_replica
+        test_pre_8022
+        test_get_sources
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_not_replica(self):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a server that is not a replica.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.get_sources(self.server), set())
+
+    def test_pre_8022(self):
+
+        """Function:  test_pre_8022
+
+        Description:  Test with a pre-MySQL 8.0.22 replica.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 7, 40)
+        self.server.data = [{"Master_UUID": "uuid1"}]
+
+        self.assertEqual(mysql_rep_cmp.get_sources(self.server), {"uuid1"})
+        self.assertEqual(self.server.cmd, "show slave status")
+
+    def test_get_sources(self):
+
+        """Function:  test_get_sources
+
+        Description:  Test with a multi-source replica.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"Source_UUID": "uuid1"},
+                            {"Source_UUID": "uuid2"}, {"Source_UUID": ""}]
+
+        self.assertEqual(
+            mysql_rep_cmp.get_sources(self.server), {"uuid1", "uuid2"})
+        self.assertEqual(self.server.cmd, "show replica status")
+
+
+if __name__ == "__main__":
+    unittest.main()
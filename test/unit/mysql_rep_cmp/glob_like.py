@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  glob_like.py
+
+    Description:  Unit testing of glob_like in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/glob_like.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_escaped
+        test_wildcards
+
+    """
+
+    def test_escaped(self):
+
+        """Function:  test_escaped
+
+        Description:  Test the SQL LIKE wildcards are escaped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.glob_like("db_1.t%\\x"),
+                         "db\\_1.t\\%\\\\x")
+
+    def test_wildcards(self):
+
+        """Function:  test_wildcards
+
+        Description:  Test the glob wildcards are converted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.glob_like("stage*.tmp?"),
+                         "stage%.tmp_")
+
+
+if __name__ == "__main__":
+    unittest.main()
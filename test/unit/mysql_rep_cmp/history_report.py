@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  history_report.py
+
+    Description:  Unit testing of history_report in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/history_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-Q": True, "-H": "history.db"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status_failed
+        test_history_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.history = [{"Master": "Master", "Slave": "Slave"}]
+        self.status = (True, None)
+        self.status2 = (False, "Error Message")
+
+    @mock.patch("mysql_rep_cmp.get_history")
+    @mock.patch("mysql_rep_cmp.data_out")
+    def test_status_failed(self, mock_out, mock_hist):
+
+        """Function:  test_status_failed
+
+        Description:  Test with status failure from data_out call.
+
+        Arguments:
+
+        """
+
+        mock_out.return_value = self.status2
+        mock_hist.return_value = self.history
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_cmp.history_report(self.args))
+
+    @mock.patch("mysql_rep_cmp.get_history")
+    @mock.patch("mysql_rep_cmp.data_out")
+    def test_history_report(self, mock_out, mock_hist):
+
+        """Function:  test_history_report
+
+        Description:  Test with the history report.
+
+        Arguments:
+
+        """
+
+        mock_out.return_value = self.status
+        mock_hist.return_value = self.history
+
+        self.assertFalse(mysql_rep_cmp.history_report(self.args))
+        self.assertEqual(
+            mock_out.call_args[0][0]["History"], self.history)
+        mock_hist.assert_called_with("history.db")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  incr_filter.py
+
+    Description:  Unit testing of incr_filter in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/incr_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import zlib
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slice
+        test_one_slice
+        test_incr_filter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {}),
+                       ("db2", "tbl3", {}),
+                       ("db3", "tbl4", {"Status": "Missing on slave"})]
+        self.slices = 1000
+        self.slice_no = zlib.crc32(b"db1.tbl2") % self.slices
+
+    def test_slice(self):
+
+        """Function:  test_slice
+
+        Description:  Test with no changes, only the slice is compared.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [item[1] for item in mysql_rep_cmp.incr_filter(
+                self.tables, set(), self.slice_no, self.slices)],
+            ["tbl2", "tbl4"])
+
+    def test_one_slice(self):
+
+        """Function:  test_one_slice
+
+        Description:  Test with one slice, all tables are compared.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_cmp.incr_filter(self.tables, set(), 0, 1)),
+            self.tables)
+
+    def test_incr_filter(self):
+
+        """Function:  test_incr_filter
+
+        Description:  Test with changed tables and databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [item[1] for item in mysql_rep_cmp.incr_filter(
+                self.tables, {("db1", "tbl1"), ("db2", None)},
+                self.slice_no, self.slices)],
+            ["tbl1", "tbl2", "tbl3", "tbl4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
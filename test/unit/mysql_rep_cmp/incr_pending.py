@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  incr_pending.py
+
+    Description:  Unit testing of incr_pending in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/incr_pending.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_checks
+        test_incr_pending
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.results = {"Checks": {
+            "db2": [mysql_rep_cmp.Check("tbl1", 1)],
+            "db1": [mysql_rep_cmp.Check("tbl1", 0),
+                    mysql_rep_cmp.Check("tbl3", 3),
+                    mysql_rep_cmp.Check("tbl2", 8)]}}
+
+    def test_no_checks(self):
+
+        """Function:  test_no_checks
+
+        Description:  Test with no tables compared.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.incr_pending({"Checks": {}}), [])
+
+    def test_incr_pending(self):
+
+        """Function:  test_incr_pending
+
+        Description:  Test the synced and skipped tables are left out.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.incr_pending(self.results),
+                         [["db1", "tbl3"], ["db2", "tbl1"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
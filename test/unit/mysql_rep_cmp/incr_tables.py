@@ -0,0 +1,177 @@
+# Classification (U)
+
+"""Program:  incr_tables.py
+
+    Description:  Unit testing of incr_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/incr_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_run
+        test_unknown
+        test_pending
+        test_incr_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {})]
+        self.state = {"File": "binlog.000012", "Position": 500, "Slice": 6}
+
+    @mock.patch("mysql_rep_cmp.binlog_changes")
+    @mock.patch("mysql_rep_cmp.binlog_pos",
+                mock.Mock(return_value=("binlog.000013", 4)))
+    def test_first_run(self, mock_changes):
+
+        """Function:  test_first_run
+
+        Description:  Test with no state from a last run.
+
+        Arguments:
+
+        """
+
+        state = {}
+        tables, summary = mysql_rep_cmp.incr_tables(
+            self.master, self.tables, state)
+
+        self.assertIs(tables, self.tables)
+        self.assertEqual(summary, {"Since": None,
+                                   "Position": "binlog.000013:4",
+                                   "Slice": "1/7", "FullScan": True})
+        self.assertEqual(
+            state, {"File": "binlog.000013", "Position": 4, "Slice": 0})
+        mock_changes.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.binlog_changes",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.binlog_pos",
+                mock.Mock(return_value=("binlog.000013", 4)))
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with the changes not known.
+
+        Arguments:
+
+        """
+
+        tables, summary = mysql_rep_cmp.incr_tables(
+            self.master, self.tables, self.state)
+
+        self.assertIs(tables, self.tables)
+        self.assertTrue(summary["FullScan"])
+
+    @mock.patch("mysql_rep_cmp.binlog_changes")
+    @mock.patch("mysql_rep_cmp.binlog_pos",
+                mock.Mock(return_value=("binlog.000013", 4)))
+    def test_pending(self, mock_changes):
+
+        """Function:  test_pending
+
+        Description:  Test the tables not in sync on the last run are
+            compared again.
+
+        Arguments:
+
+        """
+
+        self.state["Pending"] = [["db1", "tbl1"]]
+        mock_changes.return_value = {("db1", "tbl2")}
+        tables, _ = mysql_rep_cmp.incr_tables(
+            self.master, self.tables, self.state, slices=1000)
+
+        self.assertEqual(list(tables),
+                         [("db1", "tbl1", {}), ("db1", "tbl2", {})])
+
+    @mock.patch("mysql_rep_cmp.binlog_changes")
+    @mock.patch("mysql_rep_cmp.binlog_pos",
+                mock.Mock(return_value=("binlog.000013", 4)))
+    def test_incr_tables(self, mock_changes):
+
+        """Function:  test_incr_tables
+
+        Description:  Test with the tables changed since the last run.
+
+        Arguments:
+
+        """
+
+        mock_changes.return_value = {("db1", "tbl2")}
+        tables, summary = mysql_rep_cmp.incr_tables(
+            self.master, self.tables, self.state, slices=1000)
+
+        self.assertEqual(list(tables), [("db1", "tbl2", {})])
+        self.assertEqual(summary, {"Since": "binlog.000012:500",
+                                   "Position": "binlog.000013:4",
+                                   "Slice": "8/1000", "FullScan": False})
+        self.assertEqual(self.state["Slice"], 7)
+        mock_changes.assert_called_once_with(
+            self.master, ("binlog.000012", 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  is_replica.py
+
+    Description:  Unit testing of is_replica in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/is_replica.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        show_slv_hosts
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.server_id = 11
+        self.version = (8, 0, 30)
+        self.slv_lists = [{"Server_Id": 11}]
+
+    def show_slv_hosts(self):
+
+        """Method:  show_slv_hosts
+
+        Description:  Stub holder for mysql_class.MasterRep.show_slv_hosts.
+
+        Arguments:
+
+        """
+
+        return self.slv_lists
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_slaves
+        test_not_replica
+        test_str_server_id
+        test_is_replica
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves on the master.
+
+        Arguments:
+
+        """
+
+        self.master.slv_lists = []
+
+        self.assertFalse(mysql_rep_cmp.is_replica(self.master, self.slave))
+
+    def test_not_replica(self):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a slave not in replication with the master.
+
+        Arguments:
+
+        """
+
+        self.slave.server_id = 12
+
+        self.assertFalse(mysql_rep_cmp.is_replica(self.master, self.slave))
+
+    def test_str_server_id(self):
+
+        """Function:  test_str_server_id
+
+        Description:  Test with the server ids as strings.
+
+        Arguments:
+
+        """
+
+        self.master.version = (8, 0, 6)
+        self.master.slv_lists = [{"Server_id": "11"}]
+
+        self.assertTrue(mysql_rep_cmp.is_replica(self.master, self.slave))
+
+    def test_is_replica(self):
+
+        """Function:  test_is_replica
+
+        Description:  Test with a slave in replication with the master.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.is_replica(self.master, self.slave))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+# Classification (U)
+
+"""Program:  iter_tables.py
+
+    Description:  Unit testing of iter_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/iter_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.pages = []
+        self.params = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.params.append(params)
+
+        return self.pages.pop(0) if cmd and self.pages else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lazy
+        test_tables
+        test_no_databases
+        test_full_last_page
+        test_binary_order
+        test_iter_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.dbs = [{"SchemaName": "db2"}, {"SchemaName": "db1"}]
+        self.row1 = {"TableName": "t1", "Engine": "InnoDB",
+                     "TableType": "BASE TABLE", "TableRows": 10,
+                     "DataLength": 16384, "IndexLength": 0,
+                     "CreateOptions": ""}
+        self.row2 = dict(self.row1, TableName="t2")
+        self.row3 = dict(self.row1, TableName="t3")
+        self.meta = {"Engine": "InnoDB", "TableType": "BASE TABLE",
+                     "TableRows": 10, "DataLength": 16384, "IndexLength": 0,
+                     "CreateOptions": ""}
+
+    def test_lazy(self):
+
+        """Function:  test_lazy
+
+        Description:  Test no query is run until the first table is read.
+
+        Arguments:
+
+        """
+
+        self.server.pages = [self.dbs[1:], [self.row1, self.row2]]
+        tables = mysql_rep_cmp.iter_tables(self.server, page_size=2)
+
+        self.assertEqual(self.server.params, [])
+        self.assertEqual(next(tables), ("db1", "t1", self.meta))
+        self.assertEqual(self.server.params, [(), ("db1", 2)])
+
+    def test_tables(self):
+
+        """Function:  test_tables
+
+        Description:  Test with tables, only the first database is checked.
+
+        Arguments:
+
+        """
+
+        self.server.pages = [self.dbs[1:], [self.row1]]
+
+        self.assertEqual(
+            list(mysql_rep_cmp.iter_tables(
+                self.server, db_list=["db1", "db2"], tbls=["t1"])),
+            [("db1", "t1", self.meta)])
+        self.assertEqual(self.server.params,
+                         [("db1",), ("db1", "t1", 1000)])
+
+    def test_no_databases(self):
+
+        """Function:  test_no_databases
+
+        Description:  Test with no databases selected.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(mysql_rep_cmp.iter_tables(self.server)), [])
+        self.assertEqual(self.server.params, [()])
+
+    def test_full_last_page(self):
+
+        """Function:  test_full_last_page
+
+        Description:  Test with the last page full, an empty page ends it.
+
+        Arguments:
+
+        """
+
+        self.server.pages = [self.dbs[1:], [self.row1, self.row2]]
+
+        self.assertEqual(
+            len(list(mysql_rep_cmp.iter_tables(self.server, page_size=2))),
+            2)
+        self.assertEqual(self.server.params,
+                         [(), ("db1", 2), ("db1", "t2", 2)])
+
+    def test_binary_order(self):
+
+        """Function:  test_binary_order
+
+        Description:  Test the databases are read in binary order, whatever
+            the order of the server.
+
+        Arguments:
+
+        """
+
+        self.server.pages = [[{"SchemaName": "app"}, {"SchemaName": "Bar"}],
+                             [self.row1], [self.row2]]
+
+        self.assertEqual(
+            [item[:2] for item in mysql_rep_cmp.iter_tables(self.server)],
+            [("Bar", "t1"), ("app", "t2")])
+
+    def test_iter_tables(self):
+
+        """Function:  test_iter_tables
+
+        Description:  Test with the tables of several databases over several
+            pages.
+
+        Arguments:
+
+        """
+
+        self.server.pages = [self.dbs, [self.row1, self.row2], [],
+                             [self.row3]]
+
+        self.assertEqual(
+            [item[:2] for item in mysql_rep_cmp.iter_tables(
+                self.server, page_size=2, exclude=["*.tmp*"])],
+            [("db1", "t1"), ("db1", "t2"), ("db2", "t3")])
+        self.assertEqual(
+            self.server.params,
+            [(), ("db1", "%.tmp%", 2), ("db1", "%.tmp%", "t2", 2),
+             ("db2", "%.tmp%", 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  keep_checksum.py
+
+    Description:  Unit testing of keep_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/keep_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_last
+        test_keep_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.slave = "Slave"
+        self.checksum = mock.Mock(side_effect=[1, 2, 3])
+        self.last = {}
+
+    def test_last(self):
+
+        """Function:  test_last
+
+        Description:  Test only the last checksum of a server is kept.
+
+        Arguments:
+
+        """
+
+        for server in [self.master, self.slave, self.master]:
+            mysql_rep_cmp.keep_checksum(
+                self.checksum, self.last, server, "db1", "tbl1")
+
+        self.assertEqual(self.last, {"Master": 3, "Slave": 2})
+
+    def test_keep_checksum(self):
+
+        """Function:  test_keep_checksum
+
+        Description:  Test the checksum is returned and kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.keep_checksum(
+                self.checksum, self.last, self.master, "db1", "tbl1"), 1)
+        self.assertEqual(self.last, {"Master": 1})
+        self.checksum.assert_called_once_with(self.master, "db1", "tbl1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  key_column.py
+
+    Description:  Unit testing of key_column in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/key_column.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_key
+        test_key_column
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_key(self):
+
+        """Function:  test_no_key
+
+        Description:  Test with a table without an integer primary key.
+
+        Arguments:
+
+        """
+
+        self.server.data = [[]]
+
+        self.assertIsNone(
+            mysql_rep_cmp.key_column(self.server, "db1", "tbl1"))
+
+    def test_key_column(self):
+
+        """Function:  test_key_column
+
+        Description:  Test with an integer primary key.
+
+        Arguments:
+
+        """
+
+        self.server.data = [[{"Name": "id"}]]
+
+        self.assertEqual(
+            mysql_rep_cmp.key_column(self.server, "db1", "tbl1"), "id")
+        self.assertIn("index_name = 'PRIMARY'", self.server.cmds[0])
+        self.assertEqual(self.server.cmds[1], ("db1", "tbl1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
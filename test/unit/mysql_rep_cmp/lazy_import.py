@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  lazy_import.py
+
+    Description:  Unit testing of lazy_import in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/lazy_import.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import subprocess
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_startup_imports
+        test_deferred
+        test_already_loaded
+        test_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "mysql_rep_cmp_lazy_mod"
+        self.tmp_dir = tempfile.mkdtemp()
+        self.heavy = [
+            "mysql_lib.mysql_libs", "mysql_lib.mysql_class", "simplejson",
+            "json", "asyncio", "sqlite3", "pprint", "concurrent.futures"]
+
+        with open(os.path.join(self.tmp_dir, self.name + ".py"), "w",
+                  encoding="UTF-8") as fhdr:
+            fhdr.write("LOADED = True\n")
+
+        sys.path.insert(0, self.tmp_dir)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.path.remove(self.tmp_dir)
+        sys.modules.pop(self.name, None)
+        shutil.rmtree(self.tmp_dir)
+
+    def test_startup_imports(self):
+
+        """Function:  test_startup_imports
+
+        Description:  Test importing the program does not load the modules
+            that are lazy loaded.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import mysql_rep_cmp"],
+            capture_output=True, text=True, check=True)
+        loaded = [line.split("|")[-1].strip()
+                  for line in proc.stderr.splitlines()
+                  if line.startswith("import time:")]
+
+        self.assertEqual([mod for mod in self.heavy if mod in loaded], [])
+
+    def test_deferred(self):
+
+        """Function:  test_deferred
+
+        Description:  Test the module is loaded on first attribute use.
+
+        Arguments:
+
+        """
+
+        module = mysql_rep_cmp.lazy_import(self.name)
+
+        self.assertIs(sys.modules[self.name], module)
+        self.assertTrue(module.LOADED)
+
+    def test_already_loaded(self):
+
+        """Function:  test_already_loaded
+
+        Description:  Test with a module already loaded.
+
+        Arguments:
+
+        """
+
+        self.assertIs(mysql_rep_cmp.lazy_import("os"), os)
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a module that is not found.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_cmp.lazy_import("mysql_rep_cmp_no_mod"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  load_cfg.py
+
+    Description:  Unit testing of load_cfg in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/load_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Emulate a configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization.
+
+        Arguments:
+
+        """
+
+        self.user = "mysql"
+        self.japd = None
+        self.host = "hostname"
+        self.name = "ServerName"
+        self.sid = 11
+        self.serv_os = "Linux"
+        self.port = 3306
+        self.ign_dbs = ["performance_schema", "information_schema"]
+        self.ign_db_tbl = {"mysql": ["innodb_index_stats"]}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_loaded_once
+        test_immutable
+        test_bad_ign_db_tbl
+        test_missing_settings
+        test_no_ign_lists
+        test_load_cfg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = Cfg()
+        mysql_rep_cmp.load_cfg.cache_clear()
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_loaded_once(self, mock_load):
+
+        """Function:  test_loaded_once
+
+        Description:  Test the file is only loaded once.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        cfg = mysql_rep_cmp.load_cfg("mysql_cfg", "config")
+
+        self.assertIs(mysql_rep_cmp.load_cfg("mysql_cfg", "config"), cfg)
+        mock_load.assert_called_once_with("mysql_cfg", "config")
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_immutable(self, mock_load):
+
+        """Function:  test_immutable
+
+        Description:  Test the ignore lists can not be changed.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        cfg, _ = mysql_rep_cmp.load_cfg("mysql_cfg", "config")
+
+        with self.assertRaises(TypeError):
+            cfg.ign_db_tbl["sys"] = frozenset()
+
+        with self.assertRaises(AttributeError):
+            cfg.ign_dbs.add("sys")
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_bad_ign_db_tbl(self, mock_load):
+
+        """Function:  test_bad_ign_db_tbl
+
+        Description:  Test with ign_db_tbl not a dictionary of lists.
+
+        Arguments:
+
+        """
+
+        self.cfg.ign_db_tbl = {"mysql": "innodb_index_stats"}
+        mock_load.return_value = self.cfg
+
+        cfg, err_msg = mysql_rep_cmp.load_cfg("mysql_cfg", "config")
+
+        self.assertIsNone(cfg)
+        self.assertIn("ign_db_tbl", err_msg)
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_missing_settings(self, mock_load):
+
+        """Function:  test_missing_settings
+
+        Description:  Test with missing settings.
+
+        Arguments:
+
+        """
+
+        del self.cfg.host
+        del self.cfg.port
+        mock_load.return_value = self.cfg
+
+        self.assertEqual(
+            mysql_rep_cmp.load_cfg("mysql_cfg", "config"),
+            (None, "Error: mysql_cfg: Missing settings: ['host', 'port']"))
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_no_ign_lists(self, mock_load):
+
+        """Function:  test_no_ign_lists
+
+        Description:  Test with no ignore lists in the file.
+
+        Arguments:
+
+        """
+
+        del self.cfg.ign_dbs
+        del self.cfg.ign_db_tbl
+        mock_load.return_value = self.cfg
+
+        cfg, _ = mysql_rep_cmp.load_cfg("mysql_cfg", "config")
+
+        self.assertEqual(
+            (cfg.ign_dbs, dict(cfg.ign_db_tbl)), (frozenset(), {}))
+
+    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    def test_load_cfg(self, mock_load):
+
+        """Function:  test_load_cfg
+
+        Description:  Test with a valid file.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        self.assertEqual(
+            mysql_rep_cmp.load_cfg("mysql_cfg", "config"),
+            (mysql_rep_cmp.ServerCfg(
+                "mysql_cfg", "config",
+                frozenset(["performance_schema", "information_schema"]),
+                {"mysql": frozenset(["innodb_index_stats"])}, "hostname",
+                3306), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  load_modules.py
+
+    Description:  Unit testing of load_modules in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/load_modules.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import types
+import concurrent.futures
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        lazy_module
+        test_numpy
+        test_not_installed
+        test_threads
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tmp_dir = tempfile.mkdtemp()
+        sys.path.insert(0, self.tmp_dir)
+
+        with open(os.path.join(self.tmp_dir, "slow_module.py"), "w",
+                  encoding="UTF-8") as fhdr:
+            fhdr.write("import time\ntime.sleep(0.2)\nVALUE = 1\n")
+
+    def lazy_module(self):
+
+        """Function:  lazy_module
+
+        Description:  Return a lazy loaded module which is slow to load.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("slow_module", None)
+
+        return mysql_rep_cmp.lazy_import("slow_module")
+
+    def test_numpy(self):
+
+        """Function:  test_numpy
+
+        Description:  Test numpy is only loaded with the -Y option.
+
+        Arguments:
+
+        """
+
+        module = self.lazy_module()
+
+        with mock.patch("mysql_rep_cmp.numpy", module):
+            mysql_rep_cmp.load_modules(self.args)
+
+            self.assertIsNot(type(module), types.ModuleType)
+
+            self.args.args_array["-Y"] = "1000"
+            mysql_rep_cmp.load_modules(self.args)
+
+            self.assertIs(type(module), types.ModuleType)
+
+    @mock.patch("mysql_rep_cmp.zstandard", None)
+    def test_not_installed(self):
+
+        """Function:  test_not_installed
+
+        Description:  Test with a module that is not installed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.load_modules(self.args)
+
+        self.assertIsNone(mysql_rep_cmp.zstandard)
+
+    def test_threads(self):
+
+        """Function:  test_threads
+
+        Description:  Test the module is used by several threads at the
+            same moment once loaded.
+
+        Arguments:
+
+        """
+
+        module = self.lazy_module()
+
+        with mock.patch("mysql_rep_cmp.mysql_class", module):
+            mysql_rep_cmp.load_modules(self.args)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            values = list(pool.map(
+                lambda _: getattr(module, "VALUE", None), range(4)))
+
+        self.assertEqual(values, [1] * 4)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.path.remove(self.tmp_dir)
+        sys.modules.pop("slow_module", None)
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  load_part_state.py
+
+    Description:  Unit testing of load_part_state in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/load_part_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_state_file
+        test_missing_file
+        test_no_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.tmp_dir, "state.json")
+        self.state = {"db1.tbl1": {"p1": {"TableRows": 1}}}
+
+    def test_state_file(self):
+
+        """Function:  test_state_file
+
+        Description:  Test with an existing state file.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_part_state(self.state_file, self.state)
+
+        self.assertEqual(
+            mysql_rep_cmp.load_part_state(self.state_file), self.state)
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a state file that does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.load_part_state(self.state_file), {})
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no state file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.load_part_state(None), {})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  load_topology.py
+
+    Description:  Unit testing of load_topology in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/load_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        write_file
+        test_same_server
+        test_bad_line
+        test_load_topology
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.topo_file = os.path.join(self.tmp_dir, "topology.txt")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def write_file(self, data):
+
+        """Function:  write_file
+
+        Description:  Write the topology file.
+
+        Arguments:
+
+        """
+
+        with open(self.topo_file, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write(data)
+
+    def test_same_server(self):
+
+        """Function:  test_same_server
+
+        Description:  Test with a pair of the same server.
+
+        Arguments:
+
+        """
+
+        self.write_file("master slave1\nmaster master\n")
+
+        self.assertEqual(
+            mysql_rep_cmp.load_topology(self.topo_file),
+            (None, f"Error: {self.topo_file}: Line 2 is not valid"))
+
+    def test_bad_line(self):
+
+        """Function:  test_bad_line
+
+        Description:  Test with a line that is not a pair.
+
+        Arguments:
+
+        """
+
+        self.write_file("master slave1 slave2\n")
+
+        self.assertEqual(
+            mysql_rep_cmp.load_topology(self.topo_file),
+            (None, f"Error: {self.topo_file}: Line 1 is not valid"))
+
+    def test_load_topology(self):
+
+        """Function:  test_load_topology
+
+        Description:  Test with comments and blank lines.
+
+        Arguments:
+
+        """
+
+        self.write_file("# Pairs\nmaster slave1\n\n  master\tslave2\n")
+
+        self.assertEqual(
+            mysql_rep_cmp.load_topology(self.topo_file),
+            ([("master", "slave1"), ("master", "slave2")], None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+# Classification (U)
+
+"""Program:  lock_ids.py
+
+    Description:  Unit testing of lock_ids in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/lock_ids.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_topology_not_valid
+        test_topology
+        test_flavor
+        test_lock_ids
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "master", "-r": "slave", "-d": "/cfg"}
+        self.pairs = [("master", "slave"), ("master2", "slave"),
+                      ("master", "slave")]
+
+    @mock.patch("mysql_rep_cmp.load_topology",
+                mock.Mock(return_value=(None, "Error")))
+    def test_topology_not_valid(self):
+
+        """Function:  test_topology_not_valid
+
+        Description:  Test with a topology file that is not valid.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-M": "topology.txt", "-d": "/cfg"}
+
+        self.assertEqual(mysql_rep_cmp.lock_ids(self.args), [])
+
+    @mock.patch("mysql_rep_cmp.pair_id",
+                mock.Mock(side_effect=lambda pair, cfg_dir: "-".join(pair)))
+    @mock.patch("mysql_rep_cmp.load_topology")
+    def test_topology(self, mock_topo):
+
+        """Function:  test_topology
+
+        Description:  Test with -M option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-M": "topology.txt", "-d": "/cfg"}
+        mock_topo.return_value = (self.pairs, None)
+
+        self.assertEqual(mysql_rep_cmp.lock_ids(self.args),
+                         ["master-slave", "master2-slave"])
+
+    @mock.patch("mysql_rep_cmp.pair_id",
+                mock.Mock(side_effect=lambda pair, cfg_dir: "-".join(pair)))
+    def test_flavor(self):
+
+        """Function:  test_flavor
+
+        Description:  Test with -y option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-y"] = ["nightly", "600"]
+
+        self.assertEqual(mysql_rep_cmp.lock_ids(self.args),
+                         ["nightly_master-slave"])
+
+    @mock.patch("mysql_rep_cmp.pair_id")
+    def test_worker(self, mock_pair):
+
+        """Function:  test_worker
+
+        Description:  Test with -J option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-J"] = True
+
+        self.assertEqual(mysql_rep_cmp.lock_ids(self.args), [])
+        mock_pair.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.pair_id")
+    def test_lock_ids(self, mock_pair):
+
+        """Function:  test_lock_ids
+
+        Description:  Test with a master and slave pair.
+
+        Arguments:
+
+        """
+
+        mock_pair.return_value = "db1_3306-db2_3306"
+
+        self.assertEqual(mysql_rep_cmp.lock_ids(self.args),
+                         ["db1_3306-db2_3306"])
+        mock_pair.assert_called_once_with(("master", "slave"), "/cfg")
+
+
+if __name__ == "__main__":
+    unittest.main()
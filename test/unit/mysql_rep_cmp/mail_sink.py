@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  mail_sink.py
+
+    Description:  Unit testing of mail_sink in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/mail_sink.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Mail():
+
+    """Class:  Mail
+
+    Description:  Class stub holder for gen_class.Mail class.
+
+    Methods:
+        __init__
+        add_2_msg
+        send_mail
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.msg = ""
+        self.mailx = None
+
+    def add_2_msg(self, txt_ln=None):
+
+        """Method:  add_2_msg
+
+        Description:  Stub holder for gen_class.Mail.add_2_msg method.
+
+        Arguments:
+
+        """
+
+        self.msg = self.msg + txt_ln
+
+    def send_mail(self, use_mailx=False):
+
+        """Method:  send_mail
+
+        Description:  Stub holder for gen_class.Mail.send_mail method.
+
+        Arguments:
+
+        """
+
+        self.mailx = use_mailx
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mailx
+        test_mail_sink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = Mail()
+        self.body = "Email Body"
+
+    def test_mailx(self):
+
+        """Function:  test_mailx
+
+        Description:  Test with sending email with mailx.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.mail_sink(self.mail, self.body, use_mailx=True)
+
+        self.assertTrue(self.mail.mailx)
+
+    def test_mail_sink(self):
+
+        """Function:  test_mail_sink
+
+        Description:  Test with sending email.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.mail_sink(self.mail, self.body)
+
+        self.assertEqual(self.mail.msg, self.body)
+        self.assertFalse(self.mail.mailx)
+
+
+if __name__ == "__main__":
+    unittest.main()
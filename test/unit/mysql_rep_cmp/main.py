@@ -41,6 +41,7 @@ class ArgParser():
         arg_require
         arg_file_chk
         get_val
+        arg_exist
         arg_parse2
 
     """
@@ -137,6 +138,18 @@ class ArgParser():
 
         return self.args_array.get(skey, def_val)
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def arg_parse2(self):
 
         """Method:  arg_parse2
@@ -185,6 +198,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_trace
+        test_profile
+        test_topology
+        test_history_cond_req_false
+        test_history_report
         test_arg_parse2_false
         test_arg_parse2_true
         test_programlock_id
@@ -218,8 +236,137 @@ class UnitTest(unittest.TestCase):
         self.args2 = ArgParser()
         self.args.args_array = {"-c": "CfgFile", "-d": "CfgDir"}
         self.args2.args_array = {
-            "-c": "CfgFile", "-d": "CfgDir", "-y": "Flavor"}
+            "-c": "CfgFile", "-d": "CfgDir", "-y": ["Flavor"]}
         self.proglock = ProgramLock(["cmdline"], "FlavorID")
+        self.args3 = ArgParser()
+        self.args3.args_array = {"-Q": True, "-H": "history.db"}
+        self.args4 = ArgParser()
+        self.args4.args_array = {"-M": "topology.txt", "-d": "CfgDir"}
+        self.args5 = ArgParser()
+        self.args5.args_array = {
+            "-c": "CfgFile", "-d": "CfgDir", "-o": "Outfile", "-F": True}
+        self.args6 = ArgParser()
+        self.args6.args_array = {
+            "-c": "CfgFile", "-d": "CfgDir", "-B": "Tracefile"}
+
+    @mock.patch("mysql_rep_cmp.run_program")
+    @mock.patch("mysql_rep_cmp.trace_file")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    @mock.patch("mysql_rep_cmp.gen_libs.help_func")
+    @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
+    def test_trace(                             # pylint:disable=R0913,R0917
+            self, mock_arg, mock_help, mock_lock, mock_trace, mock_run):
+
+        """Function:  test_trace
+
+        Description:  Test with -B option.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args6
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_rep_cmp.main())
+        mock_trace.assert_called_once_with("Tracefile")
+        mock_run.assert_called_once_with(self.args6)
+
+    @mock.patch("mysql_rep_cmp.run_program")
+    @mock.patch("mysql_rep_cmp.profile_run")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    @mock.patch("mysql_rep_cmp.gen_libs.help_func")
+    @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
+    def test_profile(                           # pylint:disable=R0913,R0917
+            self, mock_arg, mock_help, mock_lock, mock_prof, mock_run):
+
+        """Function:  test_profile
+
+        Description:  Test with -F option.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args5
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_rep_cmp.main())
+        mock_prof.assert_called_once_with(self.args5, mock_run)
+        mock_run.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.run_program")
+    @mock.patch("mysql_rep_cmp.run_topology")
+    @mock.patch("mysql_rep_cmp.lock_ids", mock.Mock(return_value=["LockId"]))
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    @mock.patch("mysql_rep_cmp.gen_libs.help_func")
+    @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
+    def test_topology(                          # pylint:disable=R0913,R0917
+            self, mock_arg, mock_help, mock_lock, mock_topo, mock_run):
+
+        """Function:  test_topology
+
+        Description:  Test with -M option.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args4
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_rep_cmp.main())
+        mock_topo.assert_called_once_with(self.args4)
+        mock_run.assert_not_called()
+        self.assertEqual(self.args4.opt_req, ["-d"])
+
+    @mock.patch("mysql_rep_cmp.history_report")
+    @mock.patch("mysql_rep_cmp.gen_libs.help_func")
+    @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
+    def test_history_cond_req_false(self, mock_arg, mock_help, mock_hist):
+
+        """Function:  test_history_cond_req_false
+
+        Description:  Test with -Q option and arg_cond_req returns false.
+
+        Arguments:
+
+        """
+
+        self.args3.opt_con_req2 = False
+
+        mock_arg.return_value = self.args3
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_cmp.main())
+        mock_hist.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.wait_sinks")
+    @mock.patch("mysql_rep_cmp.run_program")
+    @mock.patch("mysql_rep_cmp.history_report")
+    @mock.patch("mysql_rep_cmp.gen_libs.help_func")
+    @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
+    def test_history_report(                    # pylint:disable=R0913,R0917
+            self, mock_arg, mock_help, mock_hist, mock_run, mock_wait):
+
+        """Function:  test_history_report
+
+        Description:  Test with -Q option.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args3
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_cmp.main())
+        mock_hist.assert_called_once_with(self.args3)
+        mock_run.assert_not_called()
+        mock_wait.assert_called_once_with()
 
     @mock.patch("mysql_rep_cmp.gen_class.ArgParser")
     def test_arg_parse2_false(self, mock_arg):
@@ -274,6 +421,7 @@ class UnitTest(unittest.TestCase):
         mock_lock.return_value = self.proglock
 
         self.assertFalse(mysql_rep_cmp.main())
+        self.assertEqual(mock_lock.call_args[0][1], "Flavor_CfgFile-None")
 
     @mock.patch("mysql_rep_cmp.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  name_rules.py
+
+    Description:  Unit testing of name_rules in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/name_rules.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_changed
+        test_name_rules
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rules = {
+            "db_list": ["db1"], "tbls": [], "ign_dbs": ["mysql"],
+            "ign_db_tbl": {}, "include": ["db1.t*"], "exclude": [],
+            "skip_engines": ["MEMORY"], "size": (1048576, None),
+            "skip_views": True}
+
+    def test_not_changed(self):
+
+        """Function:  test_not_changed
+
+        Description:  Test the rules passed are not changed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.name_rules(self.rules)
+
+        self.assertEqual(self.rules["size"], (1048576, None))
+
+    def test_name_rules(self):
+
+        """Function:  test_name_rules
+
+        Description:  Test only the name rules are returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.name_rules(self.rules), {
+            "db_list": ["db1"], "tbls": [], "ign_dbs": ["mysql"],
+            "ign_db_tbl": {}, "include": ["db1.t*"], "exclude": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  open_queue.py
+
+    Description:  Unit testing of open_queue in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/open_queue.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_reopen
+        test_open_queue
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+
+    def test_reopen(self):
+
+        """Function:  test_reopen
+
+        Description:  Test with a work queue that is already present.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.open_queue(self.queue_file).close()
+        conn = mysql_rep_cmp.open_queue(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select count(*) from units").fetchone()[0], 0)
+        conn.close()
+
+    def test_open_queue(self):
+
+        """Function:  test_open_queue
+
+        Description:  Test the work queue tables are created.
+
+        Arguments:
+
+        """
+
+        conn = mysql_rep_cmp.open_queue(self.queue_file)
+
+        self.assertEqual(
+            [row[0] for row in conn.execute(
+                "select name from sqlite_master where type = 'table'"
+                " order by name")], ["queue_state", "units"])
+        conn.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
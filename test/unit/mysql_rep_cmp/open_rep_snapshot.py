@@ -0,0 +1,244 @@
+# Classification (U)
+
+"""Program:  open_rep_snapshot.py
+
+    Description:  Unit testing of open_rep_snapshot in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/open_rep_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_term
+        test_diverged
+        test_timeout
+        test_second_behind
+        test_first_behind
+        test_open_rep_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rep1 = Server()
+        self.rep2 = Server()
+        self.gtid = "uuid:1-100,\nuuid2:1-5"
+        self.gtid2 = "uuid:1-90,\nuuid2:1-5"
+        self.results = "uuid:1-100,uuid2:1-5"
+        self.snapshot = "start transaction with consistent snapshot"
+
+    def test_slave_term(self):
+
+        """Function:  test_slave_term
+
+        Description:  Test with a pre-MySQL 8.0.22 replica.
+
+        Arguments:
+
+        """
+
+        self.rep2.version = (8, 0, 21)
+        self.rep1.data = [[{"Gtid": self.gtid}],
+                          [{"Behind1": 1, "Behind2": 1}]]
+        self.rep2.data = [[{"Gtid": self.gtid}]]
+
+        mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2)
+
+        self.assertEqual(self.rep1.cmds[0], "stop replica sql_thread")
+        self.assertEqual(self.rep2.cmds[0], "stop slave sql_thread")
+
+    def test_diverged(self):
+
+        """Function:  test_diverged
+
+        Description:  Test with GTID sets that have diverged.
+
+        Arguments:
+
+        """
+
+        self.rep1.data = [[{"Gtid": self.gtid}],
+                          [{"Behind1": 0, "Behind2": 0}]]
+        self.rep2.data = [[{"Gtid": "uuid3:1-5"}]]
+
+        self.assertIsNone(
+            mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2))
+        self.assertNotIn(self.snapshot, self.rep1.cmds)
+        self.assertEqual(self.rep2.cmds[-1], "start replica sql_thread")
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the replica behind not catching up.
+
+        Arguments:
+
+        """
+
+        self.rep1.data = [[{"Gtid": self.gtid}],
+                          [{"Behind1": 0, "Behind2": 1}]]
+        self.rep2.data = [[{"Gtid": self.gtid2}], [{"Status": 1}]]
+
+        self.assertIsNone(
+            mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2, 5))
+        self.assertNotIn(self.snapshot, self.rep2.cmds)
+
+    def test_second_behind(self):
+
+        """Function:  test_second_behind
+
+        Description:  Test with the second replica behind.
+
+        Arguments:
+
+        """
+
+        self.rep1.data = [[{"Gtid": self.gtid}],
+                          [{"Behind1": 0, "Behind2": 1}]]
+        self.rep2.data = [[{"Gtid": self.gtid2}], [{"Status": 0}]]
+
+        self.assertEqual(
+            mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2, 5),
+            self.results)
+        self.assertIn(
+            "start replica sql_thread until sql_after_gtids = '"
+            + self.results + "'", self.rep2.cmds)
+        self.assertIn((self.results, 5), self.rep2.cmds)
+
+    def test_first_behind(self):
+
+        """Function:  test_first_behind
+
+        Description:  Test with the first replica behind.
+
+        Arguments:
+
+        """
+
+        self.rep1.data = [[{"Gtid": self.gtid2}],
+                          [{"Behind1": 1, "Behind2": 0}], [{"Status": 0}]]
+        self.rep2.data = [[{"Gtid": self.gtid}]]
+
+        self.assertEqual(
+            mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2),
+            self.results)
+        self.assertIn(self.snapshot, self.rep1.cmds)
+        self.assertIn(self.snapshot, self.rep2.cmds)
+
+    def test_open_rep_snapshot(self):
+
+        """Function:  test_open_rep_snapshot
+
+        Description:  Test with both replicas at the same GTID set.
+
+        Arguments:
+
+        """
+
+        self.rep1.data = [[{"Gtid": self.gtid}],
+                          [{"Behind1": 1, "Behind2": 1}]]
+        self.rep2.data = [[{"Gtid": self.gtid}]]
+
+        self.assertEqual(
+            mysql_rep_cmp.open_rep_snapshot(self.rep1, self.rep2),
+            self.results)
+        self.assertEqual(self.rep1.cmds.count(self.snapshot), 1)
+        self.assertEqual(self.rep2.cmds[-2:], [
+            "stop replica sql_thread", "start replica sql_thread"])
+        self.assertEqual(self.rep2.cmds.index(self.snapshot), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+# Classification (U)
+
+"""Program:  open_snapshot.py
+
+    Description:  Unit testing of open_snapshot in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/open_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_term
+        test_timeout
+        test_open_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+        self.gtid = "uuid:1-100,\nuuid2:1-5"
+        self.results = "uuid:1-100,uuid2:1-5"
+        self.master.data = [[{"Gtid": self.gtid}]]
+
+    def test_slave_term(self):
+
+        """Function:  test_slave_term
+
+        Description:  Test with a pre-MySQL 8.0.22 replica.
+
+        Arguments:
+
+        """
+
+        self.slave.version = (8, 0, 21)
+        self.slave.data = [[{"Status": 0}]]
+
+        mysql_rep_cmp.open_snapshot(self.master, self.slave)
+
+        self.assertEqual(self.slave.cmds[0], "stop slave sql_thread")
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the replica not reaching the GTID set.
+
+        Arguments:
+
+        """
+
+        self.slave.data = [[{"Status": 1}]]
+
+        self.assertIsNone(
+            mysql_rep_cmp.open_snapshot(self.master, self.slave))
+        self.assertIn("rollback", self.master.cmds)
+        self.assertEqual(self.slave.cmds[-1], "start replica sql_thread")
+
+    def test_open_snapshot(self):
+
+        """Function:  test_open_snapshot
+
+        Description:  Test with snapshots opened on both servers.
+
+        Arguments:
+
+        """
+
+        self.slave.data = [[{"Status": 0}]]
+
+        self.assertEqual(
+            mysql_rep_cmp.open_snapshot(self.master, self.slave),
+            self.results)
+        self.assertEqual(self.master.cmds[-1], "unlock tables")
+        self.assertIn(
+            "start transaction with consistent snapshot", self.slave.cmds)
+        self.assertEqual(self.slave.cmds[-1], "start replica sql_thread")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  pair_files.py
+
+    Description:  Unit testing of pair_files in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/pair_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_topology
+        test_pair_files
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-S": "state", "-g": "incr.json"}
+        self.cfg_names = ("master", "slave")
+
+    def test_topology(self):
+
+        """Function:  test_topology
+
+        Description:  Test with -M option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = "topology"
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_files(self.args, self.cfg_names),
+            {"-S": "state.master.slave", "-W": None,
+             "-g": "incr.json.master.slave"})
+
+    def test_pair_files(self):
+
+        """Function:  test_pair_files
+
+        Description:  Test without -M option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_files(self.args, self.cfg_names),
+            {"-S": "state", "-W": None, "-g": "incr.json"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  pair_id.py
+
+    Description:  Unit testing of pair_id in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/pair_id.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_loaded
+        test_not_valid
+        test_unsafe_host
+        test_pair_id
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfgs = {
+            name: (mysql_rep_cmp.ServerCfg(
+                name, "/cfg", frozenset(), {}, host, 3306), None)
+            for name, host in [("master", "db1.example.com"),
+                               ("slave", "db2.example.com")]}
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_not_loaded(self, mock_load):
+
+        """Function:  test_not_loaded
+
+        Description:  Test with a configuration file that can not be loaded.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = [self.cfgs["master"], ImportError("slave")]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_id(["master", "slave cfg"], "/cfg"),
+            "db1.example.com_3306-slave_cfg")
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_not_valid(self, mock_load):
+
+        """Function:  test_not_valid
+
+        Description:  Test with a configuration file that is not valid.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = [self.cfgs["master"],
+                                 (None, "Error: slave: Missing settings")]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_id(["master", "slave"], "/cfg"),
+            "db1.example.com_3306-slave")
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_unsafe_host(self, mock_load):
+
+        """Function:  test_unsafe_host
+
+        Description:  Test with a host that is not safe in a file name.
+
+        Arguments:
+
+        """
+
+        self.cfgs["slave"] = (self.cfgs["slave"][0]._replace(
+            host="/var/run/mysqld.sock"), None)
+        mock_load.side_effect = lambda cfg_name, cfg_dir: self.cfgs[cfg_name]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_id(["master", "slave"], "/cfg"),
+            "db1.example.com_3306-_var_run_mysqld.sock_3306")
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_pair_id(self, mock_load):
+
+        """Function:  test_pair_id
+
+        Description:  Test the identity is made of the hosts and ports.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = lambda cfg_name, cfg_dir: self.cfgs[cfg_name]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_id(["master", "slave"], "/cfg"),
+            "db1.example.com_3306-db2.example.com_3306")
+        mock_load.assert_called_with("slave", "/cfg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+# Classification (U)
+
+"""Program:  pair_locks.py
+
+    Description:  Unit testing of pair_locks in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/pair_locks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_wait_expired
+        test_wait
+        test_deadline_passed
+        test_lock_held
+        test_pair_locks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.ids = ["pair1", "pair2"]
+        self.busy = mysql_rep_cmp.gen_class.SingleInstanceException
+
+    @mock.patch("mysql_rep_cmp.time.sleep", mock.Mock())
+    @mock.patch("mysql_rep_cmp.time.monotonic")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    def test_wait_expired(self, mock_lock, mock_time):
+
+        """Function:  test_wait_expired
+
+        Description:  Test with a lock still held once the wait is over.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-y": ["nightly", "10"]}
+        mock_lock.side_effect = self.busy
+        mock_time.side_effect = [0, 5, 5, 10]
+
+        with self.assertRaises(self.busy):
+            mysql_rep_cmp.pair_locks(self.args, self.ids)
+
+        self.assertEqual(mock_lock.call_count, 2)
+
+    @mock.patch("mysql_rep_cmp.time.sleep")
+    @mock.patch("mysql_rep_cmp.time.monotonic")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    def test_wait(self, mock_lock, mock_time, mock_sleep):
+
+        """Function:  test_wait
+
+        Description:  Test with a lock released while waiting.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-y": ["nightly", "600"]}
+        mock_lock.side_effect = ["Lock1", self.busy, "Lock2"]
+        mock_time.side_effect = [0, 1, 1]
+
+        self.assertEqual(mysql_rep_cmp.pair_locks(self.args, self.ids),
+                         ["Lock1", "Lock2"])
+        mock_sleep.assert_called_once_with(mysql_rep_cmp.LOCK_POLL)
+
+    @mock.patch("mysql_rep_cmp.time.sleep")
+    @mock.patch("mysql_rep_cmp.time.monotonic")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    def test_deadline_passed(self, mock_lock, mock_time, mock_sleep):
+
+        """Function:  test_deadline_passed
+
+        Description:  Test the wait is not negative when the deadline passes
+            after the lock is checked.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-y": ["nightly", "10"]}
+        mock_lock.side_effect = [self.busy, "Lock1", "Lock2"]
+        mock_time.side_effect = [0, 9, 11]
+
+        self.assertEqual(mysql_rep_cmp.pair_locks(self.args, self.ids),
+                         ["Lock1", "Lock2"])
+        mock_sleep.assert_called_once_with(0)
+
+    @mock.patch("mysql_rep_cmp.time.sleep")
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    def test_lock_held(self, mock_lock, mock_sleep):
+
+        """Function:  test_lock_held
+
+        Description:  Test with a lock held by another run and no wait.
+
+        Arguments:
+
+        """
+
+        mock_lock.side_effect = ["Lock1", self.busy]
+
+        with self.assertRaises(self.busy):
+            mysql_rep_cmp.pair_locks(self.args, self.ids)
+
+        mock_sleep.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.gen_class.ProgramLock")
+    def test_pair_locks(self, mock_lock):
+
+        """Function:  test_pair_locks
+
+        Description:  Test a lock is taken for each pair in order.
+
+        Arguments:
+
+        """
+
+        mock_lock.side_effect = ["Lock1", "Lock2"]
+
+        self.assertEqual(mysql_rep_cmp.pair_locks(self.args, self.ids),
+                         ["Lock1", "Lock2"])
+        self.assertEqual(
+            [item[0][1] for item in mock_lock.call_args_list], self.ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  pair_snapshot.py
+
+    Description:  Unit testing of pair_snapshot in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/pair_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_different_sources
+        test_replica_failed
+        test_replica_option
+        test_snapshot_failed
+        test_pair_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-G": True, "-T": 30}
+        self.results = {}
+        self.gtid = "uuid:1-100"
+
+    @mock.patch("mysql_rep_cmp.open_rep_snapshot")
+    @mock.patch("mysql_rep_cmp.get_sources")
+    def test_different_sources(self, mock_sources, mock_snap):
+
+        """Function:  test_different_sources
+
+        Description:  Test with replicas of different sources.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = True
+        mock_sources.side_effect = [{"uuid1"}, {"uuid2"}]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_snapshot(self.args, None, None, self.results),
+            (None, "Replicas do not replicate from the same source"))
+        mock_snap.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.open_rep_snapshot",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.get_sources")
+    def test_replica_failed(self, mock_sources):
+
+        """Function:  test_replica_failed
+
+        Description:  Test with the replicas not at the same GTID set.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = True
+        mock_sources.side_effect = [{"uuid1"}, {"uuid1"}]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_snapshot(self.args, None, None, self.results),
+            (None, "Replicas did not reach the same GTID set"))
+
+    @mock.patch("mysql_rep_cmp.open_rep_snapshot")
+    @mock.patch("mysql_rep_cmp.get_sources")
+    def test_replica_option(self, mock_sources, mock_snap):
+
+        """Function:  test_replica_option
+
+        Description:  Test with -a option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = True
+        mock_sources.side_effect = [{"uuid1", "uuid2"}, {"uuid1"}]
+        mock_snap.return_value = self.gtid
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_snapshot(self.args, "rep1", "rep2",
+                                        self.results), (self.gtid, None))
+        mock_snap.assert_called_once_with("rep1", "rep2", 30)
+        self.assertEqual(self.results,
+                         {"Source": ["uuid1"], "Snapshot": self.gtid})
+
+    @mock.patch("mysql_rep_cmp.open_snapshot", mock.Mock(return_value=None))
+    def test_snapshot_failed(self):
+
+        """Function:  test_snapshot_failed
+
+        Description:  Test with the replica not reaching the GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_snapshot(self.args, None, None, self.results),
+            (None, "Replica did not reach the master's GTID set"))
+        self.assertEqual(self.results, {})
+
+    @mock.patch("mysql_rep_cmp.open_snapshot")
+    def test_pair_snapshot(self, mock_snap):
+
+        """Function:  test_pair_snapshot
+
+        Description:  Test with -G option.
+
+        Arguments:
+
+        """
+
+        mock_snap.return_value = self.gtid
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_snapshot(self.args, None, None, self.results),
+            (self.gtid, None))
+        self.assertEqual(self.results, {"Snapshot": self.gtid})
+
+
+if __name__ == "__main__":
+    unittest.main()
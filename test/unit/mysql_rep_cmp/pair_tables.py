@@ -0,0 +1,222 @@
+# Classification (U)
+
+"""Program:  pair_tables.py
+
+    Description:  Unit testing of pair_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/pair_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_queue_gtid
+        test_queue
+        test_async
+        test_async_part
+        test_pair_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = "Master"
+        self.slave = "Slave"
+        self.tables = [("db1", "tbl1", {})]
+        self.results = {"Checks": {}}
+
+    @mock.patch("mysql_rep_cmp.cmp_tables", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_cmp.queue_cmp")
+    def test_queue_gtid(self, mock_queue):
+
+        """Function:  test_queue_gtid
+
+        Description:  Test with a work queue and a snapshot.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.pair_tables(
+            self.args, self.master, self.slave, self.tables, self.results,
+            queue_file="queue.db", gtid="uuid:1-5")
+
+        mock_queue.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.queue_cmp")
+    def test_queue(self, mock_queue):
+
+        """Function:  test_queue
+
+        Description:  Test with a work queue.
+
+        Arguments:
+
+        """
+
+        mock_queue.return_value = ["Stats"]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_tables(
+                self.args, self.master, self.slave, self.tables,
+                self.results, queue_file="queue.db",
+                part_state={"db1.tbl1": {}}), ["Stats"])
+        mock_queue.assert_called_once_with(
+            self.args, self.master, self.slave, self.tables, self.results,
+            "queue.db", part_state={"db1.tbl1": {}})
+
+    @mock.patch("mysql_rep_cmp.async_setup")
+    def test_async(self, mock_async):
+
+        """Function:  test_async
+
+        Description:  Test with -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4"}
+        mock_async.return_value = ["Stats"]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_tables(
+                self.args, self.master, self.slave, self.tables,
+                self.results, cfg_names=("master", "slave")), ["Stats"])
+        mock_async.assert_called_once_with(
+            self.args, self.master, self.slave, self.tables, self.results,
+            cfg_names=("master", "slave"))
+
+    @mock.patch("mysql_rep_cmp.async_setup")
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    def test_async_part(self, mock_cmp, mock_async):
+
+        """Function:  test_async_part
+
+        Description:  Test with -j and -P options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4", "-P": True}
+        mock_cmp.return_value = ["Stats"]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_tables(
+                self.args, self.master, self.slave, self.tables,
+                self.results, part_state={"db1.tbl1": {}}), ["Stats"])
+        mock_cmp.assert_called_once_with(
+            self.args, self.master, self.slave, self.tables, self.results,
+            part_state={"db1.tbl1": {}}, gtid=None)
+        mock_async.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    def test_pair_tables(self, mock_cmp):
+
+        """Function:  test_pair_tables
+
+        Description:  Test with the tables compared one at a time.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = ["Stats"]
+
+        self.assertEqual(
+            mysql_rep_cmp.pair_tables(
+                self.args, self.master, self.slave, self.tables,
+                self.results, gtid="uuid:1-5"), ["Stats"])
+        mock_cmp.assert_called_once_with(
+            self.args, self.master, self.slave, self.tables, self.results,
+            part_state={}, gtid="uuid:1-5")
+
+
+if __name__ == "__main__":
+    unittest.main()
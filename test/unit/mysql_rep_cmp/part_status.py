@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  part_status.py
+
+    Description:  Unit testing of part_status in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/part_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_skip_unchanged
+        test_no_update_time
+        test_not_synced
+        test_synced
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+        self.meta = {"TableRows": 1, "DataLength": 16384,
+                     "UpdateTime": "2025-01-01 00:00:00"}
+        self.meta2 = {"TableRows": 2, "DataLength": 16384,
+                      "UpdateTime": "2025-01-01 00:00:00"}
+        self.parts = {"p1": self.meta, "p2": self.meta2}
+        self.state = {"db1.tbl1": {"p1": self.meta, "p2": self.meta}}
+        self.results = {"Table": "tbl1", "Status": "Synced"}
+        self.results2 = {"Table": "tbl1", "Status": "Partitions do not match",
+                         "Partitions": ["p2"]}
+
+    @mock.patch("mysql_rep_cmp.part_tbl_cmp")
+    def test_skip_unchanged(self, mock_cmp):
+
+        """Function:  test_skip_unchanged
+
+        Description:  Test unchanged partitions are skipped.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = []
+
+        mysql_rep_cmp.part_status(
+            self.master, self.slave, "db1", "tbl1", self.parts, self.state)
+
+        mock_cmp.assert_called_with(
+            self.master, self.slave, "db1", "tbl1", ["p2"], recur=1)
+        self.assertEqual(self.state["db1.tbl1"], self.parts)
+
+    @mock.patch("mysql_rep_cmp.part_tbl_cmp")
+    def test_no_update_time(self, mock_cmp):
+
+        """Function:  test_no_update_time
+
+        Description:  Test a partition without an update time is not
+            skipped.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = []
+        self.meta["UpdateTime"] = None
+
+        mysql_rep_cmp.part_status(
+            self.master, self.slave, "db1", "tbl1", self.parts, self.state)
+
+        mock_cmp.assert_called_with(
+            self.master, self.slave, "db1", "tbl1", ["p1", "p2"], recur=1)
+
+    @mock.patch("mysql_rep_cmp.part_tbl_cmp")
+    def test_not_synced(self, mock_cmp):
+
+        """Function:  test_not_synced
+
+        Description:  Test with a partition not in sync.
+
+        Arguments:
+
+        """
+
+        mock_cmp.return_value = ["p2"]
+        state = {}
+
+        self.assertEqual(
+            mysql_rep_cmp.part_status(
+                self.master, self.slave, "db1", "tbl1", self.parts, state),
+            self.results2)
+        self.assertEqual(state, {"db1.tbl1": {"p1": self.meta}})
+
+    @mock.patch("mysql_rep_cmp.part_tbl_cmp", mock.Mock(return_value=[]))
+    def test_synced(self):
+
+        """Function:  test_synced
+
+        Description:  Test with all partitions in sync.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.part_status(
+                self.master, self.slave, "db1", "tbl1", self.parts, {}),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  part_tables.py
+
+    Description:  Unit testing of part_tables in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/part_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_db_list
+        test_part_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server.data = [[{"TableSchema": "db1", "TableName": "tbl1"},
+                             {"TableSchema": "db2", "TableName": "tbl2"}]]
+
+    def test_db_list(self):
+
+        """Function:  test_db_list
+
+        Description:  Test with a list of databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.part_tables(self.server, ["db1", "db2"]),
+            {("db1", "tbl1"), ("db2", "tbl2")})
+        self.assertTrue(self.server.cmds[0].endswith(
+            " and table_schema in (%s, %s)"))
+        self.assertEqual(self.server.cmds[1], ("db1", "db2"))
+
+    def test_part_tables(self):
+
+        """Function:  test_part_tables
+
+        Description:  Test with all databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.part_tables(self.server),
+                         {("db1", "tbl1"), ("db2", "tbl2")})
+        self.assertTrue(self.server.cmds[0].endswith(
+            " where partition_name is not null"))
+        self.assertEqual(len(self.server.cmds), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  phase.py
+
+    Description:  Unit testing of phase in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/phase.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import itertools
+import time
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_exception
+        test_phase
+        test_trace
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PHASES.clear()
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with an exception raised within the phase.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            with mysql_rep_cmp.phase("compare"):
+                raise ValueError("Error")
+
+        self.assertEqual(mysql_rep_cmp.PHASES["compare"][1], 1)
+
+    @mock.patch("mysql_rep_cmp.time.perf_counter",
+                mock.Mock(side_effect=[10.0, 12.5, 20.0, 21.0]))
+    def test_phase(self):
+
+        """Function:  test_phase
+
+        Description:  Test with two steps of the same phase.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_cmp.phase("connect"):
+            pass
+
+        with mysql_rep_cmp.phase("connect"):
+            pass
+
+        self.assertEqual(mysql_rep_cmp.PHASES["connect"], [3.5, 2])
+
+    def test_trace(self):
+
+        """Function:  test_trace
+
+        Description:  Test with tracing and a step within another step.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.TRACE.update(
+            events=[], ids=itertools.count(1).__next__, threads={},
+            start=time.perf_counter())
+
+        with mysql_rep_cmp.phase("table", db="db1", table="tbl1"):
+            with mysql_rep_cmp.phase("compare", server="Server1"):
+                pass
+
+        events = mysql_rep_cmp.TRACE["events"]
+
+        self.assertEqual([event["name"] for event in events],
+                         ["compare @ Server1", "table db1.tbl1"])
+        self.assertEqual(events[0]["args"]["parent"], 1)
+        self.assertIsNone(events[1]["args"]["parent"])
+        self.assertIsNone(mysql_rep_cmp.SPAN.get())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PHASES.clear()
+        mysql_rep_cmp.TRACE.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  plan_mode.py
+
+    Description:  Unit testing of plan_mode in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/plan_mode.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replicated
+        test_replica_queue
+        test_snapshot_queue
+        test_concurrent
+        test_concurrent_part
+        test_plan_mode
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_replicated(self):
+
+        """Function:  test_replicated
+
+        Description:  Test with -x option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-x": "admin.checksums", "-G": True}
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Replicated")
+
+    def test_replica_queue(self):
+
+        """Function:  test_replica_queue
+
+        Description:  Test with -a and -W options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-a": True, "-G": True, "-W": "queue.db"}
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Snapshot")
+
+    def test_snapshot_queue(self):
+
+        """Function:  test_snapshot_queue
+
+        Description:  Test with -G and -W options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": True, "-W": "queue.db"}
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Work queue")
+
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test with -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4"}
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Concurrent")
+
+    def test_concurrent_part(self):
+
+        """Function:  test_concurrent_part
+
+        Description:  Test with -j and -P options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "4", "-P": True}
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Sequential")
+
+    def test_plan_mode(self):
+
+        """Function:  test_plan_mode
+
+        Description:  Test with no comparison options.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.plan_mode(self.args), "Sequential")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,404 @@
+# Classification (U)
+
+"""Program:  plan_pair.py
+
+    Description:  Unit testing of plan_pair in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/plan_pair.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+def meta(data_length):
+
+    """Function:  meta
+
+    Description:  Return the metadata of a table.
+
+    Arguments:
+
+    """
+
+    return {"Engine": "InnoDB", "TableType": "BASE TABLE",
+            "TableRows": data_length // 100, "DataLength": data_length,
+            "IndexLength": 0}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        get_tables
+        entries
+        test_schema_option
+        test_part_option
+        test_concurrent
+        test_default_rate
+        test_strategies
+        test_size_rule
+        test_plan_pair
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-H": "history.db"}
+        self.master = Server("Master1")
+        self.slave = Server("Slave1")
+        self.rules = {"db_list": ["db1"]}
+        self.tables = {
+            "Master1": [("db1", "tbl1", meta(1000)),
+                        ("db1", "tbl2", meta(3000)),
+                        ("db1", "tbl3", meta(500))],
+            "Slave1": [("db1", "tbl1", meta(1100)),
+                       ("db1", "tbl2", meta(2900)),
+                       ("db1", "tbl4", meta(50))]}
+
+    def get_tables(self, server, **rules):
+
+        """Function:  get_tables
+
+        Description:  Stub holder for iter_tables.
+
+        Arguments:
+
+        """
+
+        low, high = rules.get("size") or (None, None)
+
+        return iter([item for item in self.tables[server.name]
+                     if item[1] in (rules.get("tbls") or [item[1]])
+                     and (low is None or item[2]["DataLength"] >= low)
+                     and (high is None or item[2]["DataLength"] <= high)])
+
+    def entries(self, results):
+
+        """Function:  entries
+
+        Description:  Return the tables and strategies of a plan.
+
+        Arguments:
+
+        """
+
+        return [(entry["Table"], entry["Strategy"], entry.get("Status"))
+                for entry in results["Plan"]["Tables"]["db1"]]
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate",
+                mock.Mock(return_value=(1000.0, "History")))
+    @mock.patch("mysql_rep_cmp.schema_filter")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_schema_option(self, mock_tables, mock_filter):
+
+        """Function:  test_schema_option
+
+        Description:  Test with -D option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-D"] = True
+        mock_tables.side_effect = self.get_tables
+        mock_filter.side_effect = lambda master, slave, tables: [
+            (dbs, tbl, dict(item, Status="Schema differs")
+             if tbl == "tbl2" else item) for dbs, tbl, item in tables]
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(self.entries(results)[1],
+                         ("tbl2", "None", "Schema differs"))
+        self.assertEqual(results["Plan"]["BytesScanned"],
+                         {"Master1": 1000, "Slave1": 1100})
+        self.assertEqual(results["Plan"]["ProjectedSeconds"], 1.0)
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate",
+                mock.Mock(return_value=(1000.0, "History")))
+    @mock.patch("mysql_rep_cmp.part_tables")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_part_option(self, mock_tables, mock_parts):
+
+        """Function:  test_part_option
+
+        Description:  Test with -P option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = True
+        mock_tables.side_effect = self.get_tables
+        mock_parts.return_value = {("db1", "tbl2")}
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual([item[1] for item in self.entries(results)[:2]],
+                         ["Checksum", "Partition checksum"])
+        mock_parts.assert_called_once_with(self.master, ["db1"])
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate",
+                mock.Mock(return_value=(1000.0, "History")))
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_concurrent(self, mock_tables):
+
+        """Function:  test_concurrent
+
+        Description:  Test with -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+        mock_tables.side_effect = self.get_tables
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(results["Plan"]["Mode"], "Concurrent")
+        self.assertEqual(results["Plan"]["Concurrency"], 4)
+        self.assertEqual(results["Plan"]["ProjectedSeconds"], 3.0)
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_default_rate(self, mock_tables, mock_rate):
+
+        """Function:  test_default_rate
+
+        Description:  Test without -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-G": True}
+        mock_tables.side_effect = self.get_tables
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(results["Plan"]["Rate"], mysql_rep_cmp.PLAN_RATE)
+        self.assertEqual(results["Plan"]["RateSource"], "Default")
+        self.assertEqual(self.entries(results)[0][1], "Snapshot checksum")
+        mock_rate.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate",
+                mock.Mock(return_value=(1000.0, "History")))
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_strategies(self, mock_tables):
+
+        """Function:  test_strategies
+
+        Description:  Test the tables have the strategies of their engines.
+
+        Arguments:
+
+        """
+
+        live = dict(meta(1000), Engine="MyISAM", CreateOptions="checksum=1")
+        memory = dict(meta(3000), Engine="MEMORY")
+        self.tables = {
+            "Master1": [("db1", "tbl1", live), ("db1", "tbl2", memory),
+                        ("db1", "tbl3", meta(500))],
+            "Slave1": [("db1", "tbl1", live), ("db1", "tbl2", memory),
+                       ("db1", "tbl3", meta(600))]}
+        mock_tables.side_effect = self.get_tables
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(
+            self.entries(results),
+            [("tbl1", "Quick checksum", None), ("tbl2", "Skip", "Skipped"),
+             ("tbl3", "Checksum", None)])
+        self.assertEqual(results["Plan"]["BytesScanned"],
+                         {"Master1": 500, "Slave1": 600})
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate",
+                mock.Mock(return_value=(1000.0, "History")))
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_size_rule(self, mock_tables):
+
+        """Function:  test_size_rule
+
+        Description:  Test the size range is checked in the master's query
+            only, so a table the master's size is out of range for is not
+            reported as extra on the slave.
+
+        Arguments:
+
+        """
+
+        self.rules["size"] = (600, 1050)
+        self.tables["Slave1"][1] = ("db1", "tbl2", meta(1000))
+        mock_tables.side_effect = self.get_tables
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(self.entries(results), [("tbl1", "Checksum", None)])
+        self.assertEqual(mock_tables.call_args_list[0][1],
+                         {"db_list": ["db1"]})
+        self.assertEqual(mock_tables.call_args_list[1][1],
+                         {"db_list": ["db1"], "size": (600, 1050)})
+        self.assertEqual(mock_tables.call_args_list[2][1],
+                         {"db_list": ["db1"], "tbls": ["tbl2"]})
+
+    @mock.patch("mysql_rep_cmp.get_json_template",
+                mock.Mock(return_value={"Platform": "MySQL"}))
+    @mock.patch("mysql_rep_cmp.plan_rate")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_plan_pair(self, mock_tables, mock_rate):
+
+        """Function:  test_plan_pair
+
+        Description:  Test with the tables of both servers.
+
+        Arguments:
+
+        """
+
+        mock_tables.side_effect = self.get_tables
+        mock_rate.return_value = (1000.0, "History")
+        results = mysql_rep_cmp.plan_pair(
+            self.args, self.master, self.slave, self.rules)
+
+        self.assertEqual(
+            self.entries(results),
+            [("tbl1", "Checksum", None), ("tbl2", "Checksum", None),
+             ("tbl3", "None", "Missing on slave"),
+             ("tbl4", "None", "Extra on slave")])
+        self.assertEqual(results["Plan"]["Tables"]["db1"][0],
+                         {"Table": "tbl1", "Rows": 10, "Bytes": 1000,
+                          "Strategy": "Checksum"})
+        self.assertEqual(
+            {key: value for key, value in results.items() if key != "Plan"},
+            {"Platform": "MySQL", "Master": "Master1", "Slave": "Slave1"})
+        self.assertEqual(
+            {key: value for key, value in results["Plan"].items()
+             if key != "Tables"},
+            {"Mode": "Sequential", "Concurrency": 1, "Rate": 1000,
+             "RateSource": "History",
+             "BytesScanned": {"Master1": 4000, "Slave1": 4000},
+             "ProjectedSeconds": 4.0})
+        mock_rate.assert_called_once_with(
+            "history.db", "Master1", "Slave1",
+            {("db1", "tbl1"): 1000, ("db1", "tbl2"): 3000})
+
+
+if __name__ == "__main__":
+    unittest.main()
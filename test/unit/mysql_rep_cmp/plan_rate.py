@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  plan_rate.py
+
+    Description:  Unit testing of plan_rate in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/plan_rate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_history
+        test_other_pair
+        test_plan_rate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.hist_file = os.path.join(self.tmp_dir, "history.db")
+        self.sizes = {("db1", "tbl1"): 200000000, ("db1", "tbl2"): 10}
+        self.results = {"AsOf": "2026-10-19T00:00:00", "Master": "Master1",
+                        "Slave": "Slave1"}
+
+    def test_no_history(self):
+
+        """Function:  test_no_history
+
+        Description:  Test with an empty history database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.plan_rate(
+                self.hist_file, "Master1", "Slave1", self.sizes),
+            (mysql_rep_cmp.PLAN_RATE, "Default"))
+
+    def test_other_pair(self):
+
+        """Function:  test_other_pair
+
+        Description:  Test with history of another pair only.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results,
+            [("db1", "tbl1", "Synced", 2.0, 2.5, 0)], time.time())
+
+        self.assertEqual(
+            mysql_rep_cmp.plan_rate(
+                self.hist_file, "Master1", "Slave2", self.sizes),
+            (mysql_rep_cmp.PLAN_RATE, "Default"))
+
+    def test_plan_rate(self):
+
+        """Function:  test_plan_rate
+
+        Description:  Test with the average checksum times of two runs.
+
+        Arguments:
+
+        """
+
+        for secs in [1.0, 3.0]:
+            mysql_rep_cmp.save_history(
+                self.hist_file, self.results,
+                [("db1", "tbl1", "Synced", secs, secs, 0),
+                 ("db1", "tbl2", "Missing on slave", 0, 0, 0),
+                 ("db1", "tbl3", "Synced", 9.0, 9.0, 0)], time.time())
+
+        self.assertEqual(
+            mysql_rep_cmp.plan_rate(
+                self.hist_file, "Master1", "Slave1", self.sizes),
+            (100000000.0, "History"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
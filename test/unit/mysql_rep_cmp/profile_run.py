@@ -0,0 +1,231 @@
+# Classification (U)
+
+"""Program:  profile_run.py
+
+    Description:  Unit testing of profile_run in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/profile_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import tempfile
+import shutil
+import pstats
+import tracemalloc
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+def run_func(_args):
+
+    """Function:  run_func
+
+    Description:  Function stub holder for run_program.
+
+    Arguments:
+
+    """
+
+    with mysql_rep_cmp.phase("compare"):
+        data = [str(item) for item in range(100)]
+
+    return data
+
+
+def fail_func(_args):
+
+    """Function:  fail_func
+
+    Description:  Function stub holder for a failing run_program.
+
+    Arguments:
+
+    """
+
+    with mysql_rep_cmp.phase("connect"):
+        raise ValueError("Error")
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        load_phases
+        test_exception
+        test_tracemalloc
+        test_profile_run
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.outfile = os.path.join(self.tmpdir, "out.json")
+        self.args = ArgParser()
+        self.args.args_array = {"-o": self.outfile, "-F": True}
+
+    def load_phases(self):
+
+        """Function:  load_phases
+
+        Description:  Load the phases breakdown file.
+
+        Arguments:
+
+        """
+
+        with open(self.outfile + ".phases.json", encoding="UTF-8") as fhdr:
+            return json.load(fhdr)
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with the run raising an exception.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_rep_cmp.profile_run(self.args, fail_func)
+
+        self.assertTrue(os.path.exists(self.outfile + ".prof"))
+        self.assertEqual(
+            self.load_phases()["Phases"]["connect"]["Calls"], 1)
+
+    def test_tracemalloc(self):
+
+        """Function:  test_tracemalloc
+
+        Description:  Test with -Z option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Z"] = True
+        mysql_rep_cmp.profile_run(self.args, run_func)
+
+        self.assertTrue(os.path.exists(self.outfile + ".mem"))
+        self.assertGreater(self.load_phases()["PeakMemory"], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_profile_run(self):
+
+        """Function:  test_profile_run
+
+        Description:  Test with profile and phases files written.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PHASES["output"] = [1.0, 1]
+        mysql_rep_cmp.profile_run(self.args, run_func)
+        stats = pstats.Stats(self.outfile + ".prof")
+        data = self.load_phases()
+
+        self.assertTrue(any(
+            func[2] == "run_func" for func in stats.stats))
+        self.assertEqual(list(data["Phases"]), ["compare"])
+        self.assertEqual(data["Phases"]["compare"]["Calls"], 1)
+        self.assertIn("WallTime", data)
+        self.assertNotIn("PeakMemory", data)
+        self.assertFalse(os.path.exists(self.outfile + ".mem"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PHASES.clear()
+        shutil.rmtree(self.tmpdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  queue_cmp.py
+
+    Description:  Unit testing of queue_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/queue_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_part_state
+        test_queue_cmp
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        self.args = ArgParser()
+        self.results = {"Checks": {}}
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {})]
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_part_state(self, mock_cmp):
+
+        """Function:  test_part_state
+
+        Description:  Test the synced partitions are passed to the workers
+            and the state updated with their results.
+
+        Arguments:
+
+        """
+
+        def cmp_table(*args, **kwargs):
+            passed.append(dict(kwargs["part_state"]))
+            kwargs["part_state"][f"{args[3]}.{args[4]}"] = {"p1": [1]}
+
+            return {"Table": args[4], "Status": "Synced"}
+
+        passed = []
+        part_state = {"db1.tbl1": {"p0": [1]}}
+        mock_cmp.side_effect = cmp_table
+        mysql_rep_cmp.queue_cmp(
+            self.args, None, None, iter(self.tables), self.results,
+            self.queue_file, part_state=part_state)
+
+        self.assertEqual(passed, [{"db1.tbl1": {"p0": [1]}}, {}])
+        self.assertEqual(part_state, {"db1.tbl1": {"p1": [1]},
+                                      "db1.tbl2": {"p1": [1]}})
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]),
+            {"db1": [{"Table": "tbl1", "Status": "Synced"},
+                     {"Table": "tbl2", "Status": "Synced"}]})
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_queue_cmp(self, mock_cmp):
+
+        """Function:  test_queue_cmp
+
+        Description:  Test the tables are compared through the queue.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+        mock_cmp.side_effect = lambda *args, **kwargs: {
+            "Table": args[4], "Status": "Synced"}
+
+        tbl_stats = mysql_rep_cmp.queue_cmp(
+            self.args, None, None, iter(self.tables), self.results,
+            self.queue_file)
+
+        self.assertEqual([item[:3] for item in tbl_stats],
+                         [("db1", "tbl1", "Synced"),
+                          ("db1", "tbl2", "Synced")])
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]),
+            {"db1": [{"Table": "tbl1", "Status": "Synced"},
+                     {"Table": "tbl2", "Status": "Synced"}]})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
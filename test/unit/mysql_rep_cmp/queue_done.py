@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  queue_done.py
+
+    Description:  Unit testing of queue_done in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/queue_done.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_closed
+        test_units_left
+        test_queue_done
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        self.conn = mysql_rep_cmp.open_queue(self.queue_file)
+
+    def test_not_closed(self):
+
+        """Function:  test_not_closed
+
+        Description:  Test with a queue still being filled.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_cmp.queue_done(self.conn))
+
+    def test_units_left(self):
+
+        """Function:  test_units_left
+
+        Description:  Test with units not done.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(self.queue_file, [("db1", "tbl1", {})])
+
+        self.assertFalse(mysql_rep_cmp.queue_done(self.conn))
+
+    def test_queue_done(self):
+
+        """Function:  test_queue_done
+
+        Description:  Test with all units done.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(
+            self.queue_file, [("db1", "tbl1", {"Status": "Extra on slave"})])
+
+        self.assertTrue(mysql_rep_cmp.queue_done(self.conn))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
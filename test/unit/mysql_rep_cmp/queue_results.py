@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  queue_results.py
+
+    Description:  Unit testing of queue_results in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/queue_results.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import tempfile
+import shutil
+import sqlite3
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_b_option
+        test_part_state
+        test_queue_results
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        self.args = ArgParser()
+        self.results = {"Checks": {}}
+        mysql_rep_cmp.fill_queue(
+            self.queue_file,
+            [("db1", "tbl1", {"Status": "Missing on slave"}),
+             ("db2", "tbl2", {})])
+        conn = sqlite3.connect(self.queue_file)
+
+        with conn:
+            conn.execute(
+                "update units set state = 'done', entry = ?,"
+                " checksum_time = 1.5, duration = 2.5, retries = 1"
+                " where tbl_name = 'tbl2'",
+                (json.dumps({"Table": "tbl2", "Status": "Synced"}),))
+
+        conn.close()
+
+    def test_b_option(self):
+
+        """Function:  test_b_option
+
+        Description:  Test with -b option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+        mysql_rep_cmp.queue_results(self.args, self.queue_file, self.results)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]),
+            {"db1": [{"Table": "tbl1", "Status": "Missing on slave"}],
+             "db2": []})
+
+    def test_part_state(self):
+
+        """Function:  test_part_state
+
+        Description:  Test the state is updated with the workers' synced
+            partitions.
+
+        Arguments:
+
+        """
+
+        conn = sqlite3.connect(self.queue_file)
+
+        with conn:
+            conn.execute(
+                "update units set entry = ? where tbl_name = 'tbl2'",
+                (json.dumps({"Table": "tbl2", "Status": "Synced",
+                             "PartState": {"p1": [1]}}),))
+
+        conn.close()
+        part_state = {}
+        mysql_rep_cmp.queue_results(
+            self.args, self.queue_file, self.results, part_state)
+
+        self.assertEqual(part_state, {"db2.tbl2": {"p1": [1]}})
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]["db2"]),
+            [{"Table": "tbl2", "Status": "Synced"}])
+
+    def test_queue_results(self):
+
+        """Function:  test_queue_results
+
+        Description:  Test the units are added to the results document.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+
+        self.assertEqual(
+            mysql_rep_cmp.queue_results(
+                self.args, self.queue_file, self.results),
+            [("db1", "tbl1", "Missing on slave", 0, 0, 0),
+             ("db2", "tbl2", "Synced", 1.5, 2.5, 1)])
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(self.results["Checks"]),
+            {"db1": [{"Table": "tbl1", "Status": "Missing on slave"}],
+             "db2": [{"Table": "tbl2", "Status": "Synced"}]})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
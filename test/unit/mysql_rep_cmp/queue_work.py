@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  queue_work.py
+
+    Description:  Unit testing of queue_work in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/queue_work.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import tempfile
+import shutil
+import sqlite3
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_wait_closed
+        test_lease_expired
+        test_already_done
+        test_strategy
+        test_queue_work
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.queue_file = os.path.join(self.tmp_dir, "queue.db")
+        self.args = ArgParser()
+        self.tables = [("db1", "tbl1", {}), ("db1", "tbl2", {})]
+
+    @mock.patch("mysql_rep_cmp.time.sleep")
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_wait_closed(self, mock_cmp, mock_sleep):
+
+        """Function:  test_wait_closed
+
+        Description:  Test waiting for the queue to be filled.
+
+        Arguments:
+
+        """
+
+        mock_cmp.side_effect = lambda *args, **kwargs: {
+            "Table": args[4], "Status": "Synced"}
+        mock_sleep.side_effect = lambda secs: mysql_rep_cmp.fill_queue(
+            self.queue_file, self.tables)
+
+        self.assertEqual(
+            mysql_rep_cmp.queue_work(self.args, None, None, self.queue_file),
+            2)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_lease_expired(self, mock_cmp):
+
+        """Function:  test_lease_expired
+
+        Description:  Test the result is saved after the lease expired and
+            the unit was claimed by another worker.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-U"] = "-10"
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables[:1])
+
+        def cmp_table(*args, **_kwargs):
+            conn = sqlite3.connect(self.queue_file)
+
+            with conn:
+                conn.execute("update units set worker = 'other'")
+
+            conn.close()
+
+            return {"Table": args[4], "Status": "Synced"}
+
+        mock_cmp.side_effect = cmp_table
+        mysql_rep_cmp.queue_work(self.args, None, None, self.queue_file)
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select state, entry from units").fetchall(),
+            [("done", json.dumps({"Table": "tbl1", "Status": "Synced"}))])
+        conn.close()
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_already_done(self, mock_cmp):
+
+        """Function:  test_already_done
+
+        Description:  Test the result is not saved once the unit is done by
+            another worker.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-U"] = "-10"
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables[:1])
+
+        def cmp_table(*args, **_kwargs):
+            conn = sqlite3.connect(self.queue_file)
+
+            with conn:
+                conn.execute(
+                    "update units set worker = 'other', state = 'done'")
+
+            conn.close()
+
+            return {"Table": args[4], "Status": "Synced"}
+
+        mock_cmp.side_effect = cmp_table
+        mysql_rep_cmp.queue_work(self.args, None, None, self.queue_file)
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select worker, entry from units").fetchall(),
+            [("other", None)])
+        conn.close()
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_strategy(self, mock_cmp):
+
+        """Function:  test_strategy
+
+        Description:  Test the unit's strategy is passed to the comparison.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(
+            self.queue_file, [("db1", "tbl1", {"Strategy": "Chunk hash"}),
+                              ("db1", "tbl2", {})])
+        mock_cmp.side_effect = lambda *args, **kwargs: {
+            "Table": args[4], "Status": "Synced"}
+        mysql_rep_cmp.queue_work(self.args, None, None, self.queue_file)
+
+        self.assertEqual(
+            [item[1]["meta"] for item in mock_cmp.call_args_list],
+            [{"Strategy": "Chunk hash"}, {}])
+
+    @mock.patch("mysql_rep_cmp.cmp_table")
+    def test_queue_work(self, mock_cmp):
+
+        """Function:  test_queue_work
+
+        Description:  Test all units are compared and saved.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.fill_queue(self.queue_file, self.tables)
+        mock_cmp.side_effect = lambda *args, **kwargs: {
+            "Table": args[4], "Status": "Synced"}
+
+        self.assertEqual(
+            mysql_rep_cmp.queue_work(self.args, None, None, self.queue_file),
+            2)
+        conn = sqlite3.connect(self.queue_file)
+
+        self.assertEqual(
+            conn.execute("select state, entry from units order by unit_id")
+            .fetchall(),
+            [("done", json.dumps({"Table": "tbl1", "Status": "Synced"})),
+             ("done", json.dumps({"Table": "tbl2", "Status": "Synced"}))])
+        conn.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
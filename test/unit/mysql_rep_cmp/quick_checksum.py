@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  quick_checksum.py
+
+    Description:  Unit testing of quick_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/quick_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_live
+        test_quick_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.live = [{"Table": "db1.tbl1", "Checksum": 1234}]
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_no_live(self, mock_checksum):
+
+        """Function:  test_no_live
+
+        Description:  Test with a table without a live checksum.
+
+        Arguments:
+
+        """
+
+        self.server.data = [[{"Table": "db1.tbl1", "Checksum": None}]]
+        mock_checksum.return_value = self.live
+
+        self.assertEqual(
+            mysql_rep_cmp.quick_checksum(self.server, "db1", "tbl1"),
+            self.live)
+        mock_checksum.assert_called_once_with(self.server, "db1", "tbl1")
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_quick_checksum(self, mock_checksum):
+
+        """Function:  test_quick_checksum
+
+        Description:  Test with a live checksum.
+
+        Arguments:
+
+        """
+
+        self.server.data = [self.live]
+
+        self.assertEqual(
+            mysql_rep_cmp.quick_checksum(self.server, "db1", "tbl1"),
+            self.live)
+        self.assertEqual(self.server.cmds,
+                         ["checksum table `db1`.`tbl1` quick"])
+        mock_checksum.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
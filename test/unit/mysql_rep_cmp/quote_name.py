@@ -0,0 +1,83 @@
+# Classification (U)
+
+"""Program:  quote_name.py
+
+    Description:  Unit testing of quote_name in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/quote_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_embedded_backtick
+        test_quote_name
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "tbl1"
+        self.name2 = "tb`l1"
+        self.results = "`tbl1`"
+        self.results2 = "`tb``l1`"
+
+    def test_embedded_backtick(self):
+
+        """Function:  test_embedded_backtick
+
+        Description:  Test with a backtick in the name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.quote_name(self.name2), self.results2)
+
+    def test_quote_name(self):
+
+        """Function:  test_quote_name
+
+        Description:  Test with a plain name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.quote_name(self.name), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
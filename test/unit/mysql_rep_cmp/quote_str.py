@@ -0,0 +1,80 @@
+# Classification (U)
+
+"""Program:  quote_str.py
+
+    Description:  Unit testing of quote_str in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/quote_str.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_escapes
+        test_quote_str
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.value = "tbl"
+
+    def test_escapes(self):
+
+        """Function:  test_escapes
+
+        Description:  Test with quotes and backslashes in the value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.quote_str("it's\\x"), "'it''s\\\\x'")
+
+    def test_quote_str(self):
+
+        """Function:  test_quote_str
+
+        Description:  Test quoting a value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.quote_str(self.value), "'tbl'")
+
+
+if __name__ == "__main__":
+    unittest.main()
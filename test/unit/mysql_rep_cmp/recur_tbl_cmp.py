@@ -48,6 +48,7 @@ class Server():                                         # pylint:disable=R0903
 
         """
 
+        self.name = "ServerName"
         self.extra_def_file = None
         self.sql_user = "mysql"
         self.host = "hostname"
@@ -64,6 +65,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_checksum
+        test_stats_retries
+        test_stats
         test_no_recur
         test_reached_max
         test_check_once
@@ -87,6 +91,68 @@ class UnitTest(unittest.TestCase):
         self.status = "Synced"
         self.status2 = "Checksums do not match"
 
+    @mock.patch("mysql_rep_cmp.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_checksum(self, mock_checksum):
+
+        """Function:  test_checksum
+
+        Description:  Test with a checksum function passed to each recheck.
+
+        Arguments:
+
+        """
+
+        checksum = mock.Mock(side_effect=[10, 11, 10, 10])
+
+        self.assertEqual(
+            mysql_rep_cmp.recur_tbl_cmp(
+                self.master, self.slave, "db1", "tbl1", 1,
+                checksum=checksum), self.status)
+        self.assertEqual(checksum.call_count, 4)
+        mock_checksum.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_stats_retries(self, mock_checksum):
+
+        """Function:  test_stats_retries
+
+        Description:  Test with stats and rechecks.
+
+        Arguments:
+
+        """
+
+        mock_checksum.side_effect = [10, 11, 10, 11, 10, 11]
+        stats = {}
+
+        mysql_rep_cmp.recur_tbl_cmp(
+            self.master, self.slave, "db1", "tbl1", 1, stats)
+
+        self.assertEqual(stats["Retries"], 3)
+        self.assertIn("ChecksumTime", stats)
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
+    def test_stats(self, mock_checksum):
+
+        """Function:  test_stats
+
+        Description:  Test with stats and table in sync.
+
+        Arguments:
+
+        """
+
+        mock_checksum.side_effect = [10, 10]
+        stats = {}
+
+        self.assertEqual(
+            mysql_rep_cmp.recur_tbl_cmp(
+                self.master, self.slave, "db1", "tbl1", 1, stats),
+            self.status)
+        self.assertEqual(stats.get("Retries", 0), 0)
+
     @mock.patch("mysql_rep_cmp.mysql_libs.checksum")
     def test_no_recur(self, mock_checksum):
 
@@ -0,0 +1,195 @@
+# Classification (U)
+
+"""Program:  rep_checksum.py
+
+    Description:  Unit testing of rep_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        selects
+        test_no_key
+        test_empty
+        test_rep_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.cols = [{"Name": "id"}, {"Name": "name"}]
+        self.chk_tbl = "`admin`.`checksums`"
+
+    @staticmethod
+    def selects(mock_chunk):
+
+        """Function:  selects
+
+        Description:  Return the chunk numbers and where clauses of the
+            checksummed chunks.
+
+        Arguments:
+
+        """
+
+        return [(item[0][4], item[0][5].partition(" from `db1`.`tbl1`")[2])
+                for item in mock_chunk.call_args_list]
+
+    @mock.patch("mysql_rep_cmp.rep_chunk")
+    def test_no_key(self, mock_chunk):
+
+        """Function:  test_no_key
+
+        Description:  Test a table without an integer primary key is
+            checksummed as one chunk.
+
+        Arguments:
+
+        """
+
+        self.master.data = [[], self.cols]
+        mysql_rep_cmp.rep_checksum(self.master, self.chk_tbl, "db1", "tbl1")
+
+        self.assertEqual(self.selects(mock_chunk), [(0, "")])
+
+    @mock.patch("mysql_rep_cmp.rep_chunk")
+    def test_empty(self, mock_chunk):
+
+        """Function:  test_empty
+
+        Description:  Test an empty table is checksummed as one open ended
+            chunk.
+
+        Arguments:
+
+        """
+
+        self.master.data = [[{"Name": "id"}], self.cols, []]
+        mysql_rep_cmp.rep_checksum(self.master, self.chk_tbl, "db1", "tbl1")
+
+        self.assertEqual(self.selects(mock_chunk), [(0, "")])
+
+    @mock.patch("mysql_rep_cmp.rep_chunk")
+    def test_rep_checksum(self, mock_chunk):
+
+        """Function:  test_rep_checksum
+
+        Description:  Test the table is checksummed in primary key chunks
+            with open ended first and last chunks.
+
+        Arguments:
+
+        """
+
+        self.master.data = [[{"Name": "id"}], self.cols, [{"Hi": 2}],
+                            [{"Hi": 4}], []]
+        mysql_rep_cmp.rep_checksum(
+            self.master, self.chk_tbl, "db1", "tbl1", size=2)
+
+        self.assertEqual(
+            self.selects(mock_chunk),
+            [(0, " where `id` <= 2"), (1, " where `id` > 2 and `id` <= 4"),
+             (2, " where `id` > 4")])
+        self.assertIn(
+            "select `id` as Hi from `db1`.`tbl1` where `id` > 2"
+            " order by `id` limit 1 offset 1", self.master.cmds)
+        self.assertTrue(mock_chunk.call_args[0][5].startswith(
+            "count(*) as Cnt, "))
+
+
+if __name__ == "__main__":
+    unittest.main()
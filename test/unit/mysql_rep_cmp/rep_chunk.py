@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  rep_chunk.py
+
+    Description:  Unit testing of rep_chunk in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_chunk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rep_chunk
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.master.data = [[{"Cnt": 10, "Crc": 1234}]]
+        self.chk_tbl = "`admin`.`checksums`"
+
+    def test_rep_chunk(self):
+
+        """Function:  test_rep_chunk
+
+        Description:  Test the checksum and master values of a chunk are
+            written in one transaction.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.rep_chunk(
+            self.master, self.chk_tbl, "db1", "tbl1", 2,
+            "count(*) as Cnt from `db1`.`tbl1` where `id` > 10")
+
+        self.assertEqual(
+            self.master.cmds,
+            ["start transaction",
+             "replace into `admin`.`checksums` (db, tbl, chunk, this_cnt,"
+             " this_crc) select 'db1', 'tbl1', 2, count(*) as Cnt from"
+             " `db1`.`tbl1` where `id` > 10",
+             "select this_cnt as Cnt, this_crc as Crc from"
+             " `admin`.`checksums` where db = 'db1' and tbl = 'tbl1'"
+             " and chunk = 2",
+             "update `admin`.`checksums` set master_cnt = 10,"
+             " master_crc = 1234 where db = 'db1' and tbl = 'tbl1'"
+             " and chunk = 2",
+             "commit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+# Classification (U)
+
+"""Program:  rep_cmp.py
+
+    Description:  Unit testing of rep_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rep_cmp
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-x": "admin.checksums", "-T": 30}
+        self.master = Server()
+        self.master.data = [[{"Gtid": "uuid:1-100,\nuuid2:1-5"}]]
+        self.slaves = [Server(), Server()]
+        self.master_tbls = [("db1", "tbl1", {}), ("db1", "tbl2", {})]
+        self.slave_tbls = [("db1", "tbl1", {})]
+
+    @mock.patch("mysql_rep_cmp.rep_results")
+    @mock.patch("mysql_rep_cmp.rep_collect")
+    @mock.patch("mysql_rep_cmp.rep_checksum")
+    @mock.patch("mysql_rep_cmp.rep_setup")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    def test_rep_cmp(                           # pylint:disable=R0913,R0917
+            self, mock_tbls, mock_setup, mock_chk, mock_collect,
+            mock_results):
+
+        """Function:  test_rep_cmp
+
+        Description:  Test the master is checksummed once and each replica
+            collected.
+
+        Arguments:
+
+        """
+
+        mock_tbls.side_effect = [
+            self.slave_tbls, self.master_tbls, self.master_tbls]
+        mock_setup.return_value = "`admin`.`checksums`"
+        mock_collect.side_effect = [{}, None]
+        mock_results.side_effect = ["doc1", "doc2"]
+
+        self.assertEqual(
+            mysql_rep_cmp.rep_cmp(self.args, self.master, self.slaves, {}),
+            ["doc1", "doc2"])
+        mock_chk.assert_called_once_with(
+            self.master, "`admin`.`checksums`", "db1", "tbl1")
+        mock_collect.assert_called_with(
+            self.slaves[1], "`admin`.`checksums`", "uuid:1-100,uuid2:1-5",
+            30)
+        tables = mock_results.call_args[0][3]
+        self.assertEqual([item[:2] for item in tables],
+                         [("db1", "tbl1"), ("db1", "tbl2")])
+        self.assertIsNone(tables[1][2])
+        self.assertEqual(mock_results.call_args[0][4],
+                         {("db1", "tbl1"), ("db1", "tbl2")})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+# Classification (U)
+
+"""Program:  rep_collect.py
+
+    Description:  Unit testing of rep_collect in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_collect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_chunks
+        test_rep_collect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = Server()
+        self.chk_tbl = "`admin`.`checksums`"
+        self.gtid = "uuid:1-100"
+        self.rows = [
+            {"Db": "db1", "Tbl": "tbl1", "Cnt": 10, "Crc": 5, "MstCnt": 10,
+             "MstCrc": 5},
+            {"Db": "db1", "Tbl": "tbl2", "Cnt": 9, "Crc": 5, "MstCnt": 10,
+             "MstCrc": 5}]
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the replica not reaching the GTID set.
+
+        Arguments:
+
+        """
+
+        self.slave.data = [[{"Status": 1}]]
+
+        self.assertIsNone(mysql_rep_cmp.rep_collect(
+            self.slave, self.chk_tbl, self.gtid, 5))
+        self.assertIn((self.gtid, 5), self.slave.cmds)
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test a table is out of sync when any of its chunks
+            differ.
+
+        Arguments:
+
+        """
+
+        self.slave.data = [[{"Status": 0}], [
+            self.rows[0], dict(self.rows[0], Crc=6), self.rows[0],
+            dict(self.rows[1], Cnt=10)]]
+
+        self.assertEqual(
+            mysql_rep_cmp.rep_collect(self.slave, self.chk_tbl, self.gtid),
+            {("db1", "tbl1"): "Checksums do not match",
+             ("db1", "tbl2"): "Synced"})
+
+    def test_rep_collect(self):
+
+        """Function:  test_rep_collect
+
+        Description:  Test the replica's checksums are compared.
+
+        Arguments:
+
+        """
+
+        self.slave.data = [[{"Status": 0}], self.rows]
+
+        self.assertEqual(
+            mysql_rep_cmp.rep_collect(self.slave, self.chk_tbl, self.gtid),
+            {("db1", "tbl1"): "Synced",
+             ("db1", "tbl2"): "Checksums do not match"})
+        self.assertIn("commit", self.slave.cmds)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+# Classification (U)
+
+"""Program:  rep_results.py
+
+    Description:  Unit testing of rep_results in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_results.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_collected
+        test_b_option
+        test_rep_results
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-x": "admin.checksums"}
+        self.master = Server()
+        self.slave = Server()
+        self.slave.name = "SlaveName"
+        self.tables = [("db1", "tbl1", 1.5), ("db1", "tbl2", None),
+                       ("db2", "tbl3", 0.5)]
+        self.names = {("db1", "tbl1"), ("db1", "tbl2")}
+        self.checks = {("db1", "tbl1"): "Synced"}
+
+    def test_not_collected(self):
+
+        """Function:  test_not_collected
+
+        Description:  Test with the replica not reaching the GTID set.
+
+        Arguments:
+
+        """
+
+        results, _ = mysql_rep_cmp.rep_results(
+            self.args, self.master, self.slave, self.tables[:1], self.names,
+            None)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(results["Checks"]),
+            {"db1": [{"Table": "tbl1", "Status":
+                      "Replica did not reach the master's GTID set"}]})
+
+    def test_b_option(self):
+
+        """Function:  test_b_option
+
+        Description:  Test with -b option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+        results, _ = mysql_rep_cmp.rep_results(
+            self.args, self.master, self.slave, self.tables, self.names,
+            self.checks)
+
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(results["Checks"]),
+            {"db1": [{"Table": "tbl2", "Status": "Missing on another slave"}],
+             "db2": [{"Table": "tbl3", "Status": "Missing on slave"}]})
+
+    def test_rep_results(self):
+
+        """Function:  test_rep_results
+
+        Description:  Test the results document of a replica.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+        results, tbl_stats = mysql_rep_cmp.rep_results(
+            self.args, self.master, self.slave, self.tables, self.names,
+            self.checks)
+
+        self.assertEqual(
+            (results["Master"], results["Slave"], results["Checksums"]),
+            ("ServerName", "SlaveName", "admin.checksums"))
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(results["Checks"]["db1"]),
+            [{"Table": "tbl1", "Status": "Synced"},
+             {"Table": "tbl2", "Status": "Missing on another slave"}])
+        self.assertEqual(
+            tbl_stats[0], ("db1", "tbl1", "Synced", 1.5, 1.5, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  rep_setup.py
+
+    Description:  Unit testing of rep_setup in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rep_setup.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        sql
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.data = []
+        self.cmds = []
+
+    def sql(self, cmd):
+
+        """Method:  sql
+
+        Description:  Stub holder for mysql_class.Server.sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if params:
+            self.cmds.append(params)
+
+        return self.data.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rep_setup
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+
+    def test_rep_setup(self):
+
+        """Function:  test_rep_setup
+
+        Description:  Test the session is set and the table recreated.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.rep_setup(self.master, "admin.checksums"),
+            "`admin`.`checksums`")
+        self.assertEqual(
+            self.master.cmds[1], "set session binlog_format = 'STATEMENT'")
+        self.assertEqual(
+            self.master.cmds[2], "drop table if exists `admin`.`checksums`")
+        self.assertTrue(self.master.cmds[3].startswith(
+            "create table `admin`.`checksums`"))
+        self.assertIn("primary key (db, tbl, chunk)", self.master.cmds[3])
+        self.assertEqual(self.master.cmds[4:], ["commit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  rotate_due.py
+
+    Description:  Unit testing of rotate_due in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rotate_due.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_period_previous
+        test_period_current
+        test_size_under
+        test_size_over
+        test_empty_file
+        test_no_rotation
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.outfile = os.path.join(self.tmp_dir, "out.json")
+
+        with open(self.outfile, "w", encoding="UTF-8") as fhdr:
+            fhdr.write("x" * 2048)
+
+    def test_period_previous(self):
+
+        """Function:  test_period_previous
+
+        Description:  Test with file last written in a previous day.
+
+        Arguments:
+
+        """
+
+        old_time = time.time() - 2 * 86400
+        os.utime(self.outfile, (old_time, old_time))
+
+        self.assertTrue(
+            mysql_rep_cmp.rotate_due(self.outfile, rotate_period="daily"))
+
+    def test_period_current(self):
+
+        """Function:  test_period_current
+
+        Description:  Test with file last written in the current hour.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_cmp.rotate_due(self.outfile, rotate_period="hourly"))
+
+    def test_size_under(self):
+
+        """Function:  test_size_under
+
+        Description:  Test with file smaller than the rotate size.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_cmp.rotate_due(self.outfile, "1"))
+
+    def test_size_over(self):
+
+        """Function:  test_size_over
+
+        Description:  Test with file larger than the rotate size.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.rotate_due(self.outfile, "0.001"))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty output file.
+
+        Arguments:
+
+        """
+
+        with open(self.outfile, "w", encoding="UTF-8"):
+            pass
+
+        self.assertFalse(mysql_rep_cmp.rotate_due(self.outfile, "0.001"))
+
+    def test_no_rotation(self):
+
+        """Function:  test_no_rotation
+
+        Description:  Test with no rotation options.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_cmp.rotate_due(self.outfile))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  rotate_file.py
+
+    Description:  Unit testing of rotate_file in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/rotate_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        read_file
+        test_keep_none
+        test_retention
+        test_rotate_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.outfile = os.path.join(self.tmp_dir, "out.json")
+
+        for name in ["", ".1", ".2"]:
+            with open(self.outfile + name, "w", encoding="UTF-8") as fhdr:
+                fhdr.write("file" + name)
+
+    def read_file(self, name):
+
+        """Function:  read_file
+
+        Description:  Return the contents of a file.
+
+        Arguments:
+
+        """
+
+        with open(name, "r", encoding="UTF-8") as fhdr:
+            return fhdr.read()
+
+    def test_keep_none(self):
+
+        """Function:  test_keep_none
+
+        Description:  Test with no rotated files kept.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.rotate_file(self.outfile, 0)
+
+        self.assertFalse(os.path.isfile(self.outfile))
+
+    def test_retention(self):
+
+        """Function:  test_retention
+
+        Description:  Test rotated files past the retention are removed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.rotate_file(self.outfile, 2)
+
+        self.assertEqual(self.read_file(self.outfile + ".1"), "file")
+        self.assertEqual(self.read_file(self.outfile + ".2"), "file.1")
+        self.assertFalse(os.path.isfile(self.outfile + ".3"))
+
+    def test_rotate_file(self):
+
+        """Function:  test_rotate_file
+
+        Description:  Test with rotating the output file.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.rotate_file(self.outfile)
+
+        self.assertFalse(os.path.isfile(self.outfile))
+        self.assertEqual(self.read_file(self.outfile + ".3"), "file.2")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  row_checksum.py
+
+    Description:  Unit testing of row_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/row_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.data = []
+        self.cmd = None
+        self.params = None
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_table_clause
+        test_partition_clause
+        test_row_checksum
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server.data = [{"Cnt": 5, "Crc": 123456}]
+        self.cols = ["col1", "col2"]
+        self.results = (5, 123456)
+
+    def test_table_clause(self):
+
+        """Function:  test_table_clause
+
+        Description:  Test with the whole table selected in the statement.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.row_checksum(self.server, "db1", "tbl1", self.cols)
+
+        self.assertNotIn("partition (", self.server.cmd)
+
+    def test_partition_clause(self):
+
+        """Function:  test_partition_clause
+
+        Description:  Test the partition is selected in the statement.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.row_checksum(
+            self.server, "db1", "tbl1", self.cols, "p1")
+
+        self.assertIn("`db1`.`tbl1` partition (`p1`)", self.server.cmd)
+
+    def test_row_checksum(self):
+
+        """Function:  test_row_checksum
+
+        Description:  Test with row count and checksum returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.row_checksum(
+                self.server, "db1", "tbl1", self.cols, "p1"), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
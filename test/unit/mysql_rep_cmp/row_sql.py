@@ -0,0 +1,70 @@
+# Classification (U)
+
+"""Program:  row_sql.py
+
+    Description:  Unit testing of row_sql in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/row_sql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_row_sql
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cols = ["id", "name"]
+
+    def test_row_sql(self):
+
+        """Function:  test_row_sql
+
+        Description:  Test the expression of a row.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.row_sql(self.cols),
+            "concat_ws('#', `id`, `name`, concat(isnull(`id`),"
+            " isnull(`name`)))")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,382 @@
+# Classification (U)
+
+"""Program:  run_pair.py
+
+    Description:  Unit testing of run_pair in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/run_pair.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.extra_def_file = None
+        self.sql_user = "mysql"
+        self.host = "hostname"
+        self.port = 3306
+        self.do_tbl = {}
+        self.ign_tbl = {}
+        self.server_id = 11
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Method stub holder for mysql_class.SlaveRep.connect.
+
+        Arguments:
+
+        """
+
+        status = True
+
+        if silent:
+            status = True
+
+        return status
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = conn_msg
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cfg_failed
+        test_conn_failed
+        test_not_replica
+        test_cmp_failed
+        test_cmp_exception
+        test_same_server
+        test_override
+        test_run_pair
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "config"}
+        self.master = Server()
+        self.slave = Server()
+        self.pair = ("master", "slave")
+        self.hosts = {
+            name: {"server": name + "_3306",
+                   "limit": threading.BoundedSemaphore(1), "idle": {}}
+            for name in self.pair}
+        self.results = {"Master": "master", "Slave": "slave", "Checks": {}}
+
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(None, "Error: Missing settings")))
+    def test_cfg_failed(self):
+
+        """Function:  test_cfg_failed
+
+        Description:  Test with a configuration file that is not valid.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair),
+            {"Master": "master", "Slave": "slave",
+             "Error": ["Error: Missing settings"] * 2})
+
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_conn_failed(self, mock_conn):
+
+        """Function:  test_conn_failed
+
+        Description:  Test with a connection that failed, it is not kept.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = [self.master, Server("Connection failed")]
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair)["Error"],
+            ["Connection failed"])
+        self.assertEqual(
+            self.hosts["master"]["idle"],
+            {mysql_rep_cmp.mysql_class.MasterRep: [self.master]})
+        self.assertEqual(self.hosts["slave"]["idle"], {})
+
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_not_replica(self, mock_conn, mock_cmp):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a slave not in replication with the master.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = [self.master, self.slave]
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair)["Error"],
+            "Slave is not in replication with Master")
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_cmp_failed(self, mock_conn, mock_cmp):
+
+        """Function:  test_cmp_failed
+
+        Description:  Test with the comparison failed.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = [self.master, self.slave]
+        mock_cmp.return_value = (None, "Error Message")
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair),
+            {"Master": "master", "Slave": "slave", "Error": "Error Message"})
+
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_cmp_exception(self, mock_conn, mock_cmp, mock_disconn):
+
+        """Function:  test_cmp_exception
+
+        Description:  Test with an exception in the comparison, it is the
+            pair's error, the limits are released and the connections are
+            disconnected instead of kept idle.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = [self.master, self.slave]
+        mock_cmp.side_effect = RuntimeError("Lost connection")
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair),
+            {"Master": "master", "Slave": "slave",
+             "Error": "Error encountered: Lost connection"})
+        self.assertRaises(ValueError, self.hosts["master"]["limit"].release)
+        self.assertRaises(ValueError, self.hosts["slave"]["limit"].release)
+        mock_disconn.assert_called_once_with(self.master, self.slave)
+        self.assertEqual(self.hosts["master"]["idle"], {})
+        self.assertEqual(self.hosts["slave"]["idle"], {})
+
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_same_server(self, mock_conn, mock_cmp):
+
+        """Function:  test_same_server
+
+        Description:  Test with both configuration files for one server, its
+            limit is only taken once.
+
+        Arguments:
+
+        """
+
+        self.hosts["slave"].update(self.hosts["master"], idle={})
+        mock_conn.side_effect = [self.master, self.slave]
+        mock_cmp.return_value = (self.results, None)
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair),
+            self.results)
+        self.assertRaises(ValueError, self.hosts["master"]["limit"].release)
+
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_override(self, mock_conn, mock_cmp):
+
+        """Function:  test_override
+
+        Description:  Test with -i option, the slave is a Server instance.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-i"] = True
+        mock_conn.side_effect = [self.master, self.slave]
+        mock_cmp.return_value = (self.results, None)
+
+        mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair)
+
+        self.assertEqual(mock_conn.call_args[0][3],
+                         mysql_rep_cmp.mysql_class.Server)
+
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg", mock.Mock(return_value=("", None)))
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.get_conn")
+    def test_run_pair(self, mock_conn, mock_cmp):
+
+        """Function:  test_run_pair
+
+        Description:  Test the connections are kept and the limits released.
+
+        Arguments:
+
+        """
+
+        mock_conn.side_effect = [self.master, self.slave]
+        mock_cmp.return_value = (self.results, None)
+
+        self.assertEqual(
+            mysql_rep_cmp.run_pair(self.args, self.hosts, self.pair),
+            self.results)
+        mock_cmp.assert_called_once_with(
+            self.args, self.master, self.slave, cfg_names=self.pair)
+        self.assertEqual(
+            self.hosts["slave"]["idle"],
+            {mysql_rep_cmp.mysql_class.SlaveRep: [self.slave]})
+        self.assertRaises(ValueError, self.hosts["master"]["limit"].release)
+        self.assertRaises(ValueError, self.hosts["slave"]["limit"].release)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -101,6 +101,7 @@ class SlaveRep():                                       # pylint:disable=R0903
 
         """
 
+        self.name = "ServerName"
         self.extra_def_file = None
         self.sql_user = "mysql"
         self.host = "hostname"
@@ -150,6 +151,7 @@ class Server():                                       # pylint:disable=R0903
 
         """
 
+        self.name = "ServerName"
         self.extra_def_file = None
         self.sql_user = "mysql"
         self.host = "hostname"
@@ -200,6 +202,7 @@ class MasterRep():
 
         """
 
+        self.name = "ServerName"
         self.extra_def_file = None
         self.sql_user = "mysql"
         self.host = "hostname"
@@ -241,6 +244,31 @@ class MasterRep():
         return self.slv_lists
 
 
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Emulate a loaded configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization.
+
+        Arguments:
+
+        """
+
+        self.cfg_name = "mysql_cfg"
+        self.cfg_dir = "config"
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -249,6 +277,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_replica_option
+        test_cfg_failed
         test_non_slave_compare
         test_mysql_version3
         test_mysql_version2
@@ -297,9 +327,54 @@ class UnitTest(unittest.TestCase):
         self.args6.args_array = {
             "-c": True, "-d": True, "-r": True, "-B": "db1"}
 
+    @mock.patch("mysql_rep_cmp.is_replica")
+    @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    def test_replica_option(self, mock_server, mock_replica):
+
+        """Function:  test_replica_option
+
+        Description:  Test with -a option, both servers are replicas.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = True
+        mock_server.side_effect = [self.slave, SlaveRep()]
+
+        self.assertFalse(mysql_rep_cmp.run_program(self.args))
+        self.assertEqual(mock_server.call_args_list[0][0][2],
+                         mysql_rep_cmp.mysql_class.SlaveRep)
+        mock_replica.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(None, "Error Message")))
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    def test_cfg_failed(self, mock_server):
+
+        """Function:  test_cfg_failed
+
+        Description:  Test with a configuration file that is not valid.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_cmp.run_program(self.args))
+
+        mock_server.assert_not_called()
+
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_non_slave_compare(self, mock_server):
 
@@ -318,6 +393,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_mysql_version3(self, mock_server):
 
@@ -339,6 +416,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_mysql_version2(self, mock_server):
 
@@ -359,6 +438,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_mysql_version(self, mock_server):
 
@@ -377,6 +458,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_both_conn_fail(self, mock_server):
 
@@ -400,6 +483,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_slave_conn_fail(self, mock_server):
 
@@ -422,6 +507,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_master_conn_fail(self, mock_server):
 
@@ -444,6 +531,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_conn_success(self, mock_server):
 
@@ -462,6 +551,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_str_server_id(self, mock_server):
 
@@ -482,6 +573,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_int_server_id(self, mock_server):
 
@@ -499,6 +592,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_slave_not_present(self, mock_server):
 
@@ -520,6 +615,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_database_option(self, mock_server):
 
@@ -538,6 +635,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_table_option(self, mock_server):
 
@@ -556,6 +655,8 @@ class UnitTest(unittest.TestCase):
     @mock.patch("mysql_rep_cmp.setup_cmp", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_cmp.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.load_cfg",
+                mock.Mock(return_value=(Cfg(), None)))
     @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
     def test_run_program(self, mock_server):
 
@@ -0,0 +1,292 @@
+# Classification (U)
+
+"""Program:  run_topology.py
+
+    Description:  Unit testing of run_topology in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/run_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.extra_def_file = None
+        self.sql_user = "mysql"
+        self.host = "hostname"
+        self.port = 3306
+        self.do_tbl = {}
+        self.ign_tbl = {}
+        self.server_id = 11
+        self.conn_msg = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Method stub holder for mysql_class.SlaveRep.connect.
+
+        Arguments:
+
+        """
+
+        status = True
+
+        if silent:
+            status = True
+
+        return status
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = conn_msg
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_topology_failed
+        test_data_out_failed
+        test_same_server
+        test_run_topology
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-M": "topology.txt", "-d": "config"}
+        self.server = Server()
+        self.pairs = [("master", "slave1"), ("master", "slave2")]
+
+    @mock.patch("mysql_rep_cmp.load_topology",
+                mock.Mock(return_value=(None, "Error: Line 1 is not valid")))
+    @mock.patch("mysql_rep_cmp.run_pair")
+    def test_topology_failed(self, mock_pair):
+
+        """Function:  test_topology_failed
+
+        Description:  Test with a topology file that is not valid.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mysql_rep_cmp.run_topology(self.args)
+
+        mock_pair.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.data_out",
+                mock.Mock(return_value=(False, "Error Message")))
+    @mock.patch("mysql_rep_cmp.load_topology")
+    @mock.patch("mysql_rep_cmp.run_pair", mock.Mock(return_value={}))
+    def test_data_out_failed(self, mock_topo):
+
+        """Function:  test_data_out_failed
+
+        Description:  Test with the results output failed.
+
+        Arguments:
+
+        """
+
+        mock_topo.return_value = (self.pairs, None)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_cmp.run_topology(self.args))
+
+    @mock.patch("mysql_rep_cmp.data_out",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("mysql_rep_cmp.pair_id")
+    @mock.patch("mysql_rep_cmp.load_topology")
+    @mock.patch("mysql_rep_cmp.run_pair")
+    def test_same_server(self, mock_pair, mock_topo, mock_id):
+
+        """Function:  test_same_server
+
+        Description:  Test configuration files for the same host and port
+            share the server's limit.
+
+        Arguments:
+
+        """
+
+        mock_topo.return_value = (self.pairs, None)
+        mock_id.side_effect = lambda names, cfg_dir: {
+            "master": "db1_3306", "slave1": "db2_3306",
+            "slave2": "db2_3306"}[names[0]]
+        mock_pair.return_value = {}
+
+        mysql_rep_cmp.run_topology(self.args)
+
+        hosts = mock_pair.call_args[0][1]
+        self.assertIs(hosts["slave1"]["limit"], hosts["slave2"]["limit"])
+        self.assertIsNot(hosts["master"]["limit"], hosts["slave1"]["limit"])
+        self.assertEqual(hosts["slave2"]["server"], "db2_3306")
+        mock_id.assert_called_with(mock.ANY, "config")
+
+    @mock.patch("mysql_rep_cmp.threading.BoundedSemaphore")
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.load_topology")
+    @mock.patch("mysql_rep_cmp.run_pair")
+    def test_run_topology(                      # pylint:disable=R0913,R0917
+            self, mock_pair, mock_topo, mock_out, mock_disc, mock_limit):
+
+        """Function:  test_run_topology
+
+        Description:  Test one results document with all of the pairs.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-l"] = "2"
+        mock_topo.return_value = (self.pairs, None)
+        mock_out.return_value = (True, None)
+
+        def run_pair(_args, hosts, pair):
+            hosts[pair[0]]["idle"].setdefault(Server, []).append(self.server)
+            return {"Master": pair[0], "Slave": pair[1]}
+
+        mock_pair.side_effect = run_pair
+
+        mysql_rep_cmp.run_topology(self.args)
+
+        self.assertEqual(
+            mock_out.call_args[0][0]["Pairs"],
+            [{"Master": "master", "Slave": "slave1"},
+             {"Master": "master", "Slave": "slave2"}])
+        self.assertEqual(mock_disc.call_count, 1)
+        self.assertEqual(len(mock_disc.call_args[0]), 2)
+        hosts = mock_pair.call_args[0][1]
+        self.assertEqual(set(hosts), {"master", "slave1", "slave2"})
+        mock_limit.assert_called_with(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
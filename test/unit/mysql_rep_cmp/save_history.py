@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  save_history.py
+
+    Description:  Unit testing of save_history in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/save_history.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import sqlite3
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_second_run
+        test_save_history
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.hist_file = os.path.join(self.tmp_dir, "history.db")
+        self.results = {"AsOf": "2025-01-01T00:00:00", "Master": "Master",
+                        "Slave": "Slave"}
+        self.tbl_stats = [("db1", "tbl1", "Synced", 0.5, 0.6, 0),
+                          ("db1", "tbl2", "Checksums do not match", 1.5,
+                           16.5, 3)]
+
+    def test_second_run(self):
+
+        """Function:  test_second_run
+
+        Description:  Test with saving a second run.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats, time.time())
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats, time.time())
+
+        conn = sqlite3.connect(self.hist_file)
+
+        self.assertEqual(
+            conn.execute("select count(*) from results where run_id = 2")
+            .fetchone()[0], 2)
+        conn.close()
+
+    def test_save_history(self):
+
+        """Function:  test_save_history
+
+        Description:  Test with saving a run.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.save_history(
+            self.hist_file, self.results, self.tbl_stats, time.time())
+
+        conn = sqlite3.connect(self.hist_file)
+
+        self.assertEqual(
+            conn.execute("select master, slave from runs").fetchall(),
+            [("Master", "Slave")])
+        self.assertEqual(
+            conn.execute(
+                "select db_name, tbl_name, status, checksum_time, duration,"
+                " retries from results order by tbl_name").fetchall(),
+            self.tbl_stats)
+        conn.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  schema_filter.py
+
+    Description:  Unit testing of schema_filter in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/schema_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_catalog_status
+        test_schema_differs
+        test_schema_filter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tables = [("db1", "t1", {}), ("db1", "t2", {}),
+                       ("db2", "t3", {})]
+        self.hashes = {"t1": "a", "t2": "b", "t3": "c"}
+
+    @mock.patch("mysql_rep_cmp.schema_hashes")
+    def test_catalog_status(self, mock_hashes):
+
+        """Function:  test_catalog_status
+
+        Description:  Test a table already with a status is passed through.
+
+        Arguments:
+
+        """
+
+        data = list(mysql_rep_cmp.schema_filter(
+            "Master", "Slave", [("db1", "t1", {"Status": "Extra on slave"})]))
+
+        self.assertEqual(data, [("db1", "t1", {"Status": "Extra on slave"})])
+        mock_hashes.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.schema_hashes")
+    def test_schema_differs(self, mock_hashes):
+
+        """Function:  test_schema_differs
+
+        Description:  Test with a table definition that differs.
+
+        Arguments:
+
+        """
+
+        mock_hashes.side_effect = [
+            self.hashes, dict(self.hashes, t2="x"), self.hashes, self.hashes]
+
+        data = list(mysql_rep_cmp.schema_filter(
+            "Master", "Slave", self.tables))
+
+        self.assertEqual([item[2] for item in data],
+                         [{}, {"Status": "Schema differs"}, {}])
+
+    @mock.patch("mysql_rep_cmp.schema_hashes")
+    def test_schema_filter(self, mock_hashes):
+
+        """Function:  test_schema_filter
+
+        Description:  Test the definitions are hashed once per database.
+
+        Arguments:
+
+        """
+
+        mock_hashes.return_value = self.hashes
+
+        data = list(mysql_rep_cmp.schema_filter(
+            "Master", "Slave", self.tables))
+
+        self.assertEqual(data, self.tables)
+        self.assertEqual(mock_hashes.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+# Classification (U)
+
+"""Program:  schema_hashes.py
+
+    Description:  Unit testing of schema_hashes in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/schema_hashes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.version = (8, 0, 30)
+        self.cols = []
+        self.idxs = []
+        self.params = []
+
+    def col_sql(self, cmd, params=None):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.params.append((cmd, params))
+
+        return self.cols if "information_schema.columns" in cmd \
+            else self.idxs
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_index_differs
+        test_column_differs
+        test_display_width
+        test_no_expression
+        test_schema_hashes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.server2 = Server()
+        self.col = {"TableName": "t1", "COLUMN_NAME": "id",
+                    "ORDINAL_POSITION": 1, "COLUMN_TYPE": "int",
+                    "IS_NULLABLE": "NO", "COLUMN_DEFAULT": None,
+                    "EXTRA": "", "COLLATION_NAME": None}
+        self.col2 = dict(self.col, TableName="t2")
+        self.idx = {"TableName": "t1", "INDEX_NAME": "PRIMARY",
+                    "SEQ_IN_INDEX": 1, "COLUMN_NAME": "id", "NON_UNIQUE": 0,
+                    "SUB_PART": None, "INDEX_TYPE": "BTREE",
+                    "EXPRESSION": None}
+        self.server.cols = [self.col, self.col2]
+        self.server.idxs = [self.idx]
+
+    def test_index_differs(self):
+
+        """Function:  test_index_differs
+
+        Description:  Test with an index only on one server.
+
+        Arguments:
+
+        """
+
+        self.server2.cols = [self.col, self.col2]
+        hashes = mysql_rep_cmp.schema_hashes(self.server, "db1")
+        hashes2 = mysql_rep_cmp.schema_hashes(self.server2, "db1")
+
+        self.assertNotEqual(hashes["t1"], hashes2["t1"])
+        self.assertEqual(hashes["t2"], hashes2["t2"])
+
+    def test_column_differs(self):
+
+        """Function:  test_column_differs
+
+        Description:  Test with a column type that differs.
+
+        Arguments:
+
+        """
+
+        self.server2.cols = [dict(self.col, COLUMN_TYPE="bigint"), self.col2]
+        self.server2.idxs = [self.idx]
+
+        self.assertNotEqual(
+            mysql_rep_cmp.schema_hashes(self.server, "db1")["t1"],
+            mysql_rep_cmp.schema_hashes(self.server2, "db1")["t1"])
+
+    def test_display_width(self):
+
+        """Function:  test_display_width
+
+        Description:  Test the integer display width is ignored.
+
+        Arguments:
+
+        """
+
+        self.server2.cols = [dict(self.col, COLUMN_TYPE="int(11)"), self.col2]
+        self.server2.idxs = [self.idx]
+
+        self.assertEqual(mysql_rep_cmp.schema_hashes(self.server, "db1"),
+                         mysql_rep_cmp.schema_hashes(self.server2, "db1"))
+
+    def test_no_expression(self):
+
+        """Function:  test_no_expression
+
+        Description:  Test with a server before MySQL 8.0.13, the index
+            expression is not read and hashes as on a newer server.
+
+        Arguments:
+
+        """
+
+        self.server2.version = (5, 7, 44)
+        self.server2.cols = [self.col, self.col2]
+        self.server2.idxs = [
+            dict({key: value for key, value in self.idx.items()
+                  if key != "EXPRESSION"}, expression=None)]
+
+        self.assertEqual(mysql_rep_cmp.schema_hashes(self.server, "db1"),
+                         mysql_rep_cmp.schema_hashes(self.server2, "db1"))
+        self.assertIn("null as expression", self.server2.params[1][0])
+
+    def test_schema_hashes(self):
+
+        """Function:  test_schema_hashes
+
+        Description:  Test a hash is returned per table in two queries.
+
+        Arguments:
+
+        """
+
+        hashes = mysql_rep_cmp.schema_hashes(self.server, "db1")
+
+        self.assertEqual(list(hashes), ["t1", "t2"])
+        self.assertEqual(len(hashes["t1"]), 64)
+        self.assertEqual([item[1] for item in self.server.params],
+                         [("db1",), ("db1",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -169,6 +169,18 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_plan_option
+        test_rep_option
+        test_worker_option
+        test_schema_option
+        test_invalid_size
+        test_selection_rules
+        test_async_option
+        test_history_option
+        test_snapshot_failed
+        test_snapshot_option
+        test_partition_not_part
+        test_partition_option
         test_b_option2
         test_b_option
         test_status_failed
@@ -195,21 +207,397 @@ class UnitTest(unittest.TestCase):
         self.slave.name = "SlaveName"
         self.cfg = Cfg()
         self.json_template = {"Platform": "MySQL"}
-        self.mst_db_tbl = {}
-        self.mst_db_tbl2 = {"dbs": ["tbl1"]}
-        self.mst_db_tbl3 = {"dbs": ["tbl1", "tbl2"]}
-        self.mst_db_tbl4 = {"dbs": ["tbl1", "tbl2"], "dbs2": ["tbl3", "tbl4"]}
+        self.tables = []
+        self.tables2 = [("dbs", "tbl1", {})]
+        self.tables3 = [("dbs", "tbl1", {}), ("dbs", "tbl2", {})]
+        self.tables4 = [("dbs", "tbl1", {}), ("dbs", "tbl2", {}),
+                        ("dbs2", "tbl3", {}), ("dbs2", "tbl4", {})]
         self.data_config = {"mongo": "mongo"}
         self.args_array = {"-c": True, "-d": True, "-b": True}
         self.status = (True, None)
         self.status2 = (False, "Error Message")
+        self.args_array2 = {"-c": True, "-d": True, "-P": True}
+        self.parts = {"p1": {"TableRows": 1}}
+        self.entry = {"Table": "tbl1", "Status": "Partitions do not match",
+                      "Partitions": ["p1"]}
+        self.args_array3 = {"-c": True, "-d": True, "-G": True}
+        self.gtid = "uuid:1-100"
+        self.args_array4 = {"-c": True, "-d": True, "-H": "history.db"}
+        self.args_array5 = {"-c": True, "-d": True, "-j": "4"}
+        self.args_array6 = {
+            "-c": True, "-d": True, "-X": ["*.tmp*"], "-E": ["MEMORY"],
+            "-L": "10:", "-V": True}
+        self.args_array7 = {"-c": True, "-d": True, "-L": "10"}
+        self.args_array8 = {"-c": True, "-d": True, "-D": True}
+
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.queue_work")
+    @mock.patch("mysql_rep_cmp.setup_rep_cmp")
+    def test_plan_option(                       # pylint:disable=R0913,R0917
+            self, mock_rep, mock_work, mock_cmp, mock_cfg, mock_out):
+
+        """Function:  test_plan_option
+
+        Description:  Test with -q option along with -x and -J options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {
+            "-q": True, "-x": "admin.checksums", "-J": True, "-W": "queue.db"}
+        mock_cmp.return_value = ({"Plan": {}}, None)
+        mock_cfg.return_value = {}
+        mock_out.return_value = (True, None)
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        mock_out.assert_called_once_with({"Plan": {}})
+        mock_rep.assert_not_called()
+        mock_work.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.setup_rep_cmp")
+    def test_rep_option(self, mock_rep, mock_cmp):
+
+        """Function:  test_rep_option
+
+        Description:  Test with -x option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-x": "admin.checksums"}
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        mock_rep.assert_called_once_with(self.args, self.master, self.slave)
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.cmp_pair")
+    @mock.patch("mysql_rep_cmp.queue_work")
+    def test_worker_option(self, mock_work, mock_cmp, mock_out):
+
+        """Function:  test_worker_option
+
+        Description:  Test with -J option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-J": True, "-W": "queue.db"}
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        mock_work.assert_called_once_with(
+            self.args, self.master, self.slave, "queue.db")
+        mock_cmp.assert_not_called()
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp")
+    @mock.patch("mysql_rep_cmp.schema_hashes")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_schema_option(                     # pylint:disable=R0913,R0917
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load, mock_hashes, mock_recur):
+
+        """Function:  test_schema_option
+
+        Description:  Test with -D option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array8
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+        mock_hashes.side_effect = [{"tbl1": "a"}, {"tbl1": "b"}]
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        mock_recur.assert_not_called()
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(mock_out.call_args[0][0]["Checks"]),
+            {"dbs": [{"Table": "tbl1", "Status": "Schema differs"}]})
+
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_invalid_size(self, mock_load, mock_dbstbls):
+
+        """Function:  test_invalid_size
+
+        Description:  Test with a size range that is not valid.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array7
+
+        mock_load.return_value = (self.cfg, None)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+
+        mock_dbstbls.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_selection_rules(                           # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load):
+
+        """Function:  test_selection_rules
+
+        Description:  Test all of the selection rules are passed to
+            iter_tables for the master and the name rules for the slave.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array6
+
+        mock_dbstbls.return_value = self.tables
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        self.assertEqual(mock_dbstbls.call_args_list[0], mock.call(
+            self.master, db_list=[], tbls=[], ign_dbs=self.cfg.ign_dbs,
+            ign_db_tbl=self.cfg.ign_db_tbl, include=[], exclude=["*.tmp*"],
+            skip_engines=["MEMORY"], size=(10485760, None), skip_views=True))
+        mock_dbstbls.assert_called_with(
+            self.slave, db_list=[], tbls=[], ign_dbs=self.cfg.ign_dbs,
+            ign_db_tbl=self.cfg.ign_db_tbl, include=[], exclude=["*.tmp*"])
+        self.assertEqual(mock_dbstbls.call_count, 2)
+
+    @mock.patch("mysql_rep_cmp.cmp_tables")
+    @mock.patch("mysql_rep_cmp.async_setup")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_async_option(                              # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load, mock_async, mock_cmp):
+
+        """Function:  test_async_option
+
+        Description:  Test with -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array5
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+        mock_async.return_value = []
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
+                mock.Mock(return_value="Synced"))
+    @mock.patch("mysql_rep_cmp.save_history")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_history_option(                            # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load, mock_hist):
+
+        """Function:  test_history_option
+
+        Description:  Test with -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array4
+
+        mock_dbstbls.return_value = self.tables3
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        self.assertEqual(
+            [item[:3] for item in mock_hist.call_args[0][2]],
+            [("dbs", "tbl1", "Synced"), ("dbs", "tbl2", "Synced")])
+
+    @mock.patch("mysql_rep_cmp.open_snapshot", mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_snapshot_failed(                           # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load):
+
+        """Function:  test_snapshot_failed
+
+        Description:  Test with -G option and snapshot not opened.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array3
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_load.return_value = (self.cfg, None)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.close_snapshot", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.snap_tbl_cmp",
+                mock.Mock(return_value="Synced"))
+    @mock.patch("mysql_rep_cmp.open_snapshot")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_snapshot_option(                           # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load, mock_snap):
+
+        """Function:  test_snapshot_option
+
+        Description:  Test with -G option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array3
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+        mock_snap.return_value = self.gtid
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        self.assertEqual(mock_out.call_args[0][0]["Snapshot"], self.gtid)
+
+    @mock.patch("mysql_rep_cmp.save_part_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
+                mock.Mock(return_value="Synced"))
+    @mock.patch("mysql_rep_cmp.get_partitions", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_partition_not_part(                        # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load):
+
+        """Function:  test_partition_not_part
+
+        Description:  Test with -P option and table is not partitioned.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array2
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+
+    @mock.patch("mysql_rep_cmp.save_part_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_cmp.part_status")
+    @mock.patch("mysql_rep_cmp.get_partitions")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.create_data_config")
+    @mock.patch("mysql_rep_cmp.iter_tables")
+    @mock.patch("mysql_rep_cmp.get_json_template")
+    def test_partition_option(                          # pylint:disable=R0913
+            self, mock_template, mock_dbstbls, mock_config, mock_out,
+            mock_load, mock_parts, mock_status):
+
+        """Function:  test_partition_option
+
+        Description:  Test with -P option and a partitioned table.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array2
+
+        mock_dbstbls.return_value = self.tables2
+        mock_template.return_value = self.json_template
+        mock_config.return_value = self.data_config
+        mock_out.return_value = self.status
+        mock_load.return_value = (self.cfg, None)
+        mock_parts.return_value = self.parts
+        mock_status.return_value = self.entry
+
+        self.assertFalse(
+            mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
+        self.assertEqual(
+            mysql_rep_cmp.expand_doc(
+                mock_out.call_args[0][0]["Checks"]["dbs"]), [self.entry])
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Checksums do not match"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_b_option2(                                  # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -225,21 +613,21 @@ class UnitTest(unittest.TestCase):
 
         self.args.args_array = self.args_array
 
-        mock_dbstbls.return_value = self.mst_db_tbl2
+        mock_dbstbls.return_value = self.tables2
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Synced"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_b_option(                                  # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -255,21 +643,21 @@ class UnitTest(unittest.TestCase):
 
         self.args.args_array = self.args_array
 
-        mock_dbstbls.return_value = self.mst_db_tbl2
+        mock_dbstbls.return_value = self.tables2
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Synced"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_status_failed(                             # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -283,11 +671,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_dbstbls.return_value = self.mst_db_tbl4
+        mock_dbstbls.return_value = self.tables4
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status2
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         with gen_libs.no_std_out():
             self.assertFalse(
@@ -295,10 +683,10 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Synced"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_two_dbs(                                   # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -312,21 +700,21 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_dbstbls.return_value = self.mst_db_tbl4
+        mock_dbstbls.return_value = self.tables4
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Synced"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_one_db2(                                   # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -340,21 +728,21 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_dbstbls.return_value = self.mst_db_tbl3
+        mock_dbstbls.return_value = self.tables3
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
 
     @mock.patch("mysql_rep_cmp.recur_tbl_cmp",
                 mock.Mock(return_value="Synced"))
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_one_db(                                    # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -368,19 +756,19 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_dbstbls.return_value = self.mst_db_tbl2
+        mock_dbstbls.return_value = self.tables2
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
 
-    @mock.patch("mysql_rep_cmp.gen_libs.load_module")
+    @mock.patch("mysql_rep_cmp.load_cfg")
     @mock.patch("mysql_rep_cmp.data_out")
     @mock.patch("mysql_rep_cmp.create_data_config")
-    @mock.patch("mysql_rep_cmp.mysql_libs.get_db_tbl")
+    @mock.patch("mysql_rep_cmp.iter_tables")
     @mock.patch("mysql_rep_cmp.get_json_template")
     def test_no_dbs(                                    # pylint:disable=R0913
             self, mock_template, mock_dbstbls, mock_config, mock_out,
@@ -394,11 +782,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_dbstbls.return_value = self.mst_db_tbl
+        mock_dbstbls.return_value = self.tables
         mock_template.return_value = self.json_template
         mock_config.return_value = self.data_config
         mock_out.return_value = self.status
-        mock_load.return_value = self.cfg
+        mock_load.return_value = (self.cfg, None)
 
         self.assertFalse(
             mysql_rep_cmp.setup_cmp(self.args, self.master, self.slave))
@@ -0,0 +1,309 @@
+# Classification (U)
+
+"""Program:  setup_rep_cmp.py
+
+    Description:  Unit testing of setup_rep_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/setup_rep_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, name="ServerName", conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.conn_msg = conn_msg
+        self.connected = False
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub holder for mysql_class.Server.connect method.
+
+        Arguments:
+
+        """
+
+        self.connected = silent
+
+
+class Cfg():                                            # pylint:disable=R0903
+
+    """Class:  Cfg
+
+    Description:  Emulate a configuration file.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization.
+
+        Arguments:
+
+        """
+
+        self.ign_dbs = []
+        self.ign_db_tbl = {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cfg_failed
+        test_conn_failed
+        test_not_replica
+        test_one_replica
+        test_setup_rep_cmp
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "master", "-r": "slave1", "-d": "config",
+            "-x": "admin.checksums", "-N": ["slave2"], "-i": True}
+        self.master = Server("MasterName")
+        self.slave = Server("Slave1")
+        self.slave2 = Server("Slave2")
+        self.docs = [({"Slave": "Slave1"}, []), ({"Slave": "Slave2"}, [])]
+
+    @mock.patch("mysql_rep_cmp.rep_cmp")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_cfg_failed(self, mock_load, mock_create, mock_cmp):
+
+        """Function:  test_cfg_failed
+
+        Description:  Test with a -N configuration file that is not valid.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = (None, "Error: Missing settings")
+
+        with gen_libs.no_std_out():
+            mysql_rep_cmp.setup_rep_cmp(self.args, self.master, self.slave)
+
+        mock_create.assert_not_called()
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.rep_cmp")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_conn_failed(self, mock_load, mock_create, mock_cmp, mock_disc):
+
+        """Function:  test_conn_failed
+
+        Description:  Test with a -N replica connection that failed.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = (Cfg(), None)
+        mock_create.return_value = Server("Slave2", "Connection failed")
+
+        with gen_libs.no_std_out():
+            mysql_rep_cmp.setup_rep_cmp(self.args, self.master, self.slave)
+
+        mock_cmp.assert_not_called()
+        mock_disc.assert_called_once_with(mock_create.return_value)
+
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect", mock.Mock())
+    @mock.patch("mysql_rep_cmp.is_replica", mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_cmp.rep_cmp")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_not_replica(self, mock_load, mock_create, mock_cmp):
+
+        """Function:  test_not_replica
+
+        Description:  Test with a -N server not in replication with the
+            master.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-i"]
+        mock_load.return_value = (Cfg(), None)
+        mock_create.return_value = self.slave2
+
+        with gen_libs.no_std_out():
+            mysql_rep_cmp.setup_rep_cmp(self.args, self.master, self.slave)
+
+        mock_cmp.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.rep_cmp")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_one_replica(self, mock_load, mock_cmp, mock_out):
+
+        """Function:  test_one_replica
+
+        Description:  Test with one replica, the results document is output
+            as is.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-N"]
+        mock_load.return_value = (Cfg(), None)
+        mock_cmp.return_value = self.docs[:1]
+        mock_out.return_value = (True, None)
+
+        mysql_rep_cmp.setup_rep_cmp(self.args, self.master, self.slave)
+
+        self.assertEqual(mock_cmp.call_args[0][2], [self.slave])
+        self.assertEqual(mock_out.call_args[0][0], {"Slave": "Slave1"})
+
+    @mock.patch("mysql_rep_cmp.save_history")
+    @mock.patch("mysql_rep_cmp.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_cmp.data_out")
+    @mock.patch("mysql_rep_cmp.rep_cmp")
+    @mock.patch("mysql_rep_cmp.mysql_libs.create_instance")
+    @mock.patch("mysql_rep_cmp.load_cfg")
+    def test_setup_rep_cmp(                     # pylint:disable=R0913,R0917
+            self, mock_load, mock_create, mock_cmp, mock_out, mock_disc,
+            mock_hist):
+
+        """Function:  test_setup_rep_cmp
+
+        Description:  Test with two replicas, one combined document.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "history.db"
+        mock_load.return_value = (Cfg(), None)
+        mock_create.return_value = self.slave2
+        mock_cmp.return_value = self.docs
+        mock_out.return_value = (True, None)
+
+        mysql_rep_cmp.setup_rep_cmp(self.args, self.master, self.slave)
+
+        self.assertTrue(self.slave2.connected)
+        self.assertEqual(mock_cmp.call_args[0][2], [self.slave, self.slave2])
+        self.assertEqual(mock_out.call_args[0][0]["Pairs"],
+                         [{"Slave": "Slave1"}, {"Slave": "Slave2"}])
+        self.assertEqual(mock_hist.call_count, 2)
+        mock_disc.assert_called_once_with(self.slave2)
+
+
+if __name__ == "__main__":
+    unittest.main()
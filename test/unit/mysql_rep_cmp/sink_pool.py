@@ -0,0 +1,73 @@
+# Classification (U)
+
+"""Program:  sink_pool.py
+
+    Description:  Unit testing of sink_pool in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/sink_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_created
+        test_reused
+
+    """
+
+    @mock.patch("mysql_rep_cmp.SINK_POOL", [])
+    def test_created(self):
+
+        """Function:  test_created
+
+        Description:  Test the pool is created on first use.
+
+        Arguments:
+
+        """
+
+        pool = mysql_rep_cmp.sink_pool()
+
+        self.assertEqual(mysql_rep_cmp.SINK_POOL, [pool])
+        self.assertEqual(pool.submit(sum, [1, 2]).result(), 3)
+
+    @mock.patch("mysql_rep_cmp.SINK_POOL", [])
+    def test_reused(self):
+
+        """Function:  test_reused
+
+        Description:  Test the same pool is returned on later use.
+
+        Arguments:
+
+        """
+
+        self.assertIs(mysql_rep_cmp.sink_pool(), mysql_rep_cmp.sink_pool())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  size_range.py
+
+    Description:  Unit testing of size_range in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/size_range.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_number
+        test_no_separator
+        test_max_only
+        test_min_only
+        test_size_range
+
+    """
+
+    def test_not_number(self):
+
+        """Function:  test_not_number
+
+        Description:  Test with a size that is not a number.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_cmp.size_range("ten:20"))
+
+    def test_no_separator(self):
+
+        """Function:  test_no_separator
+
+        Description:  Test with no separator.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_cmp.size_range("10"))
+
+    def test_max_only(self):
+
+        """Function:  test_max_only
+
+        Description:  Test with only a maximum size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.size_range(":5"), (None, 5242880))
+
+    def test_min_only(self):
+
+        """Function:  test_min_only
+
+        Description:  Test with only a minimum size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.size_range("10:"), (10485760, None))
+
+    def test_size_range(self):
+
+        """Function:  test_size_range
+
+        Description:  Test with a minimum and maximum size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.size_range("1:2"), (1048576, 2097152))
+
+
+if __name__ == "__main__":
+    unittest.main()
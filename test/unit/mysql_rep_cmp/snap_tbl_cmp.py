@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  snap_tbl_cmp.py
+
+    Description:  Unit testing of snap_tbl_cmp in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/snap_tbl_cmp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_synced
+        test_synced
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+        self.status = "Synced"
+        self.status2 = "Checksums do not match"
+
+    @mock.patch("mysql_rep_cmp.get_columns", mock.Mock(return_value=["c1"]))
+    @mock.patch("mysql_rep_cmp.row_checksum")
+    def test_not_synced(self, mock_chk):
+
+        """Function:  test_not_synced
+
+        Description:  Test with the table not in sync.
+
+        Arguments:
+
+        """
+
+        mock_chk.side_effect = [(1, 10), (1, 11)]
+
+        self.assertEqual(
+            mysql_rep_cmp.snap_tbl_cmp(
+                self.master, self.slave, "db1", "tbl1"), self.status2)
+
+    @mock.patch("mysql_rep_cmp.get_columns", mock.Mock(return_value=["c1"]))
+    @mock.patch("mysql_rep_cmp.row_checksum")
+    def test_synced(self, mock_chk):
+
+        """Function:  test_synced
+
+        Description:  Test with the table in sync.
+
+        Arguments:
+
+        """
+
+        mock_chk.side_effect = [(1, 10), (1, 10)]
+
+        self.assertEqual(
+            mysql_rep_cmp.snap_tbl_cmp(
+                self.master, self.slave, "db1", "tbl1"), self.status)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  status_code.py
+
+    Description:  Unit testing of status_code in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/status_code.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_new_status
+        test_status_code
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.status = "Synced"
+        self.statuses = list(mysql_rep_cmp.STATUSES)
+
+    def test_new_status(self):
+
+        """Function:  test_new_status
+
+        Description:  Test with a status not yet known.
+
+        Arguments:
+
+        """
+
+        code = mysql_rep_cmp.status_code("New status")
+
+        self.assertEqual(mysql_rep_cmp.STATUSES[code], "New status")
+        self.assertEqual(mysql_rep_cmp.status_code("New status"), code)
+
+    def test_status_code(self):
+
+        """Function:  test_status_code
+
+        Description:  Test with a known status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.status_code(self.status), 0)
+        self.assertEqual(mysql_rep_cmp.STATUSES, self.statuses)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        del mysql_rep_cmp.STATUSES[len(self.statuses):]
+        mysql_rep_cmp.STATUS_CODE.pop("New status", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  status_entry.py
+
+    Description:  Unit testing of status_entry in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/status_entry.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_strategy
+        test_status_entry
+
+    """
+
+    def test_strategy(self):
+
+        """Function:  test_strategy
+
+        Description:  Test with a table skipped by its strategy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.status_entry(
+                "tbl1", {"Engine": "MEMORY", "Strategy": "Skip",
+                         "Status": "Skipped"}),
+            {"Table": "tbl1", "Status": "Skipped", "Strategy": "Skip"})
+
+    def test_status_entry(self):
+
+        """Function:  test_status_entry
+
+        Description:  Test with a table missing on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.status_entry(
+                "tbl1", {"Engine": "InnoDB", "Status": "Missing on slave"}),
+            {"Table": "tbl1", "Status": "Missing on slave"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  table_rules.py
+
+    Description:  Unit testing of table_rules in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/table_rules.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_invalid_size
+        test_options
+        test_table_rules
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = mysql_rep_cmp.ServerCfg(
+            "master", "config", frozenset(["sys"]), {}, "hostname", 3306)
+
+    def test_invalid_size(self):
+
+        """Function:  test_invalid_size
+
+        Description:  Test with an invalid -L size range.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-L"] = "10"
+
+        self.assertIsNone(mysql_rep_cmp.table_rules(self.args, self.cfg))
+
+    def test_options(self):
+
+        """Function:  test_options
+
+        Description:  Test with the selection options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {
+            "-C": ["db1"], "-X": ["*.tmp"], "-L": "1:", "-V": True}
+        rules = mysql_rep_cmp.table_rules(self.args, self.cfg)
+
+        self.assertEqual(
+            (rules["db_list"], rules["exclude"], rules["size"],
+             rules["skip_views"]),
+            (["db1"], ["*.tmp"], (1048576, None), True))
+
+    def test_table_rules(self):
+
+        """Function:  test_table_rules
+
+        Description:  Test with no selection options.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.table_rules(self.args, self.cfg),
+            {"db_list": [], "tbls": [], "ign_dbs": frozenset(["sys"]),
+             "ign_db_tbl": {}, "include": [], "exclude": [],
+             "skip_engines": [], "size": (None, None), "skip_views": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
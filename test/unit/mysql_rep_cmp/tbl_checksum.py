@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  tbl_checksum.py
+
+    Description:  Unit testing of tbl_checksum in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/tbl_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_quick
+        test_row
+        test_chunk_no_key
+        test_chunk
+        test_no_strategy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = "Master"
+        self.cols = ["id", "name"]
+
+    def test_quick(self):
+
+        """Function:  test_quick
+
+        Description:  Test with the quick checksum strategy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_checksum(
+                self.args, self.master, "db1", "tbl1", "Quick checksum"),
+            ("Quick checksum", mysql_rep_cmp.quick_checksum))
+
+    @mock.patch("mysql_rep_cmp.get_columns")
+    def test_row(self, mock_cols):
+
+        """Function:  test_row
+
+        Description:  Test with the row checksum strategy.
+
+        Arguments:
+
+        """
+
+        mock_cols.return_value = self.cols
+        strategy, checksum = mysql_rep_cmp.tbl_checksum(
+            self.args, self.master, "db1", "tbl1", "Row checksum")
+
+        self.assertEqual(strategy, "Row checksum")
+        self.assertEqual((checksum.func, checksum.keywords),
+                         (mysql_rep_cmp.row_checksum, {"cols": self.cols}))
+
+    @mock.patch("mysql_rep_cmp.get_columns")
+    @mock.patch("mysql_rep_cmp.key_column")
+    def test_chunk_no_key(self, mock_key, mock_cols):
+
+        """Function:  test_chunk_no_key
+
+        Description:  Test with the chunk hash strategy and a table without
+            an integer primary key.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Y"] = "1000"
+        mock_key.return_value = None
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_checksum(
+                self.args, self.master, "db1", "tbl1", "Chunk hash"),
+            ("Checksum", mysql_rep_cmp.mysql_libs.checksum))
+        mock_cols.assert_not_called()
+
+    @mock.patch("mysql_rep_cmp.get_columns")
+    @mock.patch("mysql_rep_cmp.key_column")
+    def test_chunk(self, mock_key, mock_cols):
+
+        """Function:  test_chunk
+
+        Description:  Test with the chunk hash strategy.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Y"] = "1000"
+        mock_key.return_value = "id"
+        mock_cols.return_value = self.cols
+        strategy, checksum = mysql_rep_cmp.tbl_checksum(
+            self.args, self.master, "db1", "tbl1", "Chunk hash")
+
+        self.assertEqual(strategy, "Chunk hash")
+        self.assertEqual(
+            (checksum.func, checksum.keywords),
+            (mysql_rep_cmp.chunk_hashes,
+             {"key": "id", "cols": self.cols, "size": 1000}))
+        mock_key.assert_called_once_with(self.master, "db1", "tbl1")
+
+    @mock.patch("mysql_rep_cmp.key_column")
+    def test_no_strategy(self, mock_key):
+
+        """Function:  test_no_strategy
+
+        Description:  Test with no strategy chosen for the table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_checksum(
+                self.args, self.master, "db1", "tbl1", None),
+            ("Checksum", mysql_rep_cmp.mysql_libs.checksum))
+        mock_key.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
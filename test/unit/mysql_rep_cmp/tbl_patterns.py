@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  tbl_patterns.py
+
+    Description:  Unit testing of tbl_patterns in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/tbl_patterns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple
+        test_glob
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.full_name = "concat(table_schema, '.', table_name)"
+
+    def test_multiple(self):
+
+        """Function:  test_multiple
+
+        Description:  Test with a glob and a regular expression pattern.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_patterns(["stage*.*", "re:^db[.]t[0-9]+$"]),
+            (f"({self.full_name} like %s or {self.full_name} regexp %s)",
+             ["stage%.%", "^db[.]t[0-9]+$"]))
+
+    def test_glob(self):
+
+        """Function:  test_glob
+
+        Description:  Test with a glob pattern.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.tbl_patterns(["*.tmp_*"]),
+                         (f"({self.full_name} like %s)", ["%.tmp\\_%"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
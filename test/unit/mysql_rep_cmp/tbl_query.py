@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  tbl_query.py
+
+    Description:  Unit testing of tbl_query in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/tbl_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_page
+        test_all_rules
+        test_skip_views
+        test_size
+        test_skip_engines
+        test_exclude
+        test_ign_db_tbl
+        test_no_rules
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.select = "select table_name as TableName, engine as Engine," \
+            " table_type as TableType, table_rows as TableRows," \
+            " data_length as DataLength, index_length as IndexLength," \
+            " create_options as CreateOptions from information_schema.tables" \
+            " where table_schema = %s"
+        self.order = " order by cast(table_name as binary)"
+
+    def test_page(self):
+
+        """Function:  test_page
+
+        Description:  Test with the page after a table and a limit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query("db1", after="t1", limit=10),
+            (self.select + " and cast(table_name as binary) > cast(%s as"
+             " binary)" + self.order + " limit %s", ["db1", "t1", 10]))
+
+    def test_all_rules(self):
+
+        """Function:  test_all_rules
+
+        Description:  Test with all of the selection rules.
+
+        Arguments:
+
+        """
+
+        cmd, params = mysql_rep_cmp.tbl_query(
+            "db1", tbls=["t1"], ign_db_tbl={"db1": frozenset(["t2"])},
+            include=["db1.*"], exclude=["*.tmp"], skip_engines=["memory"],
+            size=(1, 2), skip_views=True)
+
+        self.assertEqual(cmd.count(" and "), 8)
+        self.assertEqual(
+            params, ["db1", "t1", "t2", "MEMORY", "db1.%", "%.tmp", 1, 2])
+
+    def test_skip_views(self):
+
+        """Function:  test_skip_views
+
+        Description:  Test with only base tables.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query("db1", skip_views=True),
+            (self.select + " and table_type = 'BASE TABLE'" + self.order,
+             ["db1"]))
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test with a minimum size only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query("db1", size=(1048576, None)),
+            (self.select + " and coalesce(data_length, 0) +"
+             " coalesce(index_length, 0) >= %s" + self.order,
+             ["db1", 1048576]))
+
+    def test_skip_engines(self):
+
+        """Function:  test_skip_engines
+
+        Description:  Test with storage engines to skip.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query(
+                "db1", skip_engines=["memory", "BLACKHOLE"]),
+            (self.select + " and upper(coalesce(engine, '')) not in"
+             " (%s, %s)" + self.order, ["db1", "MEMORY", "BLACKHOLE"]))
+
+    def test_exclude(self):
+
+        """Function:  test_exclude
+
+        Description:  Test with exclude patterns.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query("db1", exclude=["re:^stage"]),
+            (self.select + " and not (concat(table_schema, '.', table_name)"
+             " regexp %s)" + self.order, ["db1", "^stage"]))
+
+    def test_ign_db_tbl(self):
+
+        """Function:  test_ign_db_tbl
+
+        Description:  Test with tables to ignore, only those of the database
+            are used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_query(
+                "mysql", ign_db_tbl={"mysql": frozenset(["t2", "t1"]),
+                                     "db1": frozenset(["t3"])}),
+            (self.select + " and table_name not in (%s, %s)" + self.order,
+             ["mysql", "t1", "t2"]))
+
+    def test_no_rules(self):
+
+        """Function:  test_no_rules
+
+        Description:  Test with no selection rules.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_cmp.tbl_query("db1"),
+                         (self.select + self.order, ["db1"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  tbl_strategies.py
+
+    Description:  Unit testing of tbl_strategies in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/tbl_strategies.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lazy
+        test_tbl_strategies
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tables = [
+            ("db1", "tbl1", {"Engine": "InnoDB", "Status": "Extra on slave"}),
+            ("db1", "tbl2", {"Engine": "MEMORY", "SlaveEngine": "MEMORY"}),
+            ("db1", "tbl3", {"Engine": "InnoDB", "SlaveEngine": "InnoDB"})]
+
+    def test_lazy(self):
+
+        """Function:  test_lazy
+
+        Description:  Test the strategies are added as the tables are read.
+
+        Arguments:
+
+        """
+
+        tables = mysql_rep_cmp.tbl_strategies(self.args, iter(self.tables))
+
+        self.assertEqual(next(tables), self.tables[0])
+
+    def test_tbl_strategies(self):
+
+        """Function:  test_tbl_strategies
+
+        Description:  Test the strategies are added to the tables.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_cmp.tbl_strategies(self.args, self.tables)),
+            [self.tables[0],
+             ("db1", "tbl2", {"Engine": "MEMORY", "SlaveEngine": "MEMORY",
+                              "Strategy": "Skip", "Status": "Skipped"}),
+             ("db1", "tbl3", {"Engine": "InnoDB", "SlaveEngine": "InnoDB",
+                              "Strategy": "Checksum"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+# Classification (U)
+
+"""Program:  tbl_strategy.py
+
+    Description:  Unit testing of tbl_strategy in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/tbl_strategy.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_skip
+        test_engine_differs
+        test_row_format_differs
+        test_quick
+        test_quick_master_only
+        test_chunk_hash
+        test_no_slave_engine
+        test_tbl_strategy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.meta = {"Engine": "InnoDB", "CreateOptions": "",
+                     "SlaveEngine": "InnoDB", "SlaveCreateOptions": ""}
+        self.live = {"Engine": "MyISAM",
+                     "CreateOptions": "checksum=1 row_format=FIXED",
+                     "SlaveEngine": "MyISAM",
+                     "SlaveCreateOptions": "checksum=1 row_format=FIXED"}
+
+    def test_skip(self):
+
+        """Function:  test_skip
+
+        Description:  Test with an engine without lasting data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(
+                self.args, dict(self.meta, Engine="MEMORY",
+                                SlaveEngine="MEMORY")), "Skip")
+
+    def test_engine_differs(self):
+
+        """Function:  test_engine_differs
+
+        Description:  Test with a different engine on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(
+                self.args, dict(self.live, SlaveEngine="InnoDB")),
+            "Row checksum")
+
+    def test_row_format_differs(self):
+
+        """Function:  test_row_format_differs
+
+        Description:  Test with a live checksum on both servers and a
+            different row format on the slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(
+                self.args, dict(self.live, CreateOptions="checksum=1")),
+            "Row checksum")
+
+    def test_quick(self):
+
+        """Function:  test_quick
+
+        Description:  Test with a live checksum on both servers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(self.args, self.live),
+            "Quick checksum")
+
+    def test_quick_master_only(self):
+
+        """Function:  test_quick_master_only
+
+        Description:  Test with a live checksum on the master only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(
+                self.args,
+                dict(self.live, SlaveCreateOptions="row_format=FIXED")),
+            "Checksum")
+
+    def test_chunk_hash(self):
+
+        """Function:  test_chunk_hash
+
+        Description:  Test with the rows out of sync to be located.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Y"] = "1000"
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(self.args, self.meta), "Chunk hash")
+
+    def test_no_slave_engine(self):
+
+        """Function:  test_no_slave_engine
+
+        Description:  Test with metadata without the slave's engine.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(self.args, {"Engine": "InnoDB"}),
+            "Checksum")
+
+    def test_tbl_strategy(self):
+
+        """Function:  test_tbl_strategy
+
+        Description:  Test with an InnoDB table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_cmp.tbl_strategy(self.args, self.meta), "Checksum")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  trace_event.py
+
+    Description:  Unit testing of trace_event in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/trace_event.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_fields
+        test_trace_event
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.TRACE.update(threads={}, start=10.0)
+        self.fields = {"db": "db1", "table": "tbl1", "server": "Server1",
+                       "id": 2, "parent": 1}
+
+    def test_no_fields(self):
+
+        """Function:  test_no_fields
+
+        Description:  Test with a step without details.
+
+        Arguments:
+
+        """
+
+        event = mysql_rep_cmp.trace_event("output", 10.0, 10.25, {})
+
+        self.assertEqual(event["name"], "output")
+        self.assertEqual(event["ts"], 0)
+        self.assertEqual(event["dur"], 250000)
+
+    def test_trace_event(self):
+
+        """Function:  test_trace_event
+
+        Description:  Test with a step of a table on a server.
+
+        Arguments:
+
+        """
+
+        event = mysql_rep_cmp.trace_event(
+            "compare", 11.5, 12.0, self.fields)
+        thread = threading.current_thread()
+
+        self.assertEqual(
+            event, {"name": "compare db1.tbl1 @ Server1", "cat": "compare",
+                    "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                    "ts": 1500000, "dur": 500000, "args": self.fields})
+        self.assertEqual(mysql_rep_cmp.TRACE["threads"],
+                         {thread.ident: thread.name})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.TRACE.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
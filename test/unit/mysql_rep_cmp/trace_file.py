@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  trace_file.py
+
+    Description:  Unit testing of trace_file in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/trace_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import tempfile
+import shutil
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        load_trace
+        test_no_trace
+        test_exception
+        test_trace_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.trace_path = os.path.join(self.tmpdir, "trace.json")
+
+    def load_trace(self):
+
+        """Function:  load_trace
+
+        Description:  Load the trace file.
+
+        Arguments:
+
+        """
+
+        with open(self.trace_path, encoding="UTF-8") as fhdr:
+            return json.load(fhdr)
+
+    def test_no_trace(self):
+
+        """Function:  test_no_trace
+
+        Description:  Test without a trace file.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_cmp.trace_file(None):
+            with mysql_rep_cmp.phase("connect", server="Server1"):
+                pass
+
+        self.assertEqual(mysql_rep_cmp.TRACE, {})
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with an exception raised within the trace.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            with mysql_rep_cmp.trace_file(self.trace_path):
+                with mysql_rep_cmp.phase("connect", server="Server1"):
+                    raise ValueError("Error")
+
+        self.assertEqual(self.load_trace()["traceEvents"][-1]["name"],
+                         "connect @ Server1")
+        self.assertEqual(mysql_rep_cmp.TRACE, {})
+
+    def test_trace_file(self):
+
+        """Function:  test_trace_file
+
+        Description:  Test with the steps written to the trace file.
+
+        Arguments:
+
+        """
+
+        with mysql_rep_cmp.trace_file(self.trace_path):
+            with mysql_rep_cmp.phase("table", db="db1", table="tbl1"):
+                with mysql_rep_cmp.phase("compare", server="Server1"):
+                    pass
+
+        events = self.load_trace()["traceEvents"]
+
+        self.assertEqual([event["ph"] for event in events], ["M", "X", "X"])
+        self.assertEqual(events[0]["args"]["name"],
+                         threading.current_thread().name)
+        self.assertEqual(events[1]["args"]["parent"],
+                         events[2]["args"]["id"])
+        self.assertLessEqual(events[2]["ts"], events[1]["ts"])
+        self.assertEqual(mysql_rep_cmp.TRACE, {})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PHASES.clear()
+        shutil.rmtree(self.tmpdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
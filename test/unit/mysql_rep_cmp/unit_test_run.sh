@@ -14,3 +14,107 @@ echo "Unit testing..."
 /usr/bin/python test/unit/mysql_rep_cmp/create_data_config.py
 /usr/bin/python test/unit/mysql_rep_cmp/get_json_template.py
 /usr/bin/python test/unit/mysql_rep_cmp/data_out.py
+/usr/bin/python test/unit/mysql_rep_cmp/quote_name.py
+/usr/bin/python test/unit/mysql_rep_cmp/get_columns.py
+/usr/bin/python test/unit/mysql_rep_cmp/get_partitions.py
+/usr/bin/python test/unit/mysql_rep_cmp/row_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/part_tbl_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/load_part_state.py
+/usr/bin/python test/unit/mysql_rep_cmp/save_part_state.py
+/usr/bin/python test/unit/mysql_rep_cmp/part_status.py
+/usr/bin/python test/unit/mysql_rep_cmp/open_snapshot.py
+/usr/bin/python test/unit/mysql_rep_cmp/close_snapshot.py
+/usr/bin/python test/unit/mysql_rep_cmp/snap_tbl_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/encode_data.py
+/usr/bin/python test/unit/mysql_rep_cmp/compress_body.py
+/usr/bin/python test/unit/mysql_rep_cmp/mail_sink.py
+/usr/bin/python test/unit/mysql_rep_cmp/wait_sinks.py
+/usr/bin/python test/unit/mysql_rep_cmp/rotate_due.py
+/usr/bin/python test/unit/mysql_rep_cmp/rotate_file.py
+/usr/bin/python test/unit/mysql_rep_cmp/write_outfile.py
+/usr/bin/python test/unit/mysql_rep_cmp/save_history.py
+/usr/bin/python test/unit/mysql_rep_cmp/get_history.py
+/usr/bin/python test/unit/mysql_rep_cmp/history_report.py
+/usr/bin/python test/unit/mysql_rep_cmp/cmp_table.py
+/usr/bin/python test/unit/mysql_rep_cmp/async_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/async_tbl_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/async_run_tbl.py
+/usr/bin/python test/unit/mysql_rep_cmp/async_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/async_setup.py
+/usr/bin/python test/unit/mysql_rep_cmp/add_entry.py
+/usr/bin/python test/unit/mysql_rep_cmp/cmp_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/lazy_import.py
+/usr/bin/python test/unit/mysql_rep_cmp/sink_pool.py
+/usr/bin/python test/unit/mysql_rep_cmp/load_cfg.py
+/usr/bin/python test/unit/mysql_rep_cmp/glob_like.py
+/usr/bin/python test/unit/mysql_rep_cmp/size_range.py
+/usr/bin/python test/unit/mysql_rep_cmp/tbl_patterns.py
+/usr/bin/python test/unit/mysql_rep_cmp/tbl_query.py
+/usr/bin/python test/unit/mysql_rep_cmp/iter_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/diff_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/schema_hashes.py
+/usr/bin/python test/unit/mysql_rep_cmp/schema_filter.py
+/usr/bin/python test/unit/mysql_rep_cmp/is_replica.py
+/usr/bin/python test/unit/mysql_rep_cmp/load_topology.py
+/usr/bin/python test/unit/mysql_rep_cmp/get_conn.py
+/usr/bin/python test/unit/mysql_rep_cmp/run_pair.py
+/usr/bin/python test/unit/mysql_rep_cmp/run_topology.py
+/usr/bin/python test/unit/mysql_rep_cmp/cmp_pair.py
+/usr/bin/python test/unit/mysql_rep_cmp/open_queue.py
+/usr/bin/python test/unit/mysql_rep_cmp/fill_queue.py
+/usr/bin/python test/unit/mysql_rep_cmp/claim_unit.py
+/usr/bin/python test/unit/mysql_rep_cmp/queue_done.py
+/usr/bin/python test/unit/mysql_rep_cmp/queue_work.py
+/usr/bin/python test/unit/mysql_rep_cmp/queue_results.py
+/usr/bin/python test/unit/mysql_rep_cmp/queue_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/get_sources.py
+/usr/bin/python test/unit/mysql_rep_cmp/open_rep_snapshot.py
+/usr/bin/python test/unit/mysql_rep_cmp/pair_snapshot.py
+/usr/bin/python test/unit/mysql_rep_cmp/quote_str.py
+/usr/bin/python test/unit/mysql_rep_cmp/checksum_sql.py
+/usr/bin/python test/unit/mysql_rep_cmp/table_rules.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_setup.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_collect.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_results.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/setup_rep_cmp.py
+/usr/bin/python test/unit/mysql_rep_cmp/status_code.py
+/usr/bin/python test/unit/mysql_rep_cmp/expand_doc.py
+/usr/bin/python test/unit/mysql_rep_cmp/phase.py
+/usr/bin/python test/unit/mysql_rep_cmp/profile_run.py
+/usr/bin/python test/unit/mysql_rep_cmp/trace_event.py
+/usr/bin/python test/unit/mysql_rep_cmp/trace_file.py
+/usr/bin/python test/unit/mysql_rep_cmp/part_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/plan_mode.py
+/usr/bin/python test/unit/mysql_rep_cmp/plan_rate.py
+/usr/bin/python test/unit/mysql_rep_cmp/plan_pair.py
+/usr/bin/python test/unit/mysql_rep_cmp/binlog_pos.py
+/usr/bin/python test/unit/mysql_rep_cmp/binlog_event.py
+/usr/bin/python test/unit/mysql_rep_cmp/binlog_changes.py
+/usr/bin/python test/unit/mysql_rep_cmp/incr_filter.py
+/usr/bin/python test/unit/mysql_rep_cmp/incr_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/pair_files.py
+/usr/bin/python test/unit/mysql_rep_cmp/pair_tables.py
+/usr/bin/python test/unit/mysql_rep_cmp/row_sql.py
+/usr/bin/python test/unit/mysql_rep_cmp/key_column.py
+/usr/bin/python test/unit/mysql_rep_cmp/chunk_hashes.py
+/usr/bin/python test/unit/mysql_rep_cmp/chunk_ranges.py
+/usr/bin/python test/unit/mysql_rep_cmp/diff_ranges.py
+/usr/bin/python test/unit/mysql_rep_cmp/end_to_end.py
+/usr/bin/python test/unit/mysql_rep_cmp/pair_id.py
+/usr/bin/python test/unit/mysql_rep_cmp/lock_ids.py
+/usr/bin/python test/unit/mysql_rep_cmp/pair_locks.py
+/usr/bin/python test/unit/mysql_rep_cmp/tbl_strategy.py
+/usr/bin/python test/unit/mysql_rep_cmp/tbl_strategies.py
+/usr/bin/python test/unit/mysql_rep_cmp/quick_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/tbl_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/status_entry.py
+/usr/bin/python test/unit/mysql_rep_cmp/load_modules.py
+/usr/bin/python test/unit/mysql_rep_cmp/rep_chunk.py
+/usr/bin/python test/unit/mysql_rep_cmp/name_rules.py
+/usr/bin/python test/unit/mysql_rep_cmp/attr_filter.py
+/usr/bin/python test/unit/mysql_rep_cmp/keep_checksum.py
+/usr/bin/python test/unit/mysql_rep_cmp/db_query.py
+/usr/bin/python test/unit/mysql_rep_cmp/check_default.py
+/usr/bin/python test/unit/mysql_rep_cmp/incr_pending.py
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  wait_sinks.py
+
+    Description:  Unit testing of wait_sinks in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/wait_sinks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_sink_failed
+        test_sinks
+        test_no_sinks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.future = mock.Mock()
+        self.future2 = mock.Mock()
+        self.future2.result.side_effect = OSError("Mail failed")
+
+    def test_sink_failed(self):
+
+        """Function:  test_sink_failed
+
+        Description:  Test with a sink that failed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PENDING_SINKS.extend([self.future2, self.future])
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_cmp.wait_sinks())
+
+        self.future.result.assert_called_once_with()
+        self.assertEqual(mysql_rep_cmp.PENDING_SINKS, [])
+
+    def test_sinks(self):
+
+        """Function:  test_sinks
+
+        Description:  Test with sinks that finished.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.PENDING_SINKS.append(self.future)
+
+        self.assertTrue(mysql_rep_cmp.wait_sinks())
+        self.assertEqual(mysql_rep_cmp.PENDING_SINKS, [])
+
+    def test_no_sinks(self):
+
+        """Function:  test_no_sinks
+
+        Description:  Test with no pending sinks.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_cmp.wait_sinks())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        del mysql_rep_cmp.PENDING_SINKS[:]
+
+
+if __name__ == "__main__":
+    unittest.main()
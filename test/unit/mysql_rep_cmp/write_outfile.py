@@ -0,0 +1,226 @@
+# Classification (U)
+
+"""Program:  write_outfile.py
+
+    Description:  Unit testing of write_outfile in mysql_rep_cmp.py.
+
+    Usage:
+        test/unit/mysql_rep_cmp/write_outfile.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import shutil
+import gzip
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_cmp                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_zstd
+        test_gzip_append
+        test_rotate
+        test_append
+        test_keep_mode
+        test_new_mode
+        test_interrupted
+        test_write
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.outfile = os.path.join(self.tmp_dir, "out.json")
+        self.text = '{"key": "value"}'
+
+    @unittest.skipIf(not mysql_rep_cmp.zstandard, "zstandard not installed")
+    def test_zstd(self):
+
+        """Function:  test_zstd
+
+        Description:  Test with zstd compression.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.write_outfile(
+            self.outfile, self.text, file_compress="zstd")
+
+        with open(self.outfile, "rb") as fhdr:
+            self.assertEqual(
+                mysql_rep_cmp.zstandard.ZstdDecompressor().decompress(
+                    fhdr.read()).decode(), self.text + "\n")
+
+    def test_gzip_append(self):
+
+        """Function:  test_gzip_append
+
+        Description:  Test with gzip compression and append mode.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.write_outfile(
+            self.outfile, self.text, file_compress="gzip")
+        mysql_rep_cmp.write_outfile(
+            self.outfile, self.text, mode="a", file_compress="gzip")
+
+        with gzip.open(self.outfile, "rt", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), (self.text + "\n") * 2)
+
+    def test_rotate(self):
+
+        """Function:  test_rotate
+
+        Description:  Test with the output file rotated before writing.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.write_outfile(self.outfile, "x" * 2048)
+        mysql_rep_cmp.write_outfile(
+            self.outfile, self.text, rotate_size="0.001", keep=2)
+
+        with open(self.outfile, "r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), self.text + "\n")
+
+        self.assertTrue(os.path.isfile(self.outfile + ".1"))
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test with append mode.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.write_outfile(self.outfile, self.text)
+        mysql_rep_cmp.write_outfile(self.outfile, self.text, mode="a")
+
+        with open(self.outfile, "r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), (self.text + "\n") * 2)
+
+    def test_keep_mode(self):
+
+        """Function:  test_keep_mode
+
+        Description:  Test the file permissions are kept.
+
+        Arguments:
+
+        """
+
+        with open(self.outfile, "w", encoding="UTF-8"):
+            pass
+
+        os.chmod(self.outfile, 0o640)
+        mysql_rep_cmp.write_outfile(self.outfile, self.text)
+
+        self.assertEqual(os.stat(self.outfile).st_mode & 0o777, 0o640)
+
+    def test_new_mode(self):
+
+        """Function:  test_new_mode
+
+        Description:  Test a new file has the permissions of the umask.
+
+        Arguments:
+
+        """
+
+        umask = os.umask(0o027)
+
+        try:
+            mysql_rep_cmp.write_outfile(self.outfile, self.text)
+
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(os.stat(self.outfile).st_mode & 0o777, 0o640)
+
+    @mock.patch("mysql_rep_cmp.os.replace",
+                mock.Mock(side_effect=KeyboardInterrupt))
+    def test_interrupted(self):
+
+        """Function:  test_interrupted
+
+        Description:  Test the temporary file is removed when the write is
+            interrupted.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(KeyboardInterrupt):
+            mysql_rep_cmp.write_outfile(self.outfile, self.text)
+
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test with write mode and no temporary file left.
+
+        Arguments:
+
+        """
+
+        mysql_rep_cmp.write_outfile(self.outfile, self.text)
+
+        with open(self.outfile, "r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), self.text + "\n")
+
+        self.assertEqual(os.listdir(self.tmp_dir), ["out.json"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()